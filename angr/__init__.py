@@ -175,6 +175,7 @@ from . import sim_type as types
 from .state_hierarchy import StateHierarchy
 
 from .sim_state import SimState
+from .state_snapshot import StateSnapshot
 from . import engines
 from .calling_conventions import default_cc, DEFAULT_CC, SYSCALL_CC, PointerWrapper, SimCC
 from .storage.file import (
@@ -196,6 +197,11 @@ from .emulator import Emulator, EmulatorStopReason
 
 # for compatibility reasons
 from . import sim_manager as manager
+from .utils.lazy_import import lazy_attributes
+
+# submodules that are no longer imported by angr itself (e.g., angr.annocfg) are imported when they are accessed
+__getattr__ = lazy_attributes(__name__, {})
+del lazy_attributes
 
 # now that we have everything loaded, re-grab the list of loggers
 loggers.load_all_loggers()
@@ -343,6 +349,7 @@ __all__ = (
     "SimulationManager",
     "SimulationManagerError",
     "StateHierarchy",
+    "StateSnapshot",
     "TracerEnvironmentError",
     "UnsupportedCCallError",
     "UnsupportedDirtyError",
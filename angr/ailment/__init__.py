@@ -6,6 +6,7 @@ from . import statement
 from . import expression
 from .statement import Assignment, Statement
 from .expression import Expression, Const, Tmp, Register, UnaryOp, BinaryOp
+from .expression_factory import ExpressionFactory
 from .converter_common import Converter
 from .manager import Manager
 from .block_walker import AILBlockWalker, AILBlockWalkerBase
@@ -66,6 +67,7 @@ __all__ = [
     "Const",
     "Expr",
     "Expression",
+    "ExpressionFactory",
     "IRSBConverter",
     "Manager",
     "PCodeIRSBConverter",
@@ -1,10 +1,49 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
+
+from .tagged_object import TaggedObject
 
 if TYPE_CHECKING:
     from .statement import Statement
 
 
+# names of attributes that make up the structure of each type of AIL objects
+_STRUCTURAL_ATTRS: dict[type, tuple[str, ...]] = {}
+
+
+def _structural_attrs(cls: type) -> tuple[str, ...]:
+    attrs = _STRUCTURAL_ATTRS.get(cls)
+    if attrs is None:
+        attrs = tuple(
+            dict.fromkeys(
+                attr
+                for klass in reversed(cls.__mro__)
+                for attr in getattr(klass, "__slots__", ())
+                if attr not in {"_hash", "__weakref__"}
+            )
+        )
+        _STRUCTURAL_ATTRS[cls] = attrs
+    return attrs
+
+
+def _structural_key(obj) -> Any:
+    """
+    Get a key that describes the current structure of an AIL object. AIL objects are walked recursively, so changes
+    that are made in-place (which do not update the cached hashes of AIL objects) still change the key.
+    """
+
+    if isinstance(obj, TaggedObject):
+        return (
+            type(obj),
+            tuple(_structural_key(getattr(obj, attr, None)) for attr in _structural_attrs(type(obj))),
+        )
+    if isinstance(obj, (list, tuple)):
+        return type(obj), tuple(_structural_key(item) for item in obj)
+    if isinstance(obj, dict):
+        return dict, tuple((k, _structural_key(v)) for k, v in obj.items())
+    return obj
+
+
 class Block:
     """
     Describes an AIL block.
@@ -71,6 +110,16 @@ class Block:
             and all(s1.likes(s2) for s1, s2 in zip(self.statements, other.statements))
         )
 
+    def fingerprint(self) -> tuple:
+        """
+        Get a structural fingerprint of this block. Fingerprints of two blocks compare equal if and only if both blocks
+        have the same address, index, and statements with the same structure (including tags). The fingerprint is a
+        snapshot: modifying a statement in-place after taking the fingerprint changes the fingerprint of the block.
+
+        :return:    The fingerprint of this block.
+        """
+        return self.addr, self.idx, tuple(_structural_key(stmt) for stmt in self.statements)
+
     def clear_hash(self):
         self._hash = None
 
@@ -0,0 +1,219 @@
+from __future__ import annotations
+from typing import Any, TypeVar
+import copy
+import struct
+
+from .expression import (
+    Expression,
+    Const,
+    Tmp,
+    Register,
+    VirtualVariable,
+    UnaryOp,
+    Convert,
+    Reinterpret,
+    BinaryOp,
+    Load,
+    ITE,
+)
+
+
+ExprType = TypeVar("ExprType", bound=Expression)
+
+# for each supported expression class: names of attributes that are compared by value, and names of attributes that
+# hold sub-expressions
+_FIELDS: dict[type[Expression], tuple[tuple[str, ...], tuple[str, ...]]] = {
+    Const: (("bits",), ()),
+    Tmp: (("tmp_idx", "bits"), ()),
+    Register: (("reg_offset", "bits"), ()),
+    VirtualVariable: (("varid", "bits", "category", "oident"), ()),
+    UnaryOp: (("op", "bits"), ("operand",)),
+    Convert: (
+        ("op", "bits", "from_bits", "to_bits", "is_signed", "from_type", "to_type", "rounding_mode"),
+        ("operand",),
+    ),
+    Reinterpret: (("op", "bits", "from_bits", "from_type", "to_bits", "to_type"), ("operand",)),
+    BinaryOp: (
+        ("op", "bits", "signed", "floating_point", "rounding_mode", "vector_count", "vector_size"),
+        ("operands",),
+    ),
+    Load: (("size", "endness", "bits"), ("addr", "guard", "alt")),
+    ITE: (("bits",), ("cond", "iffalse", "iftrue")),
+}
+
+
+class ExpressionFactory:
+    """
+    An optional hash-consing factory for AIL expressions.
+
+    Expressions that are created or interned through the same factory are shared: structurally identical expressions
+    (including their indices, tags, and variables) are represented by the same Python object, which avoids redundant
+    allocations and turns equality checks between them into identity checks.
+
+    Interned expressions are shared between all of their users. They must be treated as immutable; replace them instead
+    of modifying their attributes or tags in place. Expressions that are not supported by the factory, or that carry
+    unhashable tags, are returned as they are.
+    """
+
+    COMMON_CONST_BITS = (1, 8, 16, 32, 64)
+    COMMON_CONST_VALUES = (0, 1)
+
+    __slots__ = (
+        "_table",
+        "hits",
+        "misses",
+    )
+
+    def __init__(self):
+        self._table: dict[tuple, Expression] = {}
+        self.hits: int = 0
+        self.misses: int = 0
+
+        for bits in self.COMMON_CONST_BITS:
+            for value in self.COMMON_CONST_VALUES:
+                self.const(value, bits)
+        self.hits, self.misses = 0, 0
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+    def clear(self) -> None:
+        self._table.clear()
+
+    #
+    # Public methods
+    #
+
+    def const(self, value: float, bits: int, idx: int | None = None, **tags) -> Const:
+        """
+        Get the interned Const expression of the given value and size.
+        """
+        tags_key = self._tags_key(tags)
+        if tags_key is None:
+            return Const(idx, None, value, bits, **tags)
+        key = Const, idx, tags_key, None, 0, (*self._const_value_key(value), bits), ()
+        return self._lookup(key, lambda: Const(idx, None, value, bits, **tags))
+
+    def register(self, reg_offset: int, bits: int, idx: int | None = None, **tags) -> Register:
+        """
+        Get the interned Register expression of the given register offset and size.
+        """
+        tags_key = self._tags_key(tags)
+        if tags_key is None:
+            return Register(idx, None, reg_offset, bits, **tags)
+        key = Register, idx, tags_key, None, 0, (reg_offset, bits), ()
+        return self._lookup(key, lambda: Register(idx, None, reg_offset, bits, **tags))
+
+    def binop(self, op: str, operands, signed: bool = False, idx: int | None = None, **kwargs) -> BinaryOp:
+        """
+        Create a BinaryOp expression, and get its interned version. Operands are interned as well.
+        """
+        return self.intern(BinaryOp(idx, op, [self.intern(operand) for operand in operands], signed, **kwargs))
+
+    def unop(self, op: str, operand: Expression, idx: int | None = None, **kwargs) -> UnaryOp:
+        """
+        Create a UnaryOp expression, and get its interned version. The operand is interned as well.
+        """
+        return self.intern(UnaryOp(idx, op, self.intern(operand), **kwargs))
+
+    def intern(self, expr: ExprType) -> ExprType:
+        """
+        Get the interned version of an expression. All sub-expressions are interned recursively.
+
+        :param expr:    The expression to intern.
+        :return:        An interned expression that is equal to `expr`, or `expr` itself if it cannot be interned.
+        """
+        fields = _FIELDS.get(type(expr))
+        if fields is None:
+            return expr
+        tags_key = self._tags_key(expr._tags)
+        if tags_key is None:
+            return expr
+
+        value_fields, child_fields = fields
+        values = tuple(getattr(expr, field) for field in value_fields)
+        if type(expr) is Const:
+            values = (*self._const_value_key(expr.value), *values)
+
+        # intern all sub-expressions first
+        children: dict[str, Any] = {}
+        child_ids = []
+        for field in child_fields:
+            child = getattr(expr, field)
+            if isinstance(child, list):
+                child = [self.intern(c) for c in child]
+                child_ids.append(tuple(id(c) for c in child))
+            elif isinstance(child, Expression):
+                child = self.intern(child)
+                child_ids.append(id(child))
+            else:
+                child_ids.append(child)
+            children[field] = child
+
+        # sub-expressions are interned and kept alive by the table, so their identities are part of the key
+        key = (
+            type(expr),
+            expr.idx,
+            tags_key,
+            getattr(expr, "variable", None),
+            getattr(expr, "variable_offset", None),
+            values,
+            tuple(child_ids),
+        )
+        return self._lookup(key, lambda: self._with_children(expr, children))
+
+    #
+    # Private methods
+    #
+
+    def _lookup(self, key: tuple, create):
+        try:
+            expr = self._table.get(key)
+        except TypeError:
+            # unhashable attributes
+            return create()
+        if expr is not None:
+            self.hits += 1
+            return expr
+        self.misses += 1
+        expr = create()
+        self._table[key] = expr
+        return expr
+
+    @staticmethod
+    def _const_value_key(value) -> tuple:
+        # floats are compared by their bit patterns: 0.0 == -0.0, and NaN is not equal to itself
+        if type(value) is float:
+            return float, struct.pack("<d", value)
+        return type(value), value
+
+    @staticmethod
+    def _tags_key(tags: dict | None) -> tuple | None:
+        if not tags:
+            return ()
+        key = tuple(sorted(tags.items()))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    @staticmethod
+    def _with_children(expr: Expression, children: dict[str, Any]) -> Expression:
+        unchanged = True
+        for field, child in children.items():
+            old_child = getattr(expr, field)
+            if isinstance(child, list):
+                unchanged = all(c is old_c for c, old_c in zip(child, old_child))
+            else:
+                unchanged = child is old_child
+            if not unchanged:
+                break
+        if unchanged:
+            return expr
+        new_expr = copy.copy(expr)
+        if expr._tags:
+            new_expr._tags = dict(expr._tags)
+        for field, child in children.items():
+            setattr(new_expr, field, child)
+        return new_expr
@@ -1,55 +1,218 @@
 # " pylint:disable=wrong-import-position
 from __future__ import annotations
+from typing import TYPE_CHECKING
+from angr.utils.lazy_import import lazy_attributes
+from .analysis import Analysis, AnalysesHub, register_analysis, default_analyses
 
-from .analysis import Analysis, AnalysesHub, register_analysis
-from .forward_analysis import ForwardAnalysis, visitors
-from .propagator import PropagatorAnalysis
-from .cfg import CFGFast, CFGEmulated, CFG, CFGArchOptions, CFGFastSoot
-from .cdg import CDG
-from .ddg import DDG
-from .vfg import VFG
-from .boyscout import BoyScout
+if TYPE_CHECKING:
+    from .forward_analysis import ForwardAnalysis, visitors
+    from .propagator import PropagatorAnalysis
+    from .cfg import CFGFast, CFGEmulated, CFG, CFGArchOptions, CFGFastSoot
+    from .cdg import CDG
+    from .ddg import DDG
+    from .vfg import VFG
+    from .boyscout import BoyScout
+    from .backward_slice import BackwardSlice
+    from .veritesting import Veritesting
+    from .vsa_ddg import VSA_DDG
+    from .bindiff import BinDiff
+    from .loopfinder import LoopFinder
+    from .congruency_check import CongruencyCheck
+    from .static_hooker import StaticHooker
+    from .reassembler import Reassembler
+    from .binary_optimizer import BinaryOptimizer
+    from .disassembly import Disassembly
+    from .variable_recovery import VariableRecovery, VariableRecoveryFast
+    from .identifier import Identifier
+    from .callee_cleanup_finder import CalleeCleanupFinder
+    from .reaching_definitions import ReachingDefinitionsAnalysis
+    from .calling_convention import CallingConventionAnalysis, FactCollector
+    from .code_tagging import CodeTagging
+    from .stack_pointer_tracker import StackPointerTracker
+    from .dominance_frontier import DominanceFrontier
+    from .data_dep import DataDependencyGraphAnalysis
+    from .decompiler import Decompiler
+    from .soot_class_hierarchy import SootClassHierarchy
+    from .xrefs import XRefsAnalysis
+    from .init_finder import InitializationFinder
+    from .complete_calling_conventions import CompleteCallingConventionsAnalysis
+    from .typehoon import Typehoon
+    from .proximity_graph import ProximityGraphAnalysis
+    from .vtable import VtableFinder
+    from .find_objects_static import StaticObjectFinder
+    from .class_identifier import ClassIdentifier
+    from .flirt import FlirtAnalysis
+    from .s_propagator import SPropagatorAnalysis
+    from .s_reaching_definitions import SReachingDefinitionsAnalysis
+    from .s_liveness import SLivenessAnalysis
+    from .codecave import CodeCaveAnalysis
+    from .patchfinder import PatchFinderAnalysis
+    from .pathfinder import Pathfinder
+    from .smc import SelfModifyingCodeAnalysis
+    from .unpacker import PackingDetector
+    from .fcp import FastConstantPropagation
+    from . import deobfuscator
 
-from .backward_slice import BackwardSlice
-from .veritesting import Veritesting
-from .vsa_ddg import VSA_DDG
-from .bindiff import BinDiff
-from .loopfinder import LoopFinder
-from .congruency_check import CongruencyCheck
-from .static_hooker import StaticHooker
-from .reassembler import Reassembler
-from .binary_optimizer import BinaryOptimizer
-from .disassembly import Disassembly
-from .variable_recovery import VariableRecovery, VariableRecoveryFast
-from .identifier import Identifier
-from .callee_cleanup_finder import CalleeCleanupFinder
-from .reaching_definitions import ReachingDefinitionsAnalysis
-from .calling_convention import CallingConventionAnalysis, FactCollector
-from .code_tagging import CodeTagging
-from .stack_pointer_tracker import StackPointerTracker
-from .dominance_frontier import DominanceFrontier
-from .data_dep import DataDependencyGraphAnalysis
-from .decompiler import Decompiler
-from .soot_class_hierarchy import SootClassHierarchy
-from .xrefs import XRefsAnalysis
-from .init_finder import InitializationFinder
-from .complete_calling_conventions import CompleteCallingConventionsAnalysis
-from .typehoon import Typehoon
-from .proximity_graph import ProximityGraphAnalysis
-from .vtable import VtableFinder
-from .find_objects_static import StaticObjectFinder
-from .class_identifier import ClassIdentifier
-from .flirt import FlirtAnalysis
-from .s_propagator import SPropagatorAnalysis
-from .s_reaching_definitions import SReachingDefinitionsAnalysis
-from .s_liveness import SLivenessAnalysis
-from .codecave import CodeCaveAnalysis
-from .patchfinder import PatchFinderAnalysis
-from .pathfinder import Pathfinder
-from .smc import SelfModifyingCodeAnalysis
-from .unpacker import PackingDetector
-from .fcp import FastConstantPropagation
-from . import deobfuscator
+# Analyses are imported lazily, since importing all of them takes a long time. Each analysis is imported when it is
+# first requested from the analyses hub (e.g., project.analyses.CFGFast), or when its class is accessed as an attribute
+# of this module (e.g., angr.analyses.CFGFast).
+
+# analysis name -> (module, class name)
+_ANALYSES: dict[str, tuple[str, str]] = {
+    "AILBlockSimplifier": ("angr.analyses.decompiler.block_simplifier", "BlockSimplifier"),
+    "AILCallSiteMaker": ("angr.analyses.decompiler.callsite_maker", "CallSiteMaker"),
+    "AILSimplifier": ("angr.analyses.decompiler.ail_simplifier", "AILSimplifier"),
+    "APIObfuscationFinder": ("angr.analyses.deobfuscator.api_obf_finder", "APIObfuscationFinder"),
+    "BackwardSlice": ("angr.analyses.backward_slice", "BackwardSlice"),
+    "BinDiff": ("angr.analyses.bindiff", "BinDiff"),
+    "BinaryOptimizer": ("angr.analyses.binary_optimizer", "BinaryOptimizer"),
+    "BoyScout": ("angr.analyses.boyscout", "BoyScout"),
+    "CDG": ("angr.analyses.cdg", "CDG"),
+    "CFB": ("angr.analyses.cfg.cfb", "CFBlanket"),
+    "CFBlanket": ("angr.analyses.cfg.cfb", "CFBlanket"),
+    "CFG": ("angr.analyses.cfg.cfg", "CFG"),
+    "CFGEmulated": ("angr.analyses.cfg.cfg_emulated", "CFGEmulated"),
+    "CFGFast": ("angr.analyses.cfg.cfg_fast", "CFGFast"),
+    "CFGFastSoot": ("angr.analyses.cfg.cfg_fast_soot", "CFGFastSoot"),
+    "CalleeCleanupFinder": ("angr.analyses.callee_cleanup_finder", "CalleeCleanupFinder"),
+    "CallingConvention": ("angr.analyses.calling_convention.calling_convention", "CallingConventionAnalysis"),
+    "ClassIdentifier": ("angr.analyses.class_identifier", "ClassIdentifier"),
+    "Clinic": ("angr.analyses.decompiler.clinic", "Clinic"),
+    "CodeCaves": ("angr.analyses.codecave", "CodeCaveAnalysis"),
+    "CodeTagging": ("angr.analyses.code_tagging", "CodeTagging"),
+    "CompleteCallingConventions": ("angr.analyses.complete_calling_conventions", "CompleteCallingConventionsAnalysis"),
+    "CongruencyCheck": ("angr.analyses.congruency_check", "CongruencyCheck"),
+    "DDG": ("angr.analyses.ddg", "DDG"),
+    "DataDep": ("angr.analyses.data_dep.data_dependency_analysis", "DataDependencyGraphAnalysis"),
+    "Decompiler": ("angr.analyses.decompiler.decompiler", "Decompiler"),
+    "Disassembly": ("angr.analyses.disassembly", "Disassembly"),
+    "DominanceFrontier": ("angr.analyses.dominance_frontier", "DominanceFrontier"),
+    "FastConstantPropagation": ("angr.analyses.fcp.fcp", "FastConstantPropagation"),
+    "Flirt": ("angr.analyses.flirt.flirt", "FlirtAnalysis"),
+    "FunctionAlignment": ("angr.analyses.patchfinder", "FunctionAlignmentAnalysis"),
+    "FunctionFactCollector": ("angr.analyses.calling_convention.fact_collector", "FactCollector"),
+    "GraphDephication": ("angr.analyses.decompiler.dephication.graph_dephication", "GraphDephication"),
+    "GraphDephicationVVarMapping": (
+        "angr.analyses.decompiler.dephication.graph_vvar_mapping",
+        "GraphDephicationVVarMapping",
+    ),
+    "Identifier": ("angr.analyses.identifier.identify", "Identifier"),
+    "ImportSourceCode": ("angr.analyses.decompiler.structured_codegen.dwarf_import", "ImportSourceCode"),
+    "InitFinder": ("angr.analyses.init_finder", "InitializationFinder"),
+    "InitializationFinder": ("angr.analyses.init_finder", "InitializationFinder"),
+    "LoopAnalysis": ("angr.analyses.loop_analysis", "LoopAnalysis"),
+    "LoopFinder": ("angr.analyses.loopfinder", "LoopFinder"),
+    "ObfuscationDetector": ("angr.analyses.unpacker.obfuscation_detector", "ObfuscationDetector"),
+    "OverlappingFunctions": ("angr.analyses.patchfinder", "OverlappingFunctionsAnalysis"),
+    "PackingDetector": ("angr.analyses.unpacker.packing_detector", "PackingDetector"),
+    "PatchFinder": ("angr.analyses.patchfinder", "PatchFinderAnalysis"),
+    "Pathfinder": ("angr.analyses.pathfinder", "Pathfinder"),
+    "Propagator": ("angr.analyses.propagator.propagator", "PropagatorAnalysis"),
+    "Proximity": ("angr.analyses.proximity_graph", "ProximityGraphAnalysis"),
+    "ReachingDefinitions": ("angr.analyses.reaching_definitions", "ReachingDefinitionsAnalysis"),
+    "Reassembler": ("angr.analyses.reassembler", "Reassembler"),
+    "RecursiveStructurer": ("angr.analyses.decompiler.structuring.recursive_structurer", "RecursiveStructurer"),
+    "RegionIdentifier": ("angr.analyses.decompiler.region_identifier", "RegionIdentifier"),
+    "RegionSimplifier": ("angr.analyses.decompiler.region_simplifiers.region_simplifier", "RegionSimplifier"),
+    "SLiveness": ("angr.analyses.s_liveness", "SLivenessAnalysis"),
+    "SMC": ("angr.analyses.smc", "SelfModifyingCodeAnalysis"),
+    "SPropagator": ("angr.analyses.s_propagator", "SPropagatorAnalysis"),
+    "SReachingDefinitions": (
+        "angr.analyses.s_reaching_definitions.s_reaching_definitions",
+        "SReachingDefinitionsAnalysis",
+    ),
+    "SeqNodeDephication": ("angr.analyses.decompiler.dephication.seqnode_dephication", "SeqNodeDephication"),
+    "SootClassHierarchy": ("angr.analyses.soot_class_hierarchy", "SootClassHierarchy"),
+    "Ssailification": ("angr.analyses.decompiler.ssailification.ssailification", "Ssailification"),
+    "StackPointerTracker": ("angr.analyses.stack_pointer_tracker", "StackPointerTracker"),
+    "StaticHooker": ("angr.analyses.static_hooker", "StaticHooker"),
+    "StaticObjectFinder": ("angr.analyses.find_objects_static", "StaticObjectFinder"),
+    "StringObfuscationFinder": ("angr.analyses.deobfuscator.string_obf_finder", "StringObfuscationFinder"),
+    "StructuredCodeGenerator": ("angr.analyses.decompiler.structured_codegen.c", "StructuredCodeGenerator"),
+    "Typehoon": ("angr.analyses.typehoon.typehoon", "Typehoon"),
+    "VFG": ("angr.analyses.vfg", "VFG"),
+    "VSA_DDG": ("angr.analyses.vsa_ddg", "VSA_DDG"),
+    "VariableRecovery": ("angr.analyses.variable_recovery.variable_recovery", "VariableRecovery"),
+    "VariableRecoveryFast": ("angr.analyses.variable_recovery.variable_recovery_fast", "VariableRecoveryFast"),
+    "Veritesting": ("angr.analyses.veritesting", "Veritesting"),
+    "VtableFinder": ("angr.analyses.vtable", "VtableFinder"),
+    "XRefs": ("angr.analyses.xrefs", "XRefsAnalysis"),
+}
+
+# attribute name -> module
+_LAZY_ATTRIBUTES: dict[str, str] = {
+    "ForwardAnalysis": ".forward_analysis",
+    "visitors": ".forward_analysis",
+    "PropagatorAnalysis": ".propagator",
+    "CFGFast": ".cfg",
+    "CFGEmulated": ".cfg",
+    "CFG": ".cfg",
+    "CFGArchOptions": ".cfg",
+    "CFGFastSoot": ".cfg",
+    "CDG": ".cdg",
+    "DDG": ".ddg",
+    "VFG": ".vfg",
+    "BoyScout": ".boyscout",
+    "BackwardSlice": ".backward_slice",
+    "Veritesting": ".veritesting",
+    "VSA_DDG": ".vsa_ddg",
+    "BinDiff": ".bindiff",
+    "LoopFinder": ".loopfinder",
+    "CongruencyCheck": ".congruency_check",
+    "StaticHooker": ".static_hooker",
+    "Reassembler": ".reassembler",
+    "BinaryOptimizer": ".binary_optimizer",
+    "Disassembly": ".disassembly",
+    "VariableRecovery": ".variable_recovery",
+    "VariableRecoveryFast": ".variable_recovery",
+    "Identifier": ".identifier",
+    "CalleeCleanupFinder": ".callee_cleanup_finder",
+    "ReachingDefinitionsAnalysis": ".reaching_definitions",
+    "CallingConventionAnalysis": ".calling_convention",
+    "FactCollector": ".calling_convention",
+    "CodeTagging": ".code_tagging",
+    "StackPointerTracker": ".stack_pointer_tracker",
+    "DominanceFrontier": ".dominance_frontier",
+    "DataDependencyGraphAnalysis": ".data_dep",
+    "Decompiler": ".decompiler",
+    "SootClassHierarchy": ".soot_class_hierarchy",
+    "XRefsAnalysis": ".xrefs",
+    "InitializationFinder": ".init_finder",
+    "CompleteCallingConventionsAnalysis": ".complete_calling_conventions",
+    "Typehoon": ".typehoon",
+    "ProximityGraphAnalysis": ".proximity_graph",
+    "VtableFinder": ".vtable",
+    "StaticObjectFinder": ".find_objects_static",
+    "ClassIdentifier": ".class_identifier",
+    "FlirtAnalysis": ".flirt",
+    "SPropagatorAnalysis": ".s_propagator",
+    "SReachingDefinitionsAnalysis": ".s_reaching_definitions",
+    "SLivenessAnalysis": ".s_liveness",
+    "CodeCaveAnalysis": ".codecave",
+    "PatchFinderAnalysis": ".patchfinder",
+    "Pathfinder": ".pathfinder",
+    "SelfModifyingCodeAnalysis": ".smc",
+    "PackingDetector": ".unpacker",
+    "FastConstantPropagation": ".fcp",
+}
+
+for _name, (_module_name, _cls_name) in _ANALYSES.items():
+    default_analyses.add_lazy_default_plugin(_name, _module_name, _cls_name)
+del _name, _module_name, _cls_name
+
+
+__getattr__ = lazy_attributes(__name__, _LAZY_ATTRIBUTES)
+
+
+def load_all_analyses() -> None:
+    """
+    Import all analyses.
+    """
+    for name in _ANALYSES:
+        default_analyses.request_plugin(name)
+    for name in _LAZY_ATTRIBUTES:
+        __getattr__(name)
+    __getattr__("deobfuscator")
 
 
 __all__ = (
@@ -108,6 +271,7 @@ __all__ = (
     "VtableFinder",
     "XRefsAnalysis",
     "deobfuscator",
+    "load_all_analyses",
     "register_analysis",
     "visitors",
 )
@@ -17,11 +17,10 @@ import typing
 
 import psutil
 
-from rich import progress
-
 from angr.misc.plugins import PluginVendor, VendorPreset
 from angr.misc import telemetry
 from angr.misc.testing import is_testing
+from angr.utils.lazy_import import lazy_import
 
 if TYPE_CHECKING:
     from angr.knowledge_base import KnowledgeBase
@@ -63,6 +62,9 @@ if TYPE_CHECKING:
 l = logging.getLogger(name=__name__)
 t = telemetry.get_tracer(name=__name__)
 
+# rich.progress is only used when the progress bar is enabled
+progress = lazy_import("rich.progress")
+
 
 class AnalysisLogEntry:
     def __init__(self, message, exc_info=False):
@@ -297,16 +299,6 @@ class Analysis:
     _progressbar = None
     _task = None
 
-    _PROGRESS_WIDGETS = [
-        progress.TaskProgressColumn(),
-        progress.BarColumn(),
-        progress.TextColumn("Elapsed:"),
-        progress.TimeElapsedColumn(),
-        progress.TextColumn("Time:"),
-        progress.TimeRemainingColumn(),
-        progress.TextColumn("{task.description}"),
-    ]
-
     @contextlib.contextmanager
     def _resilience(self, name=None, exception=Exception):
         try:
@@ -330,7 +322,15 @@ class Analysis:
         :return: None
         """
 
-        self._progressbar = progress.Progress(*self._PROGRESS_WIDGETS)
+        self._progressbar = progress.Progress(
+            progress.TaskProgressColumn(),
+            progress.BarColumn(),
+            progress.TextColumn("Elapsed:"),
+            progress.TimeElapsedColumn(),
+            progress.TextColumn("Time:"),
+            progress.TimeRemainingColumn(),
+            progress.TextColumn("{task.description}"),
+        )
         self._task = self._progressbar.add_task(total=100, description="")
 
         self._progressbar.start()
@@ -38,6 +38,7 @@ from .indirect_jump_resolvers.default_resolvers import default_indirect_jump_res
 
 if TYPE_CHECKING:
     from angr.sim_state import SimState
+    from .indirect_jump_resolvers.resolver import IndirectJumpResolver
 
 
 l = logging.getLogger(name=__name__)
@@ -166,16 +167,9 @@ class CFGBase(Analysis):
         self._exec_mem_regions = self._executable_memory_regions(None, self._force_segment)
         self._exec_mem_region_size = sum((end - start) for start, end in self._exec_mem_regions)
 
-        # initialize UnresolvableJumpTarget and UnresolvableCallTarget SimProcedure
-        # but we do not want to hook the same symbol multiple times
-        ut_jump_addr = self.project.loader.extern_object.get_pseudo_addr("UnresolvableJumpTarget")
-        if not self.project.is_hooked(ut_jump_addr):
-            self.project.hook(ut_jump_addr, SIM_PROCEDURES["stubs"]["UnresolvableJumpTarget"]())
-        self._unresolvable_jump_target_addr = ut_jump_addr
-        ut_call_addr = self.project.loader.extern_object.get_pseudo_addr("UnresolvableCallTarget")
-        if not self.project.is_hooked(ut_call_addr):
-            self.project.hook(ut_call_addr, SIM_PROCEDURES["stubs"]["UnresolvableCallTarget"]())
-        self._unresolvable_call_target_addr = ut_call_addr
+        self._unresolvable_jump_target_addr: int
+        self._unresolvable_call_target_addr: int
+        self._hook_unresolvable_targets()
 
         # partially and fully analyzed functions
         # this is implemented as a state machine: jobs (CFGJob instances) of each function are put into
@@ -311,6 +305,23 @@ class CFGBase(Analysis):
     def _function_completed(self, func_addr: int):
         pass
 
+    def _hook_unresolvable_targets(self):
+        """
+        Hook the UnresolvableJumpTarget and UnresolvableCallTarget SimProcedures at their pseudo addresses, unless they
+        are already hooked.
+        """
+
+        # initialize UnresolvableJumpTarget and UnresolvableCallTarget SimProcedure
+        # but we do not want to hook the same symbol multiple times
+        ut_jump_addr = self.project.loader.extern_object.get_pseudo_addr("UnresolvableJumpTarget")
+        if not self.project.is_hooked(ut_jump_addr):
+            self.project.hook(ut_jump_addr, SIM_PROCEDURES["stubs"]["UnresolvableJumpTarget"]())
+        self._unresolvable_jump_target_addr = ut_jump_addr
+        ut_call_addr = self.project.loader.extern_object.get_pseudo_addr("UnresolvableCallTarget")
+        if not self.project.is_hooked(ut_call_addr):
+            self.project.hook(ut_call_addr, SIM_PROCEDURES["stubs"]["UnresolvableCallTarget"]())
+        self._unresolvable_call_target_addr = ut_call_addr
+
     def _post_analysis(self):
         if self._normalize:
             if not self.normalized:
@@ -1516,6 +1527,7 @@ class CFGBase(Analysis):
                     # all nops. mark this function as a function alignment
                     l.debug("Function chunk %#x is probably used as a function alignment (all nops).", func_addr)
                     self.kb.functions[func_addr].is_alignment = True
+                    self.kb.functions[func_addr].mark_dirty()
                     continue
                 node = function.get_node(block.addr)
                 assert node is not None
@@ -1524,6 +1536,7 @@ class CFGBase(Analysis):
                     # self loop. mark this function as a function alignment
                     l.debug("Function chunk %#x is probably used as a function alignment (self-loop).", func_addr)
                     self.kb.functions[func_addr].is_alignment = True
+                    self.kb.functions[func_addr].mark_dirty()
                     continue
 
     def make_functions(self):
@@ -2882,8 +2895,22 @@ class CFGBase(Analysis):
         :return:                    A set of resolved indirect jump targets (ints).
         """
 
-        resolved = False
-        resolved_by = None
+        resolved_by, targets = self._run_indirect_jump_resolvers(jump, func_graph_complete=func_graph_complete)
+        return self._apply_indirect_jump_resolution(jump, resolved_by, targets)
+
+    def _run_indirect_jump_resolvers(
+        self, jump: IndirectJump, func_graph_complete: bool = True
+    ) -> tuple[IndirectJumpResolver | None, list[int] | None]:
+        """
+        Run indirect jump resolvers on a given indirect jump until one of them resolves it. The CFG is not updated,
+        although resolvers may update the IndirectJump instance.
+
+        :param jump:                The IndirectJump instance.
+        :param func_graph_complete: True if the function graph is complete at this point.
+        :return:                    A tuple of the resolver that resolved the indirect jump (or None if no resolver
+                                    resolved it) and the targets that the last resolver returned.
+        """
+
         targets = None
 
         block = self._lift(jump.addr)
@@ -2898,10 +2925,23 @@ class CFGBase(Analysis):
                 self, jump.addr, jump.func_addr, block, jump.jumpkind, func_graph_complete=func_graph_complete
             )
             if resolved:
-                resolved_by = resolver
-                break
+                return resolver, targets
 
-        if resolved:
+        return None, targets
+
+    def _apply_indirect_jump_resolution(
+        self, jump: IndirectJump, resolved_by: IndirectJumpResolver | None, targets: list[int] | None
+    ) -> set:
+        """
+        Update the CFG with the result of resolving an indirect jump.
+
+        :param jump:        The IndirectJump instance.
+        :param resolved_by: The resolver that resolved the indirect jump, or None if it is not resolved.
+        :param targets:     The resolved targets.
+        :return:            A set of resolved indirect jump targets (ints).
+        """
+
+        if resolved_by is not None:
             self._indirect_jump_resolved(jump, jump.addr, resolved_by, targets)
         else:
             self._indirect_jump_unresolved(jump)
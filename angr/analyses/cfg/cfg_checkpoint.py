@@ -0,0 +1,120 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any
+import os
+import pickle
+
+from angr.errors import AngrCFGError
+
+if TYPE_CHECKING:
+    from .cfg_base import CFGBase
+
+
+CHECKPOINT_VERSION = 1
+
+
+def _persistent_objects(cfg: CFGBase) -> dict[tuple, Any]:
+    """
+    Get objects that are not stored in checkpoints, but are referred to by their keys instead. These objects are either
+    recreated when the binary is loaded again, or owned by the analysis that resumes from the checkpoint.
+    """
+
+    loader = cfg.project.loader
+    objects: dict[tuple, Any] = {
+        ("cfg",): cfg,
+        ("project",): cfg.project,
+        ("kb",): cfg.kb,
+        ("arch",): cfg.project.arch,
+        ("loader",): loader,
+        ("memory",): loader.memory,
+    }
+    for idx, obj in enumerate(loader.all_objects):
+        objects[("object", idx)] = obj
+    return objects
+
+
+def _loaded_objects(cfg: CFGBase) -> list[tuple]:
+    """
+    Describe all objects that are loaded, which must not change between saving and loading a checkpoint. Objects that
+    are loaded from streams do not have stable names, so only their types and locations are compared.
+    """
+
+    return [
+        (
+            type(obj).__name__,
+            obj.binary_basename if obj.binary is not None else None,
+            obj.mapped_base,
+            obj.max_addr,
+            obj.sha256,
+        )
+        for obj in cfg.project.loader.all_objects
+    ]
+
+
+class _CheckpointPickler(pickle.Pickler):
+    def __init__(self, file, cfg: CFGBase):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._keys = {id(obj): key for key, obj in _persistent_objects(cfg).items()}
+
+    def persistent_id(self, obj):
+        return self._keys.get(id(obj))
+
+
+class _CheckpointUnpickler(pickle.Unpickler):
+    def __init__(self, file, cfg: CFGBase):
+        super().__init__(file)
+        self._objects = _persistent_objects(cfg)
+
+    def persistent_load(self, pid):
+        try:
+            return self._objects[pid]
+        except KeyError:
+            raise pickle.UnpicklingError(f"Unknown persistent object {pid!r}.") from None
+
+
+def save_cfg_checkpoint(cfg: CFGBase, path: str, state: dict[str, Any]) -> None:
+    """
+    Save the state of a CFG analysis and all knowledge base plugins to a checkpoint file. The file is replaced
+    atomically, so an existing checkpoint is kept intact if saving is interrupted.
+
+    :param cfg:     The CFG analysis.
+    :param path:    Path of the checkpoint file.
+    :param state:   Attributes of the CFG analysis to save.
+    """
+
+    header = {
+        "version": CHECKPOINT_VERSION,
+        "objects": _loaded_objects(cfg),
+    }
+    checkpoint = {
+        "state": state,
+        "kb_plugins": dict(cfg.kb._plugins),
+    }
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        # the header is checked before the rest of the checkpoint is loaded
+        pickle.dump(header, f, protocol=pickle.HIGHEST_PROTOCOL)
+        _CheckpointPickler(f, cfg).dump(checkpoint)
+    os.replace(tmp_path, path)
+
+
+def load_cfg_checkpoint(cfg: CFGBase, path: str) -> dict[str, Any]:
+    """
+    Load a checkpoint file that is saved by save_cfg_checkpoint(). Knowledge base plugins in the checkpoint are registered
+    to the knowledge base of the CFG analysis, replacing existing plugins with the same names.
+
+    :param cfg:     The CFG analysis, whose project must have loaded the same objects as when the checkpoint is saved.
+    :param path:    Path of the checkpoint file.
+    :return:        Attributes of the CFG analysis.
+    """
+
+    with open(path, "rb") as f:
+        header = pickle.load(f)
+        if header.get("version") != CHECKPOINT_VERSION:
+            raise AngrCFGError(f"Unsupported CFG checkpoint version {header.get('version')}.")
+        if header["objects"] != _loaded_objects(cfg):
+            raise AngrCFGError("The CFG checkpoint was saved with a different set of loaded objects.")
+        checkpoint = _CheckpointUnpickler(f, cfg).load()
+
+    for name, plugin in checkpoint["kb_plugins"].items():
+        cfg.kb.register_plugin(name, plugin)
+    return checkpoint["state"]
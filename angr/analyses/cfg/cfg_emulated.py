@@ -1690,6 +1690,7 @@ class CFGEmulated(ForwardAnalysis, CFGBase):  # pylint: disable=abstract-method
                         if current_function is not None:
                             call_site_addr = self._block_id_addr(pe.src_block_id)
                             current_function._call_sites[call_site_addr] = (func.addr, None)
+                            current_function.mark_dirty()
                         else:
                             l.warning(
                                 "An expected function at %#x is not found. Please report it to Fish.",
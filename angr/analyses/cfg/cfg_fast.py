@@ -4,9 +4,15 @@ from typing import TYPE_CHECKING
 import itertools
 import logging
 import math
+import multiprocessing
+import os
 import re
 import string
-from collections import defaultdict, OrderedDict
+import threading
+import time
+from collections import Counter, defaultdict, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from enum import Enum, unique
 
 import networkx
@@ -48,7 +54,10 @@ from angr.analyses import ForwardAnalysis
 from angr.rustylib import SegmentList
 from .cfg_arch_options import CFGArchOptions
 from .cfg_base import CFGBase
+from .cfg_checkpoint import load_cfg_checkpoint, save_cfg_checkpoint
+from .data_scanner import DataScanner
 from .indirect_jump_resolvers.jumptable import JumpTableResolver
+from .prologue_matcher import get_prologue_matcher
 
 if TYPE_CHECKING:
     from angr.block import Block
@@ -543,6 +552,40 @@ class CFGJob:
         )
 
 
+# the CFG and the indirect jumps that a worker process resolves. worker processes are forked, so both are snapshots of
+# the parent process at the time the worker processes are created
+_worker_cfg: CFGFast | None = None
+_worker_jumps: list[IndirectJump] = []
+
+
+def _init_indirect_jump_worker(cfg: CFGFast, jumps: list[IndirectJump]) -> None:
+    global _worker_cfg, _worker_jumps  # pylint:disable=global-statement
+    _worker_cfg = cfg
+    _worker_jumps = jumps
+
+
+def _resolve_indirect_jumps_in_worker(indices: list[int]):
+    """
+    Resolve indirect jumps of one function in a worker process. The result of each indirect jump is applied to the
+    worker's copy of the CFG before the next indirect jump is resolved, so that resolvers see the function in the same
+    state as they do when all indirect jumps are resolved in the current process.
+
+    :param indices: Indices of the indirect jumps in the list of indirect jumps that are being resolved.
+    :return:        A list of tuples of the index of the resolver that resolved the indirect jump (or None), the resolved
+                    targets, and the updated IndirectJump instance.
+    """
+
+    assert _worker_cfg is not None
+    results = []
+    for idx in indices:
+        jump = _worker_jumps[idx]
+        resolved_by, targets = _worker_cfg._run_indirect_jump_resolvers(jump)
+        resolver_idx = None if resolved_by is None else _worker_cfg.indirect_jump_resolvers.index(resolved_by)
+        results.append((resolver_idx, targets, jump))
+        _worker_cfg._apply_indirect_jump_resolution(jump, resolved_by, targets)
+    return results
+
+
 class CFGFast(ForwardAnalysis[CFGNode, CFGNode, CFGJob, int], CFGBase):  # pylint: disable=abstract-method
     """
     We find functions inside the given binary, and build a control-flow graph in very fast manners: instead of
@@ -583,6 +626,31 @@ class CFGFast(ForwardAnalysis[CFGNode, CFGNode, CFGJob, int], CFGBase):  # pylin
 
     tag = "CFGFast"
 
+    # attributes that are not saved in checkpoints. they belong to the current process or the current run
+    _CHECKPOINT_EXCLUDED_ATTRS = frozenset(
+        (
+            "project",
+            "kb",
+            "_fail_fast",
+            "_name",
+            "_progress_callback",
+            "_show_progressbar",
+            "_progressbar",
+            "_task",
+            "_status_callback",
+            "_initial_state",
+            "_ro_region_cdata_cache",
+            "_data_scanner",
+            "_checkpoint",
+            "_checkpoint_interval",
+            "_time_limit",
+            "_start_time",
+            "_last_checkpoint_time",
+            "_resumed_from_checkpoint",
+            "time_limit_reached",
+        )
+    )
+
     def __init__(
         self,
         binary=None,
@@ -622,6 +690,11 @@ class CFGFast(ForwardAnalysis[CFGNode, CFGNode, CFGJob, int], CFGBase):  # pylin
         check_funcret_max_job=500,
         indirect_calls_always_return: bool | None = None,
         jumptable_resolver_resolves_calls: bool | None = None,
+        indirect_jump_workers: int = 0,
+        checkpoint: str | None = None,
+        checkpoint_interval: float = 600.0,
+        time_limit: float | None = None,
+        resume: bool = False,
         start=None,  # deprecated
         end=None,  # deprecated
         collect_data_references=None,  # deprecated
@@ -680,6 +753,29 @@ class CFGFast(ForwardAnalysis[CFGNode, CFGNode, CFGJob, int], CFGBase):  # pylin
                                         table resolver and must be resolved using their specific resolvers. By default,
                                         we will only disable JumpTableResolver from resolving indirect calls for large
                                         binaries (region > 50 KB).
+        :param indirect_jump_workers:   Number of worker processes that resolve indirect jumps. Indirect jumps that are
+                                        pending when the job queue runs empty are resolved in a batch. Each worker
+                                        resolves all indirect jumps of a function against a snapshot of the CFG that is
+                                        taken by forking the current process, and results are fed back in the same
+                                        order as jobs. 0 (the default) resolves indirect jumps in the current process.
+                                        Worker processes are only used on platforms that support forking, when no other
+                                        threads are running, and when all indirect jump resolvers are side-effect free.
+                                        Forking and collecting results costs more than resolving a few jump tables,
+                                        so this only pays off for large binaries with many expensive jump tables
+                                        (e.g., big switch-heavy interpreters or firmware). On typical binaries such as
+                                        /bin/ls, batches hold a handful of cheap indirect jumps and CFG recovery is
+                                        slower with worker processes than without.
+        :param checkpoint:              Path of a checkpoint file. When it is specified, CFGFast periodically saves its
+                                        state during CFG recovery, including the job queue, pending jobs, traced
+                                        addresses, the partial CFG model, and the knowledge base, to this file. The file
+                                        is removed once CFG recovery completes.
+        :param checkpoint_interval:     Number of seconds between two checkpoints.
+        :param time_limit:              Number of seconds after which CFG recovery stops. A checkpoint is saved before
+                                        stopping, and the partial CFG is finalized as if the analysis were aborted. This
+                                        allows splitting CFG recovery into time-boxed slices.
+        :param resume:                  Resume CFG recovery from the checkpoint file if it exists. The project must load
+                                        the same objects as the project that the checkpoint is saved with. All other
+                                        arguments are restored from the checkpoint and ignored.
         :param check_funcret_max_job    When popping return-site jobs out of the job queue, angr will prioritize jobs
                                         for which the callee is known to return. This check may be slow when there are
                                         a large amount of jobs in different caller functions, and this situation often
@@ -701,6 +797,19 @@ class CFGFast(ForwardAnalysis[CFGNode, CFGNode, CFGJob, int], CFGBase):  # pylin
 
         ForwardAnalysis.__init__(self, allow_merging=False)
 
+        self._checkpoint = checkpoint
+        self._checkpoint_interval = checkpoint_interval
+        self._time_limit = time_limit
+        self._start_time = time.monotonic()
+        self._last_checkpoint_time = self._start_time
+        self._resumed_from_checkpoint = False
+        self.time_limit_reached = False
+
+        if resume and checkpoint is not None and os.path.isfile(checkpoint):
+            self._restore_from_checkpoint(checkpoint)
+            self._analyze()
+            return
+
         if start is not None or end is not None:
             l.warning(
                 '"start" and "end" are deprecated and will be removed soon. Please use "regions" to specify one '
@@ -799,6 +908,7 @@ class CFGFast(ForwardAnalysis[CFGNode, CFGNode, CFGJob, int], CFGBase):  # pylin
         self._nodecode_step = nodecode_step
         self._indirect_calls_always_return = indirect_calls_always_return
         self._jumptable_resolver_resolve_calls = jumptable_resolver_resolves_calls
+        self._indirect_jump_workers = indirect_jump_workers
 
         if self._indirect_calls_always_return is None:
             # heuristics
@@ -844,6 +954,9 @@ class CFGFast(ForwardAnalysis[CFGNode, CFGNode, CFGJob, int], CFGBase):  # pylin
         # Create the segment list
         self._seg_list = SegmentList()
 
+        # scans data in memory regions of the loader in bulk. it is created on demand and discarded after analysis
+        self._data_scanner: DataScanner | None = None
+
         self._read_addr_to_run = defaultdict(list)
         self._write_addr_to_run = defaultdict(list)
 
@@ -906,10 +1019,9 @@ class CFGFast(ForwardAnalysis[CFGNode, CFGNode, CFGJob, int], CFGBase):  # pylin
             size = len(data)
 
         data = bytes(pyvex.ffi.buffer(data, size))  # type:ignore
-        for x in range(256):
-            p_x = float(data.count(x)) / size
-            if p_x > 0:
-                entropy += -p_x * math.log2(p_x)
+        for count in Counter(data).values():
+            p_x = float(count) / size
+            entropy += -p_x * math.log2(p_x)
         return entropy
 
     #
@@ -1017,10 +1129,34 @@ class CFGFast(ForwardAnalysis[CFGNode, CFGNode, CFGJob, int], CFGBase):  # pylin
                 return None
         return val
 
+    def _get_data_scanner(self) -> DataScanner:
+        if self._data_scanner is None:
+            self._data_scanner = DataScanner(self, self.PRINTABLES)
+        return self._data_scanner
+
     def _scan_for_printable_strings(self, start_addr):
+        if self._base_state is None:
+            sz_bytes = self._get_data_scanner().printable_string(start_addr)
+        else:
+            sz_bytes = self._scan_for_printable_strings_bytewise(start_addr)
+
+        if sz_bytes:
+            # avoid commonly seen ambiguous cases
+            if is_arm_arch(self.project.arch):
+                # little endian
+                if self.project.arch.memory_endness == Endness.LE and b"\x70\x47" in sz_bytes:  # bx lr
+                    return 0
+                if self.project.arch.memory_endness == Endness.BE and b"\x47\x70" in sz_bytes:  # bx lr
+                    return 0
+            l.debug("Got a string of %d chars", len(sz_bytes))
+            return len(sz_bytes) + 1
+
+        # no string is found
+        return 0
+
+    def _scan_for_printable_strings_bytewise(self, start_addr: int) -> bytes | None:
         addr = start_addr
         sz = []
-        is_sz = True
 
         # Get data until we meet a null-byte
         while self._inside_regions(addr):
@@ -1030,30 +1166,23 @@ class CFGFast(ForwardAnalysis[CFGNode, CFGNode, CFGJob, int], CFGBase):  # pylin
                 break
             if val == 0:
                 if len(sz) < 4:
-                    is_sz = False
+                    return None
                 break
             if val not in self.PRINTABLES:
-                is_sz = False
-                break
+                return None
             sz.append(val)
             addr += 1
 
-        if sz and is_sz:
-            # avoid commonly seen ambiguous cases
-            if is_arm_arch(self.project.arch):
-                # little endian
-                sz_bytes = bytes(sz)
-                if self.project.arch.memory_endness == Endness.LE and b"\x70\x47" in sz_bytes:  # bx lr
-                    return 0
-                if self.project.arch.memory_endness == Endness.BE and b"\x47\x70" in sz_bytes:  # bx lr
-                    return 0
-            l.debug("Got a string of %d chars", len(sz))
-            return len(sz) + 1
-
-        # no string is found
-        return 0
+        return bytes(sz)
 
     def _scan_for_printable_widestrings(self, start_addr: int):
+        if self._base_state is None:
+            length = self._get_data_scanner().printable_widestring_length(start_addr)
+            if length:
+                l.debug("Got a wide-string of %d wide chars", length)
+                return length + 2
+            return 0
+
         addr = start_addr
         sz = []
         is_sz = True
@@ -1096,6 +1225,10 @@ class CFGFast(ForwardAnalysis[CFGNode, CFGNode, CFGJob, int], CFGBase):  # pylin
         :return:                The occurrences of a given byte.
         """
 
+        if self._base_state is None:
+            repeating_length = self._get_data_scanner().repeating_bytes_length(start_addr, repeating_byte)
+            return repeating_length if repeating_length >= threshold else 0
+
         addr = start_addr
 
         repeating_length = 0
@@ -1130,20 +1263,14 @@ class CFGFast(ForwardAnalysis[CFGNode, CFGNode, CFGJob, int], CFGBase):  # pylin
         """
 
         current_object = self.project.loader.find_object_containing(start_addr)
-        addr = start_addr
         pointer_count = 0
-        pointer_size = self.project.arch.bytes
 
-        while self._inside_regions(addr):
-            val = self._fast_memory_load_pointer(addr)
-            if val is None:
-                break
+        for val in self._get_data_scanner().iter_pointers(start_addr):
             obj = self.project.loader.find_object_containing(val)
             if obj is not None and obj is current_object:
                 pointer_count += 1
             else:
                 break
-            addr += pointer_size
 
         if pointer_count >= threshold:
             return pointer_count
@@ -1162,20 +1289,18 @@ class CFGFast(ForwardAnalysis[CFGNode, CFGNode, CFGJob, int], CFGBase):  # pylin
         """
 
         current_object = self.project.loader.find_object_containing(start_addr)
-        addr = start_addr
         ctr = 0
         pointer_count = 0
         pointer_size = self.project.arch.bytes
 
-        while self._inside_regions(addr) and ctr < window:
+        for val in itertools.islice(self._get_data_scanner().iter_pointers(start_addr), window):
             ctr += 1
-            val = self._fast_memory_load_pointer(addr)
-            if val is None:
-                break
             obj = self.project.loader.find_object_containing(val)
             if obj is not None and obj is current_object:
                 pointer_count += 1
-            addr += pointer_size
+        if ctr < window and self._inside_regions(start_addr + ctr * pointer_size):
+            # the pointer at this address cannot be loaded, but it still counts
+            ctr += 1
 
         if pointer_count >= threshold:
             return ctr
@@ -1404,6 +1529,13 @@ class CFGFast(ForwardAnalysis[CFGNode, CFGNode, CFGJob, int], CFGBase):  # pylin
         # Create a read-only memory view in loader for faster data loading
         self.project.loader.gen_ro_memview()
 
+        if self._resumed_from_checkpoint:
+            # everything else has been restored from the checkpoint
+            self._initial_state = self._create_initial_state()
+            self._lifter_register_readonly_regions()
+            self.stage = "Analysis (Stage 1)"
+            return
+
         # Call _initialize_cfg() before self.functions is used.
         self._initialize_cfg()
 
@@ -1430,13 +1562,7 @@ class CFGFast(ForwardAnalysis[CFGNode, CFGNode, CFGJob, int], CFGBase):  # pylin
         self._function_exits: defaultdict[int, set[int]] = defaultdict(set)
 
         # Create an initial state. Store it to self so we can use it globally.
-        self._initial_state = self.project.factory.blank_state(
-            mode="fastpath", add_options={o.SYMBOL_FILL_UNCONSTRAINED_MEMORY, o.SYMBOL_FILL_UNCONSTRAINED_REGISTERS}
-        )
-        initial_options = self._initial_state.options - {o.TRACK_CONSTRAINTS} - o.refs
-        initial_options |= {o.SUPER_FASTPATH}
-        # initial_options.remove(o.COW_STATES)
-        self._initial_state.options = initial_options
+        self._initial_state = self._create_initial_state()
 
         # Process known exception handlings
         if self._use_exceptions:
@@ -1475,7 +1601,8 @@ class CFGFast(ForwardAnalysis[CFGNode, CFGNode, CFGJob, int], CFGBase):  # pylin
             self._remaining_eh_frame_addrs = sorted(self._function_addresses_from_eh_frame)
 
         if self._use_function_prologues and self.project.concrete_target is None:
-            self._remaining_function_prologue_addrs = sorted(self._func_addrs_from_prologues())
+            # in descending order, so that the next address is popped from the end of the list
+            self._remaining_function_prologue_addrs = sorted(self._func_addrs_from_prologues(), reverse=True)
 
         # assumption management
         self._decoding_assumptions: dict[int, DecodingAssumption] = {}
@@ -1488,6 +1615,16 @@ class CFGFast(ForwardAnalysis[CFGNode, CFGNode, CFGJob, int], CFGBase):  # pylin
 
         self.stage = "Analysis (Stage 1)"
 
+    def _create_initial_state(self):
+        state = self.project.factory.blank_state(
+            mode="fastpath", add_options={o.SYMBOL_FILL_UNCONSTRAINED_MEMORY, o.SYMBOL_FILL_UNCONSTRAINED_REGISTERS}
+        )
+        initial_options = state.options - {o.TRACK_CONSTRAINTS} - o.refs
+        initial_options |= {o.SUPER_FASTPATH}
+        # initial_options.remove(o.COW_STATES)
+        state.options = initial_options
+        return state
+
     def _pre_job_handling(self, job: CFGJob):  # pylint:disable=arguments-differ
         """
         Some pre job-processing tasks, like update progress bar.
@@ -1532,7 +1669,19 @@ class CFGFast(ForwardAnalysis[CFGNode, CFGNode, CFGJob, int], CFGBase):  # pylin
             self._update_progress(percentage, text=text, cfg=self)
 
     def _intra_analysis(self):
-        pass
+        if self._checkpoint is None and self._time_limit is None:
+            return
+
+        now = time.monotonic()
+        if self._time_limit is not None and now - self._start_time >= self._time_limit:
+            l.info("CFG recovery reached the time limit of %s seconds.", self._time_limit)
+            if self._checkpoint is not None:
+                self.save_checkpoint()
+            self.time_limit_reached = True
+            self.abort()
+        elif self._checkpoint is not None and now - self._last_checkpoint_time >= self._checkpoint_interval:
+            self.save_checkpoint()
+            self._last_checkpoint_time = time.monotonic()
 
     def _get_successors(self, job: CFGJob) -> list[CFGJob]:  # type: ignore[override] # pylint:disable=arguments-differ
         # current_function_addr = job.func_addr
@@ -1763,8 +1912,7 @@ class CFGFast(ForwardAnalysis[CFGNode, CFGNode, CFGJob, int], CFGBase):  # pylin
 
         if self._use_function_prologues and self._remaining_function_prologue_addrs:
             while self._remaining_function_prologue_addrs:
-                prolog_addr = self._remaining_function_prologue_addrs[0]
-                self._remaining_function_prologue_addrs = self._remaining_function_prologue_addrs[1:]
+                prolog_addr = self._remaining_function_prologue_addrs.pop()
                 if self._seg_list.is_occupied(prolog_addr):
                     continue
 
@@ -1888,6 +2036,8 @@ class CFGFast(ForwardAnalysis[CFGNode, CFGNode, CFGJob, int], CFGBase):  # pylin
 
             for edge in edges_to_remove:
                 f.transition_graph.remove_edge(*edge)
+            if edges_to_remove:
+                f.mark_dirty()
 
             # Clear the cache
             f._local_transition_graph = None
@@ -1943,14 +2093,60 @@ class CFGFast(ForwardAnalysis[CFGNode, CFGNode, CFGJob, int], CFGBase):  # pylin
 
         # drop the read-only memory view in loader
         self.project.loader.discard_ro_memview()
+        self._data_scanner = None
 
         # Clean up
         self._traced_addresses = None  # type: ignore
         self._lifter_deregister_readonly_regions()
         self._function_returns = None
 
+        if self._checkpoint is not None and not self.should_abort and os.path.isfile(self._checkpoint):
+            # CFG recovery has completed, and there is nothing to resume from
+            os.remove(self._checkpoint)
+
         self._finish_progress()
 
+    def _restore_from_checkpoint(self, path: str) -> None:
+        """
+        Restore the state of CFG recovery from a checkpoint file.
+
+        :param path:    Path of the checkpoint file.
+        """
+
+        l.info("Resuming CFG recovery from checkpoint %s.", path)
+        self.__dict__.update(load_cfg_checkpoint(self, path))
+        self._resumed_from_checkpoint = True
+        # per-process states that are not part of the checkpoint
+        self._initial_state = None
+        self._data_scanner = None
+        self._ro_region_cdata_cache = None
+
+        # hooks are installed on the project, which is not part of the checkpoint
+        hooked_addrs = self._unresolvable_jump_target_addr, self._unresolvable_call_target_addr
+        self._hook_unresolvable_targets()
+        if hooked_addrs != (self._unresolvable_jump_target_addr, self._unresolvable_call_target_addr):
+            raise AngrCFGError("The CFG checkpoint was saved with a project that has different pseudo addresses.")
+
+    def save_checkpoint(self, path: str | None = None) -> None:
+        """
+        Save the current state of CFG recovery to a checkpoint file, from which CFG recovery can be resumed by creating
+        CFGFast with `resume=True`. Checkpoints can only be saved between two jobs during CFG recovery, e.g., in a status
+        callback.
+
+        :param path:    Path of the checkpoint file. By default, the path that is passed to CFGFast is used.
+        """
+
+        if path is None:
+            path = self._checkpoint
+        if path is None:
+            raise ValueError("Please specify the path of the checkpoint file.")
+        if self.stage != "Analysis (Stage 1)":
+            raise AngrCFGError("Checkpoints can only be saved during CFG recovery.")
+
+        l.debug("Saving CFG checkpoint to %s.", path)
+        state = {k: v for k, v in self.__dict__.items() if k not in self._CHECKPOINT_EXCLUDED_ATTRS}
+        save_cfg_checkpoint(self, path, state)
+
     def do_full_xrefs(self, overlay_state=None):
         """
         Perform xref recovery on all functions.
@@ -2111,49 +2307,42 @@ class CFGFast(ForwardAnalysis[CFGNode, CFGNode, CFGJob, int], CFGBase):  # pylin
         :return: A list of possible function addresses
         """
 
-        # Pre-compile all regexes
-        regexes = []
+        prologs = []
         if "has_arm_code" not in self._arch_options or self._arch_options["has_arm_code"]:
-            for ins_regex in self.project.arch.function_prologs:
-                r = re.compile(ins_regex)
-                regexes.append(r)
+            prologs.extend(self.project.arch.function_prologs)
         # EDG says: I challenge anyone bothering to read this to come up with a better
         # way to handle CPU modes that affect instruction decoding.
         # Since the only one we care about is ARM/Thumb right now
         # we have this gross hack. Sorry about that.
-        thumb_regexes = []
+        thumb_prologs = []
         if hasattr(self.project.arch, "thumb_prologs"):
-            for ins_regex in self.project.arch.thumb_prologs:
-                # Thumb prologues are found at even addrs, but their actual addr is odd!
-                # Isn't that great?
-                r = re.compile(ins_regex)
-                thumb_regexes.append(r)
+            thumb_prologs.extend(self.project.arch.thumb_prologs)
+        if not prologs and not thumb_prologs:
+            return []
+
+        # all patterns are matched together, and matches are cached per memory region
+        matcher = get_prologue_matcher(prologs + thumb_prologs)
 
-        # Construct the binary blob first
         unassured_functions = []
 
         is_arm = is_arm_arch(self.project.arch)
+        alignment = 4 if is_arm else self.project.arch.instruction_alignment
 
         for start_, bytes_ in self._binary.memory.backers():
-            for regex in regexes:
-                # Match them!
-                for mo in regex.finditer(bytes_):
-                    position = mo.start() + start_
-                    if (not is_arm and position % self.project.arch.instruction_alignment == 0) or (
-                        is_arm and position % 4 == 0
-                    ):
+            for offset, pattern_idx in matcher.find(bytes_):
+                position = offset + start_
+                if pattern_idx < len(prologs):
+                    if position % alignment == 0:
                         mapped_position = AT.from_rva(position, self._binary).to_mva()
                         if self._addr_in_exec_memory_regions(mapped_position):
                             unassured_functions.append(mapped_position)
-            # HACK part 2: Yes, i really have to do this
-            for regex in thumb_regexes:
-                # Match them!
-                for mo in regex.finditer(bytes_):
-                    position = mo.start() + start_
-                    if position % self.project.arch.instruction_alignment == 0:
-                        mapped_position = AT.from_rva(position, self._binary).to_mva()
-                        if self._addr_in_exec_memory_regions(mapped_position):
-                            unassured_functions.append(mapped_position + 1)
+                # HACK part 2: Yes, i really have to do this
+                # Thumb prologues are found at even addrs, but their actual addr is odd!
+                # Isn't that great?
+                elif position % self.project.arch.instruction_alignment == 0:
+                    mapped_position = AT.from_rva(position, self._binary).to_mva()
+                    if self._addr_in_exec_memory_regions(mapped_position):
+                        unassured_functions.append(mapped_position + 1)
 
         l.info("Found %d functions with prologue scanning.", len(unassured_functions))
         return unassured_functions
@@ -3268,6 +3457,76 @@ class CFGFast(ForwardAnalysis[CFGNode, CFGNode, CFGJob, int], CFGBase):  # pylin
 
         return False
 
+    def _process_unresolved_indirect_jumps(self):
+        """
+        Resolve all unresolved indirect jumps found in previous scanning. Indirect jumps are resolved in worker processes
+        if there are more than one of them and worker processes are enabled.
+
+        :return:    A set of concrete indirect jump targets (ints).
+        """
+
+        if (
+            self._indirect_jump_workers <= 0
+            or len(self._indirect_jumps_to_resolve) < 2
+            or "fork" not in multiprocessing.get_all_start_methods()
+            # forking a process that runs multiple threads may deadlock the child process
+            or threading.active_count() > 1
+            # updates that resolvers make to the CFG in worker processes would be lost
+            or not all(resolver.side_effect_free for resolver in self.indirect_jump_resolvers)
+        ):
+            return super()._process_unresolved_indirect_jumps()
+
+        jumps = list(self._indirect_jumps_to_resolve)
+        # resolving an indirect jump only depends on the function that the indirect jump belongs to, so indirect jumps of
+        # different functions are resolved in parallel, and indirect jumps of the same function are resolved in order
+        jumps_by_func: dict[int, list[int]] = defaultdict(list)
+        for idx, jump in enumerate(jumps):
+            jumps_by_func[jump.func_addr].append(idx)
+        if len(jumps_by_func) < 2:
+            return super()._process_unresolved_indirect_jumps()
+
+        l.info(
+            "%d indirect jumps in %d functions to resolve in %d worker processes.",
+            len(jumps),
+            len(jumps_by_func),
+            self._indirect_jump_workers,
+        )
+
+        results = {}
+        try:
+            # resolvers see the CFG as it is now, since worker processes are forked before any result is applied
+            with ProcessPoolExecutor(
+                max_workers=min(self._indirect_jump_workers, len(jumps_by_func)),
+                mp_context=multiprocessing.get_context("fork"),
+                initializer=_init_indirect_jump_worker,
+                initargs=(self, jumps),
+            ) as executor:
+                for indices, func_results in zip(
+                    jumps_by_func.values(),
+                    executor.map(_resolve_indirect_jumps_in_worker, jumps_by_func.values()),
+                ):
+                    results.update(zip(indices, func_results))
+        except BrokenProcessPool:
+            l.warning("A worker process died. Resolving the remaining indirect jumps in the current process.")
+
+        all_targets = set()
+        for idx, jump in enumerate(jumps):
+            if idx not in results:
+                all_targets |= self._process_one_indirect_jump(jump)
+                continue
+            resolver_idx, targets, resolved_jump = results[idx]
+            # copy back what resolvers learned about the indirect jump
+            jump.jumptable = resolved_jump.jumptable
+            jump.jumptables = resolved_jump.jumptables
+            jump.resolved_targets = resolved_jump.resolved_targets
+            jump.type = resolved_jump.type
+            resolved_by = None if resolver_idx is None else self.indirect_jump_resolvers[resolver_idx]
+            all_targets |= self._apply_indirect_jump_resolution(jump, resolved_by, targets)
+
+        self._indirect_jumps_to_resolve.clear()
+
+        return all_targets
+
     def _indirect_jump_resolved(self, jump: IndirectJump, jump_addr, resolved_by, targets: list[int]):
         """
         Called when an indirect jump is successfully resolved.
@@ -0,0 +1,190 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+from collections.abc import Iterator
+import bisect
+import re
+import struct
+
+if TYPE_CHECKING:
+    from .cfg_base import CFGBase
+
+
+# matches a run of repeating bytes
+_REPEATING_BYTES = re.compile(rb"(.)\1*", re.DOTALL)
+
+
+class DataScanner:
+    """
+    Scans data in the memory regions of a CFG in bulk. Memory is loaded once into chunks, where each chunk is a maximal
+    range of consecutive bytes that are both mapped and inside the memory regions of the CFG. Scans then run as regular
+    expression matches and struct unpacking over chunks instead of loading one byte at a time.
+
+    All scans return the same results as their byte-by-byte counterparts in CFGFast.
+    """
+
+    __slots__ = (
+        "_cfg",
+        "_chunk_data",
+        "_chunk_starts",
+        "_printable_run",
+        "_printables",
+        "_wide_printable_run",
+    )
+
+    def __init__(self, cfg: CFGBase, printables: bytes):
+        self._cfg = cfg
+        self._printables = frozenset(printables)
+        char_class = b"[" + b"".join(re.escape(bytes([c])) for c in sorted(self._printables) if c != 0) + b"]"
+        self._printable_run = re.compile(char_class + b"+")
+        self._wide_printable_run = re.compile(b"(?:" + char_class + b"\x00)+")
+        self._chunk_starts: list[int] | None = None
+        self._chunk_data: list[bytes] = []
+
+    def _load_chunks(self) -> None:
+        memory = self._cfg.project.loader.memory
+        self._chunk_starts = []
+
+        # merge adjacent regions, since scanning never stops at the boundary between two adjacent regions
+        runs: list[list[int]] = []
+        for start, end in self._cfg._regions.items():
+            if runs and runs[-1][1] == start:
+                runs[-1][1] = end
+            else:
+                runs.append([start, end])
+
+        for start, end in runs:
+            addr = start
+            while addr < end:
+                try:
+                    data = memory.load(addr, end - addr)
+                except KeyError:
+                    data = b""
+                if data:
+                    self._chunk_starts.append(addr)
+                    self._chunk_data.append(data)
+                    addr += len(data)
+                else:
+                    # skip the unmapped gap
+                    addr = next((s for s, _ in memory.backers(addr) if s > addr), end)
+
+    def _chunk(self, addr: int) -> tuple[bytes, int] | None:
+        """
+        Find the chunk that contains a given address.
+
+        :param addr:    The address.
+        :return:        A tuple of (chunk data, offset of the address in the chunk), or None if the address is not
+                        mapped or not inside any memory region.
+        """
+
+        if self._chunk_starts is None:
+            self._load_chunks()
+            assert self._chunk_starts is not None
+        idx = bisect.bisect_right(self._chunk_starts, addr) - 1
+        if idx < 0:
+            return None
+        data = self._chunk_data[idx]
+        offset = addr - self._chunk_starts[idx]
+        if offset >= len(data):
+            return None
+        return data, offset
+
+    def printable_string(self, addr: int) -> bytes | None:
+        """
+        Find a null-terminated string of printable characters that starts at a given address. A string that runs until
+        the end of the chunk does not need a null terminator.
+
+        :param addr:    The address to start scanning from.
+        :return:        Bytes of the string without the null terminator, or None if there is no string.
+        """
+
+        chunk = self._chunk(addr)
+        if chunk is None:
+            return None
+        data, offset = chunk
+        m = self._printable_run.match(data, offset)
+        if m is None:
+            return None
+        end = m.end()
+        if end < len(data) and (data[end] != 0 or end - offset < 4):
+            return None
+        return data[offset:end]
+
+    def printable_widestring_length(self, addr: int) -> int:
+        """
+        Find a UTF-16 string of printable ASCII characters that starts at a given address.
+
+        :param addr:    The address to start scanning from.
+        :return:        Length of the string in bytes without the null terminator, or 0 if there is no string.
+        """
+
+        chunk = self._chunk(addr)
+        if chunk is None:
+            return 0
+        data, offset = chunk
+        m = self._wide_printable_run.match(data, offset)
+        length = 0 if m is None else m.end() - offset
+
+        # the last code unit may cross the end of the chunk
+        pos = offset + length
+        while pos < len(data):
+            val0 = data[pos]
+            val1 = data[pos + 1] if pos + 1 < len(data) else self._cfg._fast_memory_load_byte(addr + length + 1)
+            if val1 is None:
+                break
+            if val0 == 0 and val1 == 0:
+                return length if length > 10 else 0
+            if val0 != 0 and val1 == 0 and val0 in self._printables:
+                length += 2
+                pos += 2
+                continue
+            return 0
+        return length
+
+    def repeating_bytes_length(self, addr: int, repeating_byte: int | None) -> int:
+        """
+        Count the occurrences of a repeating byte starting at a given address.
+
+        :param addr:            The address to start scanning from.
+        :param repeating_byte:  The repeating byte to scan for; None for the byte at the given address, which is not
+                                counted.
+        :return:                The number of occurrences.
+        """
+
+        chunk = self._chunk(addr)
+        if chunk is None:
+            return 0
+        data, offset = chunk
+        if repeating_byte is not None and data[offset] != repeating_byte:
+            return 0
+        m = _REPEATING_BYTES.match(data, offset)
+        assert m is not None
+        length = m.end() - offset
+        return length if repeating_byte is not None else length - 1
+
+    def iter_pointers(self, addr: int) -> Iterator[int]:
+        """
+        Iterate over consecutive pointers starting at a given address, until a pointer cannot be loaded or the address
+        is no longer inside any memory region.
+
+        :param addr:    The address to start scanning from.
+        :return:        An iterator of pointers.
+        """
+
+        cfg = self._cfg
+        pointer_size = cfg.project.arch.bytes
+        chunk = self._chunk(addr)
+        if chunk is not None:
+            data, offset = chunk
+            count = (len(data) - offset) // pointer_size
+            end = offset + count * pointer_size
+            for (ptr,) in struct.iter_unpack(cfg.project.arch.struct_fmt(), memoryview(data)[offset:end]):
+                yield ptr
+            addr += count * pointer_size
+
+        # the remaining pointers cross the end of the chunk
+        while cfg._inside_regions(addr):
+            ptr = cfg._fast_memory_load_pointer(addr)
+            if ptr is None:
+                return
+            yield ptr
+            addr += pointer_size
@@ -45,6 +45,9 @@ class ConstantResolver(IndirectJumpResolver):
     be resolved to a constant value. This resolver must be run after all other more specific resolvers.
     """
 
+    # propagation results that are cached in the knowledge base are only a cache
+    side_effect_free = True
+
     def __init__(self, project, max_func_nodes: int = 512):
         super().__init__(project, timeless=False)
         self.max_func_nodes = max_func_nodes
@@ -764,6 +764,8 @@ class JumpTableResolver(IndirectJumpResolver):
     table cannot be determined, a *guess* will be made based on how many entries in the table *appear* valid.
     """
 
+    side_effect_free = True
+
     def __init__(self, project, resolve_calls: bool = True):
         super().__init__(project, timeless=False)
 
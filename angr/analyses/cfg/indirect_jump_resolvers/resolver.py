@@ -8,6 +8,11 @@ if typing.TYPE_CHECKING:
 
 
 class IndirectJumpResolver:
+    # True if resolve() does not update the CFG or the knowledge base, except for the IndirectJump instance of the
+    # indirect jump that it resolves and caches. CFGFast only resolves indirect jumps in worker processes if all its
+    # resolvers are side-effect free, since other updates that the resolvers make in worker processes are lost.
+    side_effect_free = False
+
     def __init__(self, project, timeless=False, base_state=None):
         self.project: Project = project
         self.timeless = timeless
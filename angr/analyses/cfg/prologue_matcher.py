@@ -0,0 +1,240 @@
+from __future__ import annotations
+from collections import OrderedDict
+from collections.abc import Iterable
+import hashlib
+import re
+
+try:
+    import re._parser as sre_parse
+except ImportError:  # Python < 3.11
+    import sre_parse  # pylint:disable=deprecated-module
+
+
+# bytes that are too common in binaries to make good anchors
+_COMMON_BYTES = frozenset((0x00, 0xFF))
+
+
+class _AnchoredPattern:
+    """
+    A prologue pattern that contains a run of literal bytes (the anchor) at a bounded distance from the start of every
+    match of the pattern.
+    """
+
+    __slots__ = (
+        "max_offset",
+        "min_offset",
+        "pattern_idx",
+        "preceding_bytes",
+        "regex",
+    )
+
+    def __init__(self, pattern_idx: int, regex: re.Pattern, min_offset: int, max_offset: int, preceding_bytes):
+        self.pattern_idx = pattern_idx
+        self.regex = regex
+        self.min_offset = min_offset
+        self.max_offset = max_offset
+        # bytes that may appear right before the anchor, or None if any byte may appear
+        self.preceding_bytes: frozenset[int] | None = preceding_bytes
+
+
+def _byte_set(item) -> frozenset[int] | None:
+    """
+    Get all bytes that a single-byte regex item matches.
+
+    :return:    A set of bytes, or None if the item is not a single-byte item that can be easily analyzed.
+    """
+
+    op, av = item
+    if op is sre_parse.LITERAL:
+        return frozenset((av,))
+    if op is sre_parse.IN:
+        s = set()
+        for sub_op, sub_av in av:
+            if sub_op is sre_parse.LITERAL:
+                s.add(sub_av)
+            elif sub_op is sre_parse.RANGE:
+                s.update(range(sub_av[0], sub_av[1] + 1))
+            else:
+                return None
+        return frozenset(s)
+    if op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT):
+        min_repeat, _, sub = av
+        if min_repeat >= 1 and len(sub) == 1:
+            return _byte_set(sub[0])
+        return None
+    if op is sre_parse.SUBPATTERN:
+        sub = av[-1]
+        if len(sub) == 1:
+            return _byte_set(sub[0])
+    return None
+
+
+def _find_anchor(pattern: bytes) -> tuple[bytes, int, int, frozenset[int] | None] | None:
+    """
+    Find a run of literal bytes at the top level of a regex pattern that does not start with a literal.
+
+    :param pattern: The regex pattern.
+    :return:        A tuple of (the literal bytes, the minimum and the maximum offset of the literal bytes from the start
+                    of a match, bytes that may appear right before the literal bytes), or None if the pattern does not
+                    have such a run.
+    """
+
+    parsed = sre_parse.parse(pattern)
+    if parsed.state.flags & (re.IGNORECASE | re.LOCALE | re.MULTILINE):
+        return None
+    items = list(parsed)
+    if items and items[0][0] is sre_parse.LITERAL:
+        # the regex engine already searches for literal prefixes quickly
+        return None
+
+    # pick the run of literals with the most uncommon bytes, then the longest one
+    best = None
+    best_score = None
+    i = 0
+    while i < len(items):
+        if items[i][0] is not sre_parse.LITERAL:
+            i += 1
+            continue
+        j = i
+        while j < len(items) and items[j][0] is sre_parse.LITERAL:
+            j += 1
+        literal = bytes(av for _, av in items[i:j])
+        score = sum(1 for b in literal if b not in _COMMON_BYTES), len(literal)
+        if best_score is None or score > best_score:
+            best, best_score = (i, literal), score
+        i = j
+
+    if best is None or best_score[0] == 0:
+        return None
+    i, literal = best
+    min_offset, max_offset = sre_parse.SubPattern(parsed.state, items[:i]).getwidth()
+    if max_offset >= sre_parse.MAXREPEAT:
+        return None
+    preceding_bytes = _byte_set(items[i - 1]) if i > 0 else None
+    return literal, min_offset, max_offset, preceding_bytes
+
+
+class PrologueMatcher:
+    """
+    Matches a set of function prologue patterns (regexes) against a memory region.
+
+    The regex engine scans quickly for patterns that start with literal bytes, but tries every position of the region
+    for patterns that start with a character class or a wildcard. Each of the latter patterns is anchored on a run of
+    literal bytes that appears at a bounded distance from the start of every match of the pattern. The anchors of all
+    patterns are searched for together in a single pass, and patterns are only matched at the few positions where their
+    anchors appear. The remaining patterns are matched against the entire region with finditer(). Matches are the same
+    as what finditer() of each pattern reports, including that matches of the same pattern do not overlap.
+
+    Matches are cached by the SHA-256 hash of the memory region, so scanning the same binary again is cheap.
+    """
+
+    __slots__ = (
+        "_anchor_groups",
+        "_anchor_search",
+        "_cache",
+        "_unanchored",
+    )
+
+    MAX_CACHED_REGIONS = 16
+
+    def __init__(self, patterns: Iterable[bytes]):
+        self._unanchored: list[tuple[int, re.Pattern]] = []
+        anchored: dict[bytes, list[_AnchoredPattern]] = {}
+        for idx, pattern in enumerate(patterns):
+            regex = re.compile(pattern)
+            anchor = _find_anchor(pattern)
+            if anchor is None:
+                self._unanchored.append((idx, regex))
+            else:
+                literal, min_offset, max_offset, preceding_bytes = anchor
+                anchored.setdefault(literal, []).append(
+                    _AnchoredPattern(idx, regex, min_offset, max_offset, preceding_bytes)
+                )
+
+        # longer anchors come first, so that an anchor is never hidden behind its own prefix in the alternation
+        anchors = sorted(anchored, key=len, reverse=True)
+        self._anchor_groups: list[tuple[bytes, list[_AnchoredPattern]]] = [(a, anchored[a]) for a in anchors]
+        self._anchor_search = re.compile(b"|".join(re.escape(a) for a in anchors)).search if anchors else None
+        self._cache: OrderedDict[bytes, list[tuple[int, int]]] = OrderedDict()
+
+    def find(self, data: bytes | bytearray | memoryview, cache: bool = True) -> list[tuple[int, int]]:
+        """
+        Find all matches of all patterns in a memory region.
+
+        :param data:    Content of the memory region.
+        :param cache:   Whether to look up and store matches in the cache or not.
+        :return:        A list of (offset of the match, index of the pattern) tuples, sorted by offsets and then indices
+                        of patterns.
+        """
+
+        if not cache:
+            return self._find(data)
+
+        key = hashlib.sha256(data).digest()
+        matches = self._cache.get(key)
+        if matches is None:
+            matches = self._find(data)
+            self._cache[key] = matches
+            if len(self._cache) > self.MAX_CACHED_REGIONS:
+                self._cache.popitem(last=False)
+        else:
+            self._cache.move_to_end(key)
+        return list(matches)
+
+    def _find(self, data) -> list[tuple[int, int]]:
+        matches = []
+        for idx, regex in self._unanchored:
+            matches.extend((mo.start(), idx) for mo in regex.finditer(data))
+
+        if self._anchor_search is not None:
+            # the offset where the next match of each pattern may start, since matches of a pattern do not overlap
+            next_start: dict[int, int] = {}
+            search = self._anchor_search
+            pos = 0
+            while True:
+                mo = search(data, pos)
+                if mo is None:
+                    break
+                anchor_pos = mo.start()
+                for anchor, patterns in self._anchor_groups:
+                    if not data.startswith(anchor, anchor_pos):
+                        continue
+                    for p in patterns:
+                        if (
+                            p.preceding_bytes is not None
+                            and anchor_pos > 0
+                            and data[anchor_pos - 1] not in p.preceding_bytes
+                        ):
+                            continue
+                        # the leftmost position where a match that contains this anchor may start
+                        start = max(anchor_pos - p.max_offset, next_start.get(p.pattern_idx, 0))
+                        for match_start in range(start, anchor_pos - p.min_offset + 1):
+                            m = p.regex.match(data, match_start)
+                            if m is not None:
+                                matches.append((match_start, p.pattern_idx))
+                                next_start[p.pattern_idx] = max(m.end(), match_start + 1)
+                                break
+                pos = anchor_pos + 1
+
+        matches.sort()
+        return matches
+
+
+# compiled matchers of each set of patterns
+_matchers: dict[tuple[bytes, ...], PrologueMatcher] = {}
+
+
+def get_prologue_matcher(patterns: Iterable[bytes]) -> PrologueMatcher:
+    """
+    Get a compiled matcher of a set of prologue patterns. Matchers are shared by all CFGs that use the same patterns.
+
+    :param patterns:    The prologue patterns.
+    :return:            The matcher.
+    """
+
+    patterns = tuple(patterns)
+    matcher = _matchers.get(patterns)
+    if matcher is None:
+        matcher = PrologueMatcher(patterns)
+        _matchers[patterns] = matcher
+    return matcher
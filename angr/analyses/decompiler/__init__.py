@@ -5,6 +5,7 @@ from .structured_codegen import CStructuredCodeGenerator, ImportSourceCode
 from .clinic import Clinic
 from .region_simplifiers import RegionSimplifier
 from .decompiler import Decompiler
+from .decompilation_budget import DecompilationBudget
 from .decompilation_options import options, options_by_category
 from .block_simplifier import BlockSimplifier
 from .callsite_maker import CallSiteMaker
@@ -26,6 +27,7 @@ __all__ = (
     "CStructuredCodeGenerator",
     "CallSiteMaker",
     "Clinic",
+    "DecompilationBudget",
     "Decompiler",
     "GraphDephication",
     "ImportSourceCode",
@@ -39,3 +41,7 @@ __all__ = (
     "options_by_category",
     "structuring",
 )
+
+# analyses are imported lazily. the deobfuscator registers its optimization passes into decompilation presets, so it must
+# be imported together with the decompiler
+from angr.analyses import deobfuscator  # noqa:F401 pylint:disable=wrong-import-position,unused-import
@@ -44,6 +44,7 @@ from .ssailification.ssailification import Ssailification
 from .stack_item import StackItem, StackItemType
 from .return_maker import ReturnMaker
 from .ailgraph_walker import AILGraphWalker, RemoveNodeNotice
+from .utils import ail_graph_fingerprint
 from .optimization_passes import (
     OptimizationPassStage,
     RegisterSaveAreaSimplifier,
@@ -56,6 +57,7 @@ from .optimization_passes import (
 if TYPE_CHECKING:
     from angr.knowledge_plugins.cfg import CFGModel
     from .notes import DecompilationNote
+    from .decompilation_budget import DecompilationBudget
     from .decompilation_cache import DecompilationCache
     from .peephole_optimizations import PeepholeOptimizationStmtBase, PeepholeOptimizationExprBase
 
@@ -151,6 +153,7 @@ class Clinic(Analysis):
         arg_vvars: dict[int, tuple[ailment.Expr.VirtualVariable, SimVariable]] | None = None,
         start_stage: ClinicStage | None = ClinicStage.INITIALIZATION,
         notes: dict[str, DecompilationNote] | None = None,
+        budget: DecompilationBudget | None = None,
     ):
         if not func.normalized and mode == ClinicMode.DECOMPILE:
             raise ValueError("Decompilation must work on normalized function graphs.")
@@ -197,6 +200,7 @@ class Clinic(Analysis):
         self.secondary_stackvars: set[int] = set()
 
         self.notes = notes if notes is not None else {}
+        self._budget = budget
 
         #
         # intermediate variables used during decompilation
@@ -206,6 +210,12 @@ class Clinic(Analysis):
         self._spt = None
         # cached block-level reaching definition analysis results and propagator results
         self._block_simplification_cache: dict[ailment.Block, NamedTuple] | None = {}
+        # fingerprints of blocks and of the AIL graph right after they were last simplified, together with the
+        # simplification parameters. simplifying them again with the same parameters is skipped if they did not change.
+        self._simplified_block_fingerprints: dict[tuple[int, int | None], tuple[tuple, tuple]] = {}
+        self._simplified_graph_fingerprint: tuple[tuple, tuple] | None = None
+        self.skipped_block_simplifications: int = 0
+        self.skipped_function_simplifications: int = 0
         self._preserve_vvar_ids: set[int] = set()
         self._type_hints: list[tuple[atoms.VirtualVariable | atoms.MemoryLocation, str]] = []
 
@@ -1364,8 +1374,20 @@ class Clinic(Analysis):
         """
 
         blocks_by_addr_and_idx: dict[tuple[int, int | None], ailment.Block] = {}
+        params = (
+            stack_pointer_tracker,
+            set(preserve_vvar_ids) if preserve_vvar_ids is not None else None,
+            list(type_hints) if type_hints is not None else None,
+        )
 
         for ail_block in ail_graph.nodes():
+            key = ail_block.addr, ail_block.idx
+            fingerprint = ail_block.fingerprint()
+            # block simplification runs until a fixed point is reached. if the block did not change since it was last
+            # simplified with the same parameters, simplifying it again will not change anything
+            if self._simplified_block_fingerprints.get(key, None) == (params, fingerprint):
+                self.skipped_block_simplifications += 1
+                continue
             simplified = self._simplify_block(
                 ail_block,
                 stack_pointer_tracker=stack_pointer_tracker,
@@ -1373,8 +1395,8 @@ class Clinic(Analysis):
                 preserve_vvar_ids=preserve_vvar_ids,
                 type_hints=type_hints,
             )
-            key = ail_block.addr, ail_block.idx
             blocks_by_addr_and_idx[key] = simplified
+            self._simplified_block_fingerprints[key] = params, simplified.fingerprint()
 
         # update blocks_map to allow node_addr to node lookup
         def _replace_node_handler(node):
@@ -1451,6 +1473,29 @@ class Clinic(Analysis):
         Simplify the entire function until it reaches a fixed point.
         """
 
+        params = (
+            remove_dead_memdefs,
+            stack_arg_offsets,
+            unify_variables,
+            narrow_expressions,
+            only_consts,
+            fold_callexprs_into_conditions,
+            rewrite_ccalls,
+            set(removed_vvar_ids) if removed_vvar_ids is not None else None,
+            dict(arg_vvars) if arg_vvars is not None else None,
+            set(preserve_vvar_ids) if preserve_vvar_ids is not None else None,
+            set(self.secondary_stackvars),
+            self._register_save_areas_removed,
+        )
+        if self._simplified_graph_fingerprint is not None and self._simplified_graph_fingerprint == (
+            params,
+            ail_graph_fingerprint(ail_graph),
+        ):
+            # the graph did not change since it was last simplified with the same parameters
+            self.skipped_function_simplifications += 1
+            return
+
+        self._simplified_graph_fingerprint = None
         for idx in range(max_iterations):
             simplified = self._simplify_function_once(
                 ail_graph,
@@ -1467,6 +1512,10 @@ class Clinic(Analysis):
                 preserve_vvar_ids=preserve_vvar_ids,
             )
             if not simplified:
+                if idx == 0 or not narrow_expressions:
+                    # the last round ran with the same parameters as the first round of any future call would. it is a
+                    # fixed point unless the graph changes
+                    self._simplified_graph_fingerprint = params, ail_graph_fingerprint(ail_graph)
                 break
 
     @timethis
@@ -1539,6 +1588,8 @@ class Clinic(Analysis):
         for pass_ in self._optimization_passes:
             if stage != pass_.STAGE:
                 continue
+            if self._budget is not None and self._budget.should_skip_pass(pass_):
+                continue
 
             if pass_ in DUPLICATING_OPTS + CONDENSING_OPTS and self.unoptimized_graph is None:
                 # we should save a copy at the first time any optimization that could alter the structure
@@ -1560,6 +1611,7 @@ class Clinic(Analysis):
                 complete_successors=self._complete_successors,
                 stack_pointer_tracker=stack_pointer_tracker,
                 notes=self.notes,
+                budget=self._budget,
                 **kwargs,
             )
             if a.out_graph:
@@ -1826,6 +1878,7 @@ class Clinic(Analysis):
         # variable recovery
         tmp_kb = KnowledgeBase(self.project) if self.variable_kb is None else self.variable_kb
         tmp_kb.functions = self.kb.functions
+        tmp_kb.lifted_prototypes = self.kb.lifted_prototypes
         vr = self.project.analyses.VariableRecoveryFast(
             self.function,  # pylint:disable=unused-variable
             fail_fast=self._fail_fast,  # type:ignore
@@ -5,6 +5,7 @@ from collections.abc import Callable
 from collections.abc import Generator
 import operator
 import logging
+import weakref
 
 import angr.ailment as ailment
 import claripy
@@ -15,6 +16,7 @@ from unique_log_filter import UniqueLogFilter
 from angr.utils.graph import GraphUtils
 from angr.utils.graph import dominates, inverted_idoms
 from angr.utils.ail import is_head_controlled_loop_block
+from angr.utils.bool_minimizer import full_table, variable_table, minimize
 from angr.block import Block, BlockNode
 from angr.errors import AngrRuntimeError
 from .peephole_optimizations import InvertNegatedLogicalConjunctionsAndDisjunctions, RemoveRedundantNots
@@ -39,6 +41,13 @@ from .utils import peephole_optimize_expr
 l = logging.getLogger(__name__)
 l.addFilter(UniqueLogFilter())
 
+# least-recently-used memo of simplified conditions, keyed by the structural hash of conditions and the limits. only
+# weak references to conditions and their simplified forms are kept, so the memo does not keep ASTs alive
+_SIMPLIFIED_CONDITIONS: OrderedDict[
+    tuple[int, int, int], tuple[weakref.ref[claripy.ast.Bool], weakref.ref[claripy.ast.Bool]]
+] = OrderedDict()
+_SIMPLIFIED_CONDITIONS_MAX_SIZE = 4096
+
 
 _UNIFIABLE_COMPARISONS = {
     "__ne__",
@@ -1030,15 +1039,132 @@ class ConditionProcessor:
         raise AngrRuntimeError("Unreachable reached")
 
     @staticmethod
-    def simplify_condition(cond, depth_limit=8, variables_limit=8):
-
-        import sympy  # pylint:disable=import-outside-toplevel
+    def simplify_condition(cond, depth_limit: int = 8, variables_limit: int = 8, primes_limit: int = 256):
+        """
+        Simplify a boolean condition into a minimal sum-of-products or product-of-sums form, whichever is smaller.
+        Comparisons and other non-boolean sub-expressions are treated as opaque boolean variables. Results are memoized
+        in a bounded least-recently-used memo for as long as both the condition and its simplified form are alive.
+
+        :param cond:            The condition to simplify.
+        :param depth_limit:     Do not simplify the condition if it is deeper than this limit.
+        :param variables_limit: Do not simplify the condition if it has more variables or more boolean variables than
+                                this limit.
+        :param primes_limit:    Do not simplify the condition if it or its negation has more prime implicants than this
+                                limit.
+        :return:                The simplified condition, or the original condition if it cannot be simplified.
+        """
 
-        memo = {}
         if cond.depth > depth_limit or len(cond.variables) > variables_limit:
             return cond
-        sympy_expr = ConditionProcessor.claripy_ast_to_sympy_expr(cond, memo=memo)
-        return ConditionProcessor.sympy_expr_to_claripy_ast(sympy.simplify_logic(sympy_expr, deep=False), memo)
+
+        key = cond.hash(), variables_limit, primes_limit
+        cached = _SIMPLIFIED_CONDITIONS.get(key)
+        if cached is not None and cached[0]() is cond:
+            simplified = cached[1]()
+            if simplified is not None:
+                _SIMPLIFIED_CONDITIONS.move_to_end(key)
+                return simplified
+
+        simplified = ConditionProcessor._minimize_condition(cond, variables_limit, primes_limit)
+        _SIMPLIFIED_CONDITIONS[key] = weakref.ref(cond), weakref.ref(simplified)
+        _SIMPLIFIED_CONDITIONS.move_to_end(key)
+        if len(_SIMPLIFIED_CONDITIONS) > _SIMPLIFIED_CONDITIONS_MAX_SIZE:
+            # evict the least recently used entry
+            _SIMPLIFIED_CONDITIONS.popitem(last=False)
+        return simplified
+
+    @staticmethod
+    def _condition_atom(ast) -> tuple[Any, bool]:
+        """
+        Get the boolean variable that a non-boolean-operator AST represents, and whether the variable is negated.
+        """
+        if ast.op in _UNIFIABLE_COMPARISONS:
+            # unify comparisons to enable more simplification opportunities
+            inverse_op = getattr(ast.args[0], _INVERSE_OPERATIONS[ast.op])
+            return inverse_op(ast.args[1]), True
+        return ast, False
+
+    @staticmethod
+    def _minimize_condition(cond, variables_limit: int, primes_limit: int):
+        # collect boolean variables in the order of their first appearance
+        atoms: dict[int, tuple[int, Any]] = {}
+        leaves = 0
+        stack = [cond]
+        while stack:
+            ast = stack.pop()
+            if ast.op in {"And", "Or", "Not"}:
+                stack.extend(reversed(ast.args))
+            elif ast.op != "BoolV":
+                leaves += 1
+                atom, _ = ConditionProcessor._condition_atom(ast)
+                if atom.hash() not in atoms:
+                    if len(atoms) >= variables_limit:
+                        return cond
+                    atoms[atom.hash()] = len(atoms), atom
+
+        num_vars = len(atoms)
+        full = full_table(num_vars)
+        columns = [variable_table(i, num_vars) for i in range(num_vars)]
+        tables: dict[int, int] = {}
+
+        def _truth_table(ast) -> int:
+            h = ast.hash()
+            if h in tables:
+                return tables[h]
+            if ast.op == "And":
+                table = full
+                for arg in ast.args:
+                    table &= _truth_table(arg)
+            elif ast.op == "Or":
+                table = 0
+                for arg in ast.args:
+                    table |= _truth_table(arg)
+            elif ast.op == "Not":
+                table = full ^ _truth_table(ast.args[0])
+            elif ast.op == "BoolV":
+                table = full if ast.args[0] else 0
+            else:
+                atom, negated = ConditionProcessor._condition_atom(ast)
+                table = columns[atoms[atom.hash()][0]]
+                if negated:
+                    table ^= full
+            tables[h] = table
+            return table
+
+        table = _truth_table(cond)
+        if table == 0:
+            return claripy.false()
+        if table == full:
+            return claripy.true()
+
+        minimized = minimize(table, num_vars, primes_limit=primes_limit)
+        if minimized is None:
+            return cond
+        is_sop, cubes = minimized
+        if sum(care.bit_count() for care, _ in cubes) > leaves:
+            # the two-level form is larger than the original condition
+            return cond
+
+        variables = [atom for _, atom in atoms.values()]
+
+        def _cube_literals(care: int, value: int, negate: bool) -> list:
+            literals = []
+            for i in range(care.bit_length()):
+                if (care >> i) & 1:
+                    positive = bool((value >> i) & 1) != negate
+                    literals.append(variables[i] if positive else claripy.Not(variables[i]))
+            return literals
+
+        terms = []
+        for care, value in cubes:
+            literals = _cube_literals(care, value, not is_sop)
+            if len(literals) == 1:
+                terms.append(literals[0])
+            else:
+                terms.append(claripy.And(*literals) if is_sop else claripy.Or(*literals))
+        if len(terms) == 1:
+            return terms[0]
+        return claripy.Or(*terms) if is_sop else claripy.And(*terms)
 
     @staticmethod
     def _simplify_trivial_cases(cond):
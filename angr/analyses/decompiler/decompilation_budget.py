@@ -0,0 +1,95 @@
+# pylint:disable=import-outside-toplevel
+from __future__ import annotations
+from collections.abc import Callable
+import logging
+import time
+
+
+_l = logging.getLogger(name=__name__)
+
+
+class DecompilationBudget:
+    """
+    A time budget for a single decompilation request.
+
+    Expensive stages of the decompiler (optimization passes, structuring, structuring-based deoptimizations) check the
+    remaining budget before doing more work. Once the budget is exhausted, these stages do not abort. Instead, they fall
+    back to cheaper strategies (e.g., skipping optional optimization passes or structuring with gotos), so that a
+    decompilation result is always produced within a predictable amount of time.
+
+    Each fallback is recorded in `degradations` so that users can tell which parts of the output may be of lower quality.
+    """
+
+    __slots__ = (
+        "_clock",
+        "deadline",
+        "degradations",
+        "timeout",
+    )
+
+    def __init__(
+        self,
+        timeout: float | None = None,
+        deadline: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        :param timeout:     Number of seconds allowed for this decompilation request, starting from now.
+        :param deadline:    An absolute deadline, in the time of `clock`. The earlier of `timeout` and `deadline` is
+                            used when both are specified.
+        :param clock:       The clock to use. Defaults to time.monotonic.
+        """
+
+        self._clock = clock
+        self.timeout = timeout
+        if timeout is not None:
+            deadline = clock() + timeout if deadline is None else min(deadline, clock() + timeout)
+        self.deadline: float | None = deadline
+        self.degradations: list[tuple[str, str]] = []
+
+    def __repr__(self):
+        remaining = self.remaining
+        if remaining is None:
+            return "<DecompilationBudget unlimited>"
+        return f"<DecompilationBudget {remaining:.2f}s remaining>"
+
+    @property
+    def remaining(self) -> float | None:
+        """
+        Number of seconds remaining in this budget, or None if the budget is unlimited.
+        """
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - self._clock())
+
+    @property
+    def expired(self) -> bool:
+        return self.deadline is not None and self._clock() >= self.deadline
+
+    def degrade(self, stage: str, reason: str) -> None:
+        """
+        Record that a stage fell back to a cheaper strategy because the budget is exhausted.
+
+        :param stage:   Name of the stage.
+        :param reason:  A human-readable description of what was skipped or simplified.
+        """
+        _l.debug("Decompilation budget exhausted in %s: %s", stage, reason)
+        self.degradations.append((stage, reason))
+
+    def should_skip_pass(self, pass_cls) -> bool:
+        """
+        Determine if an optimization pass should be skipped. Once the budget is exhausted, only the optimization passes
+        in the "basic" decompilation preset are considered essential; all other optimization passes are skipped.
+
+        :param pass_cls:    The class of the optimization pass.
+        :return:            True if the optimization pass should be skipped, False otherwise.
+        """
+        if not self.expired:
+            return False
+
+        from .presets import DECOMPILATION_PRESETS
+
+        if pass_cls in DECOMPILATION_PRESETS["basic"].opt_passes:
+            return False
+        self.degrade(pass_cls.__name__, "Skipped optional optimization pass")
+        return True
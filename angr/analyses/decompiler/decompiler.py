@@ -23,11 +23,12 @@ from .ailgraph_walker import AILGraphWalker
 from .condition_processor import ConditionProcessor
 from .decompilation_options import DecompilationOption, PARAM_TO_OPTION
 from .decompilation_cache import DecompilationCache
+from .decompilation_budget import DecompilationBudget
 from .utils import remove_edges_in_ailgraph
 from .sequence_walker import SequenceWalker
 from .structuring.structurer_nodes import SequenceNode
 from .presets import DECOMPILATION_PRESETS, DecompilationPreset
-from .notes import DecompilationNote
+from .notes import DecompilationNote, DecompilationNoteLevel
 
 if TYPE_CHECKING:
     from angr.knowledge_plugins.cfg.cfg_model import CFGModel
@@ -76,7 +77,14 @@ class Decompiler(Analysis):
         clinic_graph=None,
         clinic_arg_vvars=None,
         clinic_start_stage=None,
+        timeout: float | None = None,
+        budget: DecompilationBudget | None = None,
     ):
+        """
+        :param timeout:     Number of seconds allowed for decompiling this function. Once it is exceeded, expensive
+                            stages fall back to cheaper strategies instead of aborting. None means no limit.
+        :param budget:      A DecompilationBudget instance to use instead of creating one from `timeout`.
+        """
         if not isinstance(func, Function):
             func = self.kb.functions[func]
         self.func: Function = func
@@ -147,6 +155,9 @@ class Decompiler(Analysis):
         self._optimization_scratch: dict[str, Any] = {}
         self.expr_collapse_depth = expr_collapse_depth
         self.notes: dict[str, DecompilationNote] = {}
+        self.budget: DecompilationBudget | None = (
+            budget if budget is not None else DecompilationBudget(timeout) if timeout is not None else None
+        )
 
         if decompile:
             with self._resilience():
@@ -165,6 +176,13 @@ class Decompiler(Analysis):
                         self._decompile()
                         for error in self.errors:
                             self.kb.decompilations[(self.func.addr, self._flavor)].errors.append(error.format())
+            if self.budget is not None and self.budget.degradations:
+                self.notes["decompilation_budget"] = DecompilationNote(
+                    "decompilation_budget",
+                    "Decompilation budget exhausted",
+                    "\n".join(f"{stage}: {reason}" for stage, reason in self.budget.degradations),
+                    level=DecompilationNoteLevel.WARNING,
+                )
 
     def _can_use_decompilation_cache(self, cache: DecompilationCache) -> bool:
         if self._cache_parameters is None or cache.parameters is None:
@@ -285,6 +303,7 @@ class Decompiler(Analysis):
                 arg_vvars=self._clinic_arg_vvars,
                 start_stage=self._clinic_start_stage,
                 notes=self.notes,
+                budget=self.budget,
                 **self.options_to_params(self.options_by_class["clinic"]),
             )
         else:
@@ -354,6 +373,7 @@ class Decompiler(Analysis):
                 ri.region,
                 cond_proc=cond_proc,
                 func=self.func,
+                budget=self.budget,
                 **self._recursive_structurer_params,
             )
             self._update_progress(80.0, text="Simplifying regions")
@@ -454,6 +474,8 @@ class Decompiler(Analysis):
                     self._recursive_structurer_params["structurer_cls"].NAME,
                 )
                 continue
+            if self.budget is not None and self.budget.should_skip_pass(pass_):
+                continue
 
             pass_ = timethis(pass_)
             a = pass_(
@@ -515,6 +537,8 @@ class Decompiler(Analysis):
                     self._recursive_structurer_params["structurer_cls"].NAME,
                 )
                 continue
+            if self.budget is not None and self.budget.should_skip_pass(pass_):
+                continue
 
             pass_ = timethis(pass_)
             a = pass_(
@@ -534,6 +558,7 @@ class Decompiler(Analysis):
                 complete_successors=self._complete_successors,
                 peephole_optimizations=self._peephole_optimizations,
                 avoid_vvar_ids=self._copied_var_ids,
+                budget=self.budget,
                 **kwargs,
             )
 
@@ -560,6 +585,8 @@ class Decompiler(Analysis):
         for pass_ in self._optimization_passes:
             if pass_.STAGE != OptimizationPassStage.AFTER_STRUCTURING:
                 continue
+            if self.budget is not None and self.budget.should_skip_pass(pass_):
+                continue
 
             pass_ = timethis(pass_)
             a = pass_(
@@ -224,8 +224,15 @@ class LoweredSwitchSimplifier(StructuringOptimizationPass):
         self.out_graph = graph_copy
         node_to_heads = defaultdict(set)
 
+        out_of_budget = False
         for _, caselists in variablehash_to_cases.items():
             for cases, redundant_nodes in caselists:
+                if self._budget is not None and self._budget.expired:
+                    # keep the if-trees that have been converted so far and leave the remaining ones as they are
+                    self._budget.degrade(self.__class__.__name__, "Stopped converting if-trees into switch-cases")
+                    out_of_budget = True
+                    break
+
                 real_cases = [case for case in cases if case.value != "default"]
                 max_continuous_cases = self._count_max_continuous_cases(real_cases)
 
@@ -357,6 +364,8 @@ class LoweredSwitchSimplifier(StructuringOptimizationPass):
                         graph_copy.add_edge(new_head, dst)
                     else:
                         graph_copy.add_edge(src, dst)
+            if out_of_budget:
+                break
 
         # find shared case nodes and make copies of them
         # note that this only solves cases where *one* node is shared between switch-cases. a more general solution
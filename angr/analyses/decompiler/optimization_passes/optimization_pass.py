@@ -22,6 +22,7 @@ from angr.project import Project
 if TYPE_CHECKING:
     from angr.knowledge_plugins.functions import Function
     from angr.analyses.decompiler.stack_item import StackItem
+    from angr.analyses.decompiler.decompilation_budget import DecompilationBudget
 
 
 _l = logging.getLogger(__name__)
@@ -142,6 +143,7 @@ class OptimizationPass(BaseOptimizationPass):
         peephole_optimizations=None,
         stack_pointer_tracker=None,
         notes: dict | None = None,
+        budget: DecompilationBudget | None = None,
         **kwargs,
     ):
         super().__init__(func)
@@ -166,6 +168,7 @@ class OptimizationPass(BaseOptimizationPass):
         self._peephole_optimizations = peephole_optimizations
         self._stack_pointer_tracker = stack_pointer_tracker
         self.notes = notes if notes is not None else {}
+        self._budget = budget
 
         # output
         self.out_graph: networkx.DiGraph | None = None
@@ -550,7 +553,12 @@ class StructuringOptimizationPass(OptimizationPass):
 
     def _fixed_point_analyze(self, cache=None):
         had_any_changes = False
-        for _ in range(self._max_opt_iters):
+        for i in range(self._max_opt_iters):
+            if i > 0 and self._budget is not None and self._budget.expired:
+                self._budget.degrade(
+                    self.__class__.__name__, f"Stopped fixed-point iterations after {i}/{self._max_opt_iters} rounds"
+                )
+                break
             if self._require_gotos:
                 assert self._goto_manager is not None
                 if not self._goto_manager.gotos:
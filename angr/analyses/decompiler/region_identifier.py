@@ -14,6 +14,7 @@ from angr.ailment.expression import Const
 from angr.utils.graph import GraphUtils
 from angr.utils.graph import dfs_back_edges, subgraph_between_nodes, dominates
 from angr.utils.doms import IncrementalDominators
+from angr.utils.graph_kernel import immediate_dominators
 from angr.errors import AngrRuntimeError
 from angr.analyses import Analysis, register_analysis
 from .structuring.structurer_nodes import MultiNode, ConditionNode, IncompleteSwitchCaseHeadStatement
@@ -76,6 +77,9 @@ class RegionIdentifier(Analysis):
         # we keep a dictionary of node and their traversal order in a quasi-topological traversal and update this
         # dictionary as we update the graph
         self._node_order: dict[Any, tuple[int, int]] = {}
+        # how many times dominators and post-dominators were computed from scratch, updated incrementally after a
+        # region is abstracted, and reused when structuring the same region again
+        self.dominator_stats: dict[str, int] = {"computed": 0, "updated": 0, "reused": 0}
 
         self._analyze()
 
@@ -312,7 +316,7 @@ class RegionIdentifier(Analysis):
         if len(refined_exit_nodes) <= 1:
             return refined_loop_nodes, refined_exit_nodes
 
-        idom = networkx.immediate_dominators(graph, head)
+        idom = immediate_dominators(graph, head)
 
         new_exit_nodes = refined_exit_nodes
         # a graph with only initial exit nodes and new loop nodes that are reachable from at least one initial exit
@@ -462,8 +466,9 @@ class RegionIdentifier(Analysis):
             subgraph = region.graph
 
             failed_region_attempts = set()
+            dom_cache = {}
             while self._make_acyclic_region(
-                head, subgraph, region.graph_with_successors, failed_region_attempts, region.cyclic
+                head, subgraph, region.graph_with_successors, failed_region_attempts, region.cyclic, dom_cache=dom_cache
             ):
                 if head not in subgraph:
                     # update head
@@ -674,7 +679,16 @@ class RegionIdentifier(Analysis):
     # Acyclic regions
     #
 
-    def _make_acyclic_region(self, head, graph: networkx.DiGraph, secondary_graph, failed_region_attempts, cyclic):
+    def _make_acyclic_region(
+        self, head, graph: networkx.DiGraph, secondary_graph, failed_region_attempts, cyclic, dom_cache=None
+    ):
+        """
+        Find and abstract acyclic regions in the graph.
+
+        :param dom_cache:   A dict that keeps the graph copy, dominators, and post-dominators between calls on the same
+                            graph, so that they are updated incrementally instead of being recomputed on every call.
+        """
+
         # pre-processing
 
         # we need to create a copy of the original graph if
@@ -682,16 +696,8 @@ class RegionIdentifier(Analysis):
         # - there are more than one end nodes
 
         head_inedges = list(graph.in_edges(head))
-        if head_inedges:
-            # we need a copy of the graph to remove edges coming into the head
-            graph_copy = networkx.DiGraph(graph)
-            # remove any in-edge to the head node
-            for src, _ in head_inedges:
-                graph_copy.remove_edge(src, head)
-        else:
-            graph_copy = graph
-
-        endnodes = [node for node in graph_copy.nodes() if graph_copy.out_degree(node) == 0]
+        # end nodes once the in-edges to the head node are removed
+        endnodes = [node for node in graph.nodes() if all(succ is head for succ in graph.successors(node))]
         if len(endnodes) == 0:
             # sanity check: there should be at least one end node
             l.critical("No end node is found in a supposedly acyclic graph. Is it really acyclic?")
@@ -705,20 +711,41 @@ class RegionIdentifier(Analysis):
             # special case: there are in-edges to head, but the only end node is not a predecessor to head.
             # in this case, we will want to put the end node and a predecessor of the head into the same region.
             add_dummy_endnode = True
-
-        if add_dummy_endnode:
-            # we need a copy of the graph!
-            graph_copy = networkx.DiGraph(graph_copy)
-            dummy_endnode = "DUMMY_ENDNODE"
-            for endnode in endnodes:
-                graph_copy.add_edge(endnode, dummy_endnode)
-            endnodes = [dummy_endnode]
+        dummy_endnode = "DUMMY_ENDNODE" if add_dummy_endnode else None
+
+        if dom_cache and self._dom_cache_valid(dom_cache, graph, head, head_inedges, endnodes, dummy_endnode):
+            # graph_copy, doms, and postdoms were kept up-to-date while regions were abstracted in the last call
+            graph_copy = dom_cache["graph_copy"]
+            doms = dom_cache["doms"]
+            postdoms = dom_cache["postdoms"]
+            self.dominator_stats["reused"] += 1
         else:
-            dummy_endnode = None
-
-        # dominators and post-dominators, computed incrementally
-        doms = IncrementalDominators(graph_copy, head)
-        postdoms = IncrementalDominators(graph_copy, endnodes[0], post=True)
+            if head_inedges:
+                # we need a copy of the graph to remove edges coming into the head
+                graph_copy = networkx.DiGraph(graph)
+                # remove any in-edge to the head node
+                for src, _ in head_inedges:
+                    graph_copy.remove_edge(src, head)
+            else:
+                graph_copy = graph
+
+            if add_dummy_endnode:
+                # we need a copy of the graph!
+                graph_copy = networkx.DiGraph(graph_copy)
+                for endnode in endnodes:
+                    graph_copy.add_edge(endnode, dummy_endnode)
+                endnodes = [dummy_endnode]
+
+            # dominators and post-dominators, computed incrementally
+            doms = IncrementalDominators(graph_copy, head)
+            postdoms = IncrementalDominators(graph_copy, endnodes[0], post=True)
+            self.dominator_stats["computed"] += 1
+            if dom_cache is not None:
+                dom_cache["graph"] = graph
+                dom_cache["graph_copy"] = graph_copy
+                dom_cache["doms"] = doms
+                dom_cache["postdoms"] = postdoms
+                dom_cache["dummy_endnode"] = dummy_endnode
 
         # visit the nodes in post-order
         region_created = False
@@ -736,6 +763,9 @@ class RegionIdentifier(Analysis):
                 # the root element of the region hierarchy should always be a GraphRegion,
                 # so we transform it into one, if necessary
                 if graph_copy.in_degree(node) == 0 and not isinstance(node, GraphRegion):
+                    # graph and graph_copy are no longer in sync
+                    if dom_cache:
+                        dom_cache.clear()
                     subgraph = networkx.DiGraph()
                     subgraph.add_node(node)
                     self._abstract_acyclic_region(
@@ -807,6 +837,7 @@ class RegionIdentifier(Analysis):
                             self._update_graph(graph_copy, region, replaced_nodes)
                         doms.graph_updated(region, replaced_nodes, region.head)
                         postdoms.graph_updated(region, replaced_nodes, region.head)
+                        self.dominator_stats["updated"] += 1
                         # break out of the inner loop
                         break
 
@@ -821,6 +852,49 @@ class RegionIdentifier(Analysis):
 
         return region_created
 
+    @staticmethod
+    def _dom_cache_valid(dom_cache, graph: networkx.DiGraph, head, head_inedges, endnodes, dummy_endnode) -> bool:
+        """
+        Check if the cached graph copy is identical to the graph copy that would be created for the current graph, in
+        which case the cached dominators and post-dominators are up-to-date as well.
+        """
+
+        if dom_cache["graph"] is not graph:
+            return False
+        graph_copy = dom_cache["graph_copy"]
+        doms = dom_cache["doms"]
+        postdoms = dom_cache["postdoms"]
+        if doms.start is not head:
+            return False
+        if graph_copy is graph:
+            return not head_inedges and dummy_endnode is None and postdoms.start is endnodes[0]
+
+        cached_dummy_endnode = dom_cache["dummy_endnode"]
+        if (
+            cached_dummy_endnode is not None
+            and dummy_endnode is None
+            and list(graph_copy.predecessors(cached_dummy_endnode)) == endnodes
+        ):
+            # all end nodes but one have been abstracted into regions, so the dummy end node is no longer needed
+            graph_copy.remove_node(cached_dummy_endnode)
+            doms.end_node_removed(cached_dummy_endnode)
+            postdoms.end_node_removed(cached_dummy_endnode)
+            dom_cache["dummy_endnode"] = cached_dummy_endnode = None
+
+        if cached_dummy_endnode != dummy_endnode:
+            return False
+        extra_nodes = 0 if dummy_endnode is None else 1
+        extra_edges = 0 if dummy_endnode is None else len(endnodes)
+        if (
+            len(graph_copy) != len(graph) + extra_nodes
+            or graph_copy.number_of_edges() != graph.number_of_edges() - len(head_inedges) + extra_edges
+            or graph_copy.in_degree[head] != 0
+        ):
+            return False
+        if dummy_endnode is None:
+            return postdoms.start is endnodes[0]
+        return set(graph_copy.predecessors(dummy_endnode)) == set(endnodes)
+
     @staticmethod
     def _update_graph(graph: networkx.DiGraph, new_region, replaced_nodes: set) -> None:
         region_in_edges = RegionIdentifier._region_in_edges(graph, new_region, data=True)
@@ -1,5 +1,8 @@
 # pylint:disable=missing-class-docstring
 from __future__ import annotations
+from bisect import bisect_left
+from collections.abc import Sequence
+
 from sortedcontainers import SortedDict
 
 from angr.sim_variable import SimVariable
@@ -9,6 +12,23 @@ from angr.sim_variable import SimVariable
 #
 
 
+def _shift_position(pos: int, offset: int, resized_starts: list[int], accumulated_deltas: list[int]) -> int:
+    # elements are shifted by the offset plus the length changes of all resized elements before them
+    i = bisect_left(resized_starts, pos)
+    return pos + offset + (accumulated_deltas[i - 1] if i else 0)
+
+
+def _accumulate_resized(resized: Sequence[tuple[int, int]]) -> tuple[list[int], list[int]]:
+    starts = []
+    accumulated = []
+    total = 0
+    for start, delta in resized:
+        total += delta
+        starts.append(start)
+        accumulated.append(total)
+    return starts, accumulated
+
+
 class PositionMappingElement:
     __slots__ = ("length", "obj", "start")
 
@@ -35,6 +55,9 @@ class PositionMapping:
     def items(self):
         return self._posmap.items()
 
+    def __len__(self):
+        return len(self._posmap)
+
     #
     # Public methods
     #
@@ -51,6 +74,38 @@ class PositionMapping:
 
         self._posmap[start_pos] = PositionMappingElement(start_pos, length, obj)
 
+    def replace_head(
+        self, head: PositionMapping, head_end: int, offset: int, resized: Sequence[tuple[int, int]] = ()
+    ) -> dict[int, int]:
+        """
+        Replace all elements that start before a position with elements in another mapping, and shift the rest of
+        elements by an offset. Lengths of some elements can be changed at the same time, in which case elements after
+        a resized element are further shifted by the change of its length. Elements are updated in place.
+
+        :param head:        The mapping whose elements replace existing elements before head_end.
+        :param head_end:    The position where the replaced elements end.
+        :param offset:      The offset to shift all elements after head_end by.
+        :param resized:     (start position, length delta) tuples of elements to resize, sorted by their start
+                            positions. Start positions are positions before shifting.
+        :return:            A dict that maps old start positions of all shifted elements to their new start positions.
+        """
+        elements = self._posmap.values()[self._posmap.bisect_left(head_end) :]
+        new_starts = {}
+        # elements are sorted by their start positions, so are the resized elements
+        i = 0
+        shift = offset
+        for element in elements:
+            old_start = element.start
+            while i < len(resized) and resized[i][0] < old_start:
+                shift += resized[i][1]
+                i += 1
+            element.start = new_starts[old_start] = old_start + shift
+            if i < len(resized) and resized[i][0] == old_start:
+                element.length += resized[i][1]
+        self._posmap = SortedDict(head._posmap)
+        self._posmap.update((element.start, element) for element in elements)
+        return new_starts
+
     def get_node(self, pos: int):
         element = self.get_element(pos)
         if element is None:
@@ -99,6 +154,17 @@ class InstructionMapping:
         else:
             self._insmap[ins_addr] = InstructionMappingElement(ins_addr, posmap_pos)
 
+    def shift(self, offset: int, resized: Sequence[tuple[int, int]] = ()) -> None:
+        """
+        Shift all positions by an offset, as well as by the length changes of all resized elements before them.
+
+        :param offset:  The offset to shift all positions by.
+        :param resized: (start position, length delta) tuples of resized elements, sorted by their start positions.
+        """
+        starts, accumulated = _accumulate_resized(resized)
+        for element in self._insmap.values():
+            element.posmap_pos = _shift_position(element.posmap_pos, offset, starts, accumulated)
+
     def get_nearest_pos(self, ins_addr: int) -> int | None:
         try:
             pre_max = next(self._insmap.irange(maximum=ins_addr, reverse=True))
@@ -158,7 +224,7 @@ class BaseStructuredCodeGenerator:
     def reapply_options(self, options):
         pass
 
-    def regenerate_text(self) -> None:
+    def regenerate_text(self, changed_variables=None) -> None:
         pass
 
     def reload_variable_types(self) -> None:
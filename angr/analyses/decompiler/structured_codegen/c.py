@@ -1,7 +1,7 @@
 # pylint:disable=missing-class-docstring,too-many-boolean-expressions,unused-argument,no-self-use
 from __future__ import annotations
 from typing import cast, Any, TYPE_CHECKING
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from collections import defaultdict, Counter
 import logging
 import struct
@@ -244,6 +244,174 @@ def type_to_c_repr_chunks(ty: SimType, name=None, name_type=None, full=False, in
 #
 
 
+class CChunkMapper:
+    """
+    Converts chunks of C constructs into text. Positions of nodes and instruction addresses in the text are recorded in
+    position maps, and comments are inserted after the statements and expressions that they belong to.
+
+    The mapper can be used to map multiple sequences of chunks one after another, in which case the text of all
+    sequences is considered as one continuous text.
+    """
+
+    __slots__ = (
+        "addr_to_pos",
+        "codegen",
+        "last_insn_addr",
+        "pending_expr_comments",
+        "pending_stmt_comments",
+        "pos",
+        "pos_to_addr",
+        "pos_to_node",
+        "used_vars",
+    )
+
+    def __init__(self, codegen, initial_pos=0, pos_to_node=None, pos_to_addr=None, addr_to_pos=None):
+        self.codegen = codegen
+        self.pos_to_node: PositionMapping | None = pos_to_node
+        self.pos_to_addr: PositionMapping | None = pos_to_addr
+        self.addr_to_pos: InstructionMapping | None = addr_to_pos
+
+        self.pending_stmt_comments = dict(codegen.stmt_comments)
+        self.pending_expr_comments = dict(codegen.expr_comments)
+        # start all positions at beginning of document
+        self.pos: int = initial_pos
+        self.last_insn_addr = None
+        # track all variables so we can tell if this is a declaration or not
+        self.used_vars: set[CVariable] = set()
+
+    def state(self):
+        """
+        Get a snapshot of the mapper state, which, together with the chunks, determines the text of the chunks that are
+        mapped next.
+        """
+        return (
+            frozenset(self.used_vars),
+            self.last_insn_addr,
+            tuple(self.pending_stmt_comments.items()),
+            tuple(self.pending_expr_comments.items()),
+        )
+
+    def map(self, chunks, name_chunks: list[tuple[int, int, CVariable | CFunctionCall]] | None = None):
+        """
+        Convert chunks into text.
+
+        :param chunks:          The chunks to convert.
+        :param name_chunks:     If specified, (index, position, node) tuples of all yielded strings that are names of
+                                variables or callees will be appended to this list, where the index is the index of
+                                the string among all strings that are yielded.
+        :return:                A generator of strings.
+        """
+        pos_to_node = self.pos_to_node
+        pos_to_addr = self.pos_to_addr
+        addr_to_pos = self.addr_to_pos
+        pending_stmt_comments = self.pending_stmt_comments
+        pending_expr_comments = self.pending_expr_comments
+        used_vars = self.used_vars
+        last_insn_addr = self.last_insn_addr
+        pos = self.pos
+        index = 0
+
+        # get each string and object representation of the chunks
+        for s, obj in chunks:
+            # filter out anything that is not a statement or expression object
+            if isinstance(obj, (CStatement, CExpression)):
+                # only add statements/expressions that can be address tracked into map_pos_to_addr
+                if hasattr(obj, "tags") and obj.tags is not None and "ins_addr" in obj.tags:
+                    if isinstance(obj, CVariable) and obj not in used_vars:
+                        used_vars.add(obj)
+                    else:
+                        last_insn_addr = obj.tags["ins_addr"]
+
+                        # all valid statements and expressions should be added to map_pos_to_addr and
+                        # tracked for instruction mapping from disassembly
+                        if pos_to_addr is not None:
+                            pos_to_addr.add_mapping(pos, len(s), obj)
+                        if addr_to_pos is not None:
+                            addr_to_pos.add_mapping(obj.tags["ins_addr"], pos)
+
+                # add all variables, constants, and function calls to map_pos_to_node for highlighting
+                # add ops to pos_to_node but NOT ast_to_pos
+                if (
+                    isinstance(
+                        obj,
+                        (
+                            CVariable,
+                            CConstant,
+                            CStructField,
+                            CIndexedVariable,
+                            CVariableField,
+                            CBinaryOp,
+                            CUnaryOp,
+                            CAssignment,
+                            CFunctionCall,
+                            CLabel,
+                        ),
+                    )
+                    and pos_to_node is not None
+                ):
+                    pos_to_node.add_mapping(pos, len(s), obj)
+
+                if name_chunks is not None and (
+                    (isinstance(obj, CVariable) and s == obj.name) or isinstance(obj, CFunctionCall)
+                ):
+                    name_chunks.append((index, pos, obj))
+
+            # add (), {}, [], and [20] to mapping for highlighting as well as the full functions name
+            elif isinstance(obj, (CClosingObject, CFunction, CArrayTypeLength, CStructFieldNameDef)):
+                if s is None:
+                    continue
+
+                if pos_to_node is not None:
+                    pos_to_node.add_mapping(pos, len(s), obj)
+
+            elif isinstance(obj, SimType):
+                if pos_to_node is not None:
+                    if isinstance(obj, TypeRef):
+                        pos_to_node.add_mapping(pos, len(s), obj.type)
+                    else:
+                        pos_to_node.add_mapping(pos, len(s), obj)
+
+            if s.endswith("\n"):
+                text = pending_stmt_comments.pop(last_insn_addr, None) if isinstance(last_insn_addr, int) else None
+                if text is not None:
+                    todo = "  // " + text
+                    pos += len(s) - 1
+                    index += 1
+                    yield s[:-1]
+                    pos += len(todo)
+                    index += 1
+                    yield todo
+                    s = "\n"
+
+            pos += len(s)
+            index += 1
+            yield s
+
+            if isinstance(obj, CExpression):
+                text = pending_expr_comments.pop(last_insn_addr, None) if isinstance(last_insn_addr, int) else None
+                if text is not None:
+                    todo = " /*" + text + "*/ "
+                    pos += len(todo)
+                    index += 1
+                    yield todo
+
+        self.pos = pos
+        self.last_insn_addr = last_insn_addr
+
+    def orphaned_comments(self):
+        """
+        Convert all comments that have not been inserted into text.
+
+        :return: A generator of strings.
+        """
+        if self.pending_expr_comments or self.pending_stmt_comments:
+            yield "// Orphaned comments\n"
+            for text in self.pending_stmt_comments.values():
+                yield "// " + text + "\n"
+            for text in self.pending_expr_comments.values():
+                yield "/* " + text + "*/\n"
+
+
 class CConstruct:
     """
     Represents a program construct in C.
@@ -265,105 +433,18 @@ class CConstruct:
         statements.
         """
 
-        pending_stmt_comments = dict(self.codegen.stmt_comments)
-        pending_expr_comments = dict(self.codegen.expr_comments)
-
-        def mapper(chunks):
-            # start all positions at beginning of document
-            pos = initial_pos
-
-            last_insn_addr = None
-
-            # track all variables so we can tell if this is a declaration or not
-            used_vars = set()
-
-            # get each string and object representation of the chunks
-            for s, obj in chunks:
-                # filter out anything that is not a statement or expression object
-                if isinstance(obj, (CStatement, CExpression)):
-                    # only add statements/expressions that can be address tracked into map_pos_to_addr
-                    if hasattr(obj, "tags") and obj.tags is not None and "ins_addr" in obj.tags:
-                        if isinstance(obj, CVariable) and obj not in used_vars:
-                            used_vars.add(obj)
-                        else:
-                            last_insn_addr = obj.tags["ins_addr"]
-
-                            # all valid statements and expressions should be added to map_pos_to_addr and
-                            # tracked for instruction mapping from disassembly
-                            if pos_to_addr is not None:
-                                pos_to_addr.add_mapping(pos, len(s), obj)
-                            if addr_to_pos is not None:
-                                addr_to_pos.add_mapping(obj.tags["ins_addr"], pos)
-
-                    # add all variables, constants, and function calls to map_pos_to_node for highlighting
-                    # add ops to pos_to_node but NOT ast_to_pos
-                    if (
-                        isinstance(
-                            obj,
-                            (
-                                CVariable,
-                                CConstant,
-                                CStructField,
-                                CIndexedVariable,
-                                CVariableField,
-                                CBinaryOp,
-                                CUnaryOp,
-                                CAssignment,
-                                CFunctionCall,
-                                CLabel,
-                            ),
-                        )
-                        and pos_to_node is not None
-                    ):
-                        pos_to_node.add_mapping(pos, len(s), obj)
-
-                # add (), {}, [], and [20] to mapping for highlighting as well as the full functions name
-                elif isinstance(obj, (CClosingObject, CFunction, CArrayTypeLength, CStructFieldNameDef)):
-                    if s is None:
-                        continue
-
-                    if pos_to_node is not None:
-                        pos_to_node.add_mapping(pos, len(s), obj)
-
-                elif isinstance(obj, SimType):
-                    if pos_to_node is not None:
-                        if isinstance(obj, TypeRef):
-                            pos_to_node.add_mapping(pos, len(s), obj.type)
-                        else:
-                            pos_to_node.add_mapping(pos, len(s), obj)
-
-                if s.endswith("\n"):
-                    text = pending_stmt_comments.pop(last_insn_addr, None) if isinstance(last_insn_addr, int) else None
-                    if text is not None:
-                        todo = "  // " + text
-                        pos += len(s) - 1
-                        yield s[:-1]
-                        pos += len(todo)
-                        yield todo
-                        s = "\n"
-
-                pos += len(s)
-                yield s
-
-                if isinstance(obj, CExpression):
-                    text = pending_expr_comments.pop(last_insn_addr, None) if isinstance(last_insn_addr, int) else None
-                    if text is not None:
-                        todo = " /*" + text + "*/ "
-                        pos += len(todo)
-                        yield todo
-
-            if pending_expr_comments or pending_stmt_comments:
-                yield "// Orphaned comments\n"
-                for text in pending_stmt_comments.values():
-                    yield "// " + text + "\n"
-                for text in pending_expr_comments.values():
-                    yield "/* " + text + "*/\n"
-
+        mapper = CChunkMapper(
+            self.codegen,
+            initial_pos=initial_pos,
+            pos_to_node=pos_to_node,
+            pos_to_addr=pos_to_addr,
+            addr_to_pos=addr_to_pos,
+        )
         # A special note about this line:
         # Polymorphism allows that the c_repr_chunks() call will be called
         # by the CFunction class, which will then call each statement within it and construct
         # the chunks that get printed in qccode_edit in angr-management.
-        return "".join(mapper(self.c_repr_chunks(indent)))
+        return "".join(mapper.map(self.c_repr_chunks(indent))) + "".join(mapper.orphaned_comments())
 
     def c_repr_chunks(self, indent=0, asexpr=False):
         raise NotImplementedError
@@ -379,6 +460,7 @@ class CFunction(CConstruct):  # pylint:disable=abstract-method
     """
 
     __slots__ = (
+        "_brace",
         "addr",
         "arg_list",
         "demangled_name",
@@ -419,6 +501,8 @@ class CFunction(CConstruct):  # pylint:disable=abstract-method
         self.unified_local_vars: dict[SimVariable, set[tuple[CVariable, SimType]]] = self.get_unified_local_vars()
         self.show_demangled_name = show_demangled_name
         self.omit_header = omit_header
+        # the braces of the function body are rendered separately in header_c_repr_chunks() and body_c_repr_chunks()
+        self._brace = CClosingObject("{")
 
     def get_unified_local_vars(self) -> dict[SimVariable, set[tuple[CVariable, SimType]]]:
         unified_to_var_and_types: dict[SimVariable, set[tuple[CVariable, SimType]]] = defaultdict(set)
@@ -526,11 +610,33 @@ class CFunction(CConstruct):  # pylint:disable=abstract-method
         else:
             yield from self.full_c_repr_chunks(indent=indent, asexpr=asexpr)
 
+    def header_c_repr_chunks(self, indent=0):
+        """
+        Chunks before the statements of the function, including local types, externs, the function header, and
+        declarations of local variables. c_repr_chunks() is always header_c_repr_chunks() followed by
+        body_c_repr_chunks().
+        """
+        if not self.omit_header:
+            yield from self._header_c_repr_chunks(indent=indent)
+
+    def body_c_repr_chunks(self, indent=0):
+        """
+        Chunks of the statements of the function and everything after them.
+        """
+        if self.omit_header:
+            yield from self.headerless_c_repr_chunks(indent=indent)
+        else:
+            yield from self._body_c_repr_chunks(indent=indent)
+
     def headerless_c_repr_chunks(self, indent=0):
         yield from self.statements.c_repr_chunks(indent=indent)
         yield "\n", None
 
     def full_c_repr_chunks(self, indent=0, asexpr=False):
+        yield from self._header_c_repr_chunks(indent=indent)
+        yield from self._body_c_repr_chunks(indent=indent)
+
+    def _header_c_repr_chunks(self, indent=0):
         indent_str = self.indent_str(indent)
         if self.codegen.show_local_types:
             local_types = [unpack_typeref(ty) for ty in self.variable_manager.types.iter_own()]
@@ -589,7 +695,6 @@ class CFunction(CConstruct):  # pylint:disable=abstract-method
         yield normalized_name, self
         # argument list
         paren = CClosingObject("(")
-        brace = CClosingObject("{")
         yield "(", paren
         for i, (arg_type, cvariable) in enumerate(zip(self.functy.args, self.arg_list)):
             if i:
@@ -605,12 +710,14 @@ class CFunction(CConstruct):  # pylint:disable=abstract-method
             yield indent_str, None
         else:
             yield " ", None
-        yield "{", brace
+        yield "{", self._brace
         yield "\n", None
         yield from self.variable_list_repr_chunks(indent=indent + INDENT_DELTA)
+
+    def _body_c_repr_chunks(self, indent=0):
         yield from self.statements.c_repr_chunks(indent=indent + INDENT_DELTA)
-        yield indent_str, None
-        yield "}", brace
+        yield self.indent_str(indent), None
+        yield "}", self._brace
         yield "\n", None
 
     @staticmethod
@@ -1358,22 +1465,11 @@ class CFunctionCall(CStatement, CExpression):
             yield " = ", None
 
         if self.callee_func is not None:
-            if self.callee_func.demangled_name and self.show_demangled_name:
-                func_name = get_cpp_function_name(self.callee_func.demangled_name)
-            else:
-                func_name = self.callee_func.name
-            if (
-                self.prettify_thiscall
-                and self.args
-                and self._is_func_likely_method(func_name, self.callee_func.is_rust_function())
-            ):
-                func_name = self.callee_func.short_name
+            func_name, is_method_call = self._callee_func_name()
+            if is_method_call:
                 yield from self._c_repr_chunks_thiscall(func_name, asexpr=asexpr)
                 return
-            if self.show_disambiguated_name and self._is_target_ambiguous(func_name):
-                func_name = self.callee_func.get_unambiguous_name(display_name=func_name)
-
-            yield func_name, self
+            yield self._disambiguate_callee_func_name(func_name), self
         elif isinstance(self.callee_target, str):
             yield self.callee_target, self
         else:
@@ -1395,6 +1491,29 @@ class CFunctionCall(CStatement, CExpression):
                 yield " /* do not return */", None
             yield "\n", None
 
+    def _callee_func_name(self) -> tuple[str, bool]:
+        """
+        Get the name of the callee function, and whether the call is displayed as a method call.
+        """
+        assert self.callee_func is not None
+        if self.callee_func.demangled_name and self.show_demangled_name:
+            func_name = get_cpp_function_name(self.callee_func.demangled_name)
+        else:
+            func_name = self.callee_func.name
+        if (
+            self.prettify_thiscall
+            and self.args
+            and self._is_func_likely_method(func_name, self.callee_func.is_rust_function())
+        ):
+            return self.callee_func.short_name, True
+        return func_name, False
+
+    def _disambiguate_callee_func_name(self, func_name: str) -> str:
+        assert self.callee_func is not None
+        if self.show_disambiguated_name and self._is_target_ambiguous(func_name):
+            return self.callee_func.get_unambiguous_name(display_name=func_name)
+        return func_name
+
     def _c_repr_chunks_thiscall(self, func_name: str, asexpr: bool = False):
         # The first argument is the `this` pointer
         assert self.args
@@ -2507,6 +2626,42 @@ class CStructFieldNameDef:
         self.name = name
 
 
+class _RenderCache:
+    """
+    Text of the function body from the last rendering, which is used for re-rendering the function incrementally.
+    """
+
+    __slots__ = (
+        "body",
+        "cfunc",
+        "header_end",
+        "header_has_addrs",
+        "header_state",
+        "name_chunks",
+        "notes_length",
+        "variable_types",
+    )
+
+    def __init__(self, cfunc: CFunction, notes_length: int, header_end: int, header_state, header_has_addrs: bool):
+        self.cfunc = cfunc
+        self.variable_types = self.get_variable_types(cfunc)
+        self.notes_length = notes_length
+        self.header_end = header_end
+        self.header_state = header_state
+        self.header_has_addrs = header_has_addrs
+        self.body: list[str] = []
+        # (index in body, position in text, node) of all names of variables and callees in the body
+        self.name_chunks: list[tuple[int, int, CVariable | CFunctionCall]] = []
+
+    @staticmethod
+    def get_variable_types(cfunc: CFunction) -> list[SimType | None]:
+        return [
+            cvar.variable_type
+            for cvar in (*cfunc.arg_list, *cfunc.variables_in_use.values())
+            if isinstance(cvar, CVariable)
+        ]
+
+
 class CStructuredCodeGenerator(BaseStructuredCodeGenerator, Analysis):
     def __init__(
         self,
@@ -2625,10 +2780,12 @@ class CStructuredCodeGenerator(BaseStructuredCodeGenerator, Analysis):
         self.cfunc: CFunction | None = None
         self.cexterns: set[CVariable] | None = None
         self.display_notes = display_notes
+        self._render_cache: _RenderCache | None = None
 
         self._analyze()
 
     def reapply_options(self, options):
+        self._render_cache = None
         for option, value in options:
             if option.param == "braces_on_own_lines":
                 self.braces_on_own_lines = value
@@ -2699,10 +2856,20 @@ class CStructuredCodeGenerator(BaseStructuredCodeGenerator, Analysis):
         self.map_ast_to_pos = None
         self.text = None
 
-    def regenerate_text(self) -> None:
+    def regenerate_text(self, changed_variables: Iterable[SimVariable] | None = None) -> None:
         """
         Re-render text and re-generate all sorts of mapping information.
+
+        :param changed_variables:   Variables that are renamed since the last rendering. If specified, and nothing else
+                                    that affects rendering has changed since then, only the function header and
+                                    occurrences of these variables are re-rendered, and existing mapping information is
+                                    updated in place. Otherwise, everything is re-rendered. Retyping variables changes
+                                    how expressions around them are rendered, so everything is re-rendered if the type of
+                                    any variable has changed.
         """
+        if changed_variables is not None and self._regenerate_text_incrementally(set(changed_variables)):
+            return
+
         self.cleanup()
         (
             self.text,
@@ -2710,31 +2877,124 @@ class CStructuredCodeGenerator(BaseStructuredCodeGenerator, Analysis):
             self.map_pos_to_addr,
             self.map_addr_to_pos,
             self.map_ast_to_pos,
-        ) = self.render_text(self.cfunc)
+        ), self._render_cache = self._render_text(self.cfunc)
 
     RENDER_TYPE = tuple[str, PositionMapping, PositionMapping, InstructionMapping, dict[Any, set[Any]]]
 
     def render_text(self, cfunc: CFunction) -> RENDER_TYPE:
+        return self._render_text(cfunc)[0]
+
+    def _render_text(self, cfunc: CFunction) -> tuple[RENDER_TYPE, _RenderCache]:
         pos_to_node = PositionMapping()
         pos_to_addr = PositionMapping()
         addr_to_pos = InstructionMapping()
-        ast_to_pos = defaultdict(set)
 
-        text = cfunc.c_repr(
-            initial_pos=0,
-            indent=self._indent,
+        notes = self.render_notes() if self.display_notes else ""
+        mapper = CChunkMapper(
+            self,
+            initial_pos=len(notes),
             pos_to_node=pos_to_node,
             pos_to_addr=pos_to_addr,
             addr_to_pos=addr_to_pos,
         )
+        header = "".join(mapper.map(cfunc.header_c_repr_chunks(indent=self._indent)))
+        cache = _RenderCache(cfunc, len(notes), mapper.pos, mapper.state(), len(pos_to_addr) > 0)
+        cache.body = list(mapper.map(cfunc.body_c_repr_chunks(indent=self._indent), cache.name_chunks))
+        cache.body += mapper.orphaned_comments()
+        text = notes + header + "".join(cache.body)
 
-        if self.display_notes:
-            notes = self.render_notes()
-            pos_to_node, pos_to_addr, addr_to_pos = self.adjust_mapping_positions(
-                len(notes), pos_to_node, pos_to_addr, addr_to_pos
-            )
-            text = notes + text
+        return (text, pos_to_node, pos_to_addr, addr_to_pos, self._build_ast_to_pos(pos_to_node)), cache
 
+    def _regenerate_text_incrementally(self, changed_variables: set[SimVariable]) -> bool:
+        """
+        Re-render the function header and all occurrences of the given variables, and update the existing text and
+        mapping information accordingly.
+
+        :param changed_variables:   Variables that are renamed.
+        :return:                    True if text is successfully re-rendered, False if a full re-rendering is required.
+        """
+        cache = self._render_cache
+        if cache is None or cache.cfunc is not self.cfunc or self.text is None:
+            return False
+        if _RenderCache.get_variable_types(self.cfunc) != cache.variable_types:
+            # variables are retyped
+            return False
+
+        notes = self.render_notes() if self.display_notes else ""
+        if len(notes) != cache.notes_length:
+            return False
+
+        # re-render the header
+        header_pos_to_node = PositionMapping()
+        header_pos_to_addr = PositionMapping()
+        mapper = CChunkMapper(
+            self,
+            initial_pos=len(notes),
+            pos_to_node=header_pos_to_node,
+            pos_to_addr=header_pos_to_addr,
+            addr_to_pos=InstructionMapping(),
+        )
+        header = "".join(mapper.map(self.cfunc.header_c_repr_chunks(indent=self._indent)))
+        if cache.header_has_addrs or len(header_pos_to_addr) > 0 or mapper.state() != cache.header_state:
+            # the header affects how the body is rendered
+            return False
+
+        # re-render names of changed variables in the body, as well as names of callees that may be ambiguous with
+        # names of changed variables
+        body = cache.body
+        new_names = {v.name for v in changed_variables}
+        renamed = []
+        for index, pos, node in cache.name_chunks:
+            if isinstance(node, CVariable):
+                if node.variable not in changed_variables and node.unified_variable not in changed_variables:
+                    continue
+                name = node.name
+            elif node.callee_func is not None:
+                # a callee name may only change if it is disambiguated, or if it is the same as a variable name
+                if not body[index].startswith("::") and body[index] not in new_names:
+                    continue
+                name, is_method_call = node._callee_func_name()
+                if is_method_call:
+                    continue
+                name = node._disambiguate_callee_func_name(name)
+            else:
+                continue
+            if name != body[index]:
+                renamed.append((index, pos, name))
+        resized = [(pos, len(name) - len(body[index])) for index, pos, name in renamed if len(name) != len(body[index])]
+        for index, _, name in renamed:
+            body[index] = name
+        offset = mapper.pos - cache.header_end
+
+        # update mappings
+        new_starts = self.map_pos_to_node.replace_head(header_pos_to_node, cache.header_end, offset, resized)
+        self.map_pos_to_addr.replace_head(header_pos_to_addr, cache.header_end, offset, resized)
+        self.map_addr_to_pos.shift(offset, resized)
+        ast_to_pos = self._build_ast_to_pos(header_pos_to_node)
+        for key, positions in self.map_ast_to_pos.items():
+            # positions of elements in the header are not in new_starts
+            positions = {new_starts[pos] for pos in positions if pos in new_starts}
+            if positions:
+                ast_to_pos[key] |= positions
+        self.map_ast_to_pos = ast_to_pos
+
+        if resized or offset:
+            # variable names are sorted by their positions, so are the resized names
+            j = 0
+            shift = offset
+            for i, (index, pos, node) in enumerate(cache.name_chunks):
+                while j < len(resized) and resized[j][0] < pos:
+                    shift += resized[j][1]
+                    j += 1
+                cache.name_chunks[i] = index, pos + shift, node
+        cache.header_end = mapper.pos
+
+        self.text = notes + header + "".join(body)
+        return True
+
+    @staticmethod
+    def _build_ast_to_pos(pos_to_node: PositionMapping) -> dict[Any, set[Any]]:
+        ast_to_pos = defaultdict(set)
         for elem, node in pos_to_node.items():
             if isinstance(node.obj, CConstant):
                 ast_to_pos[node.obj.value].add(elem)
@@ -2755,8 +3015,7 @@ class CStructuredCodeGenerator(BaseStructuredCodeGenerator, Analysis):
                 ast_to_pos[key].add(elem)
             else:
                 ast_to_pos[node.obj].add(elem)
-
-        return text, pos_to_node, pos_to_addr, addr_to_pos, ast_to_pos
+        return ast_to_pos
 
     def render_notes(self) -> str:
         """
@@ -18,6 +18,7 @@ from angr.utils.ail import is_phi_assignment, is_head_controlled_loop_block
 from angr.knowledge_plugins.cfg import IndirectJump, IndirectJumpType
 from angr.utils.constants import SWITCH_MISSING_DEFAULT_NODE_ADDR
 from angr.utils.graph import dominates, to_acyclic_graph, dfs_back_edges
+from angr.utils.graph_kernel import immediate_dominators
 from angr.analyses.decompiler.sequence_walker import SequenceWalker
 from angr.analyses.decompiler.utils import (
     remove_last_statement,
@@ -187,6 +188,7 @@ class PhoenixStructurer(StructurerBase):
         # backup the region prior to conducting a cyclic refinement because we may not be able to structure a cycle out
         # of the refined graph. in that case, we restore the original region and return.
         pre_refinement_region = None
+        refinement_skipped = False
 
         while len(self._region.graph.nodes) > 1:
             progressed = self._analyze_acyclic()
@@ -205,6 +207,13 @@ class PhoenixStructurer(StructurerBase):
                         self._region.head = next(
                             iter(node for node in self._region.graph.nodes if node.addr == self._region.head.addr)
                         )
+                elif pre_refinement_region is None and self._budget is not None and self._budget.expired:
+                    # cyclic refinement is expensive. structure the remaining cycle with gotos instead
+                    if not refinement_skipped:
+                        self._budget.degrade(
+                            self.__class__.__name__, f"Skipped cyclic refinement of region {self._region.head.addr:#x}"
+                        )
+                        refinement_skipped = True
                 elif pre_refinement_region is None:
                     pre_refinement_region = self._region.copy()
                     refined = self._refine_cyclic()
@@ -2949,7 +2958,7 @@ class PhoenixStructurer(StructurerBase):
         full_graph = _f(full_graph_raw)
         graph = _f(graph_raw)
 
-        idoms = networkx.immediate_dominators(full_graph, head)
+        idoms = immediate_dominators(full_graph, head)
         if networkx.is_directed_acyclic_graph(full_graph):
             acyclic_graph = networkx.DiGraph(full_graph)
         else:
@@ -41,6 +41,7 @@ from .structurer_nodes import (
 if TYPE_CHECKING:
     from angr.knowledge_plugins.functions import Function
     from angr.analyses.decompiler.graph_region import GraphRegion
+    from angr.analyses.decompiler.decompilation_budget import DecompilationBudget
 
 _l = logging.getLogger(__name__)
 
@@ -64,6 +65,7 @@ class StructurerBase(Analysis):
         case_entry_to_switch_head: dict[int, int] | None = None,
         parent_region=None,
         jump_tables: dict[int, IndirectJump] | None = None,
+        budget: DecompilationBudget | None = None,
         **kwargs,
     ):
         self._region: GraphRegion = region
@@ -72,6 +74,7 @@ class StructurerBase(Analysis):
         self._case_entry_to_switch_head = case_entry_to_switch_head
         self._parent_region = parent_region
         self.jump_tables = jump_tables or {}
+        self._budget = budget
 
         self.cond_proc = (
             condition_processor if condition_processor is not None else ConditionProcessor(self.project.arch)
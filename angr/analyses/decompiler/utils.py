@@ -900,6 +900,19 @@ def copy_graph(graph: networkx.DiGraph):
     return graph_copy
 
 
+def ail_graph_fingerprint(graph: networkx.DiGraph) -> tuple[dict[tuple[int, int | None], tuple], frozenset]:
+    """
+    Get a structural fingerprint of an AIL graph. Fingerprints of two graphs compare equal if and only if both graphs
+    have the same blocks (see ailment.Block.fingerprint()) and the same edges.
+
+    :param graph:   The AIL graph.
+    :return:        The fingerprint of the AIL graph.
+    """
+    blocks = {(block.addr, block.idx): block.fingerprint() for block in graph}
+    edges = frozenset(((src.addr, src.idx), (dst.addr, dst.idx)) for src, dst in graph.edges)
+    return blocks, edges
+
+
 def peephole_optimize_stmts(block, stmt_opts):
     any_update = False
     statements = []
@@ -3,6 +3,7 @@ from typing import TYPE_CHECKING
 
 from collections.abc import Generator
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 import contextlib
 import logging
 
@@ -11,6 +12,7 @@ from archinfo.arch_arm import is_arm_arch
 from angr.analyses import AnalysesHub
 from angr.analyses.analysis import Analysis
 from angr.errors import AngrRuntimeError
+from angr.utils.mp import mp_context
 from .flirt_sig import FlirtSignature, FlirtSignatureParsed
 from .flirt_function import FlirtFunction
 from .flirt_matcher import FlirtMatcher
@@ -25,6 +27,40 @@ _l = logging.getLogger(name=__name__)
 MAX_UNIQUE_STRING_LEN = 70
 
 
+# function prefixes that are shared with worker processes
+_worker_func_bytes: dict[int, tuple[int, bytes]] = {}
+
+
+def _init_worker(func_bytes: dict[int, tuple[int, bytes]]) -> None:
+    global _worker_func_bytes  # pylint:disable=global-statement
+    _worker_func_bytes = func_bytes
+
+
+def _find_candidates(sig_path: str, max_mismatched_bytes: int) -> set[int]:
+    """
+    Find all functions that may match a FLIRT signature file, only considering the bytes of each function. Referenced
+    functions of matching modules are not checked.
+
+    :param sig_path:                Path to the signature file.
+    :param max_mismatched_bytes:    Maximum number of mismatched bytes.
+    :return:                        A set of addresses of functions that may match.
+    """
+    with open(sig_path, "rb") as sigfile:
+        flirt = FlirtSignatureParsed.parse(sigfile)
+    candidates = set()
+    for func_addr, (start, func_bytes) in _worker_func_bytes.items():
+        matcher = FlirtMatcher(
+            flirt,
+            None,  # type:ignore
+            lambda _func, _addr, _call_addr, expected_name: expected_name,
+            lambda _func, _base_addr, _flirt_func: None,
+            mismatch_bytes_tolerance=max_mismatched_bytes,
+        )
+        if matcher.match_function(func_bytes, start):
+            candidates.add(func_addr)
+    return candidates
+
+
 class FlirtAnalysis(Analysis):
     """
     FlirtAnalysis accomplishes two purposes:
@@ -35,7 +71,13 @@ class FlirtAnalysis(Analysis):
       current binary, and then match all possible signatures for the architecture.
     """
 
-    def __init__(self, sig: FlirtSignature | str | None = None, max_mismatched_bytes: int = 0):
+    def __init__(self, sig: FlirtSignature | str | None = None, max_mismatched_bytes: int = 0, workers: int = 0):
+        """
+        :param sig:                     The FLIRT signature or the path to a FLIRT signature file to match.
+        :param max_mismatched_bytes:    Maximum number of mismatched bytes that are allowed when matching a function.
+        :param workers:                 Number of worker processes that pre-filter functions against signature files in
+                                        parallel. 0 to match all signature files in the current process.
+        """
 
         from angr.flirt import FLIRT_SIGNATURES_BY_ARCH  # pylint:disable=import-outside-toplevel
 
@@ -45,6 +87,11 @@ class FlirtAnalysis(Analysis):
         self.matched_suggestions: dict[str, tuple[FlirtSignature, dict[int, str]]] = {}
         self._temporary_sig = False
         self._max_mismatched_bytes = max_mismatched_bytes
+        self._workers = workers
+        # function address -> (start address, bytes of the function)
+        self._func_bytes: dict[int, tuple[int, bytes]] = {}
+        # signature path -> addresses of functions that may match this signature
+        self._candidates: dict[str, set[int]] = {}
 
         if sig:
             if isinstance(sig, str):
@@ -72,6 +119,9 @@ class FlirtAnalysis(Analysis):
             self.signatures = list(self._find_hits_by_strings(mem_regions))
             _l.debug("Identified %d signatures to apply.", len(self.signatures))
 
+        if self._workers > 0 and len(self.signatures) > 1:
+            self._find_candidates_in_parallel()
+
         path_to_sig: dict[str, FlirtSignature] = {}
         for sig_ in self.signatures:
             self._match_all_against_one_signature(sig_)
@@ -122,9 +172,63 @@ class FlirtAnalysis(Analysis):
                     # ARMHF may use ARMEL libraries
                     yield sig
 
+    def _load_function_bytes(self, func: Function) -> tuple[int, bytes]:
+        """
+        Load the bytes of a function (plus some trailing bytes), which are used for matching. Loaded bytes are cached
+        and reused for all signatures.
+
+        :param func:    The function.
+        :return:        A tuple of (the start address, the bytes).
+        """
+        if func.addr in self._func_bytes:
+            return self._func_bytes[func.addr]
+
+        start = func.addr
+        if self._is_arm:
+            start = start & 0xFFFF_FFFE
+
+        max_block_addr = max(func.block_addrs_set)
+        end_block = func.get_block(max_block_addr)
+        end = max_block_addr + end_block.size
+
+        if self._is_arm:
+            end = end & 0xFFFF_FFFE
+
+        # load all bytes
+        r = start, self.project.loader.memory.load(start, end - start + 0x100)
+        self._func_bytes[func.addr] = r
+        return r
+
+    @staticmethod
+    def _should_match(func: Function) -> bool:
+        return not func.is_simprocedure and not func.is_plt and func.is_default_name
+
+    def _find_candidates_in_parallel(self) -> None:
+        """
+        Match all functions against all signature files in worker processes, only considering the bytes of each
+        function. Functions that do not match a signature file are skipped when the signature file is applied.
+        """
+        for func in self.project.kb.functions.values():
+            if self._should_match(func):
+                self._load_function_bytes(func)
+
+        with ProcessPoolExecutor(
+            max_workers=self._workers,
+            mp_context=mp_context(),
+            initializer=_init_worker,
+            initargs=(self._func_bytes,),
+        ) as executor:
+            sig_paths = list({sig.sig_path for sig in self.signatures})
+            for sig_path, candidates in zip(
+                sig_paths,
+                executor.map(_find_candidates, sig_paths, [self._max_mismatched_bytes] * len(sig_paths)),
+            ):
+                self._candidates[sig_path] = candidates
+
     def _match_all_against_one_signature(self, sig: FlirtSignature):
         # match each function
         self._suggestions = {}
+        candidates = self._candidates.get(sig.sig_path, None)
         with open(sig.sig_path, "rb") as sigfile:
             flirt = FlirtSignatureParsed.parse(sigfile)
             tolerances = range(self._max_mismatched_bytes + 1)
@@ -151,21 +255,11 @@ class FlirtAnalysis(Analysis):
                         if not func.is_default_name:
                             # it already has a name. skip
                             continue
+                        if candidates is not None and func.addr not in candidates:
+                            # the bytes of this function do not match this signature
+                            continue
 
-                        # print(tolerance, repr(func))
-                        start = func.addr
-                        if self._is_arm:
-                            start = start & 0xFFFF_FFFE
-
-                        max_block_addr = max(func.block_addrs_set)
-                        end_block = func.get_block(max_block_addr)
-                        end = max_block_addr + end_block.size
-
-                        if self._is_arm:
-                            end = end & 0xFFFF_FFFE
-
-                        # load all bytes
-                        func_bytes = self.project.loader.memory.load(start, end - start + 0x100)
+                        start, func_bytes = self._load_function_bytes(func)
                         matcher = FlirtMatcher(
                             flirt,
                             func,
@@ -305,27 +305,38 @@ class FlirtMatcher:
 
     def match_function(self, buff: bytes, addr: int) -> bool:
         assert self.sig.root is not None
-        return any(self._match_node(node, buff, addr, 0, 0) for node in self.sig.root.children)
+        buff = memoryview(buff)
+        return any(
+            self._match_node(node, buff, addr, 0, 0) for node in self._candidate_children(self.sig.root, buff, 0)
+        )
 
-    def _match_node(self, node: FlirtNode, buff: bytes, addr: int, offset: int, mismatches: int) -> bool:
-        if len(buff) < offset + len(node.pattern):
+    def _candidate_children(self, node: FlirtNode, buff: memoryview, offset: int) -> list[FlirtNode]:
+        if self.mismatch_bytes_tolerance > 0 or offset >= len(buff):
+            return node.children
+        return node.children_by_first_byte(buff[offset])
+
+    def _match_node(self, node: FlirtNode, buff: memoryview, addr: int, offset: int, mismatches: int) -> bool:
+        length = node.length
+        if len(buff) < offset + length:
             return False
-        for i in range(len(node.pattern)):  # pylint:disable=consider-using-enumerate
-            if node.pattern[i] != -1 and node.pattern[i] != buff[offset + i]:
-                mismatches += 1
+        if length > 0:
+            # compare all non-wildcard bytes at once
+            diff = (int.from_bytes(buff[offset : offset + length], "big") & node.pattern_mask) ^ node.pattern_value
+            if diff:
+                if self.mismatch_bytes_tolerance == 0:
+                    return False
+                # count mismatched bytes
+                mismatches += length - diff.to_bytes(length, "big").count(0)
                 if mismatches > self.mismatch_bytes_tolerance:
                     return False
-        if mismatches <= self.mismatch_bytes_tolerance:
-            # a matching node is found
-            for child in node.children:
-                if self._match_node(child, buff, addr, offset + node.length, mismatches):
-                    return True
-            for module in node.modules:
-                if self._match_module(module, buff, addr, offset + node.length):
-                    return True
-        return False
+        # a matching node is found
+        next_offset = offset + length
+        for child in self._candidate_children(node, buff, next_offset):
+            if self._match_node(child, buff, addr, next_offset, mismatches):
+                return True
+        return any(self._match_module(module, buff, addr, next_offset) for module in node.modules)
 
-    def _match_module(self, module: FlirtModule, buff: bytes, addr: int, offset: int) -> bool:
+    def _match_module(self, module: FlirtModule, buff: memoryview, addr: int, offset: int) -> bool:
         offset = max(offset, 32)
         if module.crc_len > len(buff) - offset:
             return False
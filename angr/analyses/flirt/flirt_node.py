@@ -5,9 +5,22 @@ from .flirt_module import FlirtModule
 class FlirtNode:
     """
     Describes a tree node in the FLIRT signature tree.
+
+    Upon creation, the pattern of each node is compiled into an integer value and an integer mask (where wildcard bytes
+    are zeroed out), so that a node can be matched against a byte sequence with a single masked comparison. Child nodes
+    are indexed by the first byte of their patterns.
     """
 
-    __slots__ = ("children", "length", "modules", "pattern")
+    __slots__ = (
+        "_children_by_first_byte",
+        "_wildcard_children",
+        "children",
+        "length",
+        "modules",
+        "pattern",
+        "pattern_mask",
+        "pattern_value",
+    )
 
     def __init__(self, children: list[FlirtNode], modules: list[FlirtModule], length: int, pattern: list[int]):
         self.children = children
@@ -15,9 +28,35 @@ class FlirtNode:
         self.length = length
         self.pattern = pattern
 
+        self.pattern_value = int.from_bytes(bytes(0 if b == -1 else b for b in pattern), "big")
+        self.pattern_mask = int.from_bytes(bytes(0 if b == -1 else 0xFF for b in pattern), "big")
+
+        # children that may match a given first byte, in their original order
+        self._wildcard_children: list[FlirtNode] = [
+            child for child in children if not child.pattern or child.pattern[0] == -1
+        ]
+        self._children_by_first_byte: dict[int, list[FlirtNode]] = {}
+        for child in children:
+            if child.pattern and child.pattern[0] != -1 and child.pattern[0] not in self._children_by_first_byte:
+                first_byte = child.pattern[0]
+                self._children_by_first_byte[first_byte] = [
+                    c for c in children if not c.pattern or c.pattern[0] in {-1, first_byte}
+                ]
+
     @property
     def leaf(self) -> bool:
         return not self.children
 
+    def children_by_first_byte(self, first_byte: int | None) -> list[FlirtNode]:
+        """
+        Get all child nodes whose patterns may start with the given byte.
+
+        :param first_byte:  The first byte, or None if it is unknown.
+        :return:            A list of child nodes, in their original order.
+        """
+        if first_byte is None:
+            return self.children
+        return self._children_by_first_byte.get(first_byte, self._wildcard_children)
+
     def __repr__(self) -> str:
         return f"<FlirtNode length={self.length} leaf={self.leaf}>"
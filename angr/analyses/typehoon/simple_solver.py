@@ -4,6 +4,7 @@ import enum
 from collections import defaultdict
 from contextlib import suppress
 import logging
+import time
 
 import networkx
 from sortedcontainers import SortedDict
@@ -460,6 +461,8 @@ class SimpleSolver:
         self.processed_constraints_count: int = 0
         self.simplified_constraints_count: int = 0
         self.eqclass_constraints_count: list[int] = []
+        # accumulated time (in seconds) spent in each of the expensive steps of solving
+        self.timing: dict[str, float] = defaultdict(float)
 
         #
         # Solving state
@@ -593,9 +596,11 @@ class SimpleSolver:
                 )
                 primitive_constraints = self._generate_primitive_constraints(tvs, base_constraint_graph)
                 if len(tvs) > 1:
+                    start = time.perf_counter()
                     primitive_constraints |= self._generate_transitive_subtype_constraints(
                         tvs, filtered_constraint_subset, primitive_constraints
                     )
+                    self.timing["generate_transitive_subtype_constraints"] += time.perf_counter() - start
                 tvs_with_primitive_constraints = set()
                 for primitive_constraint in primitive_constraints:
                     tv = self._typevar_from_primitive_constraint(primitive_constraint)
@@ -647,7 +652,9 @@ class SimpleSolver:
         Computing sketches from constraint sets. Implements Algorithm E.1 in the retypd paper.
         """
 
+        start = time.perf_counter()
         equivalence_classes, quotient_graph = self.compute_quotient_graph(constraints)
+        self.timing["compute_quotient_graph"] += time.perf_counter() - start
 
         sketches: dict[TypeVariable, Sketch] = {}
         for tv in typevars:
@@ -665,7 +672,9 @@ class SimpleSolver:
             assert isinstance(graph_node, TypeVariable)
             assert isinstance(sketch_node, SketchNode)
             visited = {graph_node: sketch_node}
+            start = time.perf_counter()
             self._get_all_paths(quotient_graph, sketch, graph_node, visited)
+            self.timing["get_all_paths"] += time.perf_counter() - start
         return equivalence_classes, sketches
 
     def compute_quotient_graph(self, constraints: set[TypeConstraint]):
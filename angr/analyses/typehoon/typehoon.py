@@ -68,6 +68,7 @@ class Typehoon(Analysis):
         # stats
         self.processed_constraints_count: int = 0
         self.eqclass_constraints_count: list[int] = []
+        self.solver_timing: dict[str, float] = {}
 
         # import pprint
         # pprint.pprint(self._var_mapping)
@@ -223,6 +224,7 @@ class Typehoon(Analysis):
         self.solution = solver.solution
         self.processed_constraints_count = solver.processed_constraints_count
         self.eqclass_constraints_count = solver.eqclass_constraints_count
+        self.solver_timing = dict(solver.timing)
 
     def _specialize(self):
         """
@@ -55,6 +55,22 @@ class SimEngineVRAIL(
     def _process_block_end(self, block, stmt_data, whitelist):
         pass
 
+    def _lift_prototype_args(
+        self, prototype: SimTypeFunction, prototype_libname: str | None, callee_addr: int | None
+    ) -> tuple[typeconsts.TypeConstant, ...]:
+        """
+        Lift the argument types of a callee prototype into type constants. Prototypes of known callee functions are
+        lifted once and cached per function in the knowledge base, so that they are reused by all callers.
+        """
+        if callee_addr is not None:
+            return self.kb.lifted_prototypes.lift_args(callee_addr, prototype, prototype_libname, self.type_lifter)
+        return tuple(
+            self.type_lifter.lift(
+                dereference_simtype_by_lib(arg_type, prototype_libname) if prototype_libname else arg_type
+            )
+            for arg_type in prototype.args
+        )
+
     # Statement handlers
 
     def _handle_stmt_Assignment(self, stmt):
@@ -175,6 +191,7 @@ class SimEngineVRAIL(
         # discover the prototype
         prototype: SimTypeFunction | None = None
         prototype_libname: str | None = None
+        callee_addr: int | None = None
         if expr.prototype is not None:
             prototype = expr.prototype
         if isinstance(expr.target, ailment.Expr.Const):
@@ -183,6 +200,7 @@ class SimEngineVRAIL(
                 func = self.kb.functions[func_addr]
                 if prototype is None:
                     prototype = func.prototype
+                    callee_addr = func.addr
                 prototype_libname = func.prototype_libname
 
         # dump the type of the return value
@@ -192,12 +210,8 @@ class SimEngineVRAIL(
 
         if prototype is not None and args:
             # add type constraints
-            for arg, arg_type in zip(args, prototype.args):
+            for arg, arg_ty in zip(args, self._lift_prototype_args(prototype, prototype_libname, callee_addr)):
                 if arg.typevar is not None:
-                    arg_type = (
-                        dereference_simtype_by_lib(arg_type, prototype_libname) if prototype_libname else arg_type
-                    )
-                    arg_ty = self.type_lifter.lift(arg_type)
                     type_constraint = typevars.Subtype(arg.typevar, arg_ty)
                     self.state.add_type_constraint(type_constraint)
 
@@ -238,6 +252,7 @@ class SimEngineVRAIL(
         # discover the prototype
         prototype: SimTypeFunction | None = None
         prototype_libname: str | None = None
+        callee_addr: int | None = None
         if stmt.prototype is not None:
             prototype = stmt.prototype
         if isinstance(stmt.target, ailment.Expr.Const):
@@ -246,6 +261,7 @@ class SimEngineVRAIL(
                 func = self.kb.functions[func_addr]
                 if prototype is None:
                     prototype = func.prototype
+                    callee_addr = func.addr
                 prototype_libname = func.prototype_libname
 
         # dump the type of the return value
@@ -279,17 +295,12 @@ class SimEngineVRAIL(
 
         if prototype is not None and args:
             # add type constraints
-            for arg, arg_type in zip(args, prototype.args):
-                if arg.typevar is not None:
-                    arg_type = (
-                        dereference_simtype_by_lib(arg_type, prototype_libname) if prototype_libname else arg_type
-                    )
-                    arg_ty = self.type_lifter.lift(arg_type)
-                    if arg.typevar is not None and isinstance(
-                        arg_ty, (typeconsts.TypeConstant, typevars.TypeVariable, typevars.DerivedTypeVariable)
-                    ):
-                        type_constraint = typevars.Subtype(arg.typevar, arg_ty)
-                        self.state.add_type_constraint(type_constraint)
+            for arg, arg_ty in zip(args, self._lift_prototype_args(prototype, prototype_libname, callee_addr)):
+                if arg.typevar is not None and isinstance(
+                    arg_ty, (typeconsts.TypeConstant, typevars.TypeVariable, typevars.DerivedTypeVariable)
+                ):
+                    type_constraint = typevars.Subtype(arg.typevar, arg_ty)
+                    self.state.add_type_constraint(type_constraint)
 
     def _handle_stmt_Return(self, stmt):
         if stmt.ret_exprs:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 from typing import Any, TYPE_CHECKING
 import time
+import uuid
 from contextlib import contextmanager
 
 from sqlalchemy import create_engine
@@ -9,7 +10,7 @@ from sqlalchemy.exc import DatabaseError
 
 from angr.errors import AngrCorruptDBError, AngrIncompatibleDBError, AngrDBError
 from angr.project import Project
-from .models import Base, DbInformation
+from .models import Base, DbInformation, DbCallGraph
 from .serializers import LoaderSerializer, KnowledgeBaseSerializer
 
 if TYPE_CHECKING:
@@ -26,7 +27,7 @@ class AngrDB:
         "objects",
     ]
 
-    VERSION = 1
+    VERSION = 2
 
     def __init__(self, project=None):
         self.project = project
@@ -144,12 +145,33 @@ class AngrDB:
         :rtype:             bool
         """
 
-        return version == self.VERSION
+        return version is not None and 1 <= version <= self.VERSION
+
+    def migrate(self, session, version):
+        """
+        Migrate a database of an older version to the current version.
+
+        Version 1 databases may carry call graphs and revisions that were not kept up to date by all versions of angr
+        that wrote to them. Both are dropped, so that functions are loaded eagerly and the next dump rewrites all rows.
+
+        :param session:
+        :param int version: The version of the database.
+        :return:
+        """
+
+        if version < 2:
+            session.query(DbCallGraph).delete()
+            session.query(DbInformation).filter_by(key="revision").delete()
+        self.save_info(session, "version", str(self.VERSION))
 
     def dump(self, db_path, kbs: list[KnowledgeBase] | None = None, extra_info: dict[str, Any] | None = None):
         db_str = f"sqlite:///{db_path}"
 
         with self.open_db(db_str) as Session, self.session_scope(Session) as session:
+            version = self.get_dbinfo(session)["version"]
+            if self.db_compatible(version) and version < self.VERSION:
+                self.migrate(session, version)
+
             # Dump the loader
             LoaderSerializer.dump(session, self.project.loader)
             # Dump the knowledge base
@@ -157,10 +179,15 @@ class AngrDB:
             if kbs is None:
                 kbs = [self.project.kb]
 
+            # knowledge bases that were most recently dumped to or loaded from the current revision of the database
+            # only write rows that have changed since then
+            revision = self.get_info(session, "revision")
+            new_revision = uuid.uuid4().hex
             for kb in kbs:
-                KnowledgeBaseSerializer.dump(session, kb)
+                KnowledgeBaseSerializer.dump(session, kb, revision=revision, new_revision=new_revision)
 
             # Update the information
+            self.save_info(session, "revision", new_revision)
             self.update_dbinfo(session, extra_info=extra_info)
 
     def load(
@@ -169,7 +196,24 @@ class AngrDB:
         kb_names: list[str] | None = None,
         other_kbs: dict[str, KnowledgeBase] | None = None,
         extra_info: dict[str, Any] | None = None,
+        lazy_functions: bool = False,
+        max_cached_functions: int | None = None,
     ):
+        """
+        Load a project and its knowledge bases from a database.
+
+        :param db_path:                 Path to the database.
+        :param kb_names:                Names of knowledge bases to load. Only the global knowledge base is loaded by
+                                        default.
+        :param other_kbs:               A dict to store loaded knowledge bases that are not the global one.
+        :param extra_info:              A dict to store all information entries of the database.
+        :param lazy_functions:          Only load functions from the database when they are first accessed. The database
+                                        must not be removed or modified while the project is in use.
+        :param max_cached_functions:    Maximum number of lazily loaded functions to keep in memory. The least recently
+                                        used functions are evicted. None to keep all accessed functions in memory.
+        :return:                        The loaded project.
+        """
+
         db_str = f"sqlite:///{db_path}"
 
         with self.open_db(db_str) as Session, self.session_scope(Session) as session:
@@ -179,6 +223,8 @@ class AngrDB:
                 raise AngrIncompatibleDBError(
                     "Version {} is incompatible with the current version of angr.".format(dbinfo.get("version", None))
                 )
+            if dbinfo["version"] < self.VERSION:
+                self.migrate(session, dbinfo["version"])
 
             # Load the loader
             loader = LoaderSerializer.load(session)
@@ -195,8 +241,16 @@ class AngrDB:
                 )
 
             # Load knowledgebases
+            revision = self.get_info(session, "revision")
             for kb_name in kb_names:
-                kb = KnowledgeBaseSerializer.load(session, proj, kb_name)
+                kb = KnowledgeBaseSerializer.load(
+                    session,
+                    proj,
+                    kb_name,
+                    Session=Session if lazy_functions else None,
+                    max_cached_functions=max_cached_functions,
+                    revision=revision,
+                )
                 if kb is not None:
                     if kb_name == "global":
                         proj.kb = kb
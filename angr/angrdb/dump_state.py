@@ -0,0 +1,88 @@
+from __future__ import annotations
+from typing import Any
+import hashlib
+
+
+# the maximum number of parameters in a single DELETE ... WHERE ... IN (...) statement. older versions of SQLite only
+# support up to 999 parameters per statement.
+MAX_DELETE_BATCH_SIZE = 500
+
+
+class DumpState:
+    """
+    Tracks the rows that a knowledge base plugin has most recently been dumped to (or loaded from) a database, so that
+    repeated dumps to the same database only write rows that have changed since then. Functions and xrefs are marked
+    dirty upon modification. Other plugins hold objects that are modified in place from many places (e.g., variables
+    and decompilation caches), so their rows are compared by digests or values instead.
+
+    The state is only valid for the database revision that it is recorded for. AngrDB assigns a new revision to the
+    database upon each dump. When the revision of the database differs from the recorded one (for example, because the
+    plugin is dumped to another database, or the database has been updated elsewhere), serializers fall back to
+    rewriting all rows of the plugin.
+    """
+
+    __slots__ = (
+        "revision",
+        "rows",
+    )
+
+    def __init__(self):
+        self.revision: str | None = None
+        # row keys to digests (or values, or None if only keys are tracked) of rows as they are stored in the database
+        self.rows: dict[Any, Any] = {}
+
+    def is_valid(self, revision: str | None) -> bool:
+        return revision is not None and self.revision == revision
+
+    def reset(self, revision: str | None = None) -> None:
+        self.revision = revision
+        self.rows.clear()
+
+
+def get_dump_state(plugin) -> DumpState:
+    """
+    Get the dump state of a knowledge base plugin, and create one if it does not exist.
+
+    :param plugin:  The knowledge base plugin.
+    :return:        The dump state.
+    """
+    state = getattr(plugin, "_angrdb_dump_state", None)
+    if state is None:
+        state = DumpState()
+        plugin._angrdb_dump_state = state
+    return state
+
+
+def digest(*fields: bytes | str | None) -> bytes:
+    """
+    Compute a digest of all fields of a row.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    for field in fields:
+        if field is None:
+            h.update(b"\x00")
+            continue
+        if isinstance(field, str):
+            field = field.encode("utf-8")
+        h.update(b"\x01")
+        h.update(len(field).to_bytes(8, "little"))
+        h.update(field)
+    return h.digest()
+
+
+def delete_rows(session, model, db_kb, column, keys, **filters) -> None:
+    """
+    Delete rows of a knowledge base in batches.
+
+    :param session: The database session object.
+    :param model:   The model class of rows to delete.
+    :param db_kb:   The database object for KnowledgeBase.
+    :param column:  The column to filter rows by.
+    :param keys:    Values of `column` of rows to delete.
+    :param filters: Other filters.
+    """
+    keys = list(keys)
+    for i in range(0, len(keys), MAX_DELETE_BATCH_SIZE):
+        session.query(model).filter_by(kb=db_kb, **filters).filter(
+            column.in_(keys[i : i + MAX_DELETE_BATCH_SIZE])
+        ).delete(synchronize_session=False)
@@ -44,6 +44,7 @@ class DbKnowledgeBase(Base):
 
     cfgs = relationship("DbCFGModel", back_populates="kb")
     funcs = relationship("DbFunction", back_populates="kb")
+    callgraph = relationship("DbCallGraph", uselist=False, back_populates="kb")
     xrefs = relationship("DbXRefs", uselist=False, back_populates="kb")
     comments = relationship("DbComment", back_populates="kb")
     labels = relationship("DbLabel", back_populates="kb")
@@ -83,8 +84,26 @@ class DbFunction(Base):
         nullable=False,
     )
     kb = relationship("DbKnowledgeBase", uselist=False, back_populates="funcs")
-    addr = Column(Integer)
+    addr = Column(Integer, index=True)
+    blob = Column(BLOB)
+
+
+class DbCallGraph(Base):
+    """
+    Models the call graph of a FunctionManager instance, along with the block addresses of each function.
+    """
+
+    __tablename__ = "callgraphs"
+
+    id = Column(Integer, primary_key=True)
+    kb_id = Column(
+        Integer,
+        ForeignKey("knowledgebases.id"),
+        nullable=False,
+    )
+    kb = relationship("DbKnowledgeBase", uselist=False, back_populates="callgraph")
     blob = Column(BLOB)
+    block_addrs = Column(BLOB, nullable=True)
 
 
 class DbVariableCollection(Base):
@@ -1,6 +1,7 @@
 # pylint:disable=unused-import
 from __future__ import annotations
 from angr.angrdb.models import DbComment
+from angr.angrdb.dump_state import get_dump_state, delete_rows
 from angr.knowledge_plugins.comments import Comments
 
 
@@ -10,44 +11,44 @@ class CommentsSerializer:
     """
 
     @staticmethod
-    def dump(session, db_kb, comments):
+    def dump(session, db_kb, comments, revision=None, new_revision=None):
         """
 
         :param session:
         :param DbKnowledgeBase db_kb:
         :param Comments comments:
+        :param str revision:            The current revision of the database.
+        :param str new_revision:        The revision of the database after this dump.
         :return:                        None
         """
 
-        for addr, comment in comments.items():
-            db_comment = (
-                session.query(DbComment)
-                .filter_by(
-                    kb=db_kb,
-                    addr=addr,
-                )
-                .scalar()
-            )
-            if db_comment is not None:
-                if comment == db_comment.comment:
-                    continue
-                db_comment.comment = comment
-            else:
-                db_comment = DbComment(
-                    kb=db_kb,
-                    addr=addr,
-                    comment=comment,
-                    type=0,
-                )
-                session.add(db_comment)
+        state = get_dump_state(comments)
+        if state.is_valid(revision):
+            saved = state.rows
+        else:
+            saved = {db_comment.addr: db_comment.comment for db_comment in session.query(DbComment).filter_by(kb=db_kb)}
+
+        # only write comments that have changed since the last dump
+        outdated_addrs = [addr for addr, comment in saved.items() if addr not in comments or comments[addr] != comment]
+        delete_rows(session, DbComment, db_kb, DbComment.addr, outdated_addrs)
+        session.add_all(
+            DbComment(kb=db_kb, addr=addr, comment=comment, type=0)
+            for addr, comment in comments.items()
+            if addr not in saved or saved[addr] != comment
+        )
+
+        new_rows = dict(comments.items())
+        state.reset(new_revision)
+        state.rows.update(new_rows)
 
     @staticmethod
-    def load(session, db_kb, kb):  # pylint:disable=unused-argument
+    def load(session, db_kb, kb, revision=None):  # pylint:disable=unused-argument
         """
 
         :param session:
         :param DbKnowledgeBase db_kb:
         :param KnowledgeBase kb:
+        :param str revision:            The current revision of the database.
         :return:
         """
 
@@ -57,4 +58,8 @@ class CommentsSerializer:
         for db_comment in db_comments:
             comments[db_comment.addr] = db_comment.comment
 
+        state = get_dump_state(comments)
+        state.reset(revision)
+        state.rows.update((db_comment.addr, db_comment.comment) for db_comment in db_comments)
+
         return comments
@@ -1,61 +1,240 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING
+import json
+
+import networkx
+from archinfo.arch_soot import SootAddressDescriptor, SootMethodDescriptor
 
 from angr.knowledge_plugins import FunctionManager, Function
-from angr.angrdb.models import DbFunction
+from angr.knowledge_plugins.functions.function_manager import LazyFunctionDict
+from angr.angrdb.models import DbFunction, DbCallGraph
+from angr.angrdb.dump_state import get_dump_state, delete_rows
 
 if TYPE_CHECKING:
     from angr.knowledge_base import KnowledgeBase
     from angr.angrdb.models import DbKnowledgeBase
 
 
+class FunctionKeyJSONEncoder(json.JSONEncoder):
+    """
+    A JSON encoder that supports serializing function keys that are not integers, i.e., Soot method and address
+    descriptors.
+    """
+
+    def default(self, o):
+        if isinstance(o, SootMethodDescriptor):
+            return {
+                "__custom_type__": "SootMethodDescriptor",
+                "__v__": [o.class_name, o.name, list(o.params), o.ret],
+            }
+        if isinstance(o, SootAddressDescriptor):
+            return {
+                "__custom_type__": "SootAddressDescriptor",
+                "__v__": [o.method, o.block_idx, o.stmt_idx],
+            }
+        return super().default(o)
+
+
+class FunctionKeyJSONDecoder(json.JSONDecoder):
+    """
+    A JSON decoder that supports unserializing into Soot method and address descriptors.
+    """
+
+    def __init__(self):
+        super().__init__(object_hook=self._objhook)
+
+    def _objhook(self, d: dict):  # pylint:disable=no-self-use
+        if "__custom_type__" in d and "__v__" in d:
+            match d["__custom_type__"]:
+                case "SootMethodDescriptor":
+                    class_name, name, params, ret = d["__v__"]
+                    return SootMethodDescriptor(class_name, name, tuple(params), ret_type=ret)
+                case "SootAddressDescriptor":
+                    return SootAddressDescriptor(*d["__v__"])
+        return d
+
+
 class FunctionManagerSerializer:
     """
     Serialize/unserialize a function manager and its functions.
     """
 
     @staticmethod
-    def dump(session, db_kb: DbKnowledgeBase, func_manager: FunctionManager):
+    def dump(
+        session,
+        db_kb: DbKnowledgeBase,
+        func_manager: FunctionManager,
+        revision: str | None = None,
+        new_revision: str | None = None,
+    ):
         """
 
         :param session:
         :param DbKnowledgeBase db_kb:
         :param FunctionManager func_manager:
+        :param revision:                The current revision of the database.
+        :param new_revision:            The revision of the database after this dump.
         :return:
         """
 
-        # remove all existing functions
-        session.query(DbFunction).filter_by(kb=db_kb).delete()
+        state = get_dump_state(func_manager)
+        func_map = func_manager._function_map
+        lazy = isinstance(func_map, LazyFunctionDict)
 
-        for func in func_manager.values():
-            db_func = DbFunction(
-                kb=db_kb,
-                addr=func.addr,
-                blob=func.serialize(),
-            )
-            session.add(db_func)
+        block_addrs = None
+        if state.is_valid(revision):
+            block_addrs = FunctionManagerSerializer.load_block_addrs(db_kb)
+        incremental = block_addrs is not None
+
+        if not incremental:
+            # remove all existing functions
+            session.query(DbFunction).filter_by(kb=db_kb).delete()
+            state.reset()
+            block_addrs = {}
+
+        # only write functions that have been modified since the last dump
+        outdated_addrs = [addr for addr in state.rows if addr not in func_map]
+        changed = []
+        for addr in func_map:
+            if incremental and addr in state.rows:
+                if not (func_map.is_dirty(addr) if lazy else func_map[addr].dirty):
+                    continue
+                outdated_addrs.append(addr)
+            func = func_map.get(addr)
+            state.rows[addr] = None
+            changed.append((addr, func.serialize()))
+            block_addrs[addr] = sorted(func.block_addrs_set)
+
+        for addr in outdated_addrs:
+            if addr not in func_map:
+                del state.rows[addr]
+                block_addrs.pop(addr, None)
+        delete_rows(session, DbFunction, db_kb, DbFunction.addr, outdated_addrs)
+        session.add_all(DbFunction(kb=db_kb, addr=addr, blob=blob) for addr, blob in changed)
+
+        if lazy:
+            func_map.clear_dirty()
+        else:
+            for func in func_map.values():
+                func._dirty = False
+
+        # the call graph and block addresses of all functions are stored separately, so that they are available without
+        # unserializing any function. the call graph only changes along with functions
+        if changed or outdated_addrs or db_kb.callgraph is None:
+            callgraph_blob = FunctionManagerSerializer._serialize_callgraph(func_manager.callgraph)
+            block_addrs_blob = json.dumps(sorted(block_addrs.items()), cls=FunctionKeyJSONEncoder).encode("ascii")
+            db_callgraph = db_kb.callgraph
+            if db_callgraph is not None:
+                db_callgraph.blob = callgraph_blob
+                db_callgraph.block_addrs = block_addrs_blob
+            else:
+                db_callgraph = DbCallGraph(kb=db_kb, blob=callgraph_blob, block_addrs=block_addrs_blob)
+                session.add(db_callgraph)
+
+        state.revision = new_revision
 
     @staticmethod
-    def load(session, db_kb: DbKnowledgeBase, kb: KnowledgeBase):
+    def load(
+        session,
+        db_kb: DbKnowledgeBase,
+        kb: KnowledgeBase,
+        Session=None,
+        max_cached_functions: int | None = None,
+        revision: str | None = None,
+    ):
         """
 
         :param session:
         :param DbKnowledgeBase db_kb:
         :param KnowledgeBase kb:
+        :param Session:                 A session maker. When specified, functions are lazily loaded from the database
+                                        through new sessions of this session maker upon their first access.
+        :param max_cached_functions:    Maximum number of lazily loaded functions to keep in memory. None to keep all
+                                        functions that have been accessed.
+        :param revision:                The current revision of the database.
         :return:                        A loaded function manager.
         """
 
         funcs = FunctionManager(kb)
 
-        db_funcs = session.query(DbFunction).filter_by(kb=db_kb)
         all_func_addrs = {x[0] for x in session.query(DbFunction.addr).filter_by(kb=db_kb)}
+        state = get_dump_state(funcs)
+        state.reset(revision)
+
+        db_callgraph = db_kb.callgraph
+        if Session is not None and db_callgraph is not None:
+            funcs._function_map = LazyFunctionDict(
+                funcs,
+                all_func_addrs,
+                FunctionManagerSerializer._function_loader(Session, db_kb.id),
+                max_cached_functions=max_cached_functions,
+                key_types=funcs.function_address_types,
+            )
+            funcs.function_addrs_set = all_func_addrs
+            state.rows.update(dict.fromkeys(all_func_addrs))
+            funcs.callgraph = FunctionManagerSerializer._parse_callgraph(db_callgraph.blob)
+            return funcs
 
+        db_funcs = session.query(DbFunction).filter_by(kb=db_kb)
         for db_func in db_funcs:
             func = Function.parse(
                 db_func.blob, function_manager=funcs, project=kb._project, all_func_addrs=all_func_addrs
             )
             funcs[func.addr] = func
+            func._dirty = False
+            state.rows[db_func.addr] = None
 
-        funcs.rebuild_callgraph()
+        if db_callgraph is not None:
+            funcs.callgraph = FunctionManagerSerializer._parse_callgraph(db_callgraph.blob)
+        else:
+            funcs.rebuild_callgraph()
 
         return funcs
+
+    @staticmethod
+    def load_block_addrs(db_kb: DbKnowledgeBase) -> dict[int, list[int]] | None:
+        """
+        Load the block addresses of all functions without unserializing any function.
+
+        :param DbKnowledgeBase db_kb:
+        :return:                        A dict of function addresses to block addresses, or None if block addresses are
+                                        not stored in the database.
+        """
+
+        db_callgraph = db_kb.callgraph
+        if db_callgraph is None or db_callgraph.block_addrs is None:
+            return None
+        return dict(json.loads(db_callgraph.block_addrs, cls=FunctionKeyJSONDecoder))
+
+    @staticmethod
+    def _function_loader(Session, kb_id: int):
+        def _load(addr: int) -> bytes:
+            session = Session()
+            try:
+                blob = session.query(DbFunction.blob).filter_by(kb_id=kb_id, addr=addr).scalar()
+            finally:
+                session.close()
+            if blob is None:
+                raise KeyError(addr)
+            return blob
+
+        return _load
+
+    @staticmethod
+    def _serialize_callgraph(callgraph: networkx.MultiDiGraph) -> bytes:
+        return json.dumps(
+            {
+                "nodes": list(callgraph.nodes),
+                "edges": [[src, dst, data] for src, dst, data in callgraph.edges(data=True)],
+            },
+            cls=FunctionKeyJSONEncoder,
+        ).encode("ascii")
+
+    @staticmethod
+    def _parse_callgraph(blob: bytes) -> networkx.MultiDiGraph:
+        d = json.loads(blob, cls=FunctionKeyJSONDecoder)
+        callgraph = networkx.MultiDiGraph()
+        callgraph.add_nodes_from(d["nodes"])
+        for src, dst, data in d["edges"]:
+            callgraph.add_edge(src, dst, **data)
+        return callgraph
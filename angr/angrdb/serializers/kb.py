@@ -16,11 +16,15 @@ class KnowledgeBaseSerializer:
     """
 
     @staticmethod
-    def dump(session, kb: KnowledgeBase):
+    def dump(session, kb: KnowledgeBase, revision: str | None = None, new_revision: str | None = None):
         """
+        Serialize a KnowledgeBase. When the database revision is the one that the KnowledgeBase was most recently
+        dumped to or loaded from, only rows that have changed since then are written.
 
         :param session:             The database session object.
         :param KnowledgeBase kb:    The KnowledgeBase instance to serialize.
+        :param revision:            The current revision of the database.
+        :param new_revision:        The revision of the database after this dump.
         :return:                    None
         """
 
@@ -35,18 +39,23 @@ class KnowledgeBaseSerializer:
             if cfg_model is not None:
                 CFGModelSerializer.dump(session, db_kb, "CFGFast", cfg_model)
 
-        FunctionManagerSerializer.dump(session, db_kb, kb.functions)
-        XRefsSerializer.dump(session, db_kb, kb.xrefs)
-        CommentsSerializer.dump(session, db_kb, kb.comments)
-        LabelsSerializer.dump(session, db_kb, kb.labels)
-        VariableManagerSerializer.dump(session, db_kb, kb.variables)
-        StructuredCodeManagerSerializer.dump(session, db_kb, kb.decompilations)
+        FunctionManagerSerializer.dump(session, db_kb, kb.functions, revision=revision, new_revision=new_revision)
+        XRefsSerializer.dump(session, db_kb, kb.xrefs, revision=revision, new_revision=new_revision)
+        CommentsSerializer.dump(session, db_kb, kb.comments, revision=revision, new_revision=new_revision)
+        LabelsSerializer.dump(session, db_kb, kb.labels, revision=revision, new_revision=new_revision)
+        VariableManagerSerializer.dump(session, db_kb, kb.variables, revision=revision, new_revision=new_revision)
+        StructuredCodeManagerSerializer.dump(
+            session, db_kb, kb.decompilations, revision=revision, new_revision=new_revision
+        )
 
     @staticmethod
-    def load(session, project, name):
+    def load(session, project, name, Session=None, max_cached_functions=None, revision=None):
         """
 
         :param session:
+        :param Session:                 A session maker. When specified, functions are lazily loaded through it.
+        :param max_cached_functions:    Maximum number of lazily loaded functions to keep in memory.
+        :param revision:                The current revision of the database.
         :return:
         """
 
@@ -62,32 +71,34 @@ class KnowledgeBaseSerializer:
             kb.cfgs["CFGFast"] = cfg_model
 
         # Load functions
-        funcs = FunctionManagerSerializer.load(session, db_kb, kb)
+        funcs = FunctionManagerSerializer.load(
+            session, db_kb, kb, Session=Session, max_cached_functions=max_cached_functions, revision=revision
+        )
         if funcs is not None:
             kb.functions = funcs
 
         # Load xrefs
-        xrefs = XRefsSerializer.load(session, db_kb, kb, cfg_model=cfg_model)
+        xrefs = XRefsSerializer.load(session, db_kb, kb, cfg_model=cfg_model, revision=revision)
         if xrefs is not None:
             kb.xrefs = xrefs
 
         # Load comments
-        comments = CommentsSerializer.load(session, db_kb, kb)
+        comments = CommentsSerializer.load(session, db_kb, kb, revision=revision)
         if comments is not None:
             kb.comments = comments
 
         # Load labels
-        labels = LabelsSerializer.load(session, db_kb, kb)
+        labels = LabelsSerializer.load(session, db_kb, kb, revision=revision)
         if labels is not None:
             kb.labels = labels
 
         # Load variables
-        variables = VariableManagerSerializer.load(session, db_kb, kb)
+        variables = VariableManagerSerializer.load(session, db_kb, kb, revision=revision)
         if variables is not None:
             kb.variables = variables
 
         # Load structured code
-        structured_code = StructuredCodeManagerSerializer.load(session, db_kb, kb)
+        structured_code = StructuredCodeManagerSerializer.load(session, db_kb, kb, revision=revision)
         if structured_code is not None:
             kb.decompilations = structured_code
 
@@ -95,11 +106,14 @@ class KnowledgeBaseSerializer:
             # CFG may not exist for all knowledge bases
 
             # fill in CFGNode.function_address
-            for func in funcs.values():
-                for block_addr in func.block_addrs_set:
+            func_block_addrs = FunctionManagerSerializer.load_block_addrs(db_kb)
+            if func_block_addrs is None:
+                func_block_addrs = {func.addr: func.block_addrs_set for func in funcs.values()}
+            for func_addr, block_addrs in func_block_addrs.items():
+                for block_addr in block_addrs:
                     node = cfg_model.get_any_node(block_addr)
                     if node is not None:
-                        node.function_address = func.addr
+                        node.function_address = func_addr
 
             # re-initialize CFGModel.insn_addr_to_memory_data
             # fill in insn_addr_to_memory_data
@@ -1,6 +1,7 @@
 # pylint:disable=unused-import
 from __future__ import annotations
 from angr.angrdb.models import DbLabel
+from angr.angrdb.dump_state import get_dump_state, delete_rows
 from angr.knowledge_plugins.labels import Labels
 
 
@@ -10,43 +11,44 @@ class LabelsSerializer:
     """
 
     @staticmethod
-    def dump(session, db_kb, labels):
+    def dump(session, db_kb, labels, revision=None, new_revision=None):
         """
 
         :param session:
         :param DbKnowledgeBase db_kb:
         :param Labels labels:
+        :param str revision:            The current revision of the database.
+        :param str new_revision:        The revision of the database after this dump.
         :return:                        None
         """
 
-        for addr, name in labels.items():
-            db_label = (
-                session.query(DbLabel)
-                .filter_by(
-                    kb=db_kb,
-                    addr=addr,
-                )
-                .scalar()
-            )
-            if db_label is not None:
-                if name == db_label.name:
-                    continue
-                db_label.name = name
-            else:
-                db_label = DbLabel(
-                    kb=db_kb,
-                    addr=addr,
-                    name=name,
-                )
-                session.add(db_label)
+        state = get_dump_state(labels)
+        if state.is_valid(revision):
+            saved = state.rows
+        else:
+            saved = {db_label.addr: db_label.name for db_label in session.query(DbLabel).filter_by(kb=db_kb)}
+
+        # only write labels that have changed since the last dump
+        outdated_addrs = [addr for addr, name in saved.items() if addr not in labels or labels[addr] != name]
+        delete_rows(session, DbLabel, db_kb, DbLabel.addr, outdated_addrs)
+        session.add_all(
+            DbLabel(kb=db_kb, addr=addr, name=name)
+            for addr, name in labels.items()
+            if addr not in saved or saved[addr] != name
+        )
+
+        new_rows = dict(labels.items())
+        state.reset(new_revision)
+        state.rows.update(new_rows)
 
     @staticmethod
-    def load(session, db_kb, kb):  # pylint:disable=unused-argument
+    def load(session, db_kb, kb, revision=None):  # pylint:disable=unused-argument
         """
 
         :param session:
         :param DbKnowledgeBase db_kb:
         :param KnowledgeBase kb:
+        :param str revision:            The current revision of the database.
         :return:
         """
 
@@ -54,6 +56,13 @@ class LabelsSerializer:
         labels = Labels(kb)
 
         for db_label in db_labels:
-            labels[db_label.addr] = db_label.name
+            # names of functions are stored along with functions. do not rename (or lazily load) any function here
+            del labels[db_label.addr]
+            labels._labels[db_label.addr] = db_label.name
+            labels._reverse_labels[db_label.name] = db_label.addr
+
+        state = get_dump_state(labels)
+        state.reset(revision)
+        state.rows.update((db_label.addr, db_label.name) for db_label in db_labels)
 
         return labels
@@ -1,5 +1,6 @@
 from __future__ import annotations
 from typing import Any, TYPE_CHECKING
+from collections import defaultdict
 import json
 import pickle
 
@@ -7,6 +8,7 @@ from angr.analyses.decompiler.structured_codegen import DummyStructuredCodeGener
 from angr.analyses.decompiler.decompilation_cache import DecompilationCache
 from angr.knowledge_plugins import StructuredCodeManager
 from angr.angrdb.models import DbStructuredCode
+from angr.angrdb.dump_state import get_dump_state, digest, delete_rows
 
 if TYPE_CHECKING:
     from angr.knowledge_base import KnowledgeBase
@@ -19,18 +21,31 @@ class StructuredCodeManagerSerializer:
     """
 
     @staticmethod
-    def dump(session, db_kb: DbKnowledgeBase, code_manager: StructuredCodeManager):
+    def dump(
+        session,
+        db_kb: DbKnowledgeBase,
+        code_manager: StructuredCodeManager,
+        revision: str | None = None,
+        new_revision: str | None = None,
+    ):
         """
 
         :param session:
         :param db_kb:
         :param code_manager:
+        :param revision:        The current revision of the database.
+        :param new_revision:    The revision of the database after this dump.
         :return:
         """
 
-        # remove all existing stored structured code
-        session.query(DbStructuredCode).filter_by(kb=db_kb).delete()
+        state = get_dump_state(code_manager)
+        if not state.is_valid(revision):
+            # remove all existing stored structured code
+            session.query(DbStructuredCode).filter_by(kb=db_kb).delete()
+            state.reset()
 
+        outdated_keys = [key for key in state.rows if key not in code_manager.cached]
+        changed = []
         for key, cache in code_manager.cached.items():
             func_addr, flavor = key
 
@@ -52,18 +67,40 @@ class StructuredCodeManagerSerializer:
             if cache.ite_exprs:
                 ite_exprs = pickle.dumps(cache.ite_exprs)
 
-            db_code = DbStructuredCode(
-                kb=db_kb,
-                func_addr=func_addr,
-                flavor=flavor,
-                expr_comments=expr_comments,
-                stmt_comments=stmt_comments,
-                const_formats=const_formats,
-                ite_exprs=ite_exprs,
-                errors="\n\n\n".join(cache.errors),
-                # configuration=configuration,
+            errors = "\n\n\n".join(cache.errors)
+
+            # only dump structured code that has changed since the last dump
+            row_digest = digest(expr_comments, stmt_comments, const_formats, ite_exprs, errors)
+            if key in state.rows:
+                if state.rows[key] == row_digest:
+                    continue
+                outdated_keys.append(key)
+            state.rows[key] = row_digest
+
+            changed.append(
+                {
+                    "func_addr": func_addr,
+                    "flavor": flavor,
+                    "expr_comments": expr_comments,
+                    "stmt_comments": stmt_comments,
+                    "const_formats": const_formats,
+                    "ite_exprs": ite_exprs,
+                    "errors": errors,
+                    # "configuration": configuration,
+                }
             )
-            session.add(db_code)
+
+        outdated_addrs_by_flavor = defaultdict(list)
+        for key in outdated_keys:
+            if key not in code_manager.cached:
+                del state.rows[key]
+            func_addr, flavor = key
+            outdated_addrs_by_flavor[flavor].append(func_addr)
+        for flavor, func_addrs in outdated_addrs_by_flavor.items():
+            delete_rows(session, DbStructuredCode, db_kb, DbStructuredCode.func_addr, func_addrs, flavor=flavor)
+        session.add_all(DbStructuredCode(kb=db_kb, **columns) for columns in changed)
+
+        state.revision = new_revision
 
     @staticmethod
     def dict_strkey_to_intkey(d: dict[str, Any]) -> dict[int, Any]:
@@ -78,16 +115,19 @@ class StructuredCodeManagerSerializer:
         return new_d
 
     @staticmethod
-    def load(session, db_kb: DbKnowledgeBase, kb: KnowledgeBase) -> StructuredCodeManager:
+    def load(session, db_kb: DbKnowledgeBase, kb: KnowledgeBase, revision: str | None = None) -> StructuredCodeManager:
         """
 
         :param session:
         :param db_kb:
         :param kb:
+        :param revision:                The current revision of the database.
         :return:                        A loaded structured code manager
         """
 
         manager = StructuredCodeManager(kb)
+        state = get_dump_state(manager)
+        state.reset(revision)
 
         db_code_collection = session.query(DbStructuredCode).filter_by(kb=db_kb)
 
@@ -121,5 +161,8 @@ class StructuredCodeManagerSerializer:
             cache.ite_exprs = ite_exprs
             cache.errors = db_code.errors.split("\n\n\n")
             manager[(db_code.func_addr, db_code.flavor)] = cache
+            state.rows[(db_code.func_addr, db_code.flavor)] = digest(
+                db_code.expr_comments, db_code.stmt_comments, db_code.const_formats, db_code.ite_exprs, db_code.errors
+            )
 
         return manager
@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING
 from angr.knowledge_plugins import VariableManager
 from angr.knowledge_plugins.variables.variable_manager import VariableManagerInternal
 from angr.angrdb.models import DbVariableCollection
+from angr.angrdb.dump_state import get_dump_state, digest, delete_rows
 
 if TYPE_CHECKING:
     from angr.knowledge_base import KnowledgeBase
@@ -16,31 +17,71 @@ class VariableManagerSerializer:
     """
 
     @staticmethod
-    def dump(session, db_kb: DbKnowledgeBase, var_manager: VariableManager):
-        # Remove all existing variable collections
-        session.query(DbVariableCollection).filter_by(kb=db_kb).delete()
+    def dump(
+        session,
+        db_kb: DbKnowledgeBase,
+        var_manager: VariableManager,
+        revision: str | None = None,
+        new_revision: str | None = None,
+    ):
+        state = get_dump_state(var_manager)
+        incremental = state.is_valid(revision)
+        if not incremental:
+            # Remove all existing variable collections
+            session.query(DbVariableCollection).filter_by(kb=db_kb).delete()
+            state.reset()
+
+        # all variable manager internal instances, including the global variable manager internal
+        internals = dict(var_manager.function_managers)
+        internals[-1] = var_manager.global_manager
+
+        # only dump variable manager internal instances that have changed since the last dump
+        outdated_addrs = [func_addr for func_addr in state.rows if func_addr not in internals]
+        changed = []
+        for func_addr, internal in internals.items():
+            blob = internal.serialize()
+            blob_digest = digest(blob)
+            if func_addr in state.rows:
+                if state.rows[func_addr] == blob_digest:
+                    continue
+                outdated_addrs.append(func_addr)
+            state.rows[func_addr] = blob_digest
+            changed.append((func_addr, internal, blob))
+
+        for func_addr in outdated_addrs:
+            if func_addr not in internals:
+                del state.rows[func_addr]
+        delete_rows(session, DbVariableCollection, db_kb, DbVariableCollection.func_addr, outdated_addrs, ident=None)
+        for func_addr, internal, blob in changed:
+            VariableManagerSerializer.dump_internal(session, db_kb, internal, func_addr, ident=None, blob=blob)
 
-        # Dump all variable manager internal instances
-        for func_addr, internal in var_manager.function_managers.items():
-            VariableManagerSerializer.dump_internal(session, db_kb, internal, func_addr, ident=None)
-        # dump the global variable manager internal
-        VariableManagerSerializer.dump_internal(session, db_kb, var_manager.global_manager, -1, ident=None)
+        state.revision = new_revision
 
     @staticmethod
     def dump_internal(
-        session, db_kb: DbKnowledgeBase, internal_manager: VariableManagerInternal, func_addr: int, ident=None
+        session,
+        db_kb: DbKnowledgeBase,
+        internal_manager: VariableManagerInternal,
+        func_addr: int,
+        ident=None,
+        blob: bytes | None = None,
     ):
-        blob = internal_manager.serialize()
+        if blob is None:
+            blob = internal_manager.serialize()
 
         db_varcoll = DbVariableCollection(kb=db_kb, ident=ident if ident else None, func_addr=func_addr, blob=blob)
         session.add(db_varcoll)
 
     @staticmethod
-    def load(session, db_kb: DbKnowledgeBase, kb: KnowledgeBase, ident=None):
+    def load(session, db_kb: DbKnowledgeBase, kb: KnowledgeBase, ident=None, revision: str | None = None):
         variable_manager = VariableManager(kb)
+        state = get_dump_state(variable_manager)
+        # only variable collections without an identifier are dumped
+        state.reset(revision if ident is None else None)
 
         db_varcolls = session.query(DbVariableCollection).filter_by(kb=db_kb, ident=ident)
         for db_varcoll in db_varcolls:
+            state.rows[db_varcoll.func_addr] = digest(db_varcoll.blob)
             internal = VariableManagerSerializer.load_internal(db_varcoll, variable_manager)
             if internal.func_addr is None:
                 variable_manager.global_manager = internal
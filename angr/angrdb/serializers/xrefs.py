@@ -1,6 +1,7 @@
 # pylint:disable=unused-import
 from __future__ import annotations
 from angr.angrdb.models import DbXRefs
+from angr.angrdb.dump_state import get_dump_state
 from angr.knowledge_plugins.xrefs import XRefManager
 
 
@@ -10,18 +11,25 @@ class XRefsSerializer:
     """
 
     @staticmethod
-    def dump(session, db_kb, xrefs):
+    def dump(session, db_kb, xrefs, revision=None, new_revision=None):
         """
 
         :param session:
         :param DbKnowledgeBase db_kb:
         :param XRefManager xrefs:
+        :param str revision:            The current revision of the database.
+        :param str new_revision:        The revision of the database after this dump.
         :return:
         """
 
-        db_xrefs = db_kb.xrefs
+        state = get_dump_state(xrefs)
+        if state.is_valid(revision) and not xrefs._dirty:
+            # xrefs have not changed since the last dump
+            state.revision = new_revision
+            return
 
         blob = xrefs.serialize()
+        db_xrefs = db_kb.xrefs
         if db_xrefs is not None:
             # update the existing xrefs
             db_xrefs.blob = blob
@@ -30,14 +38,18 @@ class XRefsSerializer:
             db_xrefs = DbXRefs(kb=db_kb, blob=blob)
             session.add(db_xrefs)
 
+        state.reset(new_revision)
+        xrefs._dirty = False
+
     @staticmethod
-    def load(session, db_kb, kb, cfg_model=None):  # pylint:disable=unused-argument
+    def load(session, db_kb, kb, cfg_model=None, revision=None):  # pylint:disable=unused-argument
         """
 
         :param session:
         :param DbKnowledgeBase db_kb:
         :param KnowledgeBase kb:
         :param CFGModel cfg_model:
+        :param str revision:            The current revision of the database.
         :return:
         """
 
@@ -45,4 +57,8 @@ class XRefsSerializer:
         if db_xrefs is None:
             return None
 
-        return XRefManager.parse(db_xrefs.blob, cfg_model=cfg_model, kb=kb)
+        xrefs = XRefManager.parse(db_xrefs.blob, cfg_model=cfg_model, kb=kb)
+        state = get_dump_state(xrefs)
+        state.reset(revision)
+        xrefs._dirty = False
+        return xrefs
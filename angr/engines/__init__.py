@@ -1,36 +1,46 @@
 from __future__ import annotations
+from typing import TYPE_CHECKING
+import importlib.util
 
-from .engine import SimEngine
-from .failure import SimEngineFailure
-from .hook import HooksMixin
-from .procedure import ProcedureEngine, ProcedureMixin
-from .soot import SootMixin
-from .successors import SimSuccessors, SuccessorsEngine
-from .syscall import SimEngineSyscall
-from .unicorn import SimEngineUnicorn
-from .vex import HeavyResilienceMixin, HeavyVEXMixin, SimInspectMixin, SuperFastpathMixin, TrackActionsMixin
+from angr.utils.lazy_import import lazy_attributes
 
+if TYPE_CHECKING:
+    from .engine import SimEngine
+    from .failure import SimEngineFailure
+    from .hook import HooksMixin
+    from .procedure import ProcedureEngine, ProcedureMixin
+    from .soot import SootMixin
+    from .successors import SimSuccessors, SuccessorsEngine
+    from .syscall import SimEngineSyscall
+    from .unicorn import SimEngineUnicorn
+    from .vex import HeavyResilienceMixin, HeavyVEXMixin, SimInspectMixin, SuperFastpathMixin, TrackActionsMixin
+    from .uber import UberEngine
 
-class UberEngine(
-    SimEngineFailure,
-    SimEngineSyscall,
-    HooksMixin,
-    SimEngineUnicorn,
-    SuperFastpathMixin,
-    TrackActionsMixin,
-    SimInspectMixin,
-    HeavyResilienceMixin,
-    SootMixin,
-    HeavyVEXMixin,
-):
-    """
-    The default execution engine for angr. This engine includes mixins for most
-    common functionality in angr, including VEX IR, unicorn, syscall handling,
-    and simprocedure handling.
+# engines are imported from their submodules when they are accessed for the first time, so that importing one engine
+# (e.g., angr.engines.soot) does not import all other engines
+_LAZY_ATTRIBUTES: dict[str, str] = {
+    "SimEngine": ".engine",
+    "SimEngineFailure": ".failure",
+    "HooksMixin": ".hook",
+    "ProcedureEngine": ".procedure",
+    "ProcedureMixin": ".procedure",
+    "SootMixin": ".soot",
+    "SimSuccessors": ".successors",
+    "SuccessorsEngine": ".successors",
+    "SimEngineSyscall": ".syscall",
+    "SimEngineUnicorn": ".unicorn",
+    "HeavyResilienceMixin": ".vex",
+    "HeavyVEXMixin": ".vex",
+    "SimInspectMixin": ".vex",
+    "SuperFastpathMixin": ".vex",
+    "TrackActionsMixin": ".vex",
+    "UberEngine": ".uber",
+    "UberEnginePcode": ".uber",
+}
+if importlib.util.find_spec("pypcode") is not None:
+    _LAZY_ATTRIBUTES["HeavyPcodeMixin"] = ".pcode"
 
-    For some performance-sensitive applications, you may want to create a custom
-    engine with only the necessary mixins.
-    """
+__getattr__ = lazy_attributes(__name__, _LAZY_ATTRIBUTES)
 
 
 __all__ = [
@@ -52,16 +62,5 @@ __all__ = [
     "UberEngine",
 ]
 
-
-try:
-    from .pcode import HeavyPcodeMixin
-
-    class UberEnginePcode(
-        SimEngineFailure, SimEngineSyscall, HooksMixin, HeavyPcodeMixin
-    ):  # pylint:disable=abstract-method
-        pass
-
+if importlib.util.find_spec("pypcode") is not None:
     __all__.append("UberEnginePcode")
-
-except ImportError:
-    pass
@@ -1,5 +1,13 @@
 from __future__ import annotations
+from typing import TYPE_CHECKING
 
-from .engine import SootMixin
+from angr.utils.lazy_import import lazy_attributes
+
+if TYPE_CHECKING:
+    from .engine import SootMixin
+
+# the engine is only imported when it is used, so that importing Soot values (e.g., from the JavaVM memory model) does
+# not import the entire Soot engine
+__getattr__ = lazy_attributes(__name__, {"SootMixin": ".engine"})
 
 __all__ = ("SootMixin",)
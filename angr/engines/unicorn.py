@@ -441,6 +441,7 @@ class SimEngineUnicorn(SuccessorsEngine):
             state.unicorn.set_tracking(
                 track_bbls=o.UNICORN_TRACK_BBL_ADDRS in state.options,
                 track_stack=o.UNICORN_TRACK_STACK_POINTERS in state.options,
+                track_coverage=o.UNICORN_TRACK_COVERAGE in state.options,
             )
             state.unicorn.hook()
             state.unicorn.start(step=step)
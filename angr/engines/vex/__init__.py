@@ -1,9 +1,28 @@
 from __future__ import annotations
+from typing import TYPE_CHECKING
 
-from .claripy import ClaripyDataMixin
-from .light import VEXMixin, VEXResilienceMixin, VEXSlicingMixin
-from .heavy import TrackActionsMixin, HeavyVEXMixin, SimInspectMixin, HeavyResilienceMixin, SuperFastpathMixin
-from .lifter import VEXLifter
+from angr.utils.lazy_import import lazy_attributes
+
+if TYPE_CHECKING:
+    from .claripy import ClaripyDataMixin
+    from .light import VEXMixin, VEXResilienceMixin, VEXSlicingMixin
+    from .heavy import TrackActionsMixin, HeavyVEXMixin, SimInspectMixin, HeavyResilienceMixin, SuperFastpathMixin
+    from .lifter import VEXLifter
+
+_LAZY_ATTRIBUTES: dict[str, str] = {
+    "ClaripyDataMixin": ".claripy",
+    "VEXMixin": ".light",
+    "VEXResilienceMixin": ".light",
+    "VEXSlicingMixin": ".light",
+    "TrackActionsMixin": ".heavy",
+    "HeavyVEXMixin": ".heavy",
+    "SimInspectMixin": ".heavy",
+    "HeavyResilienceMixin": ".heavy",
+    "SuperFastpathMixin": ".heavy",
+    "VEXLifter": ".lifter",
+}
+
+__getattr__ = lazy_attributes(__name__, _LAZY_ATTRIBUTES)
 
 
 __all__ = (
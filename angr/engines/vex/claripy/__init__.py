@@ -1,5 +1,11 @@
 from __future__ import annotations
+from typing import TYPE_CHECKING
 
-from .datalayer import ClaripyDataMixin
+from angr.utils.lazy_import import lazy_attributes
+
+if TYPE_CHECKING:
+    from .datalayer import ClaripyDataMixin
+
+__getattr__ = lazy_attributes(__name__, {"ClaripyDataMixin": ".datalayer"})
 
 __all__ = ("ClaripyDataMixin",)
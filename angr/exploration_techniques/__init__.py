@@ -1,28 +1,63 @@
 from __future__ import annotations
+from typing import TYPE_CHECKING
 
-from .base import ExplorationTechnique
-from .slicecutor import Slicecutor
-from .driller_core import DrillerCore
-from .loop_seer import LoopSeer
-from .tracer import Tracer
-from .explorer import Explorer
-from .threading import Threading
-from .dfs import DFS
-from .lengthlimiter import LengthLimiter
-from .veritesting import Veritesting
-from .oppologist import Oppologist
-from .director import Director, ExecuteAddressGoal, CallFunctionGoal
-from .spiller import Spiller
-from .manual_mergepoint import ManualMergepoint
-from .tech_builder import TechniqueBuilder
-from .stochastic import StochasticSearch
-from .unique import UniqueSearch
-from .memory_watcher import MemoryWatcher
-from .bucketizer import Bucketizer
-from .local_loop_seer import LocalLoopSeer
-from .timeout import Timeout
-from .suggestions import Suggestions
-from .stub_stasher import StubStasher
+from angr.utils.lazy_import import lazy_attributes
+
+if TYPE_CHECKING:
+    from .base import ExplorationTechnique
+    from .slicecutor import Slicecutor
+    from .driller_core import DrillerCore
+    from .loop_seer import LoopSeer
+    from .tracer import Tracer
+    from .explorer import Explorer
+    from .threading import Threading
+    from .dfs import DFS
+    from .lengthlimiter import LengthLimiter
+    from .veritesting import Veritesting
+    from .oppologist import Oppologist
+    from .director import Director, ExecuteAddressGoal, CallFunctionGoal
+    from .spiller import Spiller
+    from .manual_mergepoint import ManualMergepoint
+    from .tech_builder import TechniqueBuilder
+    from .stochastic import StochasticSearch
+    from .unique import UniqueSearch
+    from .memory_watcher import MemoryWatcher
+    from .bucketizer import Bucketizer
+    from .local_loop_seer import LocalLoopSeer
+    from .timeout import Timeout
+    from .suggestions import Suggestions
+    from .stub_stasher import StubStasher
+
+# exploration techniques are imported from their submodules when they are accessed for the first time
+_LAZY_ATTRIBUTES: dict[str, str] = {
+    "ExplorationTechnique": ".base",
+    "Slicecutor": ".slicecutor",
+    "DrillerCore": ".driller_core",
+    "LoopSeer": ".loop_seer",
+    "Tracer": ".tracer",
+    "Explorer": ".explorer",
+    "Threading": ".threading",
+    "DFS": ".dfs",
+    "LengthLimiter": ".lengthlimiter",
+    "Veritesting": ".veritesting",
+    "Oppologist": ".oppologist",
+    "Director": ".director",
+    "ExecuteAddressGoal": ".director",
+    "CallFunctionGoal": ".director",
+    "Spiller": ".spiller",
+    "ManualMergepoint": ".manual_mergepoint",
+    "TechniqueBuilder": ".tech_builder",
+    "StochasticSearch": ".stochastic",
+    "UniqueSearch": ".unique",
+    "MemoryWatcher": ".memory_watcher",
+    "Bucketizer": ".bucketizer",
+    "LocalLoopSeer": ".local_loop_seer",
+    "Timeout": ".timeout",
+    "Suggestions": ".suggestions",
+    "StubStasher": ".stub_stasher",
+}
+
+__getattr__ = lazy_attributes(__name__, _LAZY_ATTRIBUTES)
 
 __all__ = (
     "DFS",
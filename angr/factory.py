@@ -12,18 +12,12 @@ from .sim_state import SimState
 from .calling_conventions import default_cc, SimRegArg, SimStackArg, PointerWrapper, SimCCUnknown
 from .callable import Callable
 from .errors import AngrError
-from .engines import UberEngine, ProcedureEngine
+from .engines.procedure import ProcedureEngine
 from .sim_type import SimTypeFunction, SimTypeInt
 from .codenode import HookNode, SyscallNode
 from .block import Block, SootBlock
 from .sim_manager import SimulationManager
 
-try:
-    from .engines import UberEnginePcode
-    from .engines.pcode import register_pcode_arch_default_cc
-except ImportError:
-    UberEnginePcode = None
-
 if TYPE_CHECKING:
     from angr import Project, SimCC
     from angr.engines import SimEngine
@@ -38,7 +32,7 @@ class AngrObjectFactory:
     """
 
     project: Project
-    default_engine_factory: type[SimEngine]
+    _default_engine_factory: type[SimEngine] | None
     procedure_engine: ProcedureEngine
     _default_cc: type[SimCC] | None
 
@@ -48,16 +42,12 @@ class AngrObjectFactory:
     def __init__(self, project, default_engine: type[SimEngine] | None = None):
         self._tls = threading.local()
 
-        if default_engine is None:
-            if isinstance(project.arch, archinfo.ArchPcode) and UberEnginePcode is not None:
-                l.warning("Creating project with the experimental 'UberEnginePcode' engine")
-                self.default_engine_factory = UberEnginePcode
-            else:
-                self.default_engine_factory = UberEngine
-        else:
-            self.default_engine_factory = default_engine
+        # the default engine is imported when it is used for the first time, since importing all engines is slow
+        self._default_engine_factory = default_engine
 
         if isinstance(project.arch, archinfo.ArchPcode):
+            from .engines.pcode import register_pcode_arch_default_cc  # pylint:disable=import-outside-toplevel
+
             register_pcode_arch_default_cc(project.arch)
 
         self.project = project
@@ -73,6 +63,28 @@ class AngrObjectFactory:
         self.project, self.default_engine_factory, self.procedure_engine, self._default_cc = state
         self._tls = threading.local()
 
+    @property
+    def default_engine_factory(self) -> type[SimEngine]:
+        if self._default_engine_factory is None:
+            # pylint:disable=import-outside-toplevel
+            from .engines.uber import UberEngine
+
+            try:
+                from .engines.uber import UberEnginePcode
+            except ImportError:
+                UberEnginePcode = None
+
+            if isinstance(self.project.arch, archinfo.ArchPcode) and UberEnginePcode is not None:
+                l.warning("Creating project with the experimental 'UberEnginePcode' engine")
+                self._default_engine_factory = UberEnginePcode
+            else:
+                self._default_engine_factory = UberEngine
+        return self._default_engine_factory
+
+    @default_engine_factory.setter
+    def default_engine_factory(self, v: type[SimEngine]):
+        self._default_engine_factory = v
+
     @property
     def default_engine(self):
         if not hasattr(self._tls, "default_engine"):
@@ -16,6 +16,7 @@ from .propagations import PropagationManager
 from .structured_code import StructuredCodeManager
 from .types import TypesStore
 from .callsite_prototypes import CallsitePrototypes
+from .lifted_prototypes import LiftedPrototypes
 from .custom_strings import CustomStrings
 from .obfuscations import Obfuscations
 
@@ -33,6 +34,7 @@ __all__ = (
     "KeyDefinitionManager",
     "KnowledgeBasePlugin",
     "Labels",
+    "LiftedPrototypes",
     "Obfuscations",
     "PatchManager",
     "PropagationManager",
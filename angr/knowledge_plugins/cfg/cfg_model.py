@@ -16,12 +16,14 @@ import cle
 from angr.engines.vex.lifter import VEX_IRSB_MAX_SIZE
 from angr.misc.ux import once
 from angr.protos import cfg_pb2, primitives_pb2
-from angr.serializable import Serializable
+from angr.serializable import Serializable, DEFAULT_CHUNK_SIZE, pack_chunks, read_chunks
 from angr.utils.enums_conv import cfg_jumpkind_to_pb, cfg_jumpkind_from_pb
 from angr.errors import AngrCFGError
 from .cfg_node import CFGNode
 from .memory_data import MemoryData, MemoryDataSort
 from .indirect_jump import IndirectJump
+from .csr_graph import CSRGraph
+from .loader_index import LoaderIndex
 
 if TYPE_CHECKING:
     from angr.knowledge_base.knowledge_base import KnowledgeBase
@@ -42,12 +44,13 @@ class CFGModel(Serializable):
 
     __slots__ = (
         "_cfg_manager",
+        "_csr",
+        "_graph",
         "_iropt_level",
         "_node_addrs",
         "_nodes",
         "_nodes_by_addr",
         "edges_to_repair",
-        "graph",
         "ident",
         "insn_addr_to_memory_data",
         "is_arm",
@@ -65,7 +68,9 @@ class CFGModel(Serializable):
         self._iropt_level = None
 
         # The graph
-        self.graph = networkx.DiGraph()
+        self._graph: networkx.DiGraph | None = networkx.DiGraph()
+        # The frozen graph. Only one of _graph and _csr is set at any time
+        self._csr: CSRGraph | None = None
 
         # Jump tables
         self.jump_tables: dict[int, IndirectJump] = {}
@@ -97,6 +102,34 @@ class CFGModel(Serializable):
             return None
         return self._cfg_manager._kb._project
 
+    @property
+    def graph(self) -> networkx.DiGraph:
+        """
+        The control flow graph. If the model is frozen, the model is thawed upon access.
+        """
+        if self._graph is None:
+            self.thaw()
+        return self._graph
+
+    @graph.setter
+    def graph(self, graph: networkx.DiGraph):
+        self._graph = graph
+        self._csr = None
+
+    @property
+    def is_frozen(self) -> bool:
+        return self._csr is not None
+
+    @property
+    def _graph_view(self) -> networkx.DiGraph | CSRGraph:
+        """
+        Get the graph, or the frozen graph if the model is frozen, without thawing the model. Only for read-only access
+        to nodes and edges.
+        """
+        if self._graph is None:
+            return self._csr
+        return self._graph
+
     #
     # Serialization
     #
@@ -117,21 +150,33 @@ class CFGModel(Serializable):
         return cfg_pb2.CFG()
 
     def serialize_to_cmessage(self):
+        return next(self.serialize_to_chunks(chunk_size=None))
+
+    def serialize_to_chunks(self, chunk_size: int | None = DEFAULT_CHUNK_SIZE):
+        """
+        Serialize the model into CFG cmessage objects that contain up to `chunk_size` nodes, edges, and memory data
+        items in total. Nodes are serialized before edges, so that edges can be parsed chunk by chunk.
+
+        :param chunk_size:  The maximum number of items in each cmessage object, or None to serialize the entire model
+                            into a single cmessage object.
+        :return:            An iterator of CFG cmessage objects.
+        """
+
         if "Emulated" in self.ident:
             raise NotImplementedError("Serializing a CFGEmulated instance is currently not supported.")
 
         cmsg = self._get_cmsg()
         cmsg.ident = self.ident
+        cmsg.normalized = self.normalized
+        yield from pack_chunks(cmsg, self._get_cmsg, self._iter_cmessage_items(), chunk_size)
 
+    def _iter_cmessage_items(self):
         # nodes
-        nodes = []
-        for n in self.graph.nodes():
-            nodes.append(n.serialize_to_cmessage())
-        cmsg.nodes.extend(nodes)
+        for n in self.nodes():
+            yield "nodes", n.serialize_to_cmessage()
 
         # edges
-        edges = []
-        for src, dst, data in self.graph.edges(data=True):
+        for src, dst, data in self._graph_view.edges(data=True):
             edge = primitives_pb2.Edge()
             edge.src_ea = src.addr
             edge.dst_ea = dst.addr
@@ -145,52 +190,72 @@ class CFGModel(Serializable):
                     edge.stmt_idx = v if v is not None else -1
                 else:
                     edge.data[k] = pickle.dumps(v)
-            edges.append(edge)
-        cmsg.edges.extend(edges)
+            yield "edges", edge
 
         # memory data
-        memory_data = []
         for data in self.memory_data.values():
-            memory_data.append(data.serialize_to_cmessage())
-        cmsg.memory_data.extend(memory_data)
-
-        cmsg.normalized = self.normalized
-
-        return cmsg
+            yield "memory_data", data.serialize_to_cmessage()
 
     @classmethod
     def parse_from_cmessage(cls, cmsg, cfg_manager=None, loader=None):  # pylint:disable=arguments-differ
         # create a new model unassociated from any project
         model = cls(cmsg.ident) if cfg_manager is None else cfg_manager.new_model(cmsg.ident)
+        model._parse_cmessage_chunk(cmsg, loader=loader)
+        model.normalized = cmsg.normalized
 
+        return model
+
+    @classmethod
+    def parse_from_stream(cls, stream, cfg_manager=None, loader=None):  # pylint:disable=arguments-differ
+        """
+        Parse a section of a stream that `serialize_to_stream()` writes, chunk by chunk.
+
+        :param stream:      A file object that is opened for reading in binary mode.
+        :param cfg_manager: The CFG manager to create the model in.
+        :param loader:      The loader to fill in the content of memory data with.
+        :return:            The model.
+        """
+
+        model = None
+        for chunk in read_chunks(stream):
+            cmsg = cls._get_cmsg()
+            cmsg.ParseFromString(chunk)
+            if model is None:
+                # the first chunk carries the identifier and other properties of the model
+                model = cls.parse_from_cmessage(cmsg, cfg_manager=cfg_manager, loader=loader)
+            else:
+                model._parse_cmessage_chunk(cmsg, loader=loader)
+        if model is None:
+            raise ValueError("The stream does not contain a CFG model.")
+        return model
+
+    def _parse_cmessage_chunk(self, cmsg, loader=None) -> None:
         # nodes
         for node_pb2 in cmsg.nodes:
-            node = CFGNode.parse_from_cmessage(node_pb2, cfg=model)
-            model._nodes[node.block_id] = node
-            model._nodes_by_addr[node.addr].append(node)
-            model.graph.add_node(node)
-            if len(model._nodes_by_addr[node.block_id]) > 1 and once(
-                "cfg_model_parse_from_cmessage many nodes at addr"
-            ):
+            node = CFGNode.parse_from_cmessage(node_pb2, cfg=self)
+            self._nodes[node.block_id] = node
+            self._nodes_by_addr[node.addr].append(node)
+            self.graph.add_node(node)
+            if len(self._nodes_by_addr[node.block_id]) > 1 and once("cfg_model_parse_from_cmessage many nodes at addr"):
                 l.warning(
                     "Importing a CFG with more than one node for a given address is currently unsupported. "
                     "The resulting graph may be broken."
                 )
 
-        model._node_addrs = None
+        self._node_addrs = None
 
         # edges
         for edge_pb2 in cmsg.edges:
             # more than one node at a given address is unsupported, grab the first one
-            src = model._nodes_by_addr[edge_pb2.src_ea][0]
-            dst = model._nodes_by_addr[edge_pb2.dst_ea][0]
+            src = self._nodes_by_addr[edge_pb2.src_ea][0]
+            dst = self._nodes_by_addr[edge_pb2.dst_ea][0]
             data = {}
             for k, v in edge_pb2.data.items():
                 data[k] = pickle.loads(v)
             data["jumpkind"] = cfg_jumpkind_from_pb(edge_pb2.jumpkind)
             data["ins_addr"] = edge_pb2.ins_addr if edge_pb2.ins_addr != 0xFFFF_FFFF_FFFF_FFFF else None
             data["stmt_idx"] = edge_pb2.stmt_idx if edge_pb2.stmt_idx != -1 else None
-            model.graph.add_edge(src, dst, **data)
+            self.graph.add_edge(src, dst, **data)
 
         # memory data
         for data_pb2 in cmsg.memory_data:
@@ -198,11 +263,7 @@ class CFGModel(Serializable):
             if loader is not None and md.content is None:
                 # fill in the content
                 md.fill_content(loader)
-            model.memory_data[md.addr] = md
-
-        model.normalized = cmsg.normalized
-
-        return model
+            self.memory_data[md.addr] = md
 
     #
     # Other methods
@@ -210,7 +271,12 @@ class CFGModel(Serializable):
 
     def copy(self):
         model = CFGModel(self.ident, cfg_manager=self._cfg_manager, is_arm=self.is_arm)
-        model.graph = networkx.DiGraph(self.graph)
+        if self._csr is not None:
+            # the frozen graph is immutable and can be shared
+            model._graph = None
+            model._csr = self._csr
+        else:
+            model.graph = networkx.DiGraph(self.graph)
         model.jump_tables = self.jump_tables.copy()
         model.memory_data = self.memory_data.copy()
         model.insn_addr_to_memory_data = self.insn_addr_to_memory_data.copy()
@@ -220,6 +286,83 @@ class CFGModel(Serializable):
 
         return model
 
+    #
+    # Freezing
+    #
+
+    def freeze(self) -> None:
+        """
+        Freeze the model after CFG recovery is done. The graph is converted into a CSRGraph, which stores nodes and
+        edges in compact arrays, and then dropped. Queries (e.g., get_successors() and get_all_predecessors()) are
+        answered by the CSRGraph. Accessing `graph` thaws the model by rebuilding the graph.
+
+        Only graphs whose nodes have integer addresses can be frozen.
+        """
+        if self._csr is not None:
+            return
+        self._csr = CSRGraph.from_networkx(self._graph)
+        self._graph = None
+
+    def thaw(self) -> None:
+        """
+        Rebuild the graph of a frozen model, and drop the frozen graph.
+        """
+        if self._csr is None:
+            return
+        self._graph = self._csr.to_networkx()
+        self._csr = None
+
+    def dump_frozen(self, path: str) -> None:
+        """
+        Freeze the model and write it into a file, which can be memory-mapped and loaded by `load_frozen()` in other
+        processes. Columns of the frozen graph are stored as raw arrays; nodes, memory data, and jump tables are
+        pickled.
+
+        :param path:    Path of the file.
+        """
+        self.freeze()
+        extra = {
+            "ident": self.ident,
+            "is_arm": self.is_arm,
+            "iropt_level": self._iropt_level,
+            "normalized": self.normalized,
+            "jump_tables": self.jump_tables,
+            "memory_data": self.memory_data,
+            "insn_addr_to_memory_data": self.insn_addr_to_memory_data,
+            "nodes": list(self._nodes.items()),
+        }
+        with open(path, "wb") as f:
+            self._csr.dump(f, extra=extra)
+
+    @classmethod
+    def load_frozen(cls, path: str, cfg_manager=None, use_mmap: bool = True) -> CFGModel:
+        """
+        Load a frozen model from a file that `dump_frozen()` writes.
+
+        :param path:        Path of the file.
+        :param cfg_manager: The CFG manager to associate the model with. Note that the model is not added to the
+                            manager.
+        :param use_mmap:    Memory-map the file instead of reading the frozen graph into memory.
+        :return:            The frozen model.
+        """
+        csr, extra = CSRGraph.load(path, use_mmap=use_mmap)
+        model = cls(extra["ident"], cfg_manager=cfg_manager, is_arm=extra["is_arm"])
+        model._iropt_level = extra["iropt_level"]
+        model.normalized = extra["normalized"]
+        model.jump_tables = extra["jump_tables"]
+        model.memory_data = extra["memory_data"]
+        model.insn_addr_to_memory_data = extra["insn_addr_to_memory_data"]
+        # nodes in the model and in the graph are pickled together, so they are identical objects
+        for block_id, node in extra["nodes"]:
+            model.add_node(block_id, node)
+        for node in csr.nodes:
+            node._cfg_model = model
+        for node in model._nodes.values():
+            node._cfg_model = model
+        model._graph = None
+        model._csr = csr
+        return model
+
     def _build_node_addr_index(self):
         self._node_addrs = SortedList(iter(k for k, lst in self._nodes_by_addr.items() if lst))
 
@@ -340,6 +483,14 @@ class CFGModel(Serializable):
         :param is_syscall: True returns the syscall node, False returns the normal CFGNode, None returns both
         :return:           all CFGNodes
         """
+        if self._csr is not None:
+            results = self._csr.nodes_at(addr)
+            if anyaddr:
+                results = self._csr.nodes_intersecting(addr, addr + 1) + [n for n in results if n.size == 0]
+            if is_syscall is not None:
+                results = [n for n in results if n.is_syscall == is_syscall]
+            return results
+
         results = []
 
         for cfg_node in self.graph.nodes():
@@ -359,6 +510,8 @@ class CFGModel(Serializable):
         :param size: Size of region, in bytes.
         """
         end_addr = addr + size
+        if self._csr is not None:
+            return set(self._csr.nodes_intersecting(addr, end_addr))
         return {n for n in self.nodes() if not (addr >= (n.addr + n.size) or n.addr >= end_addr)}
 
     def nodes(self):
@@ -369,6 +522,8 @@ class CFGModel(Serializable):
         :rtype: iterator
         """
 
+        if self._csr is not None:
+            return self._csr.nodes
         return self.graph.nodes()
 
     def get_predecessors(
@@ -388,6 +543,13 @@ class CFGModel(Serializable):
         if excluding_fakeret and jumpkind == "Ijk_FakeRet":
             return []
 
+        if self._csr is not None:
+            return self._csr.predecessors(
+                cfgnode,
+                jumpkind=jumpkind,
+                excluded_jumpkind="Ijk_FakeRet" if excluding_fakeret and jumpkind is None else None,
+            )
+
         if not excluding_fakeret and jumpkind is None:
             # fast path
             if cfgnode in self.graph:
@@ -425,6 +587,13 @@ class CFGModel(Serializable):
         if jumpkind is not None and excluding_fakeret and jumpkind == "Ijk_FakeRet":
             return []
 
+        if self._csr is not None:
+            return self._csr.successors(
+                node,
+                jumpkind=jumpkind,
+                excluded_jumpkind="Ijk_FakeRet" if excluding_fakeret and jumpkind is None else None,
+            )
+
         if not excluding_fakeret and jumpkind is None:
             # fast path
             if node in self.graph:
@@ -455,6 +624,11 @@ class CFGModel(Serializable):
         :rtype:                         list
         """
 
+        if self._csr is not None:
+            return self._csr.successors_and_jumpkinds(
+                node, excluded_jumpkind="Ijk_FakeRet" if excluding_fakeret else None
+            )
+
         successors = []
         for _, suc, data in self.graph.out_edges([node], data=True):
             if not excluding_fakeret or data["jumpkind"] != "Ijk_FakeRet":
@@ -475,6 +649,11 @@ class CFGModel(Serializable):
         :return:                    A list of predecessors and their corresponding jumpkinds.
         """
 
+        if self._csr is not None:
+            return self._csr.predecessors_and_jumpkinds(
+                node, excluded_jumpkind="Ijk_FakeRet" if excluding_fakeret else None
+            )
+
         predecessors = []
         for pred, _, data in self.graph.in_edges([node], data=True):
             if not excluding_fakeret or data["jumpkind"] != "Ijk_FakeRet":
@@ -492,6 +671,8 @@ class CFGModel(Serializable):
         :return: A list of predecessors in the CFG
         :rtype: list
         """
+        if self._csr is not None:
+            return list(self._csr.reachable(cfgnode, reverse=True, depth_limit=depth_limit))
         # use the reverse graph and query for successors (networkx.dfs_predecessors is misleading)
         # dfs_successors returns a dict of (node, [predecessors]). We ignore the keyset and use the values
         predecessors = set().union(*networkx.dfs_successors(self.graph.reverse(), cfgnode, depth_limit).values())
@@ -506,6 +687,8 @@ class CFGModel(Serializable):
         :return: A list of successors in the CFG
         :rtype: list
         """
+        if self._csr is not None:
+            return list(self._csr.reachable(cfgnode, depth_limit=depth_limit))
         # dfs_successors returns a dict of (node, [predecessors]). We ignore the keyset and use the values
         successors = set().union(*networkx.dfs_successors(self.graph, cfgnode, depth_limit).values())
         return list(successors)
@@ -514,6 +697,8 @@ class CFGModel(Serializable):
         """
         Returns all nodes that has an out degree >= 2
         """
+        if self._csr is not None:
+            return set(self._csr.nodes_with_min_out_degree(2))
         nodes = set()
         for n in self.graph.nodes():
             if self.graph.out_degree(n) >= 2:
@@ -529,6 +714,12 @@ class CFGModel(Serializable):
         :return: The exit statement ID
         """
 
+        if self._csr is not None:
+            eid = self._csr.edge_id(src_block, dst_block)
+            if eid is None:
+                raise AngrCFGError(f"Edge ({src_block}, {dst_block}) does not exist in CFG")
+            return self._csr.edge_data(eid)["stmt_idx"]
+
         if not self.graph.has_edge(src_block, dst_block):
             raise AngrCFGError(f"Edge ({src_block}, {dst_block}) does not exist in CFG")
 
@@ -578,6 +769,11 @@ class CFGModel(Serializable):
         :return:                    True if new data entries are found, False otherwise.
         """
 
+        loader = self.project.loader
+        # all lookups below go through an index of the loader, which is much faster than querying the loader for every
+        # memory data entry
+        loader_index = LoaderIndex(loader)
+
         # Make sure all memory data entries cover all data sections
         keys = sorted(memory_data_addrs) if memory_data_addrs is not None else sorted(self.memory_data.keys())
 
@@ -592,22 +788,22 @@ class CFGModel(Serializable):
                 # goes until the end of the section/segment
                 # TODO: the logic needs more testing
 
-                sec = self.project.loader.find_section_containing(data_addr)
+                sec = loader_index.find_section_containing(data_addr)
                 if sec is None:
-                    sec = self.project.loader.find_section_containing(data_addr - 1)
+                    sec = loader_index.find_section_containing(data_addr - 1)
                 next_sec_addr = None
                 if sec is not None:
                     last_addr = sec.vaddr + sec.memsize
                 else:
                     # it does not belong to any section. what's the next adjacent section? any memory data does not go
                     # beyond section boundaries
-                    next_sec = self.project.loader.find_section_next_to(data_addr)
+                    next_sec = loader_index.find_section_next_to(data_addr)
                     if next_sec is not None:
                         next_sec_addr = next_sec.vaddr
 
-                    seg = self.project.loader.find_segment_containing(data_addr)
+                    seg = loader_index.find_segment_containing(data_addr)
                     if seg is None:
-                        seg = self.project.loader.find_segment_containing(data_addr - 1)
+                        seg = loader_index.find_segment_containing(data_addr - 1)
                     if seg is not None:
                         last_addr = seg.vaddr + seg.memsize
                     else:
@@ -635,15 +831,14 @@ class CFGModel(Serializable):
                     # boundary does not exist, which means the data address is not mapped at all
                     data.max_size = 0
 
-        keys = sorted(self.memory_data.keys())
+        # a stack of addresses to process, where the lowest address is on the top
+        keys = sorted(self.memory_data.keys(), reverse=True)
 
         new_data_found = False
 
-        i = 0
         # pylint:disable=too-many-nested-blocks
-        while i < len(keys):
-            data_addr = keys[i]
-            i += 1
+        while keys:
+            data_addr = keys.pop()
 
             memory_data = self.memory_data[data_addr]
 
@@ -663,6 +858,7 @@ class CFGModel(Serializable):
                     xrefs=xrefs,
                     seg_list=seg_list,
                     data_type_guessing_handlers=data_type_guessing_handlers,
+                    loader_index=loader_index,
                 )
             else:
                 data_type, data_size = memory_data.sort, memory_data.size
@@ -688,7 +884,8 @@ class CFGModel(Serializable):
                             cr.memory_data = new_md
                             crs.append(cr)
                         xrefs.add_xrefs(crs)
-                    keys.insert(i, new_addr)
+                    # process the new memory data entry next
+                    keys.append(new_addr)
 
                 if data_type == MemoryDataSort.PointerArray:
                     # make sure all pointers are identified
@@ -696,11 +893,11 @@ class CFGModel(Serializable):
                     old_crs = xrefs.get_xrefs_by_dst(data_addr) if xrefs is not None else []
 
                     for j in range(0, data_size, pointer_size):
-                        ptr = self.project.loader.fast_memory_load_pointer(data_addr + j)
+                        ptr = loader_index.load_pointer(data_addr + j)
 
                         # is this pointer coming from the current binary?
-                        obj = self.project.loader.find_object_containing(ptr, membership_check=False)
-                        if obj is not self.project.loader.main_object:
+                        obj = loader_index.find_object_containing(ptr, membership_check=False)
+                        if obj is not loader.main_object:
                             # the pointer does not come from current binary. skip.
                             continue
 
@@ -742,6 +939,7 @@ class CFGModel(Serializable):
         seg_list: SegmentList | None = None,
         data_type_guessing_handlers: list[Callable] | None = None,
         extra_memory_regions: list[tuple[int, int]] | None = None,
+        loader_index: LoaderIndex | None = None,
     ):
         """
         Make a guess to the data type.
@@ -751,14 +949,17 @@ class CFGModel(Serializable):
 
         :param int data_addr: Address of the data.
         :param int max_size: The maximum size this data entry can be.
+        :param loader_index: An index of the loader to look up objects and load memory with, or None to create one.
         :return: a tuple of (data type, size). (None, None) if we fail to determine the type or the size.
         :rtype: tuple
         """
         if max_size is None:
             max_size = 0
+        if loader_index is None:
+            loader_index = LoaderIndex(self.project.loader)
 
         # quick check: if it's at the beginning of a binary, it might be the ELF header
-        elfheader_sort, elfheader_size = self._guess_data_type_elfheader(data_addr, max_size)
+        elfheader_sort, elfheader_size = self._guess_data_type_elfheader(data_addr, max_size, loader_index=loader_index)
         if elfheader_sort:
             return elfheader_sort, elfheader_size
 
@@ -779,7 +980,7 @@ class CFGModel(Serializable):
                 return MemoryDataSort.GOTPLTEntry, pointer_size
 
         # is it in a section with zero bytes, like .bss?
-        obj = self.project.loader.find_object_containing(data_addr)
+        obj = loader_index.find_object_containing(data_addr)
         if obj is None:
             return None, None
         section = obj.find_section_containing(data_addr)
@@ -788,14 +989,14 @@ class CFGModel(Serializable):
             return None, None
 
         r = self._guess_data_type_pointer_array(
-            data_addr, pointer_size, max_size, extra_memory_regions=extra_memory_regions
+            data_addr, pointer_size, max_size, extra_memory_regions=extra_memory_regions, loader_index=loader_index
         )
         if r is not None:
             return r
 
         non_zero_max_size = 1024 if max_size == 0 else max_size
         try:
-            data = self.project.loader.memory.load(data_addr, min(1024, non_zero_max_size))
+            data = loader_index.load(data_addr, min(1024, non_zero_max_size))
         except KeyError:
             data = b""
 
@@ -837,8 +1038,9 @@ class CFGModel(Serializable):
                 zero_pos = data.index(0)
             except ValueError:
                 zero_pos = None
-            if (zero_pos is not None and zero_pos > 0 and all(c in _PRINTABLES for c in data[:zero_pos])) or all(
-                c in _PRINTABLES for c in data
+            # deleting all printable characters leaves nothing if the data is printable
+            if (zero_pos is not None and zero_pos > 0 and not data[:zero_pos].translate(None, _PRINTABLES)) or (
+                not data.translate(None, _PRINTABLES)
             ):
                 # it's a string
                 # however, it may not be terminated
@@ -880,27 +1082,37 @@ class CFGModel(Serializable):
         pointer_size: int,
         max_size: int,
         extra_memory_regions: list[tuple[int, int]] | None = None,
+        loader_index: LoaderIndex | None = None,
     ):
+        if loader_index is None:
+            loader_index = LoaderIndex(self.project.loader)
+
         pointers_count = 0
 
         max_pointer_array_size = min(512 * pointer_size, max_size)
-        for i in range(0, max_pointer_array_size, pointer_size):
-            ptr = self.project.loader.fast_memory_load_pointer(data_addr + i)
+        # pointers are loaded in batches, each of which ends at the end of a memory backer
+        i, count = 0, (max_pointer_array_size + pointer_size - 1) // pointer_size
+        while i < count:
+            ptrs = loader_index.load_pointers(data_addr + i * pointer_size, count - i)
+            if not ptrs:
+                # the pointer cannot be loaded. skip it
+                i += 1
+                continue
+            i += len(ptrs)
 
-            if ptr is not None:
+            for ptr in ptrs:
                 # if self._seg_list.is_occupied(ptr) and self._seg_list.occupied_by_sort(ptr) == 'code':
                 #    # it's a code reference
                 #    # TODO: Further check if it's the beginning of an instruction
                 #    pass
-                if (
-                    self.project.loader.find_section_containing(ptr) is not None
-                    or self.project.loader.find_segment_containing(ptr) is not None
-                    or (extra_memory_regions and next(((a < ptr < b) for (a, b) in extra_memory_regions), None))
+                if loader_index.is_pointer_target(ptr) or (
+                    extra_memory_regions and next(((a < ptr < b) for (a, b) in extra_memory_regions), None)
                 ):
                     # it's a pointer of some sort
                     # TODO: Determine what sort of pointer it is
                     pointers_count += 1
                 else:
+                    i = count
                     break
 
         if pointers_count:
@@ -908,17 +1120,21 @@ class CFGModel(Serializable):
 
         return None
 
-    def _guess_data_type_elfheader(self, data_addr, max_size):
+    def _guess_data_type_elfheader(self, data_addr, max_size, loader_index: LoaderIndex | None = None):
         """
         Is the specified data chunk an ELF header?
 
         :param int data_addr:   Address of the data chunk
         :param int max_size:    Size of the data chunk.
+        :param loader_index:    An index of the loader, or None to create one.
         :return:                A tuple of ('elf-header', size) if it is, or (None, None) if it is not.
         :rtype:                 tuple
         """
 
-        obj = self.project.loader.find_object_containing(data_addr)
+        if loader_index is None:
+            loader_index = LoaderIndex(self.project.loader)
+
+        obj = loader_index.find_object_containing(data_addr)
         if obj is None:
             # it's not mapped
             return None, None
@@ -926,7 +1142,7 @@ class CFGModel(Serializable):
         if data_addr == obj.min_addr and 4 < max_size < 1000:
             # Does it start with the ELF magic bytes?
             try:
-                data = self.project.loader.memory.load(data_addr, 4)
+                data = loader_index.load(data_addr, 4)
             except KeyError:
                 return None, None
             if data == b"\x7fELF":
@@ -0,0 +1,511 @@
+from __future__ import annotations
+from typing import Any, BinaryIO
+from collections.abc import Iterator, Sequence
+from array import array
+import bisect
+import mmap
+import pickle
+import sys
+
+import networkx
+
+from angr.errors import AngrCFGError
+
+# magic bytes at the beginning of files that CSRGraph.dump() writes
+CSR_MAGIC = b"ANGRCSR\x01"
+# special values of columns
+_NO_INS_ADDR = 0xFFFF_FFFF_FFFF_FFFF
+_NO_STMT_IDX = -(2**63)
+_IRREGULAR = 0xFF
+
+# names and type codes of all columns
+_COLUMNS = (
+    ("addrs", "Q"),
+    ("sizes", "I"),
+    ("addr_order", "I"),
+    ("out_offsets", "I"),
+    ("out_dsts", "I"),
+    ("jumpkinds", "B"),
+    ("ins_addrs", "Q"),
+    ("stmt_idxs", "q"),
+    ("in_offsets", "I"),
+    ("in_srcs", "I"),
+    ("in_edges", "I"),
+)
+
+
+class CSRGraph:
+    """
+    A frozen, array-backed representation of a control flow graph.
+
+    Nodes are referred to by their indices in `nodes`. Node addresses and sizes are stored in columns, together with the
+    order of nodes sorted by their addresses. Edges are stored in compressed sparse row (CSR) form: out-edges of node `i`
+    are edges `out_offsets[i]` to `out_offsets[i + 1]`, whose destinations, jumpkinds (indices into `jumpkind_names`),
+    instruction addresses, and statement IDs are stored in the respective columns. In-edges are stored in CSR form as
+    well, and refer back to the out-edge with the same source and destination.
+
+    Edges whose attributes do not fit in the columns (missing or extra attributes, or attributes of unexpected types)
+    are marked as irregular, and their attributes are stored as dicts.
+
+    Columns are either arrays or memoryviews of a memory-mapped file (see `dump()` and `load()`).
+    """
+
+    __slots__ = (
+        "_irregular",
+        "_jumpkind_indices",
+        "_max_size",
+        "_mmap",
+        "_node_indices",
+        "addr_order",
+        "addrs",
+        "in_edges",
+        "in_offsets",
+        "in_srcs",
+        "ins_addrs",
+        "jumpkind_names",
+        "jumpkinds",
+        "nodes",
+        "out_dsts",
+        "out_offsets",
+        "sizes",
+        "stmt_idxs",
+    )
+
+    def __init__(
+        self,
+        nodes: Sequence,
+        columns: dict[str, Sequence[int]],
+        jumpkind_names: Sequence[str | None],
+        irregular: dict[int, dict[str, Any]] | None = None,
+        mm: mmap.mmap | None = None,
+    ):
+        self.nodes = tuple(nodes)
+        for name, _ in _COLUMNS:
+            setattr(self, name, columns[name])
+        self.jumpkind_names: tuple[str | None, ...] = tuple(jumpkind_names)
+        self._irregular: dict[int, dict[str, Any]] = irregular if irregular is not None else {}
+        self._mmap = mm
+
+        self._node_indices = {node: idx for idx, node in enumerate(self.nodes)}
+        self._jumpkind_indices = {jk: idx for idx, jk in enumerate(self.jumpkind_names)}
+        self._max_size = max(self.sizes, default=0)
+
+    @classmethod
+    def from_networkx(cls, graph: networkx.DiGraph) -> CSRGraph:
+        """
+        Convert a control flow graph into a CSRGraph. Nodes must have integer addresses.
+
+        :param graph:   The control flow graph.
+        :return:        The CSRGraph.
+        """
+
+        nodes = list(graph)
+        node_indices = {node: idx for idx, node in enumerate(nodes)}
+        columns = {name: array(typecode) for name, typecode in _COLUMNS}
+        jumpkind_indices: dict[str | None, int] = {}
+        irregular = {}
+
+        addrs, sizes = columns["addrs"], columns["sizes"]
+        for node in nodes:
+            if type(node.addr) is not int:
+                raise AngrCFGError(f"Cannot freeze a graph with non-integer node address {node.addr!r}.")
+            addrs.append(node.addr)
+            sizes.append(node.size if node.size is not None else 0)
+        columns["addr_order"].extend(sorted(range(len(nodes)), key=addrs.__getitem__))
+
+        out_offsets, out_dsts = columns["out_offsets"], columns["out_dsts"]
+        jumpkinds, ins_addrs, stmt_idxs = columns["jumpkinds"], columns["ins_addrs"], columns["stmt_idxs"]
+        edge_ids: dict[tuple[int, int], int] = {}
+        out_offsets.append(0)
+        for src_idx, src in enumerate(nodes):
+            for dst, data in graph.adj[src].items():
+                eid = len(out_dsts)
+                dst_idx = node_indices[dst]
+                edge_ids[(src_idx, dst_idx)] = eid
+                out_dsts.append(dst_idx)
+
+                jk = data.get("jumpkind", None)
+                ins_addr = data.get("ins_addr", None)
+                stmt_idx = data.get("stmt_idx", None)
+                if (
+                    len(data) != 3
+                    or "jumpkind" not in data
+                    or not (ins_addr is None or (type(ins_addr) is int and 0 <= ins_addr < _NO_INS_ADDR))
+                    or not (stmt_idx is None or (type(stmt_idx) is int and _NO_STMT_IDX < stmt_idx < 2**63))
+                    or (jk not in jumpkind_indices and len(jumpkind_indices) >= _IRREGULAR)
+                ):
+                    irregular[eid] = dict(data)
+                    jumpkinds.append(_IRREGULAR)
+                    ins_addrs.append(_NO_INS_ADDR)
+                    stmt_idxs.append(_NO_STMT_IDX)
+                    continue
+
+                if jk not in jumpkind_indices:
+                    jumpkind_indices[jk] = len(jumpkind_indices)
+                jumpkinds.append(jumpkind_indices[jk])
+                ins_addrs.append(_NO_INS_ADDR if ins_addr is None else ins_addr)
+                stmt_idxs.append(_NO_STMT_IDX if stmt_idx is None else stmt_idx)
+            out_offsets.append(len(out_dsts))
+
+        in_offsets, in_srcs, in_edges = columns["in_offsets"], columns["in_srcs"], columns["in_edges"]
+        in_offsets.append(0)
+        for dst_idx, dst in enumerate(nodes):
+            for src in graph.pred[dst]:
+                src_idx = node_indices[src]
+                in_srcs.append(src_idx)
+                in_edges.append(edge_ids[(src_idx, dst_idx)])
+            in_offsets.append(len(in_srcs))
+
+        return cls(nodes, columns, list(jumpkind_indices), irregular=irregular)
+
+    def to_networkx(self) -> networkx.DiGraph:
+        g = networkx.DiGraph()
+        g.add_nodes_from(self.nodes)
+        g.add_edges_from(self.edges(data=True))
+        return g
+
+    #
+    # Pickling
+    #
+
+    def __getstate__(self):
+        columns = {}
+        for name, typecode in _COLUMNS:
+            column = getattr(self, name)
+            if not isinstance(column, array):
+                column = array(typecode, column)
+            columns[name] = column
+        return {
+            "nodes": self.nodes,
+            "columns": columns,
+            "jumpkind_names": self.jumpkind_names,
+            "irregular": self._irregular,
+        }
+
+    def __setstate__(self, state):
+        self.__init__(state["nodes"], state["columns"], state["jumpkind_names"], irregular=state["irregular"])
+
+    #
+    # Files
+    #
+
+    def dump(self, f: BinaryIO, extra: Any = None) -> None:
+        """
+        Write the graph into a file that can be memory-mapped by `load()`. Nodes and `extra` are pickled, and columns
+        are stored as raw arrays in native byte order.
+
+        :param f:       A file object that is opened for writing in binary mode.
+        :param extra:   Extra (picklable) data to store in the file.
+        """
+
+        f.write(CSR_MAGIC)
+        f.write(b"\x00" * 8)
+        offset = 16
+        sections = {}
+        for name, typecode in _COLUMNS:
+            column = getattr(self, name)
+            data = column.tobytes()
+            sections[name] = (typecode, offset, len(column))
+            padding = -len(data) % 8
+            f.write(data + b"\x00" * padding)
+            offset += len(data) + padding
+
+        trailer = {
+            "byteorder": sys.byteorder,
+            "sections": sections,
+            "nodes": self.nodes,
+            "jumpkind_names": self.jumpkind_names,
+            "irregular": self._irregular,
+            "extra": extra,
+        }
+        f.write(pickle.dumps(trailer, protocol=pickle.HIGHEST_PROTOCOL))
+        f.seek(8)
+        f.write(offset.to_bytes(8, "little"))
+
+    @classmethod
+    def load(cls, path: str, use_mmap: bool = True) -> tuple[CSRGraph, Any]:
+        """
+        Load a graph from a file that `dump()` writes.
+
+        :param path:        Path of the file.
+        :param use_mmap:    Memory-map the file and use columns in place instead of copying them into arrays. The file
+                            is kept mapped until the graph is garbage-collected.
+        :return:            A tuple of the graph and the extra data stored in the file.
+        """
+
+        with open(path, "rb") as f:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if use_mmap else f.read()
+
+        if buf[:8] != CSR_MAGIC:
+            raise AngrCFGError(f"{path} is not a frozen CFG file.")
+        trailer = pickle.loads(buf[int.from_bytes(buf[8:16], "little") :])
+
+        native = trailer["byteorder"] == sys.byteorder
+        view = memoryview(buf)
+        columns = {}
+        for name, (typecode, offset, count) in trailer["sections"].items():
+            size = count * array(typecode).itemsize
+            if use_mmap and native:
+                columns[name] = view[offset : offset + size].cast(typecode)
+            else:
+                column = array(typecode)
+                column.frombytes(view[offset : offset + size])
+                if not native:
+                    column.byteswap()
+                columns[name] = column
+
+        graph = cls(
+            trailer["nodes"],
+            columns,
+            trailer["jumpkind_names"],
+            irregular=trailer["irregular"],
+            mm=buf if use_mmap and native else None,
+        )
+        return graph, trailer["extra"]
+
+    #
+    # Nodes and edges
+    #
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def __iter__(self):
+        return iter(self.nodes)
+
+    def __contains__(self, node) -> bool:
+        return node in self._node_indices
+
+    def number_of_nodes(self) -> int:
+        return len(self.nodes)
+
+    def number_of_edges(self) -> int:
+        return len(self.out_dsts)
+
+    def index(self, node) -> int | None:
+        return self._node_indices.get(node, None)
+
+    def edges(self, data: bool = False) -> Iterator:
+        """
+        Iterate over all edges. Edge attributes are returned as new dicts.
+        """
+        nodes, out_offsets, out_dsts = self.nodes, self.out_offsets, self.out_dsts
+        for src_idx, src in enumerate(nodes):
+            for eid in range(out_offsets[src_idx], out_offsets[src_idx + 1]):
+                if data:
+                    yield src, nodes[out_dsts[eid]], self.edge_data(eid)
+                else:
+                    yield src, nodes[out_dsts[eid]]
+
+    def edge_id(self, src, dst) -> int | None:
+        src_idx = self._node_indices.get(src, None)
+        dst_idx = self._node_indices.get(dst, None)
+        if src_idx is None or dst_idx is None:
+            return None
+        out_dsts = self.out_dsts
+        for eid in range(self.out_offsets[src_idx], self.out_offsets[src_idx + 1]):
+            if out_dsts[eid] == dst_idx:
+                return eid
+        return None
+
+    def edge_data(self, eid: int) -> dict[str, Any]:
+        if eid in self._irregular:
+            return dict(self._irregular[eid])
+        ins_addr = self.ins_addrs[eid]
+        stmt_idx = self.stmt_idxs[eid]
+        return {
+            "jumpkind": self.jumpkind_names[self.jumpkinds[eid]],
+            "ins_addr": None if ins_addr == _NO_INS_ADDR else ins_addr,
+            "stmt_idx": None if stmt_idx == _NO_STMT_IDX else stmt_idx,
+        }
+
+    def edge_jumpkind(self, eid: int) -> str | None:
+        jk = self.jumpkinds[eid]
+        if jk == _IRREGULAR:
+            return self._irregular[eid]["jumpkind"]
+        return self.jumpkind_names[jk]
+
+    #
+    # Queries
+    #
+
+    def successors(self, node, jumpkind: str | None = None, excluded_jumpkind: str | None = None) -> list:
+        """
+        Get successors of a node, optionally only those that are connected to the node with edges of a specific
+        jumpkind, or excluding those that are connected to the node with edges of a specific jumpkind.
+        """
+        idx = self._node_indices.get(node, None)
+        if idx is None:
+            return []
+        return self._neighbors(
+            self.out_offsets, self.out_dsts, None, idx, jumpkind=jumpkind, excluded_jumpkind=excluded_jumpkind
+        )
+
+    def predecessors(self, node, jumpkind: str | None = None, excluded_jumpkind: str | None = None) -> list:
+        """
+        Get predecessors of a node, optionally only those that are connected to the node with edges of a specific
+        jumpkind, or excluding those that are connected to the node with edges of a specific jumpkind.
+        """
+        idx = self._node_indices.get(node, None)
+        if idx is None:
+            return []
+        return self._neighbors(
+            self.in_offsets, self.in_srcs, self.in_edges, idx, jumpkind=jumpkind, excluded_jumpkind=excluded_jumpkind
+        )
+
+    def successors_and_jumpkinds(self, node, excluded_jumpkind: str | None = None) -> list[tuple[Any, str | None]]:
+        idx = self._node_indices.get(node, None)
+        if idx is None:
+            return []
+        nodes, out_dsts = self.nodes, self.out_dsts
+        results = []
+        for eid in range(self.out_offsets[idx], self.out_offsets[idx + 1]):
+            jk = self.edge_jumpkind(eid)
+            if excluded_jumpkind is None or jk != excluded_jumpkind:
+                results.append((nodes[out_dsts[eid]], jk))
+        return results
+
+    def predecessors_and_jumpkinds(self, node, excluded_jumpkind: str | None = None) -> list[tuple[Any, str | None]]:
+        idx = self._node_indices.get(node, None)
+        if idx is None:
+            return []
+        nodes, in_srcs, in_edges = self.nodes, self.in_srcs, self.in_edges
+        results = []
+        for i in range(self.in_offsets[idx], self.in_offsets[idx + 1]):
+            jk = self.edge_jumpkind(in_edges[i])
+            if excluded_jumpkind is None or jk != excluded_jumpkind:
+                results.append((nodes[in_srcs[i]], jk))
+        return results
+
+    def out_degree(self, node) -> int:
+        idx = self._node_indices[node]
+        return self.out_offsets[idx + 1] - self.out_offsets[idx]
+
+    def in_degree(self, node) -> int:
+        idx = self._node_indices[node]
+        return self.in_offsets[idx + 1] - self.in_offsets[idx]
+
+    def nodes_with_min_out_degree(self, degree: int) -> list:
+        out_offsets = self.out_offsets
+        return [node for idx, node in enumerate(self.nodes) if out_offsets[idx + 1] - out_offsets[idx] >= degree]
+
+    def edges_with_jumpkind(self, jumpkind: str | None) -> list[tuple[Any, Any]]:
+        """
+        Get all edges of a specific jumpkind.
+        """
+        nodes, out_offsets, out_dsts = self.nodes, self.out_offsets, self.out_dsts
+        jk_idx = self._jumpkind_indices.get(jumpkind, -1)
+        jumpkinds = self.jumpkinds
+        results = []
+        for src_idx, src in enumerate(nodes):
+            for eid in range(out_offsets[src_idx], out_offsets[src_idx + 1]):
+                jk = jumpkinds[eid]
+                if jk == jk_idx or (jk == _IRREGULAR and self._irregular[eid].get("jumpkind", None) == jumpkind):
+                    results.append((src, nodes[out_dsts[eid]]))
+        return results
+
+    def nodes_at(self, addr: int) -> list:
+        """
+        Get all nodes whose address is the specified one.
+        """
+        addrs, order = self.addrs, self.addr_order
+        pos = bisect.bisect_left(order, addr, key=addrs.__getitem__)
+        results = []
+        while pos < len(order) and addrs[order[pos]] == addr:
+            results.append(order[pos])
+            pos += 1
+        return [self.nodes[idx] for idx in sorted(results)]
+
+    def nodes_intersecting(self, start: int, end: int) -> list:
+        """
+        Get all nodes that intersect the region [start, end).
+        """
+        addrs, sizes, order = self.addrs, self.sizes, self.addr_order
+        pos = bisect.bisect_left(order, start - self._max_size, key=addrs.__getitem__)
+        results = []
+        while pos < len(order):
+            idx = order[pos]
+            addr = addrs[idx]
+            if addr >= end:
+                break
+            if addr + sizes[idx] > start:
+                results.append(idx)
+            pos += 1
+        return [self.nodes[idx] for idx in sorted(results)]
+
+    def reachable(self, node, reverse: bool = False, depth_limit: int | None = None) -> set:
+        """
+        Get all nodes that are reachable from a node in a depth-first search, like networkx.dfs_successors(). The node
+        itself is not included.
+
+        :param node:        The node to start from.
+        :param reverse:     Follow edges backwards.
+        :param depth_limit: Maximum depth of the search.
+        :return:            A set of nodes.
+        """
+
+        offsets, neighbors = (self.in_offsets, self.in_srcs) if reverse else (self.out_offsets, self.out_dsts)
+        source = self._node_indices.get(node, None)
+        if source is None:
+            raise networkx.NetworkXError(f"The node {node} is not in the digraph.")
+        nodes = self.nodes
+
+        if depth_limit is None:
+            # without a depth limit, all nodes that are reachable from the source node are found regardless of the
+            # order of traversal
+            visited = {source}
+            stack = [source]
+            while stack:
+                idx = stack.pop()
+                for child in neighbors[offsets[idx] : offsets[idx + 1]]:
+                    if child not in visited:
+                        visited.add(child)
+                        stack.append(child)
+            visited.discard(source)
+            return {nodes[idx] for idx in visited}
+
+        visited = {source}
+        reached = set()
+        stack = [(source, depth_limit, offsets[source])]
+        while stack:
+            idx, depth, pos = stack[-1]
+            if pos >= offsets[idx + 1]:
+                stack.pop()
+                continue
+            stack[-1] = idx, depth, pos + 1
+            child = neighbors[pos]
+            if child in visited:
+                continue
+            visited.add(child)
+            reached.add(child)
+            if depth > 1:
+                stack.append((child, depth - 1, offsets[child]))
+        return {nodes[idx] for idx in reached}
+
+    #
+    # Private methods
+    #
+
+    def _neighbors(
+        self,
+        offsets,
+        neighbors,
+        edge_ids,
+        idx: int,
+        jumpkind: str | None = None,
+        excluded_jumpkind: str | None = None,
+    ) -> list:
+        nodes = self.nodes
+        start, end = offsets[idx], offsets[idx + 1]
+        if jumpkind is None and excluded_jumpkind is None:
+            return [nodes[neighbors[i]] for i in range(start, end)]
+
+        results = []
+        for i in range(start, end):
+            jk = self.edge_jumpkind(i if edge_ids is None else edge_ids[i])
+            if jumpkind is not None:
+                if jk == jumpkind:
+                    results.append(nodes[neighbors[i]])
+            elif jk != excluded_jumpkind:
+                results.append(nodes[neighbors[i]])
+        return results
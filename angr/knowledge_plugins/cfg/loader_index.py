@@ -0,0 +1,243 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+import bisect
+import struct
+
+from cle import ExternObject, KernelObject, TLSObject
+
+if TYPE_CHECKING:
+    import cle
+    from cle.backends import Backend, Section, Segment
+
+
+class LoaderIndex:
+    """
+    A snapshot of the objects, sections, segments, and memory backers of a loader. It answers the lookups that tidying
+    memory data performs for every memory data entry by bisecting precomputed lists, instead of going through the
+    loader, its objects, and nested Clemory instances every time.
+
+    The index must be discarded once objects are loaded, memory is mapped, or memory is written to.
+    """
+
+    __slots__ = (
+        "_backer_ends",
+        "_backer_starts",
+        "_backers",
+        "_object_ends",
+        "_object_starts",
+        "_objects",
+        "_pointer_size",
+        "_pointer_target_ends",
+        "_pointer_target_starts",
+        "_pointers_fmt",
+        "_region_objects",
+        "_sectioned_objects",
+    )
+
+    def __init__(self, loader: cle.Loader):
+        self._objects: list[Backend] = loader.all_objects
+        self._object_starts: list[int] = [obj.min_addr for obj in self._objects]
+        self._object_ends: list[int] = [obj.max_addr for obj in self._objects]
+        # objects whose sections and segments are looked up, which excludes objects that CLE adds during loading
+        self._region_objects: list[Backend | None] = [
+            None if isinstance(obj, ExternObject | KernelObject | TLSObject) else obj for obj in self._objects
+        ]
+        self._sectioned_objects: list[Backend | None] = [
+            obj if obj is not None and obj.sections else None for obj in self._region_objects
+        ]
+
+        self._backer_starts: list[int] = []
+        self._backer_ends: list[int] = []
+        self._backers: list[bytes | bytearray] = []
+        for start, backer in loader.memory.backers():
+            self._backer_starts.append(start)
+            self._backer_ends.append(start + len(backer))
+            self._backers.append(backer)
+
+        arch = loader.main_object.arch
+        self._pointer_size: int = arch.bytes
+        fmt = arch.struct_fmt()
+        self._pointers_fmt: tuple[str, str] = fmt[0], fmt[1:]
+
+        self._pointer_target_starts: list[int] = []
+        self._pointer_target_ends: list[int] = []
+        self._init_pointer_targets()
+
+    def _init_pointer_targets(self) -> None:
+        """
+        Merge the ranges of all sections and segments into a sorted list of disjoint ranges. Each section or segment is
+        clipped to the range of addresses that resolve to its object.
+        """
+
+        ranges = []
+        for i, obj in enumerate(self._region_objects):
+            if obj is None:
+                continue
+            obj_start = self._object_starts[i]
+            obj_end = self._object_ends[i] + 1
+            if i + 1 < len(self._objects):
+                obj_end = min(obj_end, self._object_starts[i + 1])
+            for region in (*obj.sections, *obj.segments):
+                start = max(region.vaddr, obj_start)
+                end = min(region.vaddr + region.memsize, obj_end)
+                if start < end:
+                    ranges.append((start, end))
+
+        for start, end in sorted(ranges):
+            if self._pointer_target_ends and start <= self._pointer_target_ends[-1]:
+                self._pointer_target_ends[-1] = max(self._pointer_target_ends[-1], end)
+            else:
+                self._pointer_target_starts.append(start)
+                self._pointer_target_ends.append(end)
+
+    #
+    # Objects, sections, and segments
+    #
+
+    def _object_index(self, addr: int) -> int:
+        idx = bisect.bisect_right(self._object_starts, addr) - 1
+        if idx >= 0 and addr > self._object_ends[idx]:
+            return -1
+        return idx
+
+    def find_object_containing(self, addr: int, membership_check: bool = True) -> Backend | None:
+        """
+        Find the object that contains an address. This is the same as Loader.find_object_containing().
+
+        :param addr:                The address.
+        :param membership_check:    Whether the address must be mapped in memory or not.
+        :return:                    The object, or None if the address does not belong to any object.
+        """
+
+        idx = self._object_index(addr)
+        if idx < 0:
+            return None
+        obj = self._objects[idx]
+        if membership_check and obj.has_memory and not isinstance(obj.memory, str) and not self.is_mapped(addr):
+            return None
+        return obj
+
+    def find_section_containing(self, addr: int) -> Section | None:
+        """
+        Find the section that contains an address, skipping objects that CLE adds during loading. This is the same as
+        Loader.find_section_containing().
+
+        :param addr:    The address.
+        :return:        The section, or None if the address does not belong to any section.
+        """
+
+        idx = self._object_index(addr)
+        obj = self._sectioned_objects[idx] if idx >= 0 else None
+        return None if obj is None else obj.find_section_containing(addr)
+
+    def find_section_next_to(self, addr: int) -> Section | None:
+        """
+        Find the next section after an address, skipping objects that CLE adds during loading. This is the same as
+        Loader.find_section_next_to().
+
+        :param addr:    The address.
+        :return:        The next section, or None if there is no section after the address.
+        """
+
+        idx = self._object_index(addr)
+        obj = self._sectioned_objects[idx] if idx >= 0 else None
+        return None if obj is None else obj.sections.find_region_next_to(addr)
+
+    def find_segment_containing(self, addr: int) -> Segment | None:
+        """
+        Find the segment that contains an address, skipping objects that CLE adds during loading. This is the same as
+        Loader.find_segment_containing().
+
+        :param addr:    The address.
+        :return:        The segment, or None if the address does not belong to any segment.
+        """
+
+        idx = self._object_index(addr)
+        obj = self._region_objects[idx] if idx >= 0 else None
+        return None if obj is None else obj.find_segment_containing(addr)
+
+    def is_pointer_target(self, addr: int) -> bool:
+        """
+        Check if an address belongs to any section or segment, skipping objects that CLE adds during loading.
+
+        :param addr:    The address.
+        :return:        True if the address belongs to a section or a segment, False otherwise.
+        """
+
+        idx = bisect.bisect_right(self._pointer_target_starts, addr) - 1
+        return idx >= 0 and addr < self._pointer_target_ends[idx]
+
+    #
+    # Memory
+    #
+
+    def is_mapped(self, addr: int) -> bool:
+        """
+        Check if an address is mapped in memory.
+
+        :param addr:    The address.
+        :return:        True if the address is mapped, False otherwise.
+        """
+
+        idx = bisect.bisect_right(self._backer_ends, addr)
+        return idx < len(self._backers) and self._backer_starts[idx] <= addr
+
+    def load(self, addr: int, size: int) -> bytes:
+        """
+        Load up to `size` bytes from memory. This is the same as Clemory.load().
+
+        :param addr:    The address to load from.
+        :param size:    The maximum number of bytes to load.
+        :return:        The bytes, which are shorter than `size` if loading reaches unmapped memory.
+        :raises KeyError: If the address is not mapped.
+        """
+
+        views = []
+        for idx in range(bisect.bisect_right(self._backer_ends, addr), len(self._backers)):
+            start = self._backer_starts[idx]
+            if start > addr:
+                break
+            backer = self._backers[idx]
+            offset = addr - start
+            views.append(memoryview(backer)[offset : offset + size])
+            consumed = len(backer) - offset
+            addr += consumed
+            size -= consumed
+            if size <= 0:
+                break
+
+        if not views:
+            raise KeyError(addr)
+        return b"".join(views)
+
+    def load_pointers(self, addr: int, count: int) -> tuple[int, ...]:
+        """
+        Load up to `count` consecutive pointers from memory at once. Loading stops before the first pointer that does
+        not fit in the memory backer that the address belongs to, which Clemory.unpack_word() cannot load either.
+
+        :param addr:    The address to load from.
+        :param count:   The maximum number of pointers to load.
+        :return:        A tuple of pointers, which is empty if the first pointer cannot be loaded.
+        """
+
+        idx = bisect.bisect_right(self._backer_ends, addr)
+        if idx >= len(self._backers) or self._backer_starts[idx] > addr:
+            return ()
+        backer = self._backers[idx]
+        offset = addr - self._backer_starts[idx]
+        count = min(count, (len(backer) - offset) // self._pointer_size)
+        if count <= 0:
+            return ()
+        endness, char = self._pointers_fmt
+        return struct.unpack_from(f"{endness}{count}{char}", backer, offset)
+
+    def load_pointer(self, addr: int) -> int | None:
+        """
+        Load a pointer from memory. This is the same as Loader.fast_memory_load_pointer().
+
+        :param addr:    The address to load from.
+        :return:        The pointer, or None if the pointer cannot be loaded.
+        """
+
+        ptrs = self.load_pointers(addr, 1)
+        return ptrs[0] if ptrs else None
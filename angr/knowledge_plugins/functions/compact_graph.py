@@ -0,0 +1,253 @@
+from __future__ import annotations
+from typing import Any
+from collections.abc import Iterator
+from array import array
+import contextlib
+import itertools
+
+import networkx
+
+# special values of instruction addresses and statement IDs in CompactTransitionGraph
+_ABSENT = -(2**63)
+_NONE = _ABSENT + 1
+
+
+class CompactTransitionGraph:
+    """
+    A read-only, memory-compact representation of the transition graph of a function.
+
+    Nodes are stored once and are referred to by their integer indices. Edges are stored in integer arrays (indices of
+    source and destination nodes, instruction addresses, and statement IDs). The remaining attributes of each edge,
+    which are identical for most edges (e.g., `type` and `outside`), are stored as tuples that are interned across all
+    graphs sharing the same `interned_attrs` dict.
+
+    It supports the read-only subset of the networkx.DiGraph API that angr uses on transition graphs: iterating over and
+    testing for nodes, `edges()`, `successors()`, `predecessors()`, `out_edges()`, `in_edges()`, `has_edge()`,
+    `get_edge_data()`, `out_degree()`, `in_degree()`, and `graph[node]`. Edge attributes are returned as new dicts, so
+    modifying them does not modify the graph. Indices for adjacency queries are built upon the first query. Use
+    `to_networkx()` to get a mutable networkx.DiGraph with the same nodes, edges, and edge attributes.
+    """
+
+    __slots__ = (
+        "__weakref__",
+        "_attrs",
+        "_dsts",
+        "_in_adjacency",
+        "_ins_addrs",
+        "_node_indices",
+        "_out_adjacency",
+        "_srcs",
+        "_stmt_idxs",
+        "nodes",
+    )
+
+    def __init__(self, graph: networkx.DiGraph, interned_attrs: dict[tuple, tuple] | None = None, intern_node=None):
+        """
+        :param graph:           The transition graph to convert.
+        :param interned_attrs:  A dict for interning edge attributes. Edge attributes are interned within this graph if
+                                it is not provided.
+        :param intern_node:     A callable that returns the interned version of a node, or None to keep all nodes.
+        """
+
+        if interned_attrs is None:
+            interned_attrs = {}
+
+        self.nodes: tuple = tuple(graph) if intern_node is None else tuple(intern_node(node) for node in graph)
+        node_indices = {node: idx for idx, node in enumerate(graph)}
+
+        self._srcs = array("I")
+        self._dsts = array("I")
+        self._ins_addrs = array("q")
+        self._stmt_idxs = array("q")
+        self._attrs: list[tuple] = []
+
+        for src, dst, data in graph.edges(data=True):
+            self._srcs.append(node_indices[src])
+            self._dsts.append(node_indices[dst])
+            attrs = data
+            ins_addr = self._pack_int(data, "ins_addr")
+            stmt_idx = self._pack_int(data, "stmt_idx")
+            if ins_addr != _ABSENT or stmt_idx != _ABSENT:
+                attrs = {k: v for k, v in data.items() if not (k == "ins_addr" and ins_addr != _ABSENT)}
+                if stmt_idx != _ABSENT:
+                    del attrs["stmt_idx"]
+            self._ins_addrs.append(ins_addr)
+            self._stmt_idxs.append(stmt_idx)
+
+            attrs_key = tuple(attrs.items())
+            # attributes with unhashable values are not interned
+            with contextlib.suppress(TypeError):
+                attrs_key = interned_attrs.setdefault(attrs_key, attrs_key)
+            self._attrs.append(attrs_key)
+
+        # indices for adjacency queries, built on demand
+        self._node_indices: dict[Any, int] | None = None
+        self._out_adjacency: tuple[array, array] | None = None
+        self._in_adjacency: tuple[array, array] | None = None
+
+    def __getstate__(self):
+        return self.nodes, self._srcs, self._dsts, self._ins_addrs, self._stmt_idxs, self._attrs
+
+    def __setstate__(self, state):
+        self.nodes, self._srcs, self._dsts, self._ins_addrs, self._stmt_idxs, self._attrs = state
+        self._node_indices = None
+        self._out_adjacency = None
+        self._in_adjacency = None
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def __iter__(self):
+        return iter(self.nodes)
+
+    def __contains__(self, node) -> bool:
+        return node in self._get_node_indices()
+
+    def __getitem__(self, node) -> dict[Any, dict[str, Any]]:
+        """
+        Get the successors of a node and attributes of the edges to them, like `networkx.DiGraph[node]`.
+        """
+        return {self.nodes[self._dsts[i]]: self._edge_data(i) for i in self._edge_indices(node, True)}
+
+    def has_node(self, node) -> bool:
+        return node in self
+
+    def number_of_nodes(self) -> int:
+        return len(self.nodes)
+
+    def number_of_edges(self) -> int:
+        return len(self._srcs)
+
+    def edges(self, data: bool = False) -> Iterator:
+        """
+        Iterate over all edges. Edge attributes are returned as new dicts.
+        """
+        nodes = self.nodes
+        if not data:
+            for src_idx, dst_idx in zip(self._srcs, self._dsts):
+                yield nodes[src_idx], nodes[dst_idx]
+            return
+        for i, (src_idx, dst_idx) in enumerate(zip(self._srcs, self._dsts)):
+            yield nodes[src_idx], nodes[dst_idx], self._edge_data(i)
+
+    def successors(self, node) -> Iterator:
+        nodes, dsts = self.nodes, self._dsts
+        for i in self._edge_indices(node, True):
+            yield nodes[dsts[i]]
+
+    def predecessors(self, node) -> Iterator:
+        nodes, srcs = self.nodes, self._srcs
+        for i in self._edge_indices(node, False):
+            yield nodes[srcs[i]]
+
+    def out_edges(self, node, data: bool = False) -> Iterator:
+        """
+        Iterate over all edges that start at a node.
+        """
+        yield from self._edges_at(self._edge_indices(node, True), data)
+
+    def in_edges(self, node, data: bool = False) -> Iterator:
+        """
+        Iterate over all edges that end at a node.
+        """
+        yield from self._edges_at(self._edge_indices(node, False), data)
+
+    def out_degree(self, node) -> int:
+        return len(self._edge_indices(node, True))
+
+    def in_degree(self, node) -> int:
+        return len(self._edge_indices(node, False))
+
+    def has_edge(self, src, dst) -> bool:
+        return self._find_edge(src, dst) is not None
+
+    def get_edge_data(self, src, dst, default=None) -> dict[str, Any] | None:
+        i = self._find_edge(src, dst)
+        return default if i is None else self._edge_data(i)
+
+    def to_networkx(self) -> networkx.DiGraph:
+        g = networkx.DiGraph()
+        g.add_nodes_from(self.nodes)
+        g.add_edges_from(self.edges(data=True))
+        return g
+
+    #
+    # Private methods
+    #
+
+    def _get_node_indices(self) -> dict[Any, int]:
+        if self._node_indices is None:
+            self._node_indices = {node: idx for idx, node in enumerate(self.nodes)}
+        return self._node_indices
+
+    def _edge_indices(self, node, outgoing: bool) -> array:
+        """
+        Get indices of all edges that start (or end) at a node.
+        """
+        node_idx = self._get_node_indices().get(node, None)
+        if node_idx is None:
+            raise networkx.NetworkXError(f"The node {node} is not in the digraph.")
+        if outgoing:
+            if self._out_adjacency is None:
+                self._out_adjacency = self._build_adjacency(self._srcs)
+            offsets, edge_indices = self._out_adjacency
+        else:
+            if self._in_adjacency is None:
+                self._in_adjacency = self._build_adjacency(self._dsts)
+            offsets, edge_indices = self._in_adjacency
+        return edge_indices[offsets[node_idx] : offsets[node_idx + 1]]
+
+    def _build_adjacency(self, node_indices: array) -> tuple[array, array]:
+        """
+        Sort edges by their source (or destination) nodes. Edges of the i-th node are edge_indices[offsets[i] :
+        offsets[i + 1]].
+        """
+        counts = [0] * (len(self.nodes) + 1)
+        for idx in node_indices:
+            counts[idx + 1] += 1
+        offsets = array("I", itertools.accumulate(counts))
+        positions = list(offsets)
+        edge_indices = array("I", bytes(4 * len(node_indices)))
+        for i, idx in enumerate(node_indices):
+            edge_indices[positions[idx]] = i
+            positions[idx] += 1
+        return offsets, edge_indices
+
+    def _find_edge(self, src, dst) -> int | None:
+        if src not in self or dst not in self:
+            return None
+        dst_idx = self._node_indices[dst]
+        for i in self._edge_indices(src, True):
+            if self._dsts[i] == dst_idx:
+                return i
+        return None
+
+    def _edges_at(self, edge_indices, data: bool) -> Iterator:
+        nodes = self.nodes
+        for i in edge_indices:
+            if data:
+                yield nodes[self._srcs[i]], nodes[self._dsts[i]], self._edge_data(i)
+            else:
+                yield nodes[self._srcs[i]], nodes[self._dsts[i]]
+
+    def _edge_data(self, i: int) -> dict[str, Any]:
+        data = dict(self._attrs[i])
+        ins_addr = self._ins_addrs[i]
+        if ins_addr != _ABSENT:
+            data["ins_addr"] = None if ins_addr == _NONE else ins_addr
+        stmt_idx = self._stmt_idxs[i]
+        if stmt_idx != _ABSENT:
+            data["stmt_idx"] = None if stmt_idx == _NONE else stmt_idx
+        return data
+
+    @staticmethod
+    def _pack_int(data: dict[str, Any], key: str) -> int:
+        if key not in data:
+            return _ABSENT
+        v = data[key]
+        if v is None:
+            return _NONE
+        if type(v) is int and _NONE < v < 2**63:
+            return v
+        # keep it in the attributes
+        return _ABSENT
@@ -28,6 +28,7 @@ from angr.calling_conventions import SimCC
 from angr.project import Project
 from angr.utils.library import get_cpp_function_name
 from .function_parser import FunctionParser
+from .compact_graph import CompactTransitionGraph
 
 l = logging.getLogger(name=__name__)
 
@@ -38,13 +39,17 @@ class Function(Serializable):
     """
 
     __slots__ = (
+        "__weakref__",
         "_addr_to_block_node",
         "_argument_registers",
         "_argument_stack_variables",
         "_block_sizes",
         "_call_sites",
+        "_calling_convention",
         "_callout_sites",
+        "_compact_transition_graph",
         "_cyclomatic_complexity",
+        "_dirty",
         "_endpoints",
         "_function_manager",
         "_jumpout_sites",
@@ -53,14 +58,15 @@ class Function(Serializable):
         "_local_transition_graph",
         "_name",
         "_project",
+        "_prototype",
         "_ret_sites",
         "_retout_sites",
         "_returning",
+        "_transition_graph",
         "addr",
         "addr",
         "binary_name",
         "bp_on_stack",
-        "calling_convention",
         "from_signature",
         "info",
         "is_alignment",
@@ -71,14 +77,12 @@ class Function(Serializable):
         "is_syscall",
         "normalized",
         "previous_names",
-        "prototype",
         "prototype_libname",
         "ran_cca",
         "retaddr_on_stack",
         "sp_delta",
         "startpoint",
         "tags",
-        "transition_graph",
     )
 
     def __init__(
@@ -113,7 +117,10 @@ class Function(Serializable):
         :param bool returning:  If this function returns.
         :param bool alignment:  If this function acts as an alignment filler. Such functions usually only contain nops.
         """
-        self.transition_graph = networkx.classes.digraph.DiGraph()
+        # whether the function has been modified since it was last dumped to or loaded from a database
+        self._dirty = True
+        self._transition_graph: networkx.DiGraph | None = networkx.classes.digraph.DiGraph()
+        self._compact_transition_graph: CompactTransitionGraph | None = None
         self._local_transition_graph = None
         self.normalized = False
 
@@ -246,6 +253,22 @@ class Function(Serializable):
 
         self._init_prototype_and_calling_convention()
 
+    @property
+    def dirty(self) -> bool:
+        """
+        Whether the function has been modified since it was last dumped to or loaded from a database.
+        """
+        return self._dirty
+
+    def mark_dirty(self) -> None:
+        """
+        Mark the function as modified. Setting the name, the prototype, the calling convention, or whether the function
+        returns, and modifying the function through its methods marks it automatically. Code that sets other
+        attributes or modifies the transition graph or other containers of the function in place must call this
+        method, otherwise incremental database dumps will miss the modification.
+        """
+        self._dirty = True
+
     @property
     def name(self):
         return self._name
@@ -255,6 +278,7 @@ class Function(Serializable):
         self.previous_names.append(self._name)
         self._name = v
         self._function_manager._kb.labels[self.addr] = v
+        self._dirty = True
 
     @property
     def project(self):
@@ -270,6 +294,136 @@ class Function(Serializable):
     @returning.setter
     def returning(self, v):
         self._returning = v
+        self._dirty = True
+
+    @property
+    def calling_convention(self) -> SimCC | None:
+        return self._calling_convention
+
+    @calling_convention.setter
+    def calling_convention(self, v: SimCC | None):
+        self._calling_convention = v
+        self._dirty = True
+
+    @property
+    def prototype(self) -> SimTypeFunction | None:
+        return self._prototype
+
+    @prototype.setter
+    def prototype(self, v: SimTypeFunction | None):
+        self._prototype = v
+        self._dirty = True
+
+    @property
+    def transition_graph(self) -> networkx.DiGraph:
+        """
+        The transition graph of the function. If the function is compacted, the transition graph is rebuilt from its
+        compact representation upon access.
+        """
+        if self._transition_graph is None:
+            self._expand_transition_graph()
+        return self._transition_graph
+
+    @transition_graph.setter
+    def transition_graph(self, graph: networkx.DiGraph):
+        self._transition_graph = graph
+        self._compact_transition_graph = None
+        self._dirty = True
+
+    @property
+    def is_compact(self) -> bool:
+        return self._transition_graph is None
+
+    @property
+    def transition_graph_view(self) -> networkx.DiGraph | CompactTransitionGraph:
+        """
+        The transition graph, or a read-only view of its compact representation if the function is compacted. Unlike
+        `transition_graph`, accessing it never rebuilds the transition graph. It must not be modified.
+        """
+        if self._transition_graph is None:
+            return self._compact_transition_graph
+        return self._transition_graph
+
+    def compact(
+        self,
+        interned_bytes: dict[bytes, bytes] | None = None,
+        interned_attrs: dict[tuple, tuple] | None = None,
+        drop_block_bytes: bool = False,
+    ) -> None:
+        """
+        Convert the transition graph into a memory-compact representation and drop all cached graphs. The transition
+        graph is transparently rebuilt the next time `transition_graph` is accessed, and it stays that way until the
+        function is compacted again. `transition_graph_view`, `nodes`, `blocks`, `block_addrs`, and `graph` are
+        available without rebuilding the transition graph, and nodes of the function get their successors and
+        predecessors from the compact representation.
+
+        Equal BlockNode objects of the function are replaced by the same object. BlockNode objects are never shared with
+        other functions, since each node refers to the graph of the function that it belongs to.
+
+        :param interned_bytes:      A dict for interning the bytes that are cached in BlockNode objects (e.g., across all
+                                    functions in a function manager).
+        :param interned_attrs:      A dict for interning edge attributes.
+        :param drop_block_bytes:    Drop the bytes that are cached in BlockNode objects. Bytes of blocks are then loaded
+                                    from the memory of the project when needed.
+        """
+
+        if self._transition_graph is None:
+            return
+        interned_nodes: dict[BlockNode, BlockNode] = {}
+
+        def _intern(node):
+            if type(node) is not BlockNode:
+                return node
+            node = interned_nodes.setdefault(node, node)
+            if drop_block_bytes:
+                node.bytestr = None
+            elif interned_bytes is not None and node.bytestr is not None:
+                node.bytestr = interned_bytes.setdefault(node.bytestr, node.bytestr)
+            return node
+
+        graph = self._transition_graph
+        compact_graph = CompactTransitionGraph(graph, interned_attrs=interned_attrs, intern_node=_intern)
+        # nodes that refer to the graph that is going away refer to the compact representation instead
+        self._move_nodes(compact_graph, graph)
+        self._compact_transition_graph = compact_graph
+        self._transition_graph = None
+        self._local_transition_graph = None
+
+        self._addr_to_block_node = {addr: _intern(node) for addr, node in self._addr_to_block_node.items()}
+        self._local_blocks = {addr: _intern(node) for addr, node in self._local_blocks.items()}
+        if self.startpoint is not None:
+            self.startpoint = _intern(self.startpoint)
+        self._ret_sites = {_intern(node) for node in self._ret_sites}
+        self._jumpout_sites = {_intern(node) for node in self._jumpout_sites}
+        self._callout_sites = {_intern(node) for node in self._callout_sites}
+        self._retout_sites = {_intern(node) for node in self._retout_sites}
+        for endpoint_type, endpoints in self._endpoints.items():
+            self._endpoints[endpoint_type] = {_intern(node) for node in endpoints}
+
+    def _expand_transition_graph(self) -> None:
+        compact_graph = self._compact_transition_graph
+        graph = compact_graph.to_networkx()
+        self._move_nodes(graph, compact_graph)
+        self._transition_graph = graph
+        self._compact_transition_graph = None
+
+    def _move_nodes(self, graph, old_graph) -> None:
+        """
+        Make nodes of the function (and other nodes that do not belong to any graph) refer to a new graph. Nodes that
+        refer to graphs of other functions are left alone.
+        """
+        for node in graph:
+            if not isinstance(node, CodeNode):
+                continue
+            if node._graph is None or node.addr in self._local_block_addrs:
+                node.set_graph(graph)
+                continue
+            try:
+                refers_to_old_graph = node._graph == old_graph
+            except ReferenceError:
+                refers_to_old_graph = True
+            if refers_to_old_graph:
+                node.set_graph(graph)
 
     @property
     def blocks(self):
@@ -304,9 +458,8 @@ class Function(Serializable):
         :rtype: int
         """
         if self._cyclomatic_complexity is None:
-            self._cyclomatic_complexity = (
-                self.transition_graph.number_of_edges() - self.transition_graph.number_of_nodes() + 2
-            )
+            graph = self.transition_graph_view
+            self._cyclomatic_complexity = graph.number_of_edges() - graph.number_of_nodes() + 2
         return self._cyclomatic_complexity
 
     @property
@@ -370,7 +523,9 @@ class Function(Serializable):
 
     @property
     def nodes(self) -> Iterable[CodeNode]:
-        return self.transition_graph.nodes()
+        if self._transition_graph is None:
+            return self._compact_transition_graph.nodes
+        return self._transition_graph.nodes()
 
     def get_node(self, addr) -> BlockNode | None:
         return self._addr_to_block_node.get(addr, None)
@@ -577,10 +732,14 @@ class Function(Serializable):
     def __setstate__(self, state):
         for k, v in state.items():
             setattr(self, k, v)
+        # nodes do not keep their graphs when they are pickled
+        graph = self.transition_graph_view
+        if graph is not None:
+            self._move_nodes(graph, None)
 
     def __getstate__(self):
         # self._local_transition_graph is a cache. don't pickle it
-        d = {k: getattr(self, k) for k in self.__slots__}
+        d = {k: getattr(self, k) for k in self.__slots__ if k != "__weakref__"}
         d["_local_transition_graph"] = None
         d["_project"] = None
         d["_function_manager"] = None
@@ -823,6 +982,7 @@ class Function(Serializable):
             dst = self._register_node(True, dst)
 
         self.transition_graph[src][dst]["confirmed"] = True
+        self._dirty = True
 
     def _transit_to(
         self, from_node: CodeNode, to_node, outside=False, ins_addr=None, stmt_idx=None, is_exception=False
@@ -862,6 +1022,7 @@ class Function(Serializable):
 
         # clear the cache
         self._local_transition_graph = None
+        self._dirty = True
 
     def _call_to(self, from_node, to_func, ret_node, stmt_idx=None, ins_addr=None, return_to_outside=False):
         """
@@ -891,6 +1052,7 @@ class Function(Serializable):
                 self._fakeret_to(from_node, ret_node, to_outside=return_to_outside)
 
         self._local_transition_graph = None
+        self._dirty = True
 
     def _fakeret_to(self, from_node, to_node, confirmed=None, to_outside=False):
         from_node = self._register_node(True, from_node)
@@ -905,11 +1067,13 @@ class Function(Serializable):
             )
 
         self._local_transition_graph = None
+        self._dirty = True
 
     def _remove_fakeret(self, from_node, to_node):
         self.transition_graph.remove_edge(from_node, to_node)
 
         self._local_transition_graph = None
+        self._dirty = True
 
     def _return_from_call(self, from_func, to_node, to_outside=False):
         self.transition_graph.add_edge(from_func, to_node, type="return", to_outside=to_outside)
@@ -918,6 +1082,7 @@ class Function(Serializable):
                 data["confirmed"] = True
 
         self._local_transition_graph = None
+        self._dirty = True
 
     def _update_local_blocks(self, node: CodeNode):
         if node.addr not in self._local_blocks or self._local_blocks[node.addr] != node:
@@ -939,6 +1104,7 @@ class Function(Serializable):
         if is_local and self._local_blocks.get(node.addr, None) == node:
             return self._local_blocks[node.addr]
 
+        self._dirty = True
         if node.addr not in self and node not in self.transition_graph:
             # only add each node to the graph once
             self.transition_graph.add_node(node)
@@ -985,6 +1151,7 @@ class Function(Serializable):
         :param retn_addr:            The address that said call will return to.
         """
         self._call_sites[call_site_addr] = (call_target_addr, retn_addr)
+        self._dirty = True
 
     def _add_endpoint(self, endpoint_node, sort):
         """
@@ -1036,6 +1203,7 @@ class Function(Serializable):
         """
 
         self._endpoints[sort].add(endpoint_node)
+        self._dirty = True
 
     def mark_nonreturning_calls_endpoints(self):
         """
@@ -1048,7 +1216,7 @@ class Function(Serializable):
         :return: None
         """
 
-        for src, dst, data in self.transition_graph.edges(data=True):
+        for src, dst, data in self.transition_graph_view.edges(data=True):
             if "type" in data and data["type"] == "call":
                 func_addr = dst.addr
                 if func_addr in self._function_manager:
@@ -1113,7 +1281,7 @@ class Function(Serializable):
             g.add_node(self.startpoint)
         for block in self._local_blocks.values():
             g.add_node(block)
-        for src, dst, data in self.transition_graph.edges(data=True):
+        for src, dst, data in self.transition_graph_view.edges(data=True):
             if "type" in data and (
                 (data["type"] in ("transition", "exception") and ("outside" not in data or data["outside"] is False))
                 or (data["type"] == "fake_return" and ("outside" not in data or data["outside"] is False))
@@ -1301,7 +1469,7 @@ class Function(Serializable):
         """
         Returns a representation of the list of basic blocks in this function.
         """
-        return "[{}]".format(", ".join((f"{n.addr:#08x}") for n in self.transition_graph.nodes()))
+        return "[{}]".format(", ".join((f"{n.addr:#08x}") for n in self.nodes))
 
     def dbg_draw(self, filename):
         """
@@ -1331,10 +1499,12 @@ class Function(Serializable):
         """
         if reg_offset in self._function_manager._arg_registers and reg_offset not in self._argument_registers:
             self._argument_registers.append(reg_offset)
+            self._dirty = True
 
     def _add_argument_stack_variable(self, stack_var_offset):
         if stack_var_offset not in self._argument_stack_variables:
             self._argument_stack_variables.append(stack_var_offset)
+            self._dirty = True
 
     @property
     def arguments(self):
@@ -1487,6 +1657,7 @@ class Function(Serializable):
         self._local_transition_graph = None
 
         self.normalized = True
+        self._dirty = True
 
     def find_declaration(self, ignore_binary_name: bool = False, binary_name_hint: str | None = None) -> bool:
         """
@@ -1769,7 +1940,12 @@ class Function(Serializable):
 
     def copy(self):
         func = Function(self._function_manager, self.addr, name=self.name, syscall=self.is_syscall)
-        func.transition_graph = networkx.DiGraph(self.transition_graph)
+        if self._transition_graph is None:
+            # the compact representation is immutable and can be shared
+            func._transition_graph = None
+            func._compact_transition_graph = self._compact_transition_graph
+        else:
+            func.transition_graph = networkx.DiGraph(self.transition_graph)
         func.normalized = self.normalized
         func._ret_sites = self._ret_sites.copy()
         func._jumpout_sites = self._jumpout_sites.copy()
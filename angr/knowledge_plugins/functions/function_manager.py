@@ -9,6 +9,7 @@ import re
 import weakref
 import bisect
 import os
+import pickle
 from sortedcontainers import SortedDict
 
 import networkx
@@ -18,6 +19,8 @@ import cle
 
 from angr.errors import SimEngineError
 from angr.knowledge_plugins.plugin import KnowledgeBasePlugin
+from angr.protos import function_pb2, primitives_pb2
+from angr.serializable import Serializable, DEFAULT_CHUNK_SIZE, pack_chunks, read_chunks
 from .function import Function
 from .soot_function import SootFunction
 
@@ -79,7 +82,209 @@ class FunctionDict(SortedDict):
         return dict(self.items())
 
 
-class FunctionManager(KnowledgeBasePlugin, collections.abc.Mapping):
+class _UnloadedFunction:
+    """
+    The placeholder value of functions that are not materialized in a LazyFunctionDict.
+    """
+
+    __slots__ = ()
+
+    def __repr__(self):
+        return "<UnloadedFunction>"
+
+
+_UNLOADED = _UnloadedFunction()
+
+
+class LazyFunctionDict(FunctionDict):
+    """
+    LazyFunctionDict is a FunctionDict whose functions are materialized on first access. It knows the addresses of all
+    functions upfront, and gets the serialized form of each function from a loader callback (e.g., by querying an
+    angr database) only when the function is accessed.
+
+    Address-based queries (membership tests, `floor_addr`, `ceiling_addr`, and iterating over keys) never materialize
+    any function. Getting values (including iterating over values or items) materializes the respective functions.
+
+    When `max_cached_functions` is specified, at most this many functions that are materialized from the loader are kept
+    in memory, and the least recently used functions are evicted. Evicted functions that have been modified since they
+    were materialized are re-serialized (so that changes to them are not lost), and all evicted functions will be
+    materialized again on their next access. An evicted function that is still referenced elsewhere is reinstated
+    instead of being materialized again, so that these references never become stale.
+
+    Callees in the transition graph of a materialized function are represented by placeholder Function objects if these
+    callees are not materialized yet, which is identical to how eagerly loaded functions are unserialized.
+    """
+
+    def __init__(self, backref, func_addrs, loader, *args, max_cached_functions: int | None = None, **kwargs):
+        """
+        :param backref:                 The function manager.
+        :param func_addrs:              Addresses of all functions that can be materialized from the loader.
+        :param loader:                  A callable that takes a function address and returns the serialized function.
+        :param max_cached_functions:    Maximum number of materialized functions to keep in memory, or None to keep all
+                                        materialized functions.
+        """
+        super().__init__(backref, *args, **kwargs)
+        self._loader = loader
+        self._max_cached_functions = max_cached_functions
+        self._lru: collections.OrderedDict[int, None] = collections.OrderedDict()
+        # serialized forms of evicted functions that differ from what the loader returns
+        self._spilled: dict[int, bytes] = {}
+        # functions that have been modified since they were materialized, and may differ from what the loader returns
+        self._diverged: set[int] = set()
+        # evicted functions that were dirty upon eviction
+        self._dirty_spilled: set[int] = set()
+        self._placeholders: dict[int, Function] = {}
+        self._evicted: weakref.WeakValueDictionary[int, Function] = weakref.WeakValueDictionary()
+        self._materializing = False
+        self.materialized: int = 0
+        self.evicted: int = 0
+
+        for addr in func_addrs:
+            SortedDict.__setitem__(self, addr, _UNLOADED)
+
+    def __getitem__(self, addr):
+        func = super().__getitem__(addr)
+        return self._ensure_loaded(addr, func)
+
+    def __setitem__(self, addr, func):
+        super().__setitem__(addr, func)
+        self._spilled.pop(addr, None)
+        self._diverged.discard(addr)
+        self._dirty_spilled.discard(addr)
+        self._evicted.pop(addr, None)
+        self._lru.pop(addr, None)
+
+    def __delitem__(self, addr):
+        super().__delitem__(addr)
+        self._spilled.pop(addr, None)
+        self._diverged.discard(addr)
+        self._dirty_spilled.discard(addr)
+        self._evicted.pop(addr, None)
+        self._lru.pop(addr, None)
+
+    def __reduce__(self):
+        return FunctionDict, (None, dict(self.items()))
+
+    def get(self, addr):
+        func = super().get(addr)
+        return self._ensure_loaded(addr, func)
+
+    def copy(self):
+        return FunctionDict(None, self.items(), key_types=self._key_types)
+
+    __copy__ = copy
+
+    def is_loaded(self, addr) -> bool:
+        """
+        Check if the function at the given address is materialized, without materializing it.
+        """
+        return SortedDict.__getitem__(self, addr) is not _UNLOADED
+
+    def spilled(self, addr) -> bytes | None:
+        """
+        Get the serialized form of a function that has been modified, materialized, and evicted since, or None if the
+        function is not evicted or is identical to what the loader returns.
+        """
+        func = self._evicted.get(addr, None)
+        if func is not None and func.dirty:
+            # the function has been modified through references that are held elsewhere since its eviction
+            return func.serialize()
+        return self._spilled.get(addr, None)
+
+    def is_dirty(self, addr) -> bool:
+        """
+        Check if the function at the given address has been modified since it was last dumped or loaded, without
+        materializing it.
+        """
+        func = SortedDict.__getitem__(self, addr)
+        if func is _UNLOADED:
+            func = self._evicted.get(addr, None)
+            if func is None:
+                return addr in self._dirty_spilled
+        return func.dirty
+
+    def clear_dirty(self) -> None:
+        """
+        Clear the dirty flags of all functions, after all of them are dumped. Functions keep their changes upon eviction
+        regardless.
+        """
+        for addr, func in dict.items(self):
+            if func is _UNLOADED:
+                func = self._evicted.get(addr, None)
+                if func is None:
+                    continue
+            if func.dirty:
+                self._diverged.add(addr)
+                func._dirty = False
+        self._dirty_spilled.clear()
+
+    def loaded_values(self) -> Generator[Function]:
+        """
+        Iterate over all materialized functions, without materializing any function.
+        """
+        for func in dict.values(self):
+            if func is not _UNLOADED:
+                yield func
+
+    @property
+    def loaded_count(self) -> int:
+        return sum(1 for _ in self.loaded_values())
+
+    def _ensure_loaded(self, addr, func):
+        if func is _UNLOADED:
+            return self._materialize(addr)
+        if addr in self._lru:
+            self._lru.move_to_end(addr)
+        return func
+
+    def _materialize(self, addr) -> Function:
+        if self._materializing:
+            # we are unserializing another function that calls this function. do not materialize callees recursively
+            placeholder = self._placeholders.get(addr, None)
+            if placeholder is None:
+                placeholder = Function(self._backref, addr)
+                self._placeholders[addr] = placeholder
+            return placeholder
+
+        blob = self._spilled.pop(addr, None)
+        func = self._evicted.pop(addr, None)
+        if func is None:
+            if blob is None:
+                blob = self._loader(addr)
+            project = self._backref._kb._project if self._backref is not None else None
+            self._materializing = True
+            try:
+                func = Function.parse(blob, function_manager=self._backref, project=project, all_func_addrs=self)
+            finally:
+                self._materializing = False
+            func._dirty = addr in self._dirty_spilled
+            self.materialized += 1
+        self._dirty_spilled.discard(addr)
+
+        dict.__setitem__(self, addr, func)
+        self._placeholders.pop(addr, None)
+
+        if self._max_cached_functions is not None:
+            self._lru[addr] = None
+            self._evict()
+        return func
+
+    def _evict(self) -> None:
+        while len(self._lru) > self._max_cached_functions:
+            addr, _ = self._lru.popitem(last=False)
+            func = SortedDict.__getitem__(self, addr)
+            if func is not _UNLOADED:
+                if func.dirty:
+                    self._diverged.add(addr)
+                    self._dirty_spilled.add(addr)
+                if addr in self._diverged:
+                    self._spilled[addr] = func.serialize()
+                self._evicted[addr] = func
+                dict.__setitem__(self, addr, _UNLOADED)
+                self.evicted += 1
+
+
+class FunctionManager(KnowledgeBasePlugin, Serializable, collections.abc.Mapping):
     """
     This is a function boundaries management tool. It takes in intermediate
     results during CFG generation, and manages a function map of the binary.
@@ -110,6 +315,12 @@ class FunctionManager(KnowledgeBasePlugin, collections.abc.Mapping):
         self._function_map = state["_function_map"]
         self.callgraph = state["callgraph"]
         self.block_map = state["block_map"]
+        self.function_addrs_set = state.get("function_addrs_set", set())
+        self._arg_registers = state.get("_arg_registers", [])
+
+        self._rplt_cache_ranges = None
+        self._rplt_cache = None
+        self._binname_cache = None
 
         self._function_map._backref = weakref.proxy(self)
         for func in self._function_map.values():
@@ -123,6 +334,8 @@ class FunctionManager(KnowledgeBasePlugin, collections.abc.Mapping):
             "_function_map": self._function_map,
             "callgraph": self.callgraph,
             "block_map": self.block_map,
+            "function_addrs_set": self.function_addrs_set,
+            "_arg_registers": self._arg_registers,
         }
 
     def copy(self):
@@ -136,6 +349,103 @@ class FunctionManager(KnowledgeBasePlugin, collections.abc.Mapping):
 
         return fm
 
+    def compact(self, drop_block_bytes: bool = False) -> None:
+        """
+        Convert the transition graphs of all functions into memory-compact representations (see Function.compact()).
+        Bytes of blocks and edge attributes are interned across all functions. Functions of a lazily loaded function
+        manager that are not materialized yet are not materialized.
+
+        :param drop_block_bytes:    Drop the bytes that are cached in BlockNode objects.
+        """
+
+        interned_bytes = {}
+        interned_attrs = {}
+        if isinstance(self._function_map, LazyFunctionDict):
+            funcs = self._function_map.loaded_values()
+        else:
+            funcs = self._function_map.values()
+        for func in funcs:
+            func.compact(
+                interned_bytes=interned_bytes, interned_attrs=interned_attrs, drop_block_bytes=drop_block_bytes
+            )
+
+    #
+    # Serialization
+    #
+
+    @classmethod
+    def _get_cmsg(cls):
+        return function_pb2.Functions()
+
+    def serialize_to_cmessage(self):
+        return next(self.serialize_to_chunks(chunk_size=None))
+
+    def serialize_to_chunks(self, chunk_size: int | None = DEFAULT_CHUNK_SIZE):
+        """
+        Serialize all functions and the call graph into Functions cmessage objects. The first cmessage object carries
+        the addresses of all functions, which are necessary for parsing functions. Each cmessage object contains up to
+        `chunk_size` functions and call graph edges in total.
+
+        :param chunk_size:  The maximum number of items in each cmessage object, or None to serialize all functions
+                            into a single cmessage object.
+        :return:            An iterator of Functions cmessage objects.
+        """
+
+        cmsg = self._get_cmsg()
+        cmsg.function_addrs.extend(self._function_map)
+        yield from pack_chunks(cmsg, self._get_cmsg, self._iter_cmessage_items(), chunk_size)
+
+    def _iter_cmessage_items(self):
+        for func in self._function_map.values():
+            yield "functions", func.serialize_to_cmessage()
+
+        for src, dst, data in self.callgraph.edges(data=True):
+            edge = primitives_pb2.Edge()
+            edge.src_ea = src
+            edge.dst_ea = dst
+            for k, v in data.items():
+                edge.data[k] = pickle.dumps(v)
+            yield "callgraph_edges", edge
+
+    @classmethod
+    def parse_from_cmessage(cls, cmsg, kb=None, **kwargs):  # pylint:disable=arguments-differ
+        fm = cls(kb)
+        fm._parse_cmessage_chunk(cmsg, set(cmsg.function_addrs))
+        return fm
+
+    @classmethod
+    def parse_from_stream(cls, stream, kb=None, **kwargs):  # pylint:disable=arguments-differ
+        """
+        Parse a section of a stream that `serialize_to_stream()` writes, chunk by chunk.
+
+        :param stream:  A file object that is opened for reading in binary mode.
+        :param kb:      The knowledge base.
+        :return:        The function manager.
+        """
+
+        fm = cls(kb)
+        all_func_addrs = None
+        for chunk in read_chunks(stream):
+            cmsg = cls._get_cmsg()
+            cmsg.ParseFromString(chunk)
+            if all_func_addrs is None:
+                all_func_addrs = set(cmsg.function_addrs)
+            fm._parse_cmessage_chunk(cmsg, all_func_addrs)
+        return fm
+
+    def _parse_cmessage_chunk(self, cmsg, all_func_addrs: set[int]) -> None:
+        self.callgraph.add_nodes_from(cmsg.function_addrs)
+
+        for func_pb2 in cmsg.functions:
+            func = Function.parse_from_cmessage(
+                func_pb2, function_manager=self, project=self._kb._project, all_func_addrs=all_func_addrs
+            )
+            self[func.addr] = func
+
+        for edge_pb2 in cmsg.callgraph_edges:
+            data = {k: pickle.loads(v) for k, v in edge_pb2.data.items()}
+            self.callgraph.add_edge(edge_pb2.src_ea, edge_pb2.dst_ea, **data)
+
     def clear(self):
         self._function_map = FunctionDict(self, key_types=self.function_address_types)
         self.callgraph = networkx.MultiDiGraph()
@@ -211,6 +521,7 @@ class FunctionManager(KnowledgeBasePlugin, collections.abc.Mapping):
         dst_func = self._function_map[function_addr]
         if syscall in (True, False):
             dst_func.is_syscall = syscall
+            dst_func.mark_dirty()
         dst_func._register_node(True, node)
         self.block_map[node.addr] = node
 
@@ -251,6 +562,7 @@ class FunctionManager(KnowledgeBasePlugin, collections.abc.Mapping):
             dest_func = self._function_map[to_addr]
             if syscall in (True, False):
                 dest_func.is_syscall = syscall
+                dest_func.mark_dirty()
             func._call_to(
                 from_node,
                 dest_func,
@@ -283,6 +595,7 @@ class FunctionManager(KnowledgeBasePlugin, collections.abc.Mapping):
 
         if syscall in (True, False):
             src_func.is_syscall = syscall
+            src_func.mark_dirty()
 
         src_func._fakeret_to(from_node, to_node, confirmed=confirmed, to_outside=to_outside)
 
@@ -548,6 +861,7 @@ class FunctionManager(KnowledgeBasePlugin, collections.abc.Mapping):
                         f.name = name
                     if syscall:
                         f.is_syscall = True
+                        f.mark_dirty()
                     return f
         elif name is not None:
             func = self.query(name, check_previous_names=check_previous_names)
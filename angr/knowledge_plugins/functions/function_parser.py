@@ -61,7 +61,7 @@ class FunctionParser:
         edges = []
         external_addrs = set()
         TRANSITION_JK = func_edge_type_to_pb("transition")  # default edge type
-        for src, dst, data in function.transition_graph.edges(data=True):
+        for src, dst, data in function.transition_graph_view.edges(data=True):
             edge = primitives_pb2.Edge()
             edge.src_ea = src.addr
             edge.dst_ea = dst.addr
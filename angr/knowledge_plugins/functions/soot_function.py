@@ -112,6 +112,7 @@ class SootFunction(Function):
         if is_local and self._local_blocks.get(node.addr) == node:
             return self._local_blocks[node.addr]
 
+        self._dirty = True
         if node not in self.transition_graph:
             self.transition_graph.add_node(node)
         node._graph = self.transition_graph
@@ -0,0 +1,82 @@
+# pylint:disable=import-outside-toplevel
+from __future__ import annotations
+from typing import TYPE_CHECKING
+import copy
+
+from .plugin import KnowledgeBasePlugin
+
+if TYPE_CHECKING:
+    from angr.sim_type import SimTypeFunction
+    from angr.analyses.typehoon.lifter import TypeLifter
+    from angr.analyses.typehoon.typeconsts import TypeConstant
+
+
+class LiftedPrototypes(KnowledgeBasePlugin):
+    """
+    LiftedPrototypes caches, for each callee function, the type constants that are lifted from the arguments of its
+    prototype. Type inference of every caller function needs these type constants, and lifting them (including
+    dereferencing types from type libraries) is repeated at each call site in each caller function otherwise.
+
+    A cache entry is only valid for the exact prototype (and prototype library name) that it was created from. Type
+    constants are returned as copies, since type inference may modify the type constants in its constraints.
+    """
+
+    def __init__(self, kb):
+        super().__init__(kb=kb)
+
+        self._cache: dict[int, tuple[SimTypeFunction, str | None, tuple[TypeConstant, ...]]] = {}
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def lift_args(
+        self,
+        func_addr: int,
+        prototype: SimTypeFunction,
+        prototype_libname: str | None,
+        lifter: TypeLifter,
+    ) -> tuple[TypeConstant, ...]:
+        """
+        Get the lifted type constants of all arguments of the prototype of a callee function. Results are cached per
+        callee function.
+
+        :param func_addr:           Address of the callee function.
+        :param prototype:           The prototype of the callee function.
+        :param prototype_libname:   Name of the type library to dereference argument types with, or None.
+        :param lifter:              The type lifter to use when the cache misses.
+        :return:                    A tuple of copies of lifted type constants, one for each argument.
+        """
+
+        entry = self._cache.get(func_addr, None)
+        if entry is not None and entry[0] is prototype and entry[1] == prototype_libname:
+            self.hits += 1
+            return copy.deepcopy(entry[2])
+
+        from angr.utils.types import dereference_simtype_by_lib
+
+        self.misses += 1
+        lifted = tuple(
+            lifter.lift(dereference_simtype_by_lib(arg_type, prototype_libname) if prototype_libname else arg_type)
+            for arg_type in prototype.args
+        )
+        self._cache[func_addr] = prototype, prototype_libname, lifted
+        return copy.deepcopy(lifted)
+
+    def discard(self, func_addr: int) -> None:
+        self._cache.pop(func_addr, None)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def __contains__(self, func_addr: int) -> bool:
+        return func_addr in self._cache
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def copy(self):
+        o = LiftedPrototypes(self._kb)
+        o._cache.update(self._cache)
+        return o
+
+
+KnowledgeBasePlugin.register_default("lifted_prototypes", LiftedPrototypes)
@@ -2,7 +2,9 @@ from __future__ import annotations
 import logging
 from collections import defaultdict
 
-from angr.serializable import Serializable
+from sortedcontainers import SortedList
+
+from angr.serializable import Serializable, DEFAULT_CHUNK_SIZE, pack_chunks, read_chunks
 from angr.protos import xrefs_pb2
 from angr.knowledge_plugins.plugin import KnowledgeBasePlugin
 from .xref import XRef, XRefType
@@ -18,39 +20,88 @@ class XRefManager(KnowledgeBasePlugin, Serializable):
         self.xrefs_by_ins_addr: dict[int, set[XRef]] = defaultdict(set)
         self.xrefs_by_dst: dict[int, set[XRef]] = defaultdict(set)
 
+        # sorted instruction addresses and destination addresses to speed up region queries. Don't serialize
+        self._ins_addr_index: SortedList[int] | None = None
+        self._dst_index: SortedList[int] | None = None
+        # whether references have been added or removed since they were last dumped to or loaded from a database
+        self._dirty = True
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_ins_addr_index"] = None
+        state["_dst_index"] = None
+        return state
+
+    def __setstate__(self, state):
+        state.setdefault("_ins_addr_index", None)
+        state.setdefault("_dst_index", None)
+        state.setdefault("_dirty", True)
+        self.__dict__.update(state)
+
     def copy(self):
         xm = XRefManager(self._kb)
         xm.xrefs_by_ins_addr = self.xrefs_by_ins_addr.copy()
         xm.xrefs_by_dst = self.xrefs_by_dst.copy()
+        if self._ins_addr_index is not None:
+            xm._ins_addr_index = self._ins_addr_index.copy()
+        if self._dst_index is not None:
+            xm._dst_index = self._dst_index.copy()
         return xm
 
     def clear(self):
         self.xrefs_by_ins_addr = defaultdict(set)
         self.xrefs_by_dst = defaultdict(set)
+        self._ins_addr_index = None
+        self._dst_index = None
+        self._dirty = True
 
     def add_xref(self, xref):
-        to_remove = set()
-        # Overwrite existing "offset" refs
-        if xref.type != XRefType.Offset:
-            existing = self.get_xrefs_by_ins_addr(xref.ins_addr)
-            if existing:
-                for ex in existing:
-                    if ex.dst == xref.dst and ex.type == XRefType.Offset:
-                        # We want to remove this one and replace it with the new one
-                        to_remove.add(ex)
-
-        d0 = self.xrefs_by_ins_addr[xref.ins_addr]
-        d0.add(xref)
-        d1 = self.xrefs_by_dst[xref.dst]
-        d1.add(xref)
-
-        for ex in to_remove:
-            d0.discard(ex)
-            d1.discard(ex)
+        self.add_xrefs([xref])
 
     def add_xrefs(self, xrefs):
+        """
+        Add multiple references at once. Existing Offset references with the same instruction address and destination
+        are replaced by non-Offset references.
+
+        :param xrefs:   An iterable of XRef objects.
+        """
+
+        by_ins_addr = self.xrefs_by_ins_addr
+        by_dst = self.xrefs_by_dst
+        new_ins_addrs = []
+        new_dsts = []
+
         for xref in xrefs:
-            self.add_xref(xref)
+            ins_addr = xref.ins_addr
+            dst = xref.dst
+
+            d0 = by_ins_addr.get(ins_addr, None)
+            if not d0:
+                if d0 is None:
+                    d0 = by_ins_addr[ins_addr] = set()
+                new_ins_addrs.append(ins_addr)
+            d1 = by_dst.get(dst, None)
+            if not d1:
+                if d1 is None:
+                    d1 = by_dst[dst] = set()
+                new_dsts.append(dst)
+
+            # Overwrite existing "offset" refs
+            to_remove = None
+            if d0 and xref.type != XRefType.Offset:
+                to_remove = [ex for ex in d0 if ex.dst == dst and ex.type == XRefType.Offset]
+
+            d0.add(xref)
+            d1.add(xref)
+
+            if to_remove:
+                for ex in to_remove:
+                    d0.discard(ex)
+                    d1.discard(ex)
+
+        self._update_index(self._ins_addr_index, new_ins_addrs)
+        self._update_index(self._dst_index, new_dsts)
+        self._dirty = True
 
     def get_xrefs_by_ins_addr(self, ins_addr):
         return self.xrefs_by_ins_addr.get(ins_addr, set())
@@ -65,13 +116,12 @@ class XRefManager(KnowledgeBasePlugin, Serializable):
         Will only return absolute xrefs, not relative ones (like SP offsets)
         """
 
-        def f(x):
-            return isinstance(x, int) and start <= x <= end
+        if self._dst_index is None:
+            self._dst_index = self._build_index(self.xrefs_by_dst)
 
-        addrs = filter(f, self.xrefs_by_dst.keys())
         refs = set()
-        for addr in addrs:
-            refs = refs.union(self.xrefs_by_dst[addr])
+        for addr in self._dst_index.irange(start, end):
+            refs.update(self.xrefs_by_dst.get(addr, ()))
         return refs
 
     def get_xrefs_by_ins_addr_region(self, start, end) -> set[XRef]:
@@ -80,15 +130,26 @@ class XRefManager(KnowledgeBasePlugin, Serializable):
         bounded by start and end.  Useful for finding references from a basic block or function.
         """
 
-        def f(x):
-            return isinstance(x, int) and start <= x <= end
+        if self._ins_addr_index is None:
+            self._ins_addr_index = self._build_index(self.xrefs_by_ins_addr)
 
-        addrs = filter(f, self.xrefs_by_ins_addr.keys())
         refs = set()
-        for addr in addrs:
-            refs = refs.union(self.xrefs_by_ins_addr[addr])
+        for addr in self._ins_addr_index.irange(start, end):
+            refs.update(self.xrefs_by_ins_addr.get(addr, ()))
         return refs
 
+    @staticmethod
+    def _update_index(index: SortedList[int] | None, addrs: list) -> None:
+        if index is None:
+            return
+        for addr in addrs:
+            if isinstance(addr, int) and addr not in index:
+                index.add(addr)
+
+    @staticmethod
+    def _build_index(xrefs_by_addr: dict[int, set[XRef]]) -> SortedList[int]:
+        return SortedList(addr for addr in xrefs_by_addr if isinstance(addr, int))
+
     # TODO: Maybe add some helpers that accept Function or Block objects for the sake of clean analyses.
 
     @classmethod
@@ -96,22 +157,49 @@ class XRefManager(KnowledgeBasePlugin, Serializable):
         return xrefs_pb2.XRefs()
 
     def serialize_to_cmessage(self):
-        # pylint:disable=no-member
-        cmsg = self._get_cmsg()
-        # references
-        refs = []
-        for ref_set in self.xrefs_by_ins_addr.values():
-            for ref in ref_set:
-                refs.append(ref.serialize_to_cmessage())
-        cmsg.xrefs.extend(refs)
-        return cmsg
+        return next(self.serialize_to_chunks(chunk_size=None))
+
+    def serialize_to_chunks(self, chunk_size: int | None = DEFAULT_CHUNK_SIZE):
+        """
+        Serialize all references into XRefs cmessage objects that contain up to `chunk_size` references each.
+
+        :param chunk_size:  The maximum number of references in each cmessage object, or None to serialize all
+                            references into a single cmessage object.
+        :return:            An iterator of XRefs cmessage objects.
+        """
+        refs = (
+            ("xrefs", ref.serialize_to_cmessage()) for ref_set in self.xrefs_by_ins_addr.values() for ref in ref_set
+        )
+        yield from pack_chunks(self._get_cmsg(), self._get_cmsg, refs, chunk_size)
 
     @classmethod
     def parse_from_cmessage(cls, cmsg, cfg_model=None, kb=None, **kwargs):  # pylint:disable=arguments-differ
         model = XRefManager(kb)
-        bits = kb._project.arch.bits
+        model._parse_cmessage_chunk(cmsg, cfg_model=cfg_model)
+        return model
+
+    @classmethod
+    def parse_from_stream(cls, stream, cfg_model=None, kb=None, **kwargs):  # pylint:disable=arguments-differ
+        """
+        Parse a section of a stream that `serialize_to_stream()` writes, chunk by chunk.
+
+        :param stream:      A file object that is opened for reading in binary mode.
+        :param cfg_model:   The CFG model to get memory data of references from.
+        :param kb:          The knowledge base.
+        :return:            The XRef manager.
+        """
+        model = XRefManager(kb)
+        for chunk in read_chunks(stream):
+            cmsg = cls._get_cmsg()
+            cmsg.ParseFromString(chunk)
+            model._parse_cmessage_chunk(cmsg, cfg_model=cfg_model)
+        return model
+
+    def _parse_cmessage_chunk(self, cmsg, cfg_model=None) -> None:
+        bits = self._kb._project.arch.bits
 
         # references
+        xrefs = []
         for xref_pb2 in cmsg.xrefs:
             if xref_pb2.data_ea == -1:
                 l.warning("Unknown address of the referenced data item. Ignore the reference at %#x.", xref_pb2.ea)
@@ -119,9 +207,8 @@ class XRefManager(KnowledgeBasePlugin, Serializable):
             xref = XRef.parse_from_cmessage(xref_pb2, bits=bits)
             if cfg_model is not None and isinstance(xref.dst, int):
                 xref.memory_data = cfg_model.memory_data.get(xref.dst, None)
-            model.add_xref(xref)
-
-        return model
+            xrefs.append(xref)
+        self.add_xrefs(xrefs)
 
 
 KnowledgeBasePlugin.register_default("xrefs", XRefManager)
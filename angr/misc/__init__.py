@@ -5,11 +5,13 @@ from . import autoimport
 from .loggers import Loggers
 from .plugins import PluginHub, PluginPreset
 from .hookset import HookSet
+from .lazy_hooks import LazyHooks
 from .picklable_lock import PicklableLock
 
 
 __all__ = (
     "HookSet",
+    "LazyHooks",
     "Loggers",
     "PicklableLock",
     "PluginHub",
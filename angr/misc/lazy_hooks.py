@@ -0,0 +1,94 @@
+from __future__ import annotations
+from typing import Any
+from collections.abc import Callable, MutableMapping
+
+
+class LazyHooks(MutableMapping):
+    """
+    A mapping of addresses to hooks (SimProcedure instances). Besides regular hooks, pending hooks can be registered as
+    factories, which are only called to create the hooks when the hooks are looked up for the first time.
+
+    Membership tests and iteration over addresses do not create pending hooks. Looking up hooks (including iterating
+    over values or items) does.
+    """
+
+    __slots__ = (
+        "_hooks",
+        "_pending",
+    )
+
+    def __init__(self, hooks: dict[Any, Any] | None = None):
+        self._hooks: dict[Any, Any] = {} if hooks is None else dict(hooks)
+        self._pending: dict[Any, Callable[[], Any]] = {}
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    def add_pending(self, addr, factory: Callable[[], Any]) -> None:
+        """
+        Register a pending hook at an address, replacing any existing hook.
+
+        :param addr:    The address to hook.
+        :param factory: A callable that creates the hook.
+        """
+        self._hooks.pop(addr, None)
+        self._pending[addr] = factory
+
+    def materialize_all(self) -> None:
+        """
+        Create all pending hooks.
+        """
+        for addr in list(self._pending):
+            self._materialize(addr)
+
+    def _materialize(self, addr):
+        factory = self._pending.pop(addr)
+        hook = self._hooks[addr] = factory()
+        return hook
+
+    def __getitem__(self, addr):
+        try:
+            return self._hooks[addr]
+        except KeyError:
+            if addr in self._pending:
+                return self._materialize(addr)
+            raise
+
+    def get(self, addr, default=None):
+        hook = self._hooks.get(addr, None)
+        if hook is not None:
+            return hook
+        if addr in self._pending:
+            return self._materialize(addr)
+        return default
+
+    def __contains__(self, addr) -> bool:
+        return addr in self._hooks or addr in self._pending
+
+    def __setitem__(self, addr, hook):
+        self._pending.pop(addr, None)
+        self._hooks[addr] = hook
+
+    def __delitem__(self, addr):
+        if self._pending.pop(addr, None) is None:
+            del self._hooks[addr]
+
+    def __iter__(self):
+        # hooks may be created (and moved from _pending to _hooks) during iteration
+        return iter(list(self._hooks) + list(self._pending))
+
+    def __len__(self) -> int:
+        return len(self._hooks) + len(self._pending)
+
+    def __repr__(self):
+        return f"<LazyHooks: {len(self._hooks)} hooks, {len(self._pending)} pending>"
+
+    def __getstate__(self):
+        # factories are not necessarily picklable
+        self.materialize_all()
+        return {"_hooks": self._hooks}
+
+    def __setstate__(self, s):
+        self._hooks = s["_hooks"]
+        self._pending = {}
@@ -3,6 +3,7 @@ from typing import TypeVar, Generic
 
 from angr.errors import AngrNoPluginError
 
+import importlib
 import logging
 
 l = logging.getLogger(name=__name__)
@@ -218,6 +219,12 @@ class PluginPreset:
 
     def __init__(self):
         self._default_plugins: dict[str, type[P]] = {}
+        self._lazy_plugins: dict[str, tuple[str, str]] = {}
+
+    def __setstate__(self, s):
+        self.__dict__.update(s)
+        # presets that are pickled before lazy plugins are supported
+        self.__dict__.setdefault("_lazy_plugins", {})
 
     def activate(self, hub):  # pylint:disable=no-self-use,unused-argument
         """
@@ -236,12 +243,25 @@ class PluginPreset:
         Add a plugin to the preset.
         """
         self._default_plugins[name] = plugin_cls
+        self._lazy_plugins.pop(name, None)
+
+    def add_lazy_default_plugin(self, name: str, module_name: str, cls_name: str):
+        """
+        Add a plugin to the preset without importing the module where the plugin class is defined. The module is
+        imported when the plugin is requested for the first time.
+
+        :param name:        Name of the plugin.
+        :param module_name: Absolute name of the module that defines the plugin class.
+        :param cls_name:    Name of the plugin class in the module.
+        """
+        if name not in self._default_plugins:
+            self._lazy_plugins[name] = module_name, cls_name
 
     def list_default_plugins(self):
         """
         Return a list of the names of available default plugins.
         """
-        return self._default_plugins.keys()
+        return self._default_plugins.keys() | self._lazy_plugins.keys()
 
     def request_plugin(self, name: str) -> type[P]:
         """
@@ -250,8 +270,15 @@ class PluginPreset:
         """
         try:
             return self._default_plugins[name]
+        except KeyError:
+            pass
+        try:
+            module_name, cls_name = self._lazy_plugins[name]
         except KeyError as err:
             raise AngrNoPluginError(f"There is no plugin named {name}") from err
+        plugin_cls = getattr(importlib.import_module(module_name), cls_name)
+        self.add_default_plugin(name, plugin_cls)
+        return plugin_cls
 
     def copy(self):
         """
@@ -260,6 +287,7 @@ class PluginPreset:
         cls = self.__class__
         result = cls.__new__(cls)
         result._default_plugins = dict(self._default_plugins)  # pylint:disable=protected-access
+        result._lazy_plugins = dict(self._lazy_plugins)  # pylint:disable=protected-access
         return result
 
 
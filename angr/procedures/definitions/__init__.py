@@ -17,6 +17,7 @@ from angr.sim_type import parse_cpp_file, parse_file, SimTypeFunction, SimTypeBo
 from angr.calling_conventions import DEFAULT_CC, CC_NAMES
 from angr.misc import autoimport
 from angr.misc.ux import once
+from angr.utils.lazy_import import LazyDict
 from angr.procedures.stubs.ReturnUnconstrained import ReturnUnconstrained
 from angr.procedures.stubs.syscall_stub import syscall as stub_syscall
 
@@ -25,8 +26,9 @@ if TYPE_CHECKING:
 
 
 l = logging.getLogger(name=__name__)
-SIM_LIBRARIES: dict[str, list[SimLibrary]] = {}
-SIM_TYPE_COLLECTIONS: dict[str, SimTypeCollection] = {}
+# common types and definitions are loaded when either of the two dicts is accessed for the first time
+SIM_LIBRARIES: dict[str, list[SimLibrary]] = LazyDict(lambda: _load_common_definitions())
+SIM_TYPE_COLLECTIONS: dict[str, SimTypeCollection] = LazyDict(lambda: _load_common_definitions())
 
 
 class SimTypeCollection:
@@ -1022,11 +1024,16 @@ COMMON_LIBRARIES = {
 }
 
 
-# Load common types
-load_type_collections(skip={"win32"})
+def _load_common_definitions():
+    if once("load_common_definitions"):
+        # make sure both dicts are populated before loading anything into either of them
+        SIM_LIBRARIES.load()
+        SIM_TYPE_COLLECTIONS.load()
 
+        # Load common types
+        load_type_collections(skip={"win32"})
 
-# Load common definitions
-_load_definitions(os.path.join(_DEFINITIONS_BASEDIR, "common"), only=COMMON_LIBRARIES)
-_load_definitions(_DEFINITIONS_BASEDIR, only=COMMON_LIBRARIES)
-_update_glibc(SIM_LIBRARIES["libc.so"][0])
+        # Load common definitions
+        _load_definitions(os.path.join(_DEFINITIONS_BASEDIR, "common"), only=COMMON_LIBRARIES)
+        _load_definitions(_DEFINITIONS_BASEDIR, only=COMMON_LIBRARIES)
+        _update_glibc(SIM_LIBRARIES["libc.so"][0])
@@ -52,3 +52,16 @@ class IFuncResolver(angr.SimProcedure):
 
         self.state.globals[("ifunc_resolution", funcaddr)] = value
         self.jump(value)
+
+
+class LazyIFuncResolver(IFuncResolver):
+    """
+    An IFuncResolver that replaces a resolver whose IRELATIVE relocation is not resolved eagerly. Calls to the resolver
+    are calls to the resolved function, which is assumed to return, so that static analyses keep the fall-through edges
+    at call sites.
+    """
+
+    DYNAMIC_RET = True
+
+    def dynamic_returns(self, blocks, **kwargs) -> bool:
+        return True
@@ -1,6 +1,8 @@
 from __future__ import annotations
+import functools
 import logging
 import os
+import time
 import types
 from io import BytesIO, IOBase
 import pickle
@@ -15,6 +17,7 @@ import cle
 from .sim_procedure import SimProcedure
 
 from .errors import AngrNoPluginError
+from .misc.lazy_hooks import LazyHooks
 
 l = logging.getLogger(name=__name__)
 
@@ -81,6 +84,9 @@ class Project:
     :param load_function:               A function that defines how the Project should be loaded. Default to unpickling.
     :param analyses_preset:             The plugin preset for the analyses provider (i.e. Analyses instance).
     :type analyses_preset:              angr.misc.PluginPreset
+    :param lazy_hooks:                  Defer creating SimProcedures for imported symbols until the hooks are looked
+                                        up for the first time, and defer resolving IRELATIVE relocations until the
+                                        resolvers are called. This speeds up creating projects with many imports.
 
     Any additional keyword arguments passed will be passed onto ``cle.Loader``.
 
@@ -95,6 +101,8 @@ class Project:
     :type loader:       cle.Loader
     :ivar storage:      Dictionary of things that should be loaded/stored with the Project.
     :type storage:      defaultdict(list)
+    :ivar init_timings: Time (in seconds) spent in each step of creating the Project.
+    :type init_timings: dict[str, float]
     """
 
     arch: archinfo.Arch
@@ -119,8 +127,12 @@ class Project:
         analyses_preset=None,
         concrete_target=None,
         eager_ifunc_resolution=None,
+        lazy_hooks: bool = False,
         **kwargs,
     ):
+        self.init_timings: dict[str, float] = {}
+        start = time.perf_counter()
+
         # Step 1: Load the binary
 
         if load_options is None:
@@ -148,6 +160,7 @@ class Project:
             l.info("Loading binary %s", thing)
             self.filename = str(thing)
             self.loader = cle.Loader(self.filename, concrete_target=concrete_target, **load_options)
+        self.init_timings["load"] = time.perf_counter() - start
 
         # Step 2: determine its CPU architecture, ideally falling back to CLE's guess
         if isinstance(arch, str):
@@ -170,7 +183,8 @@ class Project:
                 "Project causes the resulting object to be un-serializable."
             )
 
-        self._sim_procedures = {}
+        self._lazy_hooks = lazy_hooks
+        self._sim_procedures = LazyHooks() if lazy_hooks else {}
 
         self.concrete_target = concrete_target
 
@@ -219,6 +233,7 @@ class Project:
             simos = "snimmuc_nxp"
 
         # Step 4: determine the guest OS
+        start = time.perf_counter()
         if isinstance(simos, type) and issubclass(simos, SimOS):
             self.simos = simos(self)  # pylint:disable=invalid-name
         elif isinstance(simos, str):
@@ -245,7 +260,10 @@ class Project:
             self.simos, "is_javavm_with_jni_support", False
         )
 
+        self.init_timings["setup"] = time.perf_counter() - start
+
         # Step 6: Register simprocedures as appropriate for library functions
+        start = time.perf_counter()
         if isinstance(self.arch, ArchSoot) and getattr(self.simos, "is_javavm_with_jni_support", False):
             # If we execute a Java archive that includes native JNI libraries,
             # we need to use the arch of the native simos for all (native) sim
@@ -255,9 +273,12 @@ class Project:
             sim_proc_arch = self.arch
         for obj in self.loader.initial_load_objects:
             self._register_object(obj, sim_proc_arch)
+        self.init_timings["hook_symbols"] = time.perf_counter() - start
 
         # Step 7: Run OS-specific configuration
+        start = time.perf_counter()
         self.simos.configure_project()
+        self.init_timings["configure_simos"] = time.perf_counter() - start
 
     @property
     def kb(self):
@@ -380,7 +401,7 @@ class Project:
                     if not sim_lib.has_implementation(export.name):
                         continue
                     l.info("Using builtin SimProcedure for %s from %s", export.name, sim_lib.name)
-                    self.hook_symbol(export.rebased_addr, sim_lib.get(export.name, sim_proc_arch))
+                    self._hook_symbol_with(export.rebased_addr, sim_lib.get, export.name, sim_proc_arch)
                     break
 
             # Step 2.3: If 2.2 didn't work, check if the symbol wants to be resolved
@@ -394,10 +415,10 @@ class Project:
                 if self._check_user_blacklists(export.name):
                     if not func.is_weak:
                         l.info("Using stub SimProcedure for unresolved %s from %s", func.name, sim_lib.name)
-                        self.hook_symbol(export.rebased_addr, sim_lib.get_stub(export.name, sim_proc_arch))
+                        self._hook_symbol_with(export.rebased_addr, sim_lib.get_stub, export.name, sim_proc_arch)
                 else:
                     l.info("Using builtin SimProcedure for unresolved %s from %s", export.name, sim_lib.name)
-                    self.hook_symbol(export.rebased_addr, sim_lib.get(export.name, sim_proc_arch))
+                    self._hook_symbol_with(export.rebased_addr, sim_lib.get, export.name, sim_proc_arch)
 
             # Step 2.4: If 2.3 didn't work (the symbol didn't request a provider we know of), try
             # looking through each of the SimLibraries we're using to resolve unresolved
@@ -410,10 +431,12 @@ class Project:
                         if self._check_user_blacklists(export.name):
                             if not func.is_weak:
                                 l.info("Using stub SimProcedure for unresolved %s from %s", export.name, sim_lib.name)
-                                self.hook_symbol(export.rebased_addr, sim_lib.get_stub(export.name, sim_proc_arch))
+                                self._hook_symbol_with(
+                                    export.rebased_addr, sim_lib.get_stub, export.name, sim_proc_arch
+                                )
                         else:
                             l.info("Using builtin SimProcedure for unresolved %s from %s", export.name, sim_lib.name)
-                            self.hook_symbol(export.rebased_addr, sim_lib.get(export.name, sim_proc_arch))
+                            self._hook_symbol_with(export.rebased_addr, sim_lib.get, export.name, sim_proc_arch)
                         break
                 else:
                     if not func.is_weak:
@@ -430,7 +453,7 @@ class Project:
                                     export.name,
                                 )
 
-                        self.hook_symbol(export.rebased_addr, the_lib.get(export.name, sim_proc_arch))
+                        self._hook_symbol_with(export.rebased_addr, the_lib.get, export.name, sim_proc_arch)
 
             # Step 2.5: If the requesting object wants us to guess simprocedures, do the guessing
             elif reloc.owner.guess_simprocs and self._guess_simprocedure(func, reloc.owner.guess_simprocs_hint):
@@ -445,6 +468,26 @@ class Project:
                     SIM_PROCEDURES["stubs"]["ReturnUnconstrained"](display_name=export.name, is_stub=True),
                 )
 
+    def _hook_symbol_with(self, addr: int, factory, name: str, arch) -> int:
+        """
+        Hook a symbol with the SimProcedure that `factory(name, arch)` creates. In lazy-hooking mode, the SimProcedure
+        is only created when the hook is looked up for the first time.
+
+        :param addr:    The address of the symbol.
+        :param factory: A callable that creates the SimProcedure, e.g., SimLibrary.get.
+        :param name:    Name of the function.
+        :param arch:    The architecture of the SimProcedure.
+        :return:        The hooked address.
+        """
+        if not isinstance(self._sim_procedures, LazyHooks):
+            return self.hook_symbol(addr, factory(name, arch))
+
+        hook_addr, _ = self.simos.prepare_function_symbol(None, basic_addr=addr)
+        if self.is_hooked(hook_addr):
+            l.warning("Address is already hooked, during hook(%s, %s). Re-hooking.", self._addr_to_str(hook_addr), name)
+        self._sim_procedures.add_pending(hook_addr, functools.partial(factory, name, arch))
+        return hook_addr
+
     def _guess_simprocedure(self, f, hint):
         """
         Does symbol name `f` exist as a SIM_PROCEDURE? If so, return it, else return None.
@@ -0,0 +1,35 @@
+# stub file for angr.rustylib.graph
+
+def immediate_dominators(
+    num_nodes: int, edges: list[tuple[int, int]], entry: int, reverse: bool = False
+) -> list[int | None]:
+    """
+    Compute immediate dominators (or immediate post-dominators if `reverse` is True) of all nodes that are reachable
+    from `entry`. The item at index `i` is the immediate dominator of node `i`, or None if node `i` is unreachable. The
+    immediate dominator of `entry` is itself.
+    """
+
+def dominance_frontiers(
+    num_nodes: int, edges: list[tuple[int, int]], idoms: list[int | None], reverse: bool = False
+) -> list[list[int]]:
+    """
+    Compute dominance frontiers (or post-dominance frontiers if `reverse` is True) of all nodes, given their immediate
+    dominators as returned by `immediate_dominators`.
+    """
+
+def reverse_post_order(num_nodes: int, edges: list[tuple[int, int]], entry: int) -> list[int]:
+    """
+    Return all nodes that are reachable from `entry` in reverse post order.
+    """
+
+def strongly_connected_components(num_nodes: int, edges: list[tuple[int, int]]) -> list[list[int]]:
+    """
+    Return all strongly connected components of the graph in reverse topological order.
+    """
+
+def loop_nesting_forest(num_nodes: int, edges: list[tuple[int, int]], entry: int) -> list[tuple[int, list[int]]]:
+    """
+    Return the loop nesting forest of all nodes that are reachable from `entry`, as a list of (loop header, loop members)
+    tuples. Loop members are sorted in reverse post order and include the header. Outer loops come before their inner
+    loops.
+    """
@@ -1,4 +1,109 @@
 from __future__ import annotations
+from typing import Any, BinaryIO
+from collections.abc import Iterator
+from collections import defaultdict
+
+
+# the default maximum number of items (e.g., nodes, edges, or references) in each chunk of a stream
+DEFAULT_CHUNK_SIZE = 4096
+
+
+def write_delimited(stream: BinaryIO, data: bytes) -> None:
+    """
+    Write a length-delimited record, which is the length of `data` encoded as a varint followed by `data`. This is the
+    same framing as writeDelimitedTo() and parseDelimitedFrom() in other protobuf implementations.
+
+    :param stream:  A file object that is opened for writing in binary mode.
+    :param data:    The data to write.
+    """
+
+    n = len(data)
+    header = bytearray()
+    while n > 0x7F:
+        header.append((n & 0x7F) | 0x80)
+        n >>= 7
+    header.append(n)
+    stream.write(bytes(header))
+    stream.write(data)
+
+
+def read_delimited(stream: BinaryIO) -> bytes | None:
+    """
+    Read a length-delimited record that `write_delimited()` writes.
+
+    :param stream:  A file object that is opened for reading in binary mode.
+    :return:        The data of the record, or None if the end of the stream is reached.
+    """
+
+    n = 0
+    shift = 0
+    while True:
+        b = stream.read(1)
+        if not b:
+            if shift == 0:
+                return None
+            raise EOFError("Unexpected end of stream in the length of a record.")
+        n |= (b[0] & 0x7F) << shift
+        if not b[0] & 0x80:
+            break
+        shift += 7
+
+    data = stream.read(n)
+    if len(data) != n:
+        raise EOFError("Unexpected end of stream in a record.")
+    return data
+
+
+def read_chunks(stream: BinaryIO) -> Iterator[bytes]:
+    """
+    Read all chunks of a section in a stream. A section ends at an empty record or at the end of the stream.
+
+    Each chunk is a self-contained serialized protobuf message, which can be parsed independently (e.g., in other
+    processes).
+
+    :param stream:  A file object that is opened for reading in binary mode.
+    :return:        An iterator of chunks.
+    """
+
+    while True:
+        data = read_delimited(stream)
+        if not data:
+            return
+        yield data
+
+
+def pack_chunks(first_cmsg, get_cmsg, items: Iterator[tuple[str, Any]], chunk_size: int | None) -> Iterator:
+    """
+    Pack items into cmessage objects of the same type, each of which contains up to `chunk_size` items in total.
+
+    :param first_cmsg:  The first cmessage object, which may carry other fields (e.g., identifiers) already.
+    :param get_cmsg:    A callable that returns a new, empty cmessage object.
+    :param items:       An iterator of tuples of names of repeated fields and the cmessage objects to add to them.
+    :param chunk_size:  The maximum number of items in each cmessage object, or None to pack all items into the first
+                        cmessage object.
+    :return:            An iterator of cmessage objects. At least one cmessage object is generated.
+    """
+
+    cmsg = first_cmsg
+    fields: dict[str, list] = defaultdict(list)
+    count = 0
+    first = True
+    for field, item in items:
+        fields[field].append(item)
+        count += 1
+        if chunk_size is not None and count >= chunk_size:
+            for k, lst in fields.items():
+                getattr(cmsg, k).extend(lst)
+            fields.clear()
+            yield cmsg
+            cmsg = get_cmsg()
+            count = 0
+            first = False
+
+    if count or first:
+        for k, lst in fields.items():
+            getattr(cmsg, k).extend(lst)
+        yield cmsg
 
 
 class Serializable:
@@ -38,6 +143,33 @@ class Serializable:
 
         return self.serialize_to_cmessage().SerializeToString()
 
+    def serialize_to_chunks(self, chunk_size: int = DEFAULT_CHUNK_SIZE):  # pylint:disable=unused-argument
+        """
+        Serialize the class object into a sequence of protobuf cmessage objects of the same type. Merging all cmessage
+        objects in order gives the cmessage object that `serialize_to_cmessage()` returns.
+
+        :param chunk_size:  The maximum number of items in each cmessage object. Classes that do not support chunking
+                            return a single cmessage object.
+        :return:            An iterator of protobuf cmessage objects.
+        """
+
+        yield self.serialize_to_cmessage()
+
+    def serialize_to_stream(self, stream: BinaryIO, chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        """
+        Serialize the class object into a section of a stream. The section consists of length-delimited chunks that
+        are written one by one, and ends with an empty record. Multiple sections may be written into the same stream.
+
+        :param stream:      A file object that is opened for writing in binary mode.
+        :param chunk_size:  The maximum number of items in each chunk.
+        """
+
+        for cmsg in self.serialize_to_chunks(chunk_size=chunk_size):
+            data = cmsg.SerializeToString()
+            if data:
+                write_delimited(stream, data)
+        write_delimited(stream, b"")
+
     @classmethod
     def parse_from_cmessage(cls, cmsg, **kwargs):
         """
@@ -64,3 +196,19 @@ class Serializable:
         pb2_obj.ParseFromString(s)
 
         return cls.parse_from_cmessage(pb2_obj, **kwargs)
+
+    @classmethod
+    def parse_from_stream(cls, stream: BinaryIO, **kwargs):
+        """
+        Parse a section of a stream that `serialize_to_stream()` writes and create a class object. By default, all
+        chunks are merged before the class object is created. Classes that support chunking parse chunks one by one.
+
+        :param stream:  A file object that is opened for reading in binary mode.
+        :return:        A class object.
+        """
+
+        pb2_obj = cls._get_cmsg()
+        for chunk in read_chunks(stream):
+            pb2_obj.MergeFromString(chunk)
+
+        return cls.parse_from_cmessage(pb2_obj, **kwargs)
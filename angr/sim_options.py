@@ -164,6 +164,8 @@ UNICORN_ZEROPAGE_GUARD = "UNICORN_ZEROPAGE_GUARD"
 UNICORN_SYM_REGS_SUPPORT = "UNICORN_SYM_REGS_SUPPORT"
 UNICORN_TRACK_BBL_ADDRS = "UNICORN_TRACK_BBL_ADDRS"
 UNICORN_TRACK_STACK_POINTERS = "UNICORN_TRACK_STACK_POINTERS"
+# track edge coverage and execution counts of basic blocks in native code (see Unicorn.get_coverage_bitmap)
+UNICORN_TRACK_COVERAGE = "UNICORN_TRACK_COVERAGE"
 
 # concretize symbolic data when we see it "too often"
 UNICORN_THRESHOLD_CONCRETIZATION = "UNICORN_THRESHOLD_CONCRETIZATION"
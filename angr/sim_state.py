@@ -19,6 +19,7 @@ from .errors import SimMergeError, SimValueError, SimStateError, SimSolverModeEr
 from .misc.plugins import PluginHub, PluginPreset
 from .sim_state_options import SimStateOptions
 from .state_plugins import SimStatePlugin
+from .state_snapshot import StateSnapshot
 
 if TYPE_CHECKING:
     from .storage import DefaultMemory
@@ -569,6 +570,15 @@ class SimState(Generic[IPTypeConc, IPTypeSym], PluginHub[SimStatePlugin]):
 
         return state
 
+    def snapshot(self) -> StateSnapshot:
+        """
+        Take an immutable snapshot of the state, from which new states can be spawned cheaply with
+        `StateSnapshot.spawn()`. The snapshot can be saved to disk and loaded in other processes.
+
+        :return:    The snapshot.
+        """
+        return StateSnapshot(self)
+
     def merge(self, *others, **kwargs):
         """
         Merges this state with the other states. Returns the merging result, merged state, and the merge flag.
@@ -1607,6 +1607,8 @@ class SimStruct(NamedTypeMixin, SimType):
         return d
 
     def extract(self, state, addr, concrete=False) -> SimStructValue:
+        from angr.state_plugins.view import SimMemView  # pylint:disable=import-outside-toplevel
+
         values = {}
         for name, offset in self.offsets.items():
             ty = self.fields[name]
@@ -1849,6 +1851,8 @@ class SimUnion(NamedTypeMixin, SimType):
         return view._deeper(ty=ty, addr=view._addr)
 
     def extract(self, state, addr, concrete=False):
+        from angr.state_plugins.view import SimMemView  # pylint:disable=import-outside-toplevel
+
         values = {}
         for name, ty in self.members.items():
             v = SimMemView(ty=ty, addr=addr, state=state)
@@ -2001,6 +2005,8 @@ class SimCppClass(SimStruct):
         return f"class {self.name}" if not self.name.startswith("class") else self.name
 
     def extract(self, state, addr, concrete=False) -> SimCppClassValue:
+        from angr.state_plugins.view import SimMemView  # pylint:disable=import-outside-toplevel
+
         values = {}
         for name, offset in self.offsets.items():
             ty = self.fields[name]
@@ -3974,5 +3980,3 @@ struct timeval {
 """
         )
     )
-
-from .state_plugins.view import SimMemView
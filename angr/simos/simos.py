@@ -50,33 +50,51 @@ class SimOS:
         self.unresolvable_call_target = self.project.loader.extern_object.allocate()
         self.project.hook(self.unresolvable_call_target, P["stubs"]["UnresolvableCallTarget"]())
 
-        def irelative_resolver(resolver_addr: int) -> int | None:
-            # autohooking runs before this does, might have provided this already
-            # in that case, we want to advertise the _resolver_ address, since it is now
-            # providing the behavior of the actual function
-            if self.project.is_hooked(resolver_addr):
-                return resolver_addr
-
-            base_state = self.state_blank(
-                addr=0, add_options={o.SYMBOL_FILL_UNCONSTRAINED_MEMORY, o.SYMBOL_FILL_UNCONSTRAINED_REGISTERS}
-            )
-            prototype = "void *x(long)" if isinstance(self.arch, ArchS390X) else "void *x(void)"
-            resolver = self.project.factory.callable(
-                resolver_addr, concrete_only=True, base_state=base_state, prototype=prototype
+        self.project.loader.perform_irelative_relocs(self._resolve_irelative)
+
+    def _resolve_irelative(self, resolver_addr: int) -> int | None:
+        """
+        Resolve an IRELATIVE relocation by running its resolver, or hook the resolver with a SimProcedure that resolves
+        the target upon the first call if hooks are created lazily.
+
+        :param resolver_addr:   Address of the resolver.
+        :return:                The address to write into the relocated slot, or None if it cannot be resolved.
+        """
+        # autohooking runs before this does, might have provided this already
+        # in that case, we want to advertise the _resolver_ address, since it is now
+        # providing the behavior of the actual function
+        if self.project.is_hooked(resolver_addr):
+            return resolver_addr
+
+        if self.project._lazy_hooks and not isinstance(self.arch, ArchS390X):
+            # do not run the resolver now. hook it with a SimProcedure that calls the resolver and jumps to the
+            # resolved function when it is called
+            self.project.hook(
+                resolver_addr,
+                P["linux_loader"]["LazyIFuncResolver"](
+                    display_name=f"IFuncResolver.{resolver_addr:#x}", funcaddr=resolver_addr
+                ),
             )
-            try:
-                # On s390x ifunc resolvers expect hwcaps.
-                val = resolver(0) if isinstance(self.arch, ArchS390X) else resolver()
-            except AngrCallableMultistateError:
-                _l.error("Resolver at %#x failed to resolve! (multivalued)", resolver_addr)
-                return None
-            except AngrCallableError:
-                _l.error("Resolver at %#x failed to resolve!", resolver_addr)
-                return None
-
-            return val.concrete_value if val is not None and val.concrete else None
-
-        self.project.loader.perform_irelative_relocs(irelative_resolver)
+            return resolver_addr
+
+        base_state = self.state_blank(
+            addr=0, add_options={o.SYMBOL_FILL_UNCONSTRAINED_MEMORY, o.SYMBOL_FILL_UNCONSTRAINED_REGISTERS}
+        )
+        prototype = "void *x(long)" if isinstance(self.arch, ArchS390X) else "void *x(void)"
+        resolver = self.project.factory.callable(
+            resolver_addr, concrete_only=True, base_state=base_state, prototype=prototype
+        )
+        try:
+            # On s390x ifunc resolvers expect hwcaps.
+            val = resolver(0) if isinstance(self.arch, ArchS390X) else resolver()
+        except AngrCallableMultistateError:
+            _l.error("Resolver at %#x failed to resolve! (multivalued)", resolver_addr)
+            return None
+        except AngrCallableError:
+            _l.error("Resolver at %#x failed to resolve!", resolver_addr)
+            return None
+
+        return val.concrete_value if val is not None and val.concrete else None
 
     def _weak_hook_symbol(self, name, hook, scope=None):
         sym = self.project.loader.find_symbol(name) if scope is None else scope.get_symbol(name)
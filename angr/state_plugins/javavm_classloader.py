@@ -4,7 +4,6 @@ import logging
 from archinfo.arch_soot import SootAddressDescriptor, SootAddressTerminator, SootClassDescriptor
 
 from angr.engines.soot.method_dispatcher import resolve_method
-from angr.engines import UberEngine
 from angr.sim_state import SimState
 from .plugin import SimStatePlugin
 
@@ -91,6 +90,8 @@ class SimJavaVmClassloader(SimStatePlugin):
             self.state, "<clinit>", class_.name, include_superclasses=False, init_class=False
         )
         if clinit_method.is_loaded:
+            from angr.engines import UberEngine  # pylint:disable=import-outside-toplevel
+
             engine = UberEngine(self.state.project)
             # use a fresh engine, as the default engine instance may be in use at this time
             javavm_simos = self.state.project.simos
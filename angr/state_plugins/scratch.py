@@ -32,6 +32,8 @@ class SimStateScratch(SimStatePlugin):
         self.bbl_addr_list = None
         self.stack_pointer_list = None
         self.executed_pages_set = None
+        self.coverage_bitmap = None
+        self.block_hit_counts = None
 
         # information on exits *from* this state
         self.jumpkind = None
@@ -78,6 +80,8 @@ class SimStateScratch(SimStatePlugin):
             self.sim_procedure = scratch.sim_procedure
             self.bbl_addr_list = scratch.bbl_addr_list
             self.stack_pointer_list = scratch.stack_pointer_list
+            self.coverage_bitmap = scratch.coverage_bitmap
+            self.block_hit_counts = scratch.block_hit_counts
 
             self.statement_offset = scratch.statement_offset
 
@@ -14,11 +14,9 @@ import cffi  # lmao
 import archinfo
 import claripy
 import pyvex
-from angr.engines.vex.claripy import ccall
 from angr.sim_state import SimState
 
 from angr import sim_options as options
-from angr.engines.vex.claripy.irop import operations as irop_ops
 from angr.errors import SimMemoryError, SimSegfaultError, SimUnicornError, SimUnicornUnsupport, SimValueError
 from angr.misc.testing import is_testing
 from .plugin import SimStatePlugin
@@ -290,7 +288,8 @@ class AggressiveConcretizationAnnotation(claripy.SimplificationAvoidanceAnnotati
 
 
 #
-# Because Unicorn leaks like crazy, we use one Uc object per thread...
+# Because Unicorn leaks like crazy, we keep a small pool of long-lived Uc objects per thread. Read-only pages stay mapped
+# and registers keep their values across runs, so each run only maps the pages and writes the registers that differ...
 #
 
 _unicounter = itertools.count()
@@ -304,6 +303,15 @@ class Uniwrapper(unicorn.Uc if unicorn is not None else object):
         self.cache_key = cache_key
         self.wrapped_mapped = set()
         self.wrapped_hooks = set()
+        # read-only pages that stay mapped across resets: addr -> (permissions, page, symbolic bitmap, data or None if
+        # the page is copied into unicorn). each page of the state memory is pinned with a shared reference, so any
+        # write to it in any state copies the page first, and the page (including the buffers that unicorn maps) is
+        # known to be unchanged as long as a state still refers to the same page object
+        self.base_pages = {}
+        # concrete values of registers that are known to be in unicorn, so that unchanged ones are not written again
+        self.reg_values: dict[int, int] = {}
+        # values of model-specific registers that were written into unicorn
+        self.msr_values: dict[int, int] = {}
         self.id = None
         uc_mode = arch.uc_mode_thumb if thumb else arch.uc_mode
         unicorn.Uc.__init__(self, arch.uc_arch, uc_mode)
@@ -335,14 +343,59 @@ class Uniwrapper(unicorn.Uc if unicorn is not None else object):
         # l.debug("Unmapping %d bytes at %#x", size, addr)
         m = unicorn.Uc.mem_unmap(self, addr, size)
         self.wrapped_mapped.discard((addr, size))
+        self._drop_base_page(addr)
         return m
 
-    def mem_reset(self):
+    def mem_reset(self, keep_base_pages=False):
         # l.debug("Resetting memory.")
+        kept = set()
         for addr, size in self.wrapped_mapped:
+            if keep_base_pages and size == 0x1000 and addr in self.base_pages:
+                kept.add((addr, size))
+                continue
             # l.debug("Unmapping %d bytes at %#x", size, addr)
             unicorn.Uc.mem_unmap(self, addr, size)
-        self.wrapped_mapped.clear()
+        self.wrapped_mapped = kept
+        if not keep_base_pages:
+            self.drop_base_pages()
+
+    def add_base_page(self, addr, perm, page, bitmap, data=None):
+        """
+        Keep a mapped read-only page across resets. The page of the state memory that it is mapped from is pinned.
+        """
+        self._drop_base_page(addr)
+        page.acquire_shared()
+        self.base_pages[addr] = perm, page, bitmap, data
+
+    def drop_base_pages(self):
+        """
+        Forget all kept read-only pages and unpin the pages of the state memory. Pages stay mapped until the next
+        reset.
+        """
+        for addr in list(self.base_pages):
+            self._drop_base_page(addr)
+
+    def _drop_base_page(self, addr):
+        entry = self.base_pages.pop(addr, None)
+        if entry is not None:
+            entry[1].release_shared()
+
+    def reg_write(self, reg_id, value):
+        self.reg_values.pop(reg_id, None)
+        return unicorn.Uc.reg_write(self, reg_id, value)
+
+    def reg_write_cached(self, reg_id, value):
+        """
+        Write a register unless it is known to hold the given value already.
+        """
+        if self.reg_values.get(reg_id) == value:
+            return
+        unicorn.Uc.reg_write(self, reg_id, value)
+        self.reg_values[reg_id] = value
+
+    def emu_start(self, begin, until, timeout=0, count=0):
+        self.reg_values.clear()
+        return unicorn.Uc.emu_start(self, begin, until, timeout=timeout, count=count)
 
     def hook_reset(self):
         # l.debug("Resetting hooks.")
@@ -351,14 +404,70 @@ class Uniwrapper(unicorn.Uc if unicorn is not None else object):
             unicorn.Uc.hook_del(self, h)
         self.wrapped_hooks.clear()
 
-    def reset(self):
-        self.mem_reset()
+    def reset(self, keep_base_pages=False):
+        self.mem_reset(keep_base_pages=keep_base_pages)
         # self.hook_reset()
         # l.debug("Reset complete.")
 
 
+class UnicornPool:
+    """
+    A bounded pool of Uniwrapper objects, keyed by architecture, cache key, and Thumb mode. The least recently used
+    object is discarded when the pool is full.
+
+    The cache key is that of the Unicorn plugin of the root state, and is inherited by every copy of the plugin, so
+    all states that descend from one root state share pooled objects. It is deliberately not derived from the project:
+    native code keys its cache of concrete memory pages by the same value, and that cache is only valid among states that
+    start from the same initial memory, which two root states of one project need not do.
+    """
+
+    MAX_SIZE = 4
+
+    def __init__(self, max_size=None):
+        self.max_size = self.MAX_SIZE if max_size is None else max_size
+        self._ucs: dict[tuple, Uniwrapper] = {}
+
+    def __len__(self):
+        return len(self._ucs)
+
+    def get(self, arch, cache_key, thumb=False) -> Uniwrapper:
+        """
+        Get the pooled Uniwrapper object for the given key, and create it if it does not exist.
+        """
+        key = arch.name, cache_key, thumb
+        uc = self._ucs.pop(key, None)
+        if uc is not None and uc.arch != arch:
+            uc.drop_base_pages()
+            uc = None
+        if uc is None:
+            uc = Uniwrapper(arch, cache_key, thumb=thumb)
+        # re-insert it to mark it as the most recently used one
+        self._ucs[key] = uc
+        while len(self._ucs) > self.max_size:
+            self._ucs.pop(next(iter(self._ucs))).drop_base_pages()
+        return uc
+
+    def discard(self, arch, cache_key) -> None:
+        """
+        Discard all pooled Uniwrapper objects (in both ARM and Thumb modes) for the given architecture and cache key.
+        """
+        for key in [key for key in self._ucs if key[:2] == (arch.name, cache_key)]:
+            self._ucs.pop(key).drop_base_pages()
+
+    def clear(self) -> None:
+        for uc in self._ucs.values():
+            uc.drop_base_pages()
+        self._ucs.clear()
+
+
 _unicorn_tls = threading.local()
-_unicorn_tls.uc = None
+
+
+def _unicorn_pool() -> UnicornPool:
+    pool = getattr(_unicorn_tls, "pool", None)
+    if pool is None:
+        pool = _unicorn_tls.pool = UnicornPool()
+    return pool
 
 
 class _VexCacheInfo(ctypes.Structure):
@@ -470,7 +579,11 @@ def _load_native():
             ctypes.c_uint64,
         )
         _setup_prototype(h, "process_transmit", ctypes.POINTER(TRANSMIT_RECORD), state_t, ctypes.c_uint32)
-        _setup_prototype(h, "set_tracking", None, state_t, ctypes.c_bool, ctypes.c_bool)
+        _setup_prototype(h, "set_tracking", None, state_t, ctypes.c_bool, ctypes.c_bool, ctypes.c_bool)
+        _setup_prototype(h, "coverage_bitmap", ctypes.c_void_p, state_t)
+        _setup_prototype(h, "coverage_bitmap_size", ctypes.c_uint64, state_t)
+        _setup_prototype(h, "block_hit_count", ctypes.c_uint64, state_t)
+        _setup_prototype(h, "block_hits", ctypes.c_void_p, state_t)
         _setup_prototype(h, "executed_pages", ctypes.c_uint64, state_t)
         _setup_prototype(h, "in_cache", ctypes.c_bool, state_t, ctypes.c_uint64)
         if unicorn is not None:
@@ -799,7 +912,7 @@ class Unicorn(SimStatePlugin):
         self._unicount = next(_unicounter)
         self._uc_state = None
         self.cache_key = hash(self)
-        _unicorn_tls.uc = None
+        _unicorn_pool().clear()
 
     def set_state(self, state):
         SimStatePlugin.set_state(self, state)
@@ -814,30 +927,29 @@ class Unicorn(SimStatePlugin):
     def uc(self):
         new_id = next(_unicounter)
         is_thumb = self.state.arch.qemu_name == "arm" and self.state.arch.is_thumb(self.state.addr)
-        if (
-            not hasattr(_unicorn_tls, "uc")
-            or _unicorn_tls.uc is None
-            or _unicorn_tls.uc.arch != self.state.arch
-            or _unicorn_tls.uc.cache_key != self.cache_key
-        ):
-            _unicorn_tls.uc = Uniwrapper(self.state.arch, self.cache_key, thumb=is_thumb)
-        elif _unicorn_tls.uc.id != self._unicount:
+        pool = _unicorn_pool()
+        uc = pool.get(self.state.arch, self.cache_key, thumb=is_thumb)
+        if uc.id is not None and uc.id != self._unicount:
             if not self._reuse_unicorn:
-                _unicorn_tls.uc = Uniwrapper(self.state.arch, self.cache_key, thumb=is_thumb)
+                pool.discard(self.state.arch, self.cache_key)
+                uc = pool.get(self.state.arch, self.cache_key, thumb=is_thumb)
             else:
                 # l.debug("Reusing unicorn state!")
-                _unicorn_tls.uc.reset()
+                uc.reset(keep_base_pages=True)
         else:
             # l.debug("Reusing unicorn state!")
             pass
 
-        _unicorn_tls.uc.id = new_id
+        uc.id = new_id
         self._unicount = new_id
-        return _unicorn_tls.uc
+        return uc
 
-    @staticmethod
-    def delete_uc():
-        _unicorn_tls.uc = None
+    def delete_uc(self):
+        """
+        Discard the pooled unicorn objects for the architecture and the cache key of this plugin, so that a new one is
+        created upon the next access.
+        """
+        _unicorn_pool().discard(self.state.arch, self.cache_key)
 
     @property
     def _uc_regs(self):
@@ -865,8 +977,8 @@ class Unicorn(SimStatePlugin):
             (ctypes.c_uint64 * len(stop_points))(*(ctypes.c_uint64(sp) for sp in stop_points)),
         )
 
-    def set_tracking(self, track_bbls, track_stack):
-        _UC_NATIVE.set_tracking(self._uc_state, track_bbls, track_stack)
+    def set_tracking(self, track_bbls, track_stack, track_coverage=False):
+        _UC_NATIVE.set_tracking(self._uc_state, track_bbls, track_stack, track_coverage)
 
     def hook(self):
         # l.debug('adding native hooks')
@@ -1077,16 +1189,18 @@ class Unicorn(SimStatePlugin):
 
         return True
 
-    def _map_one_page(self, _uc, addr):
-        # allow any SimMemory errors to propagate upward. they will be caught immediately above
+    def _page_permissions(self, addr):
         perm = self.state.memory.permissions(addr)
 
         if perm.op != "BVV":
-            perm = 7
-        elif options.ENABLE_NX not in self.state.options:
-            perm = perm.args[0] | 4
-        else:
-            perm = perm.args[0]
+            return 7
+        if options.ENABLE_NX not in self.state.options:
+            return perm.args[0] | 4
+        return perm.args[0]
+
+    def _map_one_page(self, _uc, addr):
+        # allow any SimMemory errors to propagate upward. they will be caught immediately above
+        perm = self._page_permissions(addr)
 
         # this should return two memoryviews
         # if they are writable they are direct references to the state backing store and can be mapped directly
@@ -1108,6 +1222,7 @@ class Unicorn(SimStatePlugin):
             # self.uc.mem_write(addr, data)
             self._mapped += 1
             _UC_NATIVE.activate_page(self._uc_state, addr, int(ffi.cast("uint64_t", ffi.from_buffer(bitmap))), None)
+            data = None
         else:
             # new-style mapping, do it directly
             self.uc.mem_map_ptr(addr, 0x1000, perm, int(ffi.cast("uint64_t", ffi.from_buffer(data))))
@@ -1119,6 +1234,46 @@ class Unicorn(SimStatePlugin):
                 int(ffi.cast("unsigned long", ffi.from_buffer(data))),
             )
 
+        if not perm & 2 and self._reuse_unicorn:
+            # unicorn cannot write to this page. keep it mapped for the next states that have the same page
+            page = self._state_page(addr)
+            if page is not None:
+                self.uc.add_base_page(addr, perm, page, bitmap, data=data)
+
+    def _state_page(self, addr):
+        """
+        Get the page of the state memory that contains the given address, or None if the memory is not paged in the
+        same way as unicorn memory.
+        """
+        memory = self.state.memory
+        pages = getattr(memory, "_pages", None)
+        if pages is None or memory.page_size != 0x1000:
+            return None
+        return pages.get(addr // 0x1000, None)
+
+    def _restore_base_pages(self):
+        """
+        Activate the read-only pages that are still mapped in the pooled unicorn object if the current state still
+        refers to the same pages, and unmap the others (which will be mapped again upon the first access). Pages are
+        pinned when they are mapped, so a page that any state writes to is replaced in that state, and nothing is read
+        or compared here.
+        """
+        uc = self.uc
+        for addr, (perm, page, bitmap, data) in list(uc.base_pages.items()):
+            try:
+                unchanged = self._state_page(addr) is page and self._page_permissions(addr) == perm
+            except SimMemoryError:
+                unchanged = False
+            if not unchanged:
+                uc.mem_unmap(addr, 0x1000)
+                continue
+            _UC_NATIVE.activate_page(
+                self._uc_state,
+                addr,
+                int(ffi.cast("uint64_t", ffi.from_buffer(bitmap))),
+                None if data is None else int(ffi.cast("unsigned long", ffi.from_buffer(data))),
+            )
+
     def _get_details_of_blocks_with_symbolic_vex_stmts(self):
         def _get_reg_values(register_values):
             for register_value in register_values:
@@ -1284,6 +1439,9 @@ class Unicorn(SimStatePlugin):
         if self.gdt is not None:
             _UC_NATIVE.activate_page(self._uc_state, self.gdt.addr, bytes(0x1000), None)
 
+        # activate pages that are kept mapped from earlier runs
+        self._restore_base_pages()
+
         # Pass all concrete fd bytes to native interface so that it can handle relevant syscalls
         if fd_bytes is not None:
             for fd_num, fd_data in fd_bytes.items():
@@ -1359,6 +1517,10 @@ class Unicorn(SimStatePlugin):
 
         # Set floating point operations VEX codes
         if options.UNSUPPORTED_FORCE_CONCRETIZE in self.state.options:
+            from angr.engines.vex.claripy.irop import (  # pylint:disable=import-outside-toplevel
+                operations as irop_ops,
+            )
+
             fp_op_codes = [ctypes.c_uint64(pyvex.irop_enums_to_ints[op.name]) for op in irop_ops.values() if op._float]
             fp_op_codes_array = (ctypes.c_uint64 * len(fp_op_codes))(*fp_op_codes)
             fp_reg_start_offset, fp_regs_size = self.state.arch.registers["fpu_regs"]
@@ -1377,6 +1539,8 @@ class Unicorn(SimStatePlugin):
 
         addr = self.state.solver.eval(self.state.ip)
         l.info("started emulation at %#x (%d steps)", addr, self.max_steps if step is None else step)
+        # registers are changed by the emulation, and they are read back in get_regs()
+        self.uc.reg_values.clear()
         self.time = time.time()
         self.errno = _UC_NATIVE.start(self._uc_state, addr, self.max_steps if step is None else step)
         self.time = time.time() - self.time
@@ -1386,6 +1550,31 @@ class Unicorn(SimStatePlugin):
         bbl_addrs = _UC_NATIVE.bbl_addrs(self._uc_state)
         return bbl_addrs[:steps]
 
+    def get_coverage_bitmap(self) -> bytes:
+        """
+        Get the AFL-style edge coverage bitmap of the current run. Each byte is a saturating hit counter of the edges
+        that hash to it. Coverage must be tracked (see `UNICORN_TRACK_COVERAGE`).
+
+        :return:    The coverage bitmap, or an empty bytes object if coverage is not tracked.
+        """
+        size = _UC_NATIVE.coverage_bitmap_size(self._uc_state)
+        if not size:
+            return b""
+        return ctypes.string_at(_UC_NATIVE.coverage_bitmap(self._uc_state), size)
+
+    def get_block_hit_counts(self) -> dict[int, int]:
+        """
+        Get the number of times each basic block is executed in the current run. Coverage must be tracked (see
+        `UNICORN_TRACK_COVERAGE`).
+
+        :return:    A dict of block addresses to execution counts.
+        """
+        count = _UC_NATIVE.block_hit_count(self._uc_state)
+        if not count:
+            return {}
+        hits = memoryview(ctypes.string_at(_UC_NATIVE.block_hits(self._uc_state), count * 16)).cast("Q")
+        return dict(zip(hits[::2], hits[1::2]))
+
     def get_stop_details(self):
         return _UC_NATIVE.get_stop_details(self._uc_state)
 
@@ -1526,6 +1715,10 @@ class Unicorn(SimStatePlugin):
         if options.UNICORN_TRACK_STACK_POINTERS in state.options:
             stack_pointers = _UC_NATIVE.stack_pointers(self._uc_state)
             state.scratch.stack_pointer_list = stack_pointers[: unicorn_obj.steps]
+        # get the coverage
+        if options.UNICORN_TRACK_COVERAGE in state.options:
+            state.scratch.coverage_bitmap = self.get_coverage_bitmap()
+            state.scratch.block_hit_counts = self.get_block_hit_counts()
         # syscall counts
         state.history.recent_syscall_count = _UC_NATIVE.syscall_count(self._uc_state)
         # executed page set
@@ -1555,7 +1748,7 @@ class Unicorn(SimStatePlugin):
             self.delete_uc()
 
         # l.debug("Resetting the unicorn state.")
-        self.uc.reset()
+        self.uc.reset(keep_base_pages=self._reuse_unicorn)
 
     def set_regs(self):
         """setting unicorn registers"""
@@ -1585,7 +1778,7 @@ class Unicorn(SimStatePlugin):
             if v is None:
                 raise SimValueError("setting a symbolic register")
             # l.debug('setting $%s = %#x', r, self.state.solver.eval(v))
-            uc.reg_write(c, self.state.solver.eval(v))
+            uc.reg_write_cached(c, self.state.solver.eval(v))
 
             start, size = self.state.arch.registers[r]
             if v.symbolic:
@@ -1735,6 +1928,10 @@ class Unicorn(SimStatePlugin):
         BASE = 0x100B000000
 
         uc = self.uc
+        if uc.msr_values.get(msr) == val:
+            # writing MSRs runs code in unicorn, which clobbers registers
+            return
+        uc.msr_values[msr] = val
         uc.mem_map(BASE, 0x1000)
         uc.mem_write(BASE, setup_code)
         uc.reg_write(self._uc_const.UC_X86_REG_RCX, msr)
@@ -1785,10 +1982,12 @@ class Unicorn(SimStatePlugin):
                 saved_registers.append((cur_group, state.registers.load(cur_group, last - cur_group + 1)))
 
         # now we sync registers out of unicorn
+        uc = self.uc
         for r, c in self._uc_regs.items():
             if r in state.arch.reg_blacklist:
                 continue
-            v = self.uc.reg_read(c)
+            v = uc.reg_read(c)
+            uc.reg_values[c] = v
             # l.debug('getting $%s = %#x', r, v)
             setattr(state.regs, r, v)
 
@@ -1871,6 +2070,8 @@ class Unicorn(SimStatePlugin):
                 return False
 
         if self.state.arch.vex_conditional_helpers:
+            from angr.engines.vex.claripy import ccall  # pylint:disable=import-outside-toplevel
+
             flags = ccall._get_flags(self.state)
             processed_flags = self._process_value(flags, "reg")
             if processed_flags is None or processed_flags.symbolic:
@@ -0,0 +1,178 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any, BinaryIO
+import io
+import pickle
+
+from .errors import SimStateError
+
+if TYPE_CHECKING:
+    from .project import Project
+    from .sim_state import SimState
+
+
+def _persistent_objects(project: Project | None) -> dict[tuple, Any]:
+    """
+    Get objects that are not stored in snapshots, but are referred to by their keys instead. These objects belong to
+    the project, and are recreated when the binary is loaded again.
+    """
+
+    if project is None:
+        return {}
+    loader = project.loader
+    objects: dict[tuple, Any] = {
+        ("project",): project,
+        ("loader",): loader,
+        ("memory",): loader.memory,
+    }
+    for idx, obj in enumerate(loader.all_objects):
+        objects[("object", idx)] = obj
+    return objects
+
+
+def _loaded_objects(project: Project) -> list[tuple]:
+    """
+    Describe all objects that are loaded, which must not change between saving and loading a snapshot. Objects that are
+    loaded from streams do not have stable names, so only their types and locations are compared.
+    """
+
+    return [
+        (
+            type(obj).__name__,
+            obj.binary_basename if obj.binary is not None else None,
+            obj.mapped_base,
+            obj.max_addr,
+            obj.sha256,
+        )
+        for obj in project.loader.all_objects
+    ]
+
+
+class _SnapshotPickler(pickle.Pickler):
+    """
+    A pickler that stores references to the project, the loader, and all loaded objects instead of pickling them.
+    """
+
+    def __init__(self, file, project, *args, **kwargs):
+        super().__init__(file, *args, **kwargs)
+        self._keys = {id(obj): key for key, obj in _persistent_objects(project).items()}
+
+    def persistent_id(self, obj):
+        return self._keys.get(id(obj))
+
+
+class _SnapshotUnpickler(pickle.Unpickler):
+    """
+    An unpickler that resolves references to the project, the loader, and all loaded objects to those of the given
+    project.
+    """
+
+    def __init__(self, file, project, *args, **kwargs):
+        super().__init__(file, *args, **kwargs)
+        self._objects = _persistent_objects(project)
+
+    def persistent_load(self, pid):
+        try:
+            return self._objects[pid]
+        except KeyError:
+            raise pickle.UnpicklingError(f"Unknown persistent object {pid!r}.") from None
+
+
+class StateSnapshot:
+    """
+    An immutable snapshot of a fully initialized SimState (including its memory, registers, and all plugins), from which
+    new states can be spawned without re-creating and re-initializing them.
+
+    Spawning a state is as cheap as copying a state: memory pages of the snapshot are shared with all spawned states and
+    are only copied upon writes. The snapshot keeps a private copy of the state, so changes to the original state or to
+    any spawned state do not affect the snapshot.
+
+    Snapshots can be saved to files and loaded in other processes. The project, its loader, and all loaded objects are
+    not saved with the snapshot, and the project must be provided when loading the snapshot. It must have loaded the same
+    objects as the project of the snapshot. Spawned states then share the loader of that project, like states that are
+    created by the project.
+    """
+
+    __slots__ = ("_base",)
+
+    def __init__(self, state: SimState):
+        self._base = state.copy()
+
+    @property
+    def project(self) -> Project | None:
+        return self._base.project
+
+    @property
+    def arch(self):
+        return self._base.arch
+
+    @property
+    def addr(self) -> int:
+        return self._base.addr
+
+    def spawn(self) -> SimState:
+        """
+        Create a new state from this snapshot.
+
+        :return:    The new state.
+        """
+        return self._base.copy()
+
+    #
+    # Serialization
+    #
+
+    def dump(self, f: BinaryIO) -> None:
+        """
+        Save this snapshot to a file.
+
+        :param f:   A writable binary file object.
+        """
+        # the header is checked before the state is loaded
+        project = self._base.project
+        header = {
+            "has_project": project is not None,
+            "objects": _loaded_objects(project) if project is not None else None,
+        }
+        pickle.dump(header, f, protocol=pickle.HIGHEST_PROTOCOL)
+        _SnapshotPickler(f, self._base.project, protocol=pickle.HIGHEST_PROTOCOL).dump(self._base)
+
+    def dumps(self) -> bytes:
+        """
+        Save this snapshot to a bytes object.
+        """
+        f = io.BytesIO()
+        self.dump(f)
+        return f.getvalue()
+
+    @classmethod
+    def load(cls, f: BinaryIO, project: Project | None = None) -> StateSnapshot:
+        """
+        Load a snapshot from a file.
+
+        :param f:       A readable binary file object.
+        :param project: The project that the snapshot belongs to. It is required if the snapshot is taken from a state
+                        with a project, and it must have loaded the same objects as that project.
+        :return:        The snapshot.
+        """
+        header = pickle.load(f)
+        if header["has_project"]:
+            if project is None:
+                raise SimStateError("This state snapshot is taken from a state with a project. Please specify project.")
+            if header["objects"] != _loaded_objects(project):
+                raise SimStateError(
+                    "The state snapshot is taken from a project with a different set of loaded objects."
+                )
+        state = _SnapshotUnpickler(f, project).load()
+        snapshot = cls.__new__(cls)
+        snapshot._base = state
+        return snapshot
+
+    @classmethod
+    def loads(cls, data: bytes, project: Project | None = None) -> StateSnapshot:
+        """
+        Load a snapshot from a bytes object.
+        """
+        return cls.load(io.BytesIO(data), project=project)
+
+    def __repr__(self):
+        return f"<StateSnapshot of {self._base!r}>"
@@ -0,0 +1,215 @@
+"""
+Two-level minimization of boolean functions.
+
+Boolean functions of n variables are represented as truth tables, which are Python integers of 2**n bits. Bit a of the
+truth table is the value of the function under assignment a, where variable i is true if and only if bit i of a is set.
+Operating on entire truth tables at once makes evaluating and minimizing functions of up to 16 or so variables fast.
+
+Cubes (products of literals) are represented as tuples of (care, value), where care is a bitmask of the variables that
+appear in the cube, and value is a bitmask of the variables that appear non-negated.
+"""
+
+from __future__ import annotations
+
+Cube = tuple[int, int]
+
+
+class _TooManyPrimeImplicants(Exception):
+    """
+    Raised internally when a function has more prime implicants than the caller allows.
+    """
+
+
+def full_table(num_vars: int) -> int:
+    """
+    The truth table of the constant true function.
+    """
+    return (1 << (1 << num_vars)) - 1
+
+
+def variable_table(index: int, num_vars: int) -> int:
+    """
+    The truth table of the function that returns the value of a variable.
+
+    :param index:       Index of the variable.
+    :param num_vars:    Number of variables.
+    """
+    block = 1 << index
+    period = block << 1
+    # one period is `block` zeros followed by `block` ones, repeated across the entire table
+    unit = ((1 << block) - 1) << block
+    return unit * (full_table(num_vars) // ((1 << period) - 1))
+
+
+def cube_table(cube: Cube, columns: list[int], full: int) -> int:
+    """
+    The truth table of a cube.
+
+    :param cube:        The cube.
+    :param columns:     Truth tables of all variables, as returned by variable_table().
+    :param full:        The truth table of the constant true function.
+    """
+    care, value = cube
+    table = full
+    i = 0
+    while care:
+        if care & 1:
+            table &= columns[i] if value & 1 else full ^ columns[i]
+        care >>= 1
+        value >>= 1
+        i += 1
+    return table
+
+
+def cube_size(cube: Cube) -> int:
+    """
+    The number of literals in a cube.
+    """
+    return cube[0].bit_count()
+
+
+def prime_implicants(table: int, num_vars: int, limit: int | None = None) -> set[Cube] | None:
+    """
+    Compute all prime implicants of a function by recursively expanding the function on its most significant variable.
+    For f = x & f1 | ~x & f0, a prime implicant of f is either a prime implicant of f0 & f1, or (~x & p) where p is a
+    prime implicant of f0 but not of f0 & f1, or (x & p) where p is a prime implicant of f1 but not of f0 & f1.
+
+    The number of prime implicants can grow exponentially with the number of variables, so the expansion stops as soon
+    as the function, or any of its cofactors, has more than `limit` prime implicants.
+
+    :param table:       The truth table of the function.
+    :param num_vars:    Number of variables.
+    :param limit:       The maximum number of prime implicants, or None for no limit.
+    :return:            A set of cubes, or None if there are more than `limit` prime implicants.
+    """
+    try:
+        return _prime_implicants(table, num_vars, {}, limit)
+    except _TooManyPrimeImplicants:
+        return None
+
+
+def _prime_implicants(
+    table: int, num_vars: int, memo: dict[tuple[int, int], set[Cube]], limit: int | None
+) -> set[Cube]:
+    if table == 0:
+        return set()
+    if table == full_table(num_vars):
+        return {(0, 0)}
+
+    key = table, num_vars
+    if key in memo:
+        return memo[key]
+
+    half = 1 << (num_vars - 1)
+    f0 = table & ((1 << half) - 1)
+    f1 = table >> half
+    common = _prime_implicants(f0 & f1, num_vars - 1, memo, limit)
+    primes = set(common)
+    bit = 1 << (num_vars - 1)
+    for care, value in _prime_implicants(f0, num_vars - 1, memo, limit) - common:
+        primes.add((care | bit, value))
+    for care, value in _prime_implicants(f1, num_vars - 1, memo, limit) - common:
+        primes.add((care | bit, value | bit))
+    if limit is not None and len(primes) > limit:
+        raise _TooManyPrimeImplicants
+
+    memo[key] = primes
+    return primes
+
+
+def minimal_cover(table: int, num_vars: int, primes_limit: int | None = None) -> list[Cube] | None:
+    """
+    Find a small set of prime implicants whose disjunction is the function, i.e., a minimal sum-of-products form of the
+    function. Essential prime implicants are always selected, and the remaining minterms are covered greedily. The
+    result is not guaranteed to be the global minimum, but it is irredundant.
+
+    :param table:           The truth table of the function.
+    :param num_vars:        Number of variables.
+    :param primes_limit:    Give up if the function has more prime implicants than this limit.
+    :return:                A list of cubes sorted by their variables, or None if the function has too many prime
+                            implicants.
+    """
+    if table == 0:
+        return []
+    full = full_table(num_vars)
+    if table == full:
+        return [(0, 0)]
+
+    columns = [variable_table(i, num_vars) for i in range(num_vars)]
+    primes = prime_implicants(table, num_vars, limit=primes_limit)
+    if primes is None:
+        return None
+    primes = sorted(primes, key=_cube_sort_key)
+    tables = {prime: cube_table(prime, columns, full) for prime in primes}
+
+    # minterms that are covered by exactly one prime implicant
+    once = twice = 0
+    for prime in primes:
+        t = tables[prime]
+        twice |= once & t
+        once |= t
+    exactly_once = once & ~twice
+
+    selected = [prime for prime in primes if tables[prime] & exactly_once]
+    uncovered = table
+    for prime in selected:
+        uncovered &= ~tables[prime]
+
+    while uncovered:
+        best = max(
+            (prime for prime in primes if tables[prime] & uncovered),
+            key=lambda p: ((tables[p] & uncovered).bit_count(), -cube_size(p)),
+        )
+        selected.append(best)
+        uncovered &= ~tables[best]
+
+    # remove redundant cubes that are covered by other cubes
+    for prime in reversed(list(selected)):
+        rest = 0
+        for other in selected:
+            if other != prime:
+                rest |= tables[other]
+        if tables[prime] & ~rest == 0:
+            selected.remove(prime)
+
+    return sorted(selected, key=_cube_sort_key)
+
+
+def _cube_sort_key(cube: Cube):
+    care, value = cube
+    # order cubes by their variables, lowest index first; positive literals come first
+    return [(i, not (value >> i) & 1) for i in range(care.bit_length()) if (care >> i) & 1]
+
+
+def minimize(table: int, num_vars: int, primes_limit: int | None = None) -> tuple[bool, list[Cube]] | None:
+    """
+    Minimize a function into either the sum-of-products form or the product-of-sums form, whichever has fewer literals.
+
+    :param table:           The truth table of the function.
+    :param num_vars:        Number of variables.
+    :param primes_limit:    Give up if the function or its negation has more prime implicants than this limit.
+    :return:                A tuple of (is_sop, cubes), or None if there are too many prime implicants. If is_sop is
+                            True, the function is the disjunction of conjunctions of the literals in each cube.
+                            Otherwise, the function is the conjunction of disjunctions of the *negated* literals in
+                            each cube (i.e., the cubes are a sum-of-products form of the negated function). Constant
+                            functions are always returned in the sum-of-products form, where an empty list means false
+                            and [(0, 0)] means true.
+    """
+    full = full_table(num_vars)
+    if table in {0, full}:
+        return True, minimal_cover(table, num_vars)
+
+    sop = minimal_cover(table, num_vars, primes_limit=primes_limit)
+    if sop is None:
+        return None
+    pos = minimal_cover(full ^ table, num_vars, primes_limit=primes_limit)
+    if pos is None:
+        return None
+    sop_cost = sum(cube_size(cube) for cube in sop)
+    pos_cost = sum(cube_size(cube) for cube in pos)
+    if sop_cost != pos_cost:
+        return sop_cost < pos_cost, sop if sop_cost < pos_cost else pos
+    # prefer the sum-of-products form when the function is true under at least half of all assignments
+    if table.bit_count() >= 1 << (num_vars - 1):
+        return True, sop
+    return False, pos
@@ -5,13 +5,16 @@ from collections import defaultdict
 
 import networkx
 
-from angr.utils.graph import shallow_reverse
+from angr.utils.graph_kernel import immediate_dominators
 
 
 class IncrementalDominators:
     """
     This class allows for incrementally updating dominators and post-dominators for graphs. The graph must only be
     modified by replacing nodes, not adding nodes or edges.
+
+    ``full_computations`` and ``incremental_updates`` count how many times dominators were computed from scratch and
+    how many times they were updated incrementally, respectively.
     """
 
     def __init__(self, graph: networkx.DiGraph, start, post: bool = False):
@@ -24,15 +27,13 @@ class IncrementalDominators:
         self._dfs: dict[Any, set[Any]] | None = None  # initialized on-demand
         self._inverted_dom_tree: dict[Any, Any] | None = None  # initialized on demand
 
+        self.full_computations = 1
+        self.incremental_updates = 0
+
         self._doms = self.init_doms()
 
     def init_doms(self) -> dict[Any, Any]:
-        if self._post:
-            t = shallow_reverse(self.graph)
-            doms = networkx.immediate_dominators(t, self.start)
-        else:
-            doms = networkx.immediate_dominators(self.graph, self.start)
-        return doms
+        return immediate_dominators(self.graph, self.start, reverse=self._post)
 
     def init_dfs(self) -> dict[Any, set[Any]]:
         _pred = self.graph.predecessors if self._pre else self.graph.successors
@@ -57,6 +58,7 @@ class IncrementalDominators:
                 self._inverted_dom_tree[dtor].append(dtee)
 
     def graph_updated(self, new_node: Any, replaced_nodes: set[Any], replaced_head: Any):
+        self.incremental_updates += 1
         self._update_inverted_domtree()
         assert self._inverted_dom_tree is not None
 
@@ -91,9 +93,9 @@ class IncrementalDominators:
                         df.remove(rn)
                         df.add(new_node)
 
-        # keep inverted dom tree up-to-date
-        self._inverted_dom_tree[new_dom].append(new_node)
+        # keep inverted dom tree up-to-date. new_dom is new_node itself if the start node is replaced
         self._inverted_dom_tree[new_node] = new_node_doms
+        self._inverted_dom_tree[new_dom].append(new_node)
         for rn in replaced_nodes:
             if rn in self._doms:
                 d = self._doms[rn]
@@ -102,6 +104,34 @@ class IncrementalDominators:
             if rn in self._inverted_dom_tree:
                 del self._inverted_dom_tree[rn]
 
+    def end_node_removed(self, node: Any):
+        """
+        Update dominators after removing an end node (a node without successors) with exactly one predecessor from the
+        graph. When computing post-dominators, the end node must be the start node, and its predecessor becomes the new
+        start node.
+        """
+        self.incremental_updates += 1
+        self._update_inverted_domtree()
+        assert self._inverted_dom_tree is not None
+
+        dom = self._doms.pop(node, None)
+        if self._post:
+            # the only node that the end node immediately post-dominates is its predecessor
+            (new_start,) = [dtee for dtee in self._inverted_dom_tree.pop(node, []) if dtee is not node]
+            self._doms[new_start] = new_start
+            self._inverted_dom_tree[new_start].append(new_start)
+            self.start = new_start
+        else:
+            # the end node does not dominate any other node
+            if dom is not None:
+                self._inverted_dom_tree[dom].remove(node)
+            self._inverted_dom_tree.pop(node, None)
+
+        if self._dfs is not None:
+            self._dfs.pop(node, None)
+            for df in self._dfs.values():
+                df.discard(node)
+
     def idom(self, node: Any) -> Any | None:
         """
         Get the immediate dominator of a given node.
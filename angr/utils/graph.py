@@ -6,6 +6,8 @@ import logging
 import networkx
 import networkx.algorithms
 
+from .graph_kernel import immediate_dominators, strongly_connected_components
+
 
 def shallow_reverse(g) -> networkx.DiGraph:
     """
@@ -48,7 +50,7 @@ def inverted_idoms(graph: networkx.DiGraph) -> tuple[networkx.DiGraph, dict | No
         else:
             endnode = next(iter(end_nodes))  # pick the end node
 
-        idoms = networkx.immediate_dominators(inverted_graph, endnode)
+        idoms = immediate_dominators(inverted_graph, endnode)
     else:
         idoms = None
     return inverted_graph, idoms
@@ -785,7 +787,7 @@ class GraphUtils:
 
         # find all strongly connected components in the graph
         sccs = sorted(
-            (scc for scc in networkx.strongly_connected_components(graph) if len(scc) > 1),
+            (scc for scc in strongly_connected_components(graph) if len(scc) > 1),
             key=lambda x: (len(x), min(node.addr if hasattr(node, "addr") else node for node in x)),
         )
         comp_indices = {}
@@ -0,0 +1,149 @@
+from __future__ import annotations
+import os
+from typing import Any, Generic, TypeVar
+from collections.abc import Hashable, Iterator
+
+import networkx
+
+try:
+    from angr.rustylib import graph as _native_graph
+except ImportError:
+    _native_graph = None
+
+HAS_NATIVE_GRAPH_KERNEL = _native_graph is not None
+# the native graph kernel is opt-in until it is built and tested on all platforms that angr supports
+USE_NATIVE_GRAPH_KERNEL = os.environ.get("ANGR_NATIVE_GRAPH_KERNEL", "").lower() not in {"", "no", "0", "false"}
+
+T = TypeVar("T", bound=Hashable)
+
+
+class IndexedGraph(Generic[T]):
+    """
+    A directed graph whose nodes are mapped to consecutive integers, which is how graphs are passed to the native graph
+    kernel.
+    """
+
+    __slots__ = (
+        "edges",
+        "index",
+        "nodes",
+    )
+
+    def __init__(self, nodes: list[T], edges: list[tuple[int, int]]):
+        self.nodes = nodes
+        self.index: dict[T, int] = {node: i for i, node in enumerate(nodes)}
+        self.edges = edges
+
+    @classmethod
+    def from_networkx(cls, graph: networkx.DiGraph) -> IndexedGraph:
+        obj = cls(list(graph), [])
+        index = obj.index
+        obj.edges = [(index[src], index[dst]) for src, dst in graph.edges()]
+        return obj
+
+    def __len__(self):
+        return len(self.nodes)
+
+
+def immediate_dominators(graph: networkx.DiGraph, start: T, reverse: bool = False) -> dict[T, T]:
+    """
+    Compute immediate dominators of all nodes that are reachable from the start node. Results are the same as
+    networkx.immediate_dominators().
+
+    :param graph:   The graph.
+    :param start:   The start node.
+    :param reverse: Compute immediate post-dominators (i.e., immediate dominators on the reversed graph) instead.
+    :return:        A dict mapping nodes to their immediate dominators. The start node is mapped to itself.
+    """
+
+    if _native_graph is None or not USE_NATIVE_GRAPH_KERNEL:
+        if reverse:
+            graph = graph.reverse(copy=False)
+        return networkx.immediate_dominators(graph, start)
+
+    g = IndexedGraph.from_networkx(graph)
+    idoms = _native_graph.immediate_dominators(len(g), g.edges, g.index[start], reverse=reverse)
+    nodes = g.nodes
+    return {nodes[i]: nodes[idom] for i, idom in enumerate(idoms) if idom is not None}
+
+
+def dominance_frontiers(graph: networkx.DiGraph, start: T, reverse: bool = False) -> dict[T, set[T]]:
+    """
+    Compute dominance frontiers of all nodes that are reachable from the start node. Results are the same as
+    networkx.dominance_frontiers().
+
+    :param graph:   The graph.
+    :param start:   The start node.
+    :param reverse: Compute post-dominance frontiers (i.e., dominance frontiers on the reversed graph) instead.
+    :return:        A dict mapping nodes to their dominance frontiers.
+    """
+
+    if _native_graph is None or not USE_NATIVE_GRAPH_KERNEL:
+        if reverse:
+            graph = graph.reverse(copy=False)
+        return networkx.dominance_frontiers(graph, start)
+
+    g = IndexedGraph.from_networkx(graph)
+    idoms = _native_graph.immediate_dominators(len(g), g.edges, g.index[start], reverse=reverse)
+    frontiers = _native_graph.dominance_frontiers(len(g), g.edges, idoms, reverse=reverse)
+    nodes = g.nodes
+    return {nodes[i]: {nodes[j] for j in frontier} for i, frontier in enumerate(frontiers) if idoms[i] is not None}
+
+
+def strongly_connected_components(graph: networkx.DiGraph) -> Iterator[set[T]]:
+    """
+    Generate strongly connected components of the graph. Results are the same as
+    networkx.strongly_connected_components(), although components may be generated in a different order.
+
+    :param graph:   The graph.
+    :return:        A generator of sets of nodes.
+    """
+
+    if _native_graph is None or not USE_NATIVE_GRAPH_KERNEL:
+        yield from networkx.strongly_connected_components(graph)
+        return
+
+    g = IndexedGraph.from_networkx(graph)
+    nodes = g.nodes
+    for scc in _native_graph.strongly_connected_components(len(g), g.edges):
+        yield {nodes[i] for i in scc}
+
+
+def loop_nesting_forest(graph: networkx.DiGraph, entry: T) -> list[tuple[T, set[T]]]:
+    """
+    Compute the loop nesting forest of all nodes that are reachable from the entry node. A loop is a strongly connected
+    component with at least one edge, and its header is the member that comes first in reverse post order. Inner loops
+    are the loops among the members of a loop after removing all edges into its header.
+
+    :param graph:   The graph.
+    :param entry:   The entry node.
+    :return:        A list of (loop header, loop members) tuples, in which outer loops come before their inner loops.
+    """
+
+    if _native_graph is not None and USE_NATIVE_GRAPH_KERNEL:
+        g = IndexedGraph.from_networkx(graph)
+        nodes = g.nodes
+        return [
+            (nodes[header], {nodes[i] for i in members})
+            for header, members in _native_graph.loop_nesting_forest(len(g), g.edges, g.index[entry])
+        ]
+
+    rpo_index = {node: i for i, node in enumerate(reversed(list(networkx.dfs_postorder_nodes(graph, source=entry))))}
+    forest = []
+    worklist: list[tuple[set[Any], Any]] = [(set(rpo_index), None)]
+    while worklist:
+        members, header = worklist.pop()
+        if header is not None:
+            forest.append((header, members))
+        subgraph = networkx.DiGraph(graph.subgraph(members))
+        if header is not None:
+            subgraph.remove_edges_from(list(subgraph.in_edges(header)))
+        loops = [
+            scc
+            for scc in networkx.strongly_connected_components(subgraph)
+            if len(scc) > 1 or subgraph.has_edge(next(iter(scc)), next(iter(scc)))
+        ]
+        loops = sorted(((min(scc, key=rpo_index.__getitem__), scc) for scc in loops), key=lambda x: rpo_index[x[0]])
+        for loop_header, scc in reversed(loops):
+            worklist.append((scc, loop_header))
+    return forest
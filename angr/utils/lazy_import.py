@@ -1,9 +1,14 @@
 from __future__ import annotations
+from collections.abc import Callable, MutableMapping
+from typing import Any
+import importlib
 import importlib.util
 import sys
 
 
 def lazy_import(name):
+    if name in sys.modules:
+        return sys.modules[name]
     spec = importlib.util.find_spec(name)
     loader = importlib.util.LazyLoader(spec.loader)
     spec.loader = loader
@@ -11,3 +16,71 @@ def lazy_import(name):
     sys.modules[name] = module
     loader.exec_module(module)
     return module
+
+
+def lazy_attributes(package_name: str, attributes: dict[str, str]) -> Callable[[str], Any]:
+    """
+    Create a module-level __getattr__ function (see PEP 562) for a package, which imports attributes of the package from
+    its submodules when they are accessed for the first time. Submodules of the package are imported as well when they
+    are accessed as attributes of the package.
+
+    :param package_name:    Name of the package.
+    :param attributes:      A dict that maps names of attributes to names of submodules (relative to the package) where
+                            the attributes are defined.
+    :return:                The __getattr__ function.
+    """
+
+    def __getattr__(name: str):
+        if name in attributes:
+            value = getattr(importlib.import_module(attributes[name], package_name), name)
+        elif not name.startswith("__") and importlib.util.find_spec(f"{package_name}.{name}") is not None:
+            value = importlib.import_module(f".{name}", package_name)
+        else:
+            raise AttributeError(f"module {package_name!r} has no attribute {name!r}")
+        setattr(sys.modules[package_name], name, value)
+        return value
+
+    return __getattr__
+
+
+class LazyDict(MutableMapping):
+    """
+    A dict that is populated by calling a loader function when it is accessed for the first time. The loader may access
+    the dict (e.g., to add items) while it is running.
+    """
+
+    __slots__ = (
+        "_dict",
+        "_loader",
+    )
+
+    def __init__(self, loader: Callable[[], None]):
+        self._dict: dict = {}
+        self._loader: Callable[[], None] | None = loader
+
+    def load(self) -> dict:
+        if self._loader is not None:
+            loader, self._loader = self._loader, None
+            loader()
+        return self._dict
+
+    def __getitem__(self, k):
+        return self.load()[k]
+
+    def __setitem__(self, k, v):
+        self.load()[k] = v
+
+    def __delitem__(self, k):
+        del self.load()[k]
+
+    def __contains__(self, k):
+        return k in self.load()
+
+    def __iter__(self):
+        return iter(self.load())
+
+    def __len__(self):
+        return len(self.load())
+
+    def __repr__(self):
+        return repr(self.load())
@@ -0,0 +1,118 @@
+//! Graph algorithms on integer-indexed directed graphs.
+//!
+//! Nodes are integers in `0..num_nodes`, and edges are `(source, destination)` pairs. Graphs are converted to a
+//! compressed sparse row (CSR) representation before running any algorithm. All functions release the GIL while the
+//! algorithms run.
+
+mod kernel;
+
+use kernel::{
+    Csr, Tarjan, UNDEFINED, check_node, compute_dominance_frontiers, compute_idoms,
+    compute_loop_nesting_forest, post_order,
+};
+use pyo3::{exceptions::PyValueError, prelude::*};
+
+#[pyfunction]
+#[pyo3(signature = (num_nodes, edges, entry, reverse=false))]
+/// Compute immediate dominators (or immediate post-dominators if `reverse` is true) of all nodes that are reachable
+/// from `entry`. Returns a list where the item at index `i` is the immediate dominator of node `i`, or None if node `i`
+/// is unreachable. The immediate dominator of `entry` is itself.
+pub fn immediate_dominators(
+    py: Python<'_>,
+    num_nodes: usize,
+    edges: Vec<(usize, usize)>,
+    entry: usize,
+    reverse: bool,
+) -> PyResult<Vec<Option<usize>>> {
+    check_node(num_nodes, entry).map_err(PyValueError::new_err)?;
+    py.allow_threads(|| {
+        let graph = Csr::new(num_nodes, &edges, reverse).map_err(PyValueError::new_err)?;
+        let preds = Csr::new(num_nodes, &edges, !reverse).map_err(PyValueError::new_err)?;
+        let idom = compute_idoms(&graph, &preds, entry);
+        Ok(idom
+            .into_iter()
+            .map(|d| (d != UNDEFINED).then_some(d))
+            .collect())
+    })
+}
+
+#[pyfunction]
+#[pyo3(signature = (num_nodes, edges, idoms, reverse=false))]
+/// Compute dominance frontiers (or post-dominance frontiers if `reverse` is true) of all nodes, given their immediate
+/// dominators as returned by `immediate_dominators`. Returns a list of sorted lists of nodes.
+pub fn dominance_frontiers(
+    py: Python<'_>,
+    num_nodes: usize,
+    edges: Vec<(usize, usize)>,
+    idoms: Vec<Option<usize>>,
+    reverse: bool,
+) -> PyResult<Vec<Vec<usize>>> {
+    if idoms.len() != num_nodes {
+        return Err(PyValueError::new_err(
+            "The number of immediate dominators must be num_nodes",
+        ));
+    }
+    py.allow_threads(|| {
+        let preds = Csr::new(num_nodes, &edges, !reverse).map_err(PyValueError::new_err)?;
+        let idom: Vec<usize> = idoms.into_iter().map(|d| d.unwrap_or(UNDEFINED)).collect();
+        Ok(compute_dominance_frontiers(&preds, &idom))
+    })
+}
+
+#[pyfunction]
+/// Return all nodes that are reachable from `entry` in reverse post order.
+pub fn reverse_post_order(
+    py: Python<'_>,
+    num_nodes: usize,
+    edges: Vec<(usize, usize)>,
+    entry: usize,
+) -> PyResult<Vec<usize>> {
+    check_node(num_nodes, entry).map_err(PyValueError::new_err)?;
+    py.allow_threads(|| {
+        let graph = Csr::new(num_nodes, &edges, false).map_err(PyValueError::new_err)?;
+        let mut order = post_order(&graph, entry);
+        order.reverse();
+        Ok(order)
+    })
+}
+
+#[pyfunction]
+/// Return all strongly connected components of the graph in reverse topological order.
+pub fn strongly_connected_components(
+    py: Python<'_>,
+    num_nodes: usize,
+    edges: Vec<(usize, usize)>,
+) -> PyResult<Vec<Vec<usize>>> {
+    py.allow_threads(|| {
+        let graph = Csr::new(num_nodes, &edges, false).map_err(PyValueError::new_err)?;
+        let nodes: Vec<usize> = (0..num_nodes).collect();
+        Ok(Tarjan::new(num_nodes).run(&graph, &nodes, |_, _| true))
+    })
+}
+
+#[pyfunction]
+/// Return the loop nesting forest of all nodes that are reachable from `entry`, as a list of (loop header, loop
+/// members) tuples. Loop members are sorted in reverse post order and include the header. Outer loops come before
+/// their inner loops.
+pub fn loop_nesting_forest(
+    py: Python<'_>,
+    num_nodes: usize,
+    edges: Vec<(usize, usize)>,
+    entry: usize,
+) -> PyResult<Vec<(usize, Vec<usize>)>> {
+    check_node(num_nodes, entry).map_err(PyValueError::new_err)?;
+    py.allow_threads(|| {
+        let graph = Csr::new(num_nodes, &edges, false).map_err(PyValueError::new_err)?;
+        Ok(compute_loop_nesting_forest(&graph, entry))
+    })
+}
+
+#[pymodule]
+pub fn graph(m: &Bound<'_, PyModule>) -> PyResult<()> {
+    m.add_function(wrap_pyfunction!(immediate_dominators, m)?)?;
+    m.add_function(wrap_pyfunction!(dominance_frontiers, m)?)?;
+    m.add_function(wrap_pyfunction!(reverse_post_order, m)?)?;
+    m.add_function(wrap_pyfunction!(strongly_connected_components, m)?)?;
+    m.add_function(wrap_pyfunction!(loop_nesting_forest, m)?)?;
+    Ok(())
+}
@@ -0,0 +1,365 @@
+//! The graph algorithms behind the `graph` module. This module does not depend on pyo3 so that the algorithms can be
+//! tested on their own with `cargo test`.
+
+pub const UNDEFINED: usize = usize::MAX;
+
+/// A directed graph in compressed sparse row form.
+pub struct Csr {
+    offsets: Vec<usize>,
+    targets: Vec<usize>,
+}
+
+impl Csr {
+    pub fn new(num_nodes: usize, edges: &[(usize, usize)], reverse: bool) -> Result<Self, String> {
+        let mut offsets = vec![0usize; num_nodes + 1];
+        for &(src, dst) in edges {
+            if src >= num_nodes || dst >= num_nodes {
+                return Err(format!(
+                    "Edge ({src}, {dst}) refers to a node that does not exist"
+                ));
+            }
+            let from = if reverse { dst } else { src };
+            offsets[from + 1] += 1;
+        }
+        for i in 0..num_nodes {
+            offsets[i + 1] += offsets[i];
+        }
+
+        let mut fill = offsets.clone();
+        let mut targets = vec![0usize; edges.len()];
+        for &(src, dst) in edges {
+            let (from, to) = if reverse { (dst, src) } else { (src, dst) };
+            targets[fill[from]] = to;
+            fill[from] += 1;
+        }
+        Ok(Csr { offsets, targets })
+    }
+
+    fn num_nodes(&self) -> usize {
+        self.offsets.len() - 1
+    }
+
+    fn successors(&self, node: usize) -> &[usize] {
+        &self.targets[self.offsets[node]..self.offsets[node + 1]]
+    }
+}
+
+pub fn check_node(num_nodes: usize, node: usize) -> Result<(), String> {
+    if node >= num_nodes {
+        return Err(format!("Node {node} does not exist"));
+    }
+    Ok(())
+}
+
+/// Nodes that are reachable from `entry` in depth-first post order.
+pub fn post_order(graph: &Csr, entry: usize) -> Vec<usize> {
+    let mut visited = vec![false; graph.num_nodes()];
+    let mut order = Vec::new();
+    // (node, index of the next successor to visit)
+    let mut stack = vec![(entry, 0usize)];
+    visited[entry] = true;
+    while let Some(top) = stack.last_mut() {
+        let node = top.0;
+        let succs = graph.successors(node);
+        if top.1 < succs.len() {
+            let succ = succs[top.1];
+            top.1 += 1;
+            if !visited[succ] {
+                visited[succ] = true;
+                stack.push((succ, 0));
+            }
+        } else {
+            order.push(node);
+            stack.pop();
+        }
+    }
+    order
+}
+
+/// Immediate dominators of all nodes that are reachable from `entry`, computed with the iterative algorithm in "A
+/// Simple, Fast Dominance Algorithm" by Cooper, Harvey, and Kennedy. The immediate dominator of `entry` is itself, and
+/// the immediate dominators of unreachable nodes are `UNDEFINED`.
+pub fn compute_idoms(graph: &Csr, preds: &Csr, entry: usize) -> Vec<usize> {
+    let order = post_order(graph, entry);
+    let mut po_index = vec![UNDEFINED; graph.num_nodes()];
+    for (i, &node) in order.iter().enumerate() {
+        po_index[node] = i;
+    }
+
+    let mut idom = vec![UNDEFINED; graph.num_nodes()];
+    idom[entry] = entry;
+    let mut changed = true;
+    while changed {
+        changed = false;
+        for &node in order.iter().rev() {
+            if node == entry {
+                continue;
+            }
+            let mut new_idom = UNDEFINED;
+            for &pred in preds.successors(node) {
+                if idom[pred] == UNDEFINED {
+                    continue;
+                }
+                new_idom = if new_idom == UNDEFINED {
+                    pred
+                } else {
+                    intersect(&idom, &po_index, pred, new_idom)
+                };
+            }
+            if new_idom != UNDEFINED && idom[node] != new_idom {
+                idom[node] = new_idom;
+                changed = true;
+            }
+        }
+    }
+    idom
+}
+
+fn intersect(idom: &[usize], po_index: &[usize], mut a: usize, mut b: usize) -> usize {
+    while a != b {
+        while po_index[a] < po_index[b] {
+            a = idom[a];
+        }
+        while po_index[b] < po_index[a] {
+            b = idom[b];
+        }
+    }
+    a
+}
+
+/// Dominance frontiers of all nodes, given the immediate dominators.
+pub fn compute_dominance_frontiers(preds: &Csr, idom: &[usize]) -> Vec<Vec<usize>> {
+    let mut frontiers: Vec<Vec<usize>> = vec![Vec::new(); preds.num_nodes()];
+    for node in 0..preds.num_nodes() {
+        if idom[node] == UNDEFINED {
+            continue;
+        }
+        let node_preds = preds.successors(node);
+        if node_preds.len() < 2 {
+            continue;
+        }
+        for &pred in node_preds {
+            let mut runner = pred;
+            if idom[runner] == UNDEFINED {
+                continue;
+            }
+            while runner != idom[node] {
+                frontiers[runner].push(node);
+                if runner == idom[runner] {
+                    break;
+                }
+                runner = idom[runner];
+            }
+        }
+    }
+    for frontier in &mut frontiers {
+        frontier.sort_unstable();
+        frontier.dedup();
+    }
+    frontiers
+}
+
+/// Tarjan's strongly connected components algorithm without recursion. The state is kept across runs so that it can be
+/// reused to find SCCs of many subgraphs of the same graph; only the states of the visited nodes are reset.
+pub struct Tarjan {
+    index: Vec<usize>,
+    lowlink: Vec<usize>,
+    on_stack: Vec<bool>,
+    visited: Vec<usize>,
+}
+
+impl Tarjan {
+    pub fn new(num_nodes: usize) -> Self {
+        Tarjan {
+            index: vec![UNDEFINED; num_nodes],
+            lowlink: vec![0; num_nodes],
+            on_stack: vec![false; num_nodes],
+            visited: Vec::new(),
+        }
+    }
+
+    /// Find SCCs in the subgraph induced by `nodes`, ignoring edges for which `keep_edge` returns false. SCCs are
+    /// returned in reverse topological order.
+    pub fn run<F: Fn(usize, usize) -> bool>(
+        &mut self,
+        graph: &Csr,
+        nodes: &[usize],
+        keep_edge: F,
+    ) -> Vec<Vec<usize>> {
+        let mut components = Vec::new();
+        let mut stack = Vec::new();
+        let mut call_stack: Vec<(usize, usize)> = Vec::new();
+        let mut next_index = 0;
+
+        for &root in nodes {
+            if self.index[root] != UNDEFINED {
+                continue;
+            }
+            self.visit(root, &mut next_index, &mut stack);
+            call_stack.push((root, 0));
+
+            while let Some(top) = call_stack.last_mut() {
+                let node = top.0;
+                let succs = graph.successors(node);
+                if top.1 < succs.len() {
+                    let succ = succs[top.1];
+                    top.1 += 1;
+                    if !keep_edge(node, succ) {
+                        continue;
+                    }
+                    if self.index[succ] == UNDEFINED {
+                        self.visit(succ, &mut next_index, &mut stack);
+                        call_stack.push((succ, 0));
+                    } else if self.on_stack[succ] {
+                        self.lowlink[node] = self.lowlink[node].min(self.index[succ]);
+                    }
+                } else {
+                    call_stack.pop();
+                    if let Some(&(parent, _)) = call_stack.last() {
+                        self.lowlink[parent] = self.lowlink[parent].min(self.lowlink[node]);
+                    }
+                    if self.lowlink[node] == self.index[node] {
+                        let mut component = Vec::new();
+                        while let Some(member) = stack.pop() {
+                            self.on_stack[member] = false;
+                            component.push(member);
+                            if member == node {
+                                break;
+                            }
+                        }
+                        components.push(component);
+                    }
+                }
+            }
+        }
+
+        for &node in &self.visited {
+            self.index[node] = UNDEFINED;
+        }
+        self.visited.clear();
+        components
+    }
+
+    fn visit(&mut self, node: usize, next_index: &mut usize, stack: &mut Vec<usize>) {
+        self.index[node] = *next_index;
+        self.lowlink[node] = *next_index;
+        *next_index += 1;
+        self.on_stack[node] = true;
+        self.visited.push(node);
+        stack.push(node);
+    }
+}
+
+/// The loop nesting forest of all nodes that are reachable from `entry`. Each loop is a non-trivial SCC (or a node with
+/// a self-loop) of the graph, and its header is the member that comes first in reverse post order. Inner loops are
+/// found by removing the edges into the header and looking for SCCs among the remaining members of the loop.
+///
+/// Loops are returned in pre-order of the forest, i.e., outer loops come before their inner loops.
+pub fn compute_loop_nesting_forest(graph: &Csr, entry: usize) -> Vec<(usize, Vec<usize>)> {
+    let mut rpo = post_order(graph, entry);
+    rpo.reverse();
+    let mut rpo_index = vec![UNDEFINED; graph.num_nodes()];
+    for (i, &node) in rpo.iter().enumerate() {
+        rpo_index[node] = i;
+    }
+
+    // the ID of the region that each node was most recently assigned to
+    let mut region = vec![UNDEFINED; graph.num_nodes()];
+    let mut tarjan = Tarjan::new(graph.num_nodes());
+    let mut forest = Vec::new();
+
+    // (members of the region sorted in RPO, header of the region or UNDEFINED for the whole graph)
+    let mut worklist: Vec<(Vec<usize>, usize)> = vec![(rpo, UNDEFINED)];
+    let mut next_region_id = 0;
+    while let Some((members, header)) = worklist.pop() {
+        let region_id = next_region_id;
+        next_region_id += 1;
+        for &node in &members {
+            region[node] = region_id;
+        }
+
+        let region_ref = &region;
+        let mut loops: Vec<Vec<usize>> = tarjan
+            .run(graph, &members, |_, dst| {
+                region_ref[dst] == region_id && dst != header
+            })
+            .into_iter()
+            .filter(|scc| {
+                scc.len() > 1 || (scc[0] != header && graph.successors(scc[0]).contains(&scc[0]))
+            })
+            .collect();
+        for scc in &mut loops {
+            scc.sort_unstable_by_key(|&node| rpo_index[node]);
+        }
+        loops.sort_unstable_by_key(|scc| rpo_index[scc[0]]);
+
+        if header != UNDEFINED {
+            forest.push((header, members));
+        }
+        // push in reverse so that sibling loops are processed in RPO of their headers
+        for scc in loops.into_iter().rev() {
+            let loop_header = scc[0];
+            worklist.push((scc, loop_header));
+        }
+    }
+    forest
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn idoms(num_nodes: usize, edges: &[(usize, usize)], entry: usize) -> Vec<usize> {
+        let graph = Csr::new(num_nodes, edges, false).unwrap();
+        let preds = Csr::new(num_nodes, edges, true).unwrap();
+        compute_idoms(&graph, &preds, entry)
+    }
+
+    #[test]
+    fn diamond_dominators() {
+        // 0 -> 1 -> 3, 0 -> 2 -> 3
+        let edges = [(0, 1), (0, 2), (1, 3), (2, 3)];
+        assert_eq!(idoms(5, &edges, 0), vec![0, 0, 0, 0, UNDEFINED]);
+
+        let preds = Csr::new(5, &edges, true).unwrap();
+        let frontiers = compute_dominance_frontiers(&preds, &idoms(5, &edges, 0));
+        assert_eq!(frontiers, vec![vec![], vec![3], vec![3], vec![], vec![]]);
+    }
+
+    #[test]
+    fn strongly_connected_components() {
+        let edges = [(0, 1), (1, 2), (2, 1), (2, 3), (3, 3)];
+        let graph = Csr::new(4, &edges, false).unwrap();
+        let nodes: Vec<usize> = (0..4).collect();
+        let mut sccs = Tarjan::new(4).run(&graph, &nodes, |_, _| true);
+        for scc in &mut sccs {
+            scc.sort_unstable();
+        }
+        assert_eq!(sccs, vec![vec![3], vec![1, 2], vec![0]]);
+    }
+
+    #[test]
+    fn nested_loops() {
+        // 0 -> 1 -> 2 -> 3 -> 2, 3 -> 1, 1 -> 4
+        let edges = [(0, 1), (1, 2), (2, 3), (3, 2), (3, 1), (1, 4)];
+        let graph = Csr::new(5, &edges, false).unwrap();
+        assert_eq!(
+            compute_loop_nesting_forest(&graph, 0),
+            vec![(1, vec![1, 2, 3]), (2, vec![2, 3])]
+        );
+    }
+
+    #[test]
+    fn self_loop() {
+        let edges = [(0, 1), (1, 1), (1, 2)];
+        let graph = Csr::new(3, &edges, false).unwrap();
+        assert_eq!(compute_loop_nesting_forest(&graph, 0), vec![(1, vec![1])]);
+    }
+
+    #[test]
+    fn invalid_nodes() {
+        assert!(Csr::new(2, &[(0, 2)], false).is_err());
+        assert!(check_node(2, 2).is_err());
+        assert!(check_node(2, 1).is_ok());
+    }
+}
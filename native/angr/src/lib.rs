@@ -1,3 +1,4 @@
+pub mod graph;
 pub mod icicle;
 pub mod segmentlist;
 
@@ -23,6 +24,7 @@ fn import_submodule<'py>(
 
 #[pymodule]
 fn rustylib(m: &Bound<'_, PyModule>) -> PyResult<()> {
+    import_submodule(m.py(), m, "angr.rustylib", "graph", graph::graph)?;
     import_submodule(m.py(), m, "angr.rustylib", "icicle", icicle::icicle)?;
     import_submodule(
         m.py(),
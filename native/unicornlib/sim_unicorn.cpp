@@ -60,6 +60,14 @@ State::State(uc_engine *_uc, uint64_t cache_key, simos_t curr_os, bool symb_addr
 	trace_last_block_tot_count = -1;
 	trace_last_block_curr_count = -1;
 	executed_blocks_count = -1;
+	track_bbls = false;
+	track_stack = false;
+	track_coverage = false;
+	coverage_prev_loc = 0;
+	coverage_last_prev_loc = 0;
+	coverage_last_index = -1;
+	coverage_last_block = 0;
+	coverage_last_value = 0;
 }
 
 /*
@@ -198,6 +206,9 @@ void State::step(address_t current_address, int32_t size, bool check_stop_points
 	if (track_stack) {
 		stack_pointers.push_back(get_stack_pointer());
 	}
+	if (track_coverage) {
+		update_coverage(current_address);
+	}
 	executed_pages.insert(current_address & ~0xFFFULL);
 	cur_address = current_address;
 	cur_size = size;
@@ -443,6 +454,44 @@ void State::rollback() {
 
 	if (track_bbls) bbl_addrs.pop_back();
 	if (track_stack) stack_pointers.pop_back();
+	if (track_coverage) undo_coverage_update();
+}
+
+void State::set_coverage_tracking(bool enabled) {
+	track_coverage = enabled;
+	if (enabled && coverage_bitmap.empty()) {
+		coverage_bitmap.resize(COVERAGE_MAP_SIZE, 0);
+	}
+}
+
+void State::update_coverage(address_t block_addr) {
+	// AFL-style edge coverage: the bitmap is indexed by a hash of the previous and the current block
+	address_t cur_loc = ((block_addr >> 4) ^ (block_addr << 8)) & (COVERAGE_MAP_SIZE - 1);
+	uint64_t index = cur_loc ^ coverage_prev_loc;
+
+	coverage_last_index = index;
+	coverage_last_block = block_addr;
+	coverage_last_value = coverage_bitmap[index];
+	coverage_last_prev_loc = coverage_prev_loc;
+	if (coverage_bitmap[index] != UINT8_MAX) {
+		coverage_bitmap[index]++;
+	}
+	coverage_prev_loc = cur_loc >> 1;
+	block_hit_counts[block_addr]++;
+}
+
+void State::undo_coverage_update() {
+	if (coverage_last_index < 0) {
+		return;
+	}
+	coverage_bitmap[coverage_last_index] = coverage_last_value;
+	coverage_prev_loc = coverage_last_prev_loc;
+	coverage_last_index = -1;
+
+	auto it = block_hit_counts.find(coverage_last_block);
+	if (it != block_hit_counts.end() && --it->second == 0) {
+		block_hit_counts.erase(it);
+	}
 }
 
 /*
@@ -3118,9 +3167,38 @@ void simunicorn_clear_page_cache(State *state) {
 
 // Tracking settings
 extern "C"
-void simunicorn_set_tracking(State *state, bool track_bbls, bool track_stack) {
+void simunicorn_set_tracking(State *state, bool track_bbls, bool track_stack, bool track_coverage) {
 	state->track_bbls = track_bbls;
 	state->track_stack = track_stack;
+	state->set_coverage_tracking(track_coverage);
+}
+
+// Coverage
+extern "C"
+uint8_t *simunicorn_coverage_bitmap(State *state) {
+	return state->coverage_bitmap.empty() ? NULL : &(state->coverage_bitmap[0]);
+}
+
+extern "C"
+uint64_t simunicorn_coverage_bitmap_size(State *state) {
+	return state->coverage_bitmap.size();
+}
+
+extern "C"
+uint64_t simunicorn_block_hit_count(State *state) {
+	// flatten the hit counts into (address, count) pairs, which can be read with simunicorn_block_hits
+	state->block_hit_counts_flat.clear();
+	state->block_hit_counts_flat.reserve(state->block_hit_counts.size() * 2);
+	for (auto &entry: state->block_hit_counts) {
+		state->block_hit_counts_flat.push_back(entry.first);
+		state->block_hit_counts_flat.push_back(entry.second);
+	}
+	return state->block_hit_counts.size();
+}
+
+extern "C"
+uint64_t *simunicorn_block_hits(State *state) {
+	return state->block_hit_counts_flat.empty() ? NULL : &(state->block_hit_counts_flat[0]);
 }
 
 extern "C"
@@ -17,6 +17,9 @@ static const uint8_t MAX_REGISTER_BYTE_SIZE = 32;
 static const uint16_t ANGR_PAGE_SIZE = 0x1000;
 static const uint8_t PAGE_SHIFT = 12;
 
+// Size of the AFL-style edge coverage bitmap. Must be a power of two.
+static const uint32_t COVERAGE_MAP_SIZE = 1 << 16;
+
 typedef uint64_t address_t;
 typedef uint64_t unicorn_reg_id_t;
 typedef int64_t vex_reg_offset_t;
@@ -805,6 +808,19 @@ class State {
 
 		bool track_bbls;
 		bool track_stack;
+		bool track_coverage;
+
+		// Edge coverage bitmap with saturating 8-bit hit counters, and number of executions of each basic block
+		std::vector<uint8_t> coverage_bitmap;
+		std::unordered_map<address_t, uint64_t> block_hit_counts;
+		// Flattened (address, count) pairs of block_hit_counts, built upon request
+		std::vector<uint64_t> block_hit_counts_flat;
+		// Previous location in coverage bitmap and details of last update, to undo it in rollback
+		address_t coverage_prev_loc;
+		address_t coverage_last_prev_loc;
+		address_t coverage_last_block;
+		int64_t coverage_last_index;
+		uint8_t coverage_last_value;
 
 		uc_cb_eventmem_t py_mem_callback;
 
@@ -854,6 +870,13 @@ class State {
 		 */
 		void rollback();
 
+		/*
+		 * track edge coverage and per-block execution counts.
+		 */
+		void set_coverage_tracking(bool enabled);
+		void update_coverage(address_t block_addr);
+		void undo_coverage_update();
+
 		/*
 		 * allocate a new PageBitmap and put into active_pages.
 		 */
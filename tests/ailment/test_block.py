@@ -0,0 +1,66 @@
+# pylint: disable=missing-class-docstring,no-self-use
+from __future__ import annotations
+import unittest
+
+import networkx
+
+from angr import ailment
+from angr.analyses.decompiler.utils import ail_graph_fingerprint
+
+
+class TestBlock(unittest.TestCase):
+    def _make_block(self, addr: int, value: int) -> ailment.Block:
+        reg = ailment.Expr.Register(None, None, 16, 64)
+        stmt = ailment.Stmt.Assignment(0, reg, ailment.Expr.Const(None, None, value, 64), ins_addr=addr)
+        return ailment.Block(addr, 4, statements=[stmt])
+
+    def test_block_fingerprint(self):
+        block = self._make_block(0x400000, 1)
+        fingerprint = block.fingerprint()
+
+        # copies of a block have the same fingerprint
+        assert block.copy().fingerprint() == fingerprint
+
+        # replacing a statement with an equivalent one does not change the fingerprint
+        block.statements[0] = self._make_block(0x400000, 1).statements[0]
+        assert block.fingerprint() == fingerprint
+
+        block.statements[0] = self._make_block(0x400000, 2).statements[0]
+        assert block.fingerprint() != fingerprint
+
+    def test_block_fingerprint_in_place_modification(self):
+        target = ailment.Expr.Const(None, None, 0x400010, 64)
+        jump = ailment.Stmt.Jump(1, target, target_idx=None, ins_addr=0x400000)
+        block = ailment.Block(0x400000, 4, statements=[jump])
+        fingerprint = block.fingerprint()
+
+        # statements are modified in-place, like RedundantLabelRemover does when redirecting jumps
+        jump.target = ailment.Expr.Const(None, None, 0x400020, 64)
+        assert block.fingerprint() != fingerprint
+        jump.target = target
+        assert block.fingerprint() == fingerprint
+        jump.target_idx = 1
+        assert block.fingerprint() != fingerprint
+        jump.target_idx = None
+
+        # nested expressions are modified in-place, too
+        target.value = 0x400030
+        assert block.fingerprint() != fingerprint
+
+    def test_ail_graph_fingerprint(self):
+        a, b, c = self._make_block(0x400000, 1), self._make_block(0x400010, 2), self._make_block(0x400020, 3)
+        graph = networkx.DiGraph([(a, b), (a, c)])
+        fingerprint = ail_graph_fingerprint(graph)
+        assert ail_graph_fingerprint(networkx.DiGraph(graph)) == fingerprint
+
+        graph.add_edge(b, c)
+        assert ail_graph_fingerprint(graph) != fingerprint
+        graph.remove_edge(b, c)
+        assert ail_graph_fingerprint(graph) == fingerprint
+
+        c.statements.append(ailment.Stmt.Jump(1, ailment.Expr.Const(None, None, 0x400000, 64), ins_addr=0x400020))
+        assert ail_graph_fingerprint(graph) != fingerprint
+
+
+if __name__ == "__main__":
+    unittest.main()
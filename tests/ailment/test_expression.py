@@ -17,6 +17,38 @@ class TestExpression(unittest.TestCase):
         h = hash(phi_expr)  # should not crash
         assert h is not None
 
+    def test_expression_factory(self):
+        factory = ailment.ExpressionFactory()
+
+        # common constants are interned
+        assert factory.const(0, 32) is factory.const(0, 32)
+        assert factory.const(1, 64) is not factory.const(1.0, 64)
+        assert factory.register(16, 64) is factory.register(16, 64)
+
+        reg = ailment.expression.Register(None, None, 16, 64)
+        const = ailment.expression.Const(None, None, 1, 64)
+        expr = factory.intern(ailment.expression.BinaryOp(None, "Add", [reg, const], False, bits=64))
+        assert expr.operands[0] is factory.register(16, 64)
+        assert expr.operands[1] is factory.const(1, 64)
+        assert factory.binop("Add", [reg.copy(), const.copy()], bits=64) is expr
+        assert factory.intern(expr) is expr
+
+        # tags are part of the identity of interned expressions
+        tagged = factory.binop("Add", [reg.copy(), const.copy()], bits=64, ins_addr=0x400000)
+        assert tagged is not expr
+        assert tagged == expr
+        assert tagged.ins_addr == 0x400000
+        assert factory.unop("Neg", tagged) is factory.unop("Neg", tagged.copy())
+
+        # floats are interned by their bit patterns
+        assert factory.const(0.0, 64) is not factory.const(-0.0, 64)
+        assert str(factory.const(-0.0, 64).value) == "-0.0"
+        neg_zero = ailment.expression.Const(None, None, -0.0, 64)
+        assert factory.intern(ailment.expression.Const(None, None, 0.0, 64)) is not factory.intern(neg_zero)
+        assert factory.intern(neg_zero.copy()) is factory.intern(neg_zero)
+        nan = float("nan")
+        assert factory.const(nan, 64) is factory.const(nan, 64)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -5,11 +5,19 @@ from __future__ import annotations
 __package__ = __package__ or "tests.analyses.cfg"  # pylint:disable=redefined-builtin
 
 import os
+import pickle
+import struct
+import tempfile
 import unittest
 import logging
 
+import networkx
+
 import angr
+from angr.errors import AngrCFGError
 from angr.analyses import CFGFast
+from angr.knowledge_plugins.cfg import CFGModel, MemoryDataSort
+from angr.knowledge_plugins.cfg.loader_index import LoaderIndex
 
 from tests.common import bin_location
 
@@ -52,6 +60,177 @@ class TestCfgModel(unittest.TestCase):
         for addr in expected_removed_addrs:
             assert cfg.model.get_any_node(addr) is None
 
+    def _queries(self, model):
+        results = []
+        for node in sorted(model.nodes(), key=lambda n: (n.addr, n.size)):
+            results.append(
+                (
+                    node,
+                    set(model.get_successors(node)),
+                    set(model.get_successors(node, excluding_fakeret=False)),
+                    set(model.get_successors(node, jumpkind="Ijk_Call")),
+                    set(model.get_predecessors(node)),
+                    set(model.get_predecessors(node, excluding_fakeret=False)),
+                    set(model.get_predecessors(node, jumpkind="Ijk_Boring")),
+                    set(model.get_successors_and_jumpkinds(node, excluding_fakeret=False)),
+                    set(model.get_predecessors_and_jumpkinds(node)),
+                    set(model.get_all_successors(node)),
+                    set(model.get_all_predecessors(node)),
+                    set(model.get_all_nodes(node.addr + 1, anyaddr=True)),
+                    model.get_all_nodes_intersecting_region(node.addr, 2),
+                )
+            )
+        results.append(model.get_branching_nodes())
+        return results
+
+    def _check_frozen_model(self, model):
+        expected = self._queries(model)
+        edges = sorted(
+            (src.addr, dst.addr, tuple(sorted(data.items()))) for src, dst, data in model.graph.edges(data=True)
+        )
+
+        model.freeze()
+        assert model.is_frozen
+        assert self._queries(model) == expected
+        assert model.is_frozen
+
+        # round-trip through pickling and files
+        assert self._queries(pickle.loads(pickle.dumps(model))) == expected
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "cfg.frozen")
+            model.dump_frozen(path)
+            for use_mmap in (True, False):
+                loaded = CFGModel.load_frozen(path, use_mmap=use_mmap)
+                assert loaded.is_frozen
+                assert self._queries(loaded) == expected
+                assert loaded.serialize() == model.serialize()
+                del loaded
+
+        # the graph is rebuilt upon access
+        graph = model.graph
+        assert not model.is_frozen
+        assert (
+            sorted((src.addr, dst.addr, tuple(sorted(data.items()))) for src, dst, data in graph.edges(data=True))
+            == edges
+        )
+
+    def test_cfgmodel_freeze(self):
+        proj = angr.Project(FAUXWARE_PATH, auto_load_libs=False)
+        cfg = proj.analyses[CFGFast].prep()(normalize=True)
+        model = cfg.model
+        self._check_frozen_model(model)
+
+        main = model.get_any_node(proj.kb.functions["main"].addr)
+        exit_stmt_idxs = {succ: model.get_exit_stmt_idx(main, succ) for succ in main.successors}
+        model.freeze()
+        assert {succ: model.get_exit_stmt_idx(main, succ) for succ in main.successors} == exit_stmt_idxs
+
+        # edges with attributes that do not fit in the columns of frozen graphs
+        authenticate = model.get_any_node(proj.kb.functions["authenticate"].addr)
+        model.graph.add_edge(authenticate, main, jumpkind="Ijk_Boring", extra=True)
+        self._check_frozen_model(model)
+
+    def test_cfgmodel_freeze_edge_cases(self):
+        # an empty model
+        model = CFGModel("empty")
+        model.freeze()
+        assert model.is_frozen
+        assert model.get_any_node(0x400000) is None
+        assert not model.get_branching_nodes()
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, "empty.cfg")
+            model.dump_frozen(path)
+            loaded = CFGModel.load_frozen(path)
+            assert loaded.is_frozen
+            assert loaded.graph.number_of_nodes() == 0
+
+            # files that dump_frozen() does not write
+            path = os.path.join(d, "bogus.cfg")
+            with open(path, "wb") as f:
+                f.write(b"\x00" * 0x20)
+            with self.assertRaises(AngrCFGError):
+                CFGModel.load_frozen(path)
+
+        proj = angr.Project(FAUXWARE_PATH, auto_load_libs=False)
+        model = proj.analyses[CFGFast].prep()(normalize=True).model
+        node = model.get_any_node(proj.kb.functions["main"].addr)
+        model.freeze()
+        csr = model._csr
+        # freezing again keeps the frozen graph
+        model.freeze()
+        assert model._csr is csr
+
+        # copies share the frozen graph, and thawing a copy leaves the original frozen
+        copy = model.copy()
+        assert copy.is_frozen and copy._csr is csr
+        copy.graph.remove_node(node)
+        assert not copy.is_frozen
+        assert model.is_frozen
+        assert node in model.graph
+
+        # nodes that are not in the graph
+        model.freeze()
+        detached = node.copy()
+        detached.addr = max(n.addr for n in model.nodes()) + 0x1000
+        assert model.get_successors(detached) == []
+        assert model.get_predecessors(detached) == []
+        with self.assertRaises(networkx.NetworkXError):
+            model.get_all_successors(detached)
+        model.thaw()
+        with self.assertRaises(networkx.NetworkXError):
+            model.get_all_successors(detached)
+
+        # graphs with non-integer addresses cannot be frozen
+        detached.addr = ("method", 0, 0)
+        model.graph.add_node(detached)
+        with self.assertRaises(AngrCFGError):
+            model.freeze()
+        assert not model.is_frozen
+        assert detached in model.graph
+
+    def test_tidy_data_references_without_binaries(self):
+        data = (
+            b"\xc3" * 0x10
+            + struct.pack("<3Q", 0x400000, 0x400030, 0x400040)
+            + b"\xff" * 0x08
+            + b"hello world\x00".ljust(0x10, b"\xff")
+            + "wide string!".encode("utf_16_le")
+            + b"\x00\x00"
+            + b"\xff" * 0x08
+        )
+        proj = angr.load_shellcode(data, "amd64", load_address=0x400000)
+        model = CFGModel("test", cfg_manager=proj.kb.cfgs)
+        for addr in (0x400010, 0x400030, 0x400040):
+            model.add_memory_data(addr, None)
+        model.tidy_data_references()
+
+        expected = {
+            0x400010: (MemoryDataSort.PointerArray, 0x18, None),
+            0x400030: (MemoryDataSort.String, 12, b"hello world"),
+            0x400040: (MemoryDataSort.UnicodeString, 26, "wide string!".encode("utf_16_le")),
+        }
+        for addr, (sort, size, content) in expected.items():
+            memory_data = model.memory_data[addr]
+            assert (memory_data.sort, memory_data.size, memory_data.content) == (sort, size, content)
+
+    def test_loader_index(self):
+        data = b"\x00" * 0x11 + struct.pack("<2Q", 0x400008, 0x500000)
+        proj = angr.load_shellcode(data, "amd64", load_address=0x400000)
+        loader = proj.loader
+        index = LoaderIndex(loader)
+        addrs = [0, 0x3FFFFF, 0x400000, 0x400010, 0x400011, 0x400020, 0x400021, loader.max_addr, loader.max_addr + 1]
+        addrs += [obj.min_addr for obj in loader.all_objects]
+        for addr in addrs:
+            assert index.find_object_containing(addr) is loader.find_object_containing(addr)
+            assert index.find_section_containing(addr) is loader.find_section_containing(addr)
+            assert index.find_segment_containing(addr) is loader.find_segment_containing(addr)
+            assert index.is_pointer_target(addr) == (
+                loader.find_section_containing(addr) is not None or loader.find_segment_containing(addr) is not None
+            )
+            assert index.load_pointer(addr) == loader.fast_memory_load_pointer(addr)
+        assert index.load(0x400011, 0x100) == loader.memory.load(0x400011, 0x100)
+        assert index.load_pointers(0x400011, 3) == (0x400008, 0x500000)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -4,16 +4,27 @@ from __future__ import annotations
 
 __package__ = __package__ or "tests.analyses.cfg"  # pylint:disable=redefined-builtin
 
+import io
 import os
 import logging
+import random
+import re
+import struct
+import tempfile
 import unittest
 
 import archinfo
 import angr
 from angr.knowledge_plugins.cfg import CFGNode, CFGModel, MemoryDataSort
-from angr.analyses.cfg.indirect_jump_resolvers import mips_elf_fast
+from angr.analyses.cfg.indirect_jump_resolvers import (
+    mips_elf_fast,
+    ArmElfFastResolver,
+    ConstantResolver,
+    JumpTableResolver,
+)
+from angr.analyses.cfg.prologue_matcher import PrologueMatcher
 
-from tests.common import bin_location, slow_test
+from tests.common import bin_location, slow_test, TWO_FUNCTIONS_SHELLCODE, TWO_FUNCTIONS_STARTS
 
 l = logging.getLogger("angr.tests.test_cfgfast")
 
@@ -894,6 +905,229 @@ class TestCfgfast(unittest.TestCase):
         assert len(func.endpoints) == 1
         assert func.endpoints[0].addr == 0x40400A
 
+    def test_lazy_irelative_resolver_returns(self):
+        # sub_40000d calls sub_400000, which is hooked like a resolver of a lazily resolved IRELATIVE relocation
+        proj = angr.load_shellcode(TWO_FUNCTIONS_SHELLCODE, "amd64", load_address=0x400000, lazy_hooks=True)
+        assert proj.simos._resolve_irelative(0x400000) == 0x400000
+        assert proj.hooked_by(0x400000).display_name == "IFuncResolver.0x400000"
+
+        cfg = proj.analyses.CFGFast(normalize=True, function_starts=TWO_FUNCTIONS_STARTS)
+        call_site = cfg.model.get_any_node(0x40000D)
+        assert [
+            node.addr for node in cfg.model.get_successors(call_site, excluding_fakeret=False, jumpkind="Ijk_FakeRet")
+        ] == [0x400012]
+        assert cfg.kb.functions[0x400000].returning
+        caller = cfg.kb.functions[0x40000D]
+        assert 0x400012 in caller.block_addrs_set
+        assert caller.returning
+
+    def test_data_scans_in_blob(self):
+        strings = b"hello world\x00" + b"\x00" * 4 + cstring_to_unicode_string(b"wide string!") + b"\x00\x00"
+        padding = b"\xcc" * 9 + b"\x00" * 3
+        pointers = struct.pack("<4Q", 0x400000, 0x400010, 0x400020, 0x400030)
+        data = b"\xc3" + b"\x00" * 15 + strings + padding + pointers
+        proj = angr.Project(
+            io.BytesIO(data),
+            main_opts={"backend": "blob", "arch": "AMD64", "base_addr": 0x400000, "entry_point": 0x400000},
+            auto_load_libs=False,
+        )
+        cfg = proj.analyses.CFGFast()
+
+        padding_addr = 0x400010 + len(strings)
+        pointers_addr = padding_addr + len(padding)
+        assert cfg._scan_for_printable_strings(0x400010) == 12
+        assert cfg._scan_for_printable_strings(0x400011) == 11
+        assert cfg._scan_for_printable_widestrings(0x400020) == 26
+        assert cfg._scan_for_repeating_bytes(padding_addr, 0xCC) == 9
+        # the run of zeros continues into the low bytes of the first pointer
+        assert cfg._scan_for_repeating_bytes(padding_addr + 9, 0x00) == 5
+        assert cfg._scan_for_consecutive_pointers(pointers_addr) == 4
+        assert cfg._scan_for_consecutive_pointers(pointers_addr + 8) == 3
+        # a misaligned pointer does not point into the memory region
+        assert cfg._scan_for_consecutive_pointers(pointers_addr + 4) == 0
+
+    def test_indirect_jump_workers(self):
+        # functions that switch over 4 cases through a jump table of 32-bit offsets
+        func = bytes.fromhex(
+            "83ff03"  # cmp edi, 3
+            "772a"  # ja default
+            "89f8"  # mov eax, edi
+            "488d1526000000"  # lea rdx, [rip + table]
+            "48630482"  # movsxd rax, dword ptr [rdx + rax * 4]
+            "4801d0"  # add rax, rdx
+            "ffe0"  # jmp rax
+            "b801000000c3"  # mov eax, 1; ret
+            "b802000000c3"  # mov eax, 2; ret
+            "b803000000c3"  # mov eax, 3; ret
+            "b804000000c3"  # mov eax, 4; ret
+            "31c0c3"  # default: xor eax, eax; ret
+            "cccc"
+        ) + struct.pack("<4i", -0x1D, -0x17, -0x11, -0x0B)
+        data = func * 4
+        func_addrs = [0x400000 + i * len(func) for i in range(4)]
+
+        results = []
+        for workers in (0, 2):
+            proj = angr.load_shellcode(data, "amd64", load_address=0x400000)
+            cfg = proj.analyses.CFGFast(function_starts=func_addrs, indirect_jump_workers=workers)
+            results.append(
+                (
+                    sorted((node.addr, node.size) for node in cfg.graph.nodes()),
+                    {addr: sorted(jump.resolved_targets) for addr, jump in cfg.indirect_jumps.items()},
+                    {addr: (data.size, data.sort) for addr, data in cfg.memory_data.items()},
+                )
+            )
+
+        jumps = results[0][1]
+        assert len(jumps) == 4
+        for func_addr, (addr, targets) in zip(func_addrs, sorted(jumps.items())):
+            assert addr == func_addr + 5
+            assert targets == [func_addr + off for off in (0x17, 0x1D, 0x23, 0x29)]
+        assert results[0] == results[1]
+
+    def test_indirect_jump_workers_arm(self):
+        def switch_func(addr):
+            # cmp r0, #3; ldrls pc, [pc, r0, lsl #2]; b default; a jump table of 4 absolute addresses; 4 cases that
+            # return 1 to 4; default: mov r0, #0; bx lr
+            words = [0xE3500003, 0x979FF100, 0xEA00000B] + [addr + 28 + 8 * i for i in range(4)]
+            for i in range(4):
+                words += [0xE3A00001 + i, 0xE12FFF1E]
+            words += [0xE3A00000, 0xE12FFF1E, 0, 0, 0]
+            return struct.pack("<20I", *words)
+
+        base = 0x10000
+        func_addrs = [base + i * 0x50 for i in range(4)]
+        caller_addr = base + 0x140
+        # push {r4, lr}; ldr r3, [pc, #4]; blx r3; pop {r4, pc}; the address of the first function
+        data = b"".join(switch_func(addr) for addr in func_addrs) + struct.pack(
+            "<5I", 0xE92D4010, 0xE59F3004, 0xE12FFF33, 0xE8BD8010, func_addrs[0]
+        )
+
+        class RecordingJumpTableResolver(JumpTableResolver):
+            def __init__(self, project, side_effect_free: bool):
+                super().__init__(project)
+                self.side_effect_free = side_effect_free
+                self.resolved_addrs = []
+
+            def resolve(self, cfg, addr, *args, **kwargs):
+                # this list is only updated in the current process when indirect jumps are not resolved in workers
+                self.resolved_addrs.append(addr)
+                return super().resolve(cfg, addr, *args, **kwargs)
+
+        results = []
+        for workers, side_effect_free in ((0, True), (2, True), (2, False)):
+            proj = angr.load_shellcode(data, "armel", load_address=base)
+            jumptable_resolver = RecordingJumpTableResolver(proj, side_effect_free)
+            cfg = proj.analyses.CFGFast(
+                function_starts=[*func_addrs, caller_addr],
+                indirect_jump_workers=workers,
+                # ArmElfFastResolver occupies the literal pool of the caller in the segment list
+                indirect_jump_resolvers=[ArmElfFastResolver(proj), jumptable_resolver, ConstantResolver(proj)],
+            )
+            assert bool(jumptable_resolver.resolved_addrs) == (workers == 0 or not side_effect_free)
+            results.append(
+                (
+                    sorted((node.addr, node.size) for node in cfg.graph.nodes()),
+                    sorted((src.addr, dst.addr) for src, dst in cfg.graph.edges()),
+                    {addr: sorted(jump.resolved_targets) for addr, jump in cfg.indirect_jumps.items()},
+                    sorted(cfg.jump_tables),
+                    [cfg._seg_list.occupied_by_sort(addr) for addr in range(base, base + len(data), 4)],
+                )
+            )
+
+        jumps = results[0][2]
+        assert jumps[caller_addr] == [func_addrs[0]]
+        for func_addr in func_addrs:
+            assert jumps[func_addr] == [func_addr + 28 + 8 * i for i in range(4)]
+        assert results[0][3] == func_addrs
+        assert results[0][4][(caller_addr + 0x10 - base) // 4] == "pointer-array"
+        assert results[0] == results[1] == results[2]
+
+    @staticmethod
+    def _summarize_cfg(cfg):
+        return (
+            sorted((node.addr, node.size) for node in cfg.graph.nodes()),
+            sorted((src.addr, dst.addr) for src, dst in cfg.graph.edges()),
+            sorted(cfg.kb.functions),
+            {addr: sorted(jump.resolved_targets) for addr, jump in cfg.indirect_jumps.items()},
+            sorted((addr, data.sort, data.size) for addr, data in cfg.memory_data.items()),
+        )
+
+    def _resume_in_slices(self, load_project, **kwargs):
+        expected = self._summarize_cfg(load_project().analyses.CFGFast(**kwargs))
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "cfg.ckpt")
+            slices = 0
+            while True:
+                # every slice runs in a new project, and stops right after its first job
+                cfg = load_project().analyses.CFGFast(checkpoint=path, time_limit=0, resume=True, **kwargs)
+                slices += 1
+                if not cfg.time_limit_reached:
+                    break
+                assert os.path.isfile(path)
+                assert slices < 1000
+
+            assert slices > 1
+            assert self._summarize_cfg(cfg) == expected
+            # the checkpoint is removed once CFG recovery completes
+            assert not os.path.exists(path)
+
+    def test_resume_from_checkpoint(self):
+        path = os.path.join(test_location, "x86_64", "fauxware")
+        self._resume_in_slices(lambda: angr.Project(path, auto_load_libs=False), normalize=True)
+
+    def test_resume_from_checkpoint_with_jump_tables(self):
+        # functions that call each other, followed by the jump-table function in test_indirect_jump_workers
+        callers = bytes.fromhex(
+            "e80b000000"  # call 0x400010
+            "e806000000"  # call 0x400010
+            "c3"  # ret
+            "cccccccccc"
+            "e80b000000"  # call 0x400020
+            "c3"  # ret
+            "cccccccccccccccccc"
+            "31c0c3"  # xor eax, eax; ret
+        ).ljust(0x30, b"\xcc")
+        func = bytes.fromhex(
+            "83ff03"  # cmp edi, 3
+            "772a"  # ja default
+            "89f8"  # mov eax, edi
+            "488d1526000000"  # lea rdx, [rip + table]
+            "48630482"  # movsxd rax, dword ptr [rdx + rax * 4]
+            "4801d0"  # add rax, rdx
+            "ffe0"  # jmp rax
+            "b801000000c3"  # mov eax, 1; ret
+            "b802000000c3"  # mov eax, 2; ret
+            "b803000000c3"  # mov eax, 3; ret
+            "b804000000c3"  # mov eax, 4; ret
+            "31c0c3"  # default: xor eax, eax; ret
+            "cccc"
+        ) + struct.pack("<4i", -0x1D, -0x17, -0x11, -0x0B)
+        data = callers + func
+        func_addrs = [0x400000, 0x400030]
+
+        self._resume_in_slices(
+            lambda: angr.load_shellcode(data, "amd64", load_address=0x400000), function_starts=func_addrs
+        )
+
+    def test_prologue_matcher(self):
+        rng = random.Random(0)
+        for arch in archinfo.all_arches:
+            patterns = list(arch.function_prologs) + list(getattr(arch, "thumb_prologs", []))
+            if not patterns:
+                continue
+            matcher = PrologueMatcher(patterns)
+            # random bytes that mostly consist of bytes in the patterns, so that many of them match
+            alphabet = sorted({int(h, 16) for p in patterns for h in re.findall(rb"\\x([0-9a-f]{2})", p)})
+            data = bytearray(rng.choice(alphabet) if rng.random() < 0.8 else rng.randrange(256) for _ in range(50000))
+
+            expected = sorted((mo.start(), idx) for idx, p in enumerate(patterns) for mo in re.finditer(p, data))
+            assert matcher.find(data, cache=False) == expected
+            assert matcher.find(data) == expected
+            # matches of the same bytes are cached
+            assert matcher.find(bytes(data)) == expected
+
 
 class TestCfgfastDataReferences(unittest.TestCase):
     def test_data_references_x86_64(self):
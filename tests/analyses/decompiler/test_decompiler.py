@@ -32,7 +32,7 @@ from angr.analyses import (
     Decompiler,
 )
 from angr.analyses.complete_calling_conventions import CallingConventionAnalysisMode
-from angr.analyses.decompiler import DECOMPILATION_PRESETS
+from angr.analyses.decompiler import DECOMPILATION_PRESETS, DecompilationBudget
 from angr.analyses.decompiler.optimization_passes.expr_op_swapper import OpDescriptor
 from angr.analyses.decompiler.optimization_passes import (
     DUPLICATING_OPTS,
@@ -48,7 +48,7 @@ from angr.analyses.decompiler.optimization_passes import (
 from angr.analyses.decompiler.decompilation_options import get_structurer_option, PARAM_TO_OPTION
 from angr.analyses.decompiler.structuring import STRUCTURER_CLASSES, PhoenixStructurer, SAILRStructurer
 from angr.analyses.decompiler.structuring.phoenix import MultiStmtExprMode
-from angr.sim_variable import SimStackVariable
+from angr.sim_variable import SimStackVariable, SimVariable
 from angr.utils.library import convert_cproto_to_py
 
 from tests.common import bin_location, slow_test, print_decompilation_result, WORKER
@@ -3643,6 +3643,54 @@ class TestDecompiler(unittest.TestCase):
         print_decompilation_result(d)
         assert "::libc.so.0::puts" in d.codegen.text
 
+    def test_incremental_text_regeneration(self):
+        bin_path = os.path.join(test_location, "x86_64", "fauxware")
+        proj = angr.Project(bin_path, auto_load_libs=False)
+        cfg = proj.analyses.CFGFast(normalize=True, data_references=True)
+        proj.analyses.CompleteCallingConventions(cfg=cfg, recover_variables=True, analyze_callsites=True)
+
+        d = proj.analyses[Decompiler]("main", cfg=cfg.model)
+        codegen = d.codegen
+
+        def rendering():
+            return (
+                codegen.text,
+                [
+                    (pos, elem.length, type(elem.obj))
+                    for pos, elem in codegen.map_pos_to_node.items()
+                    if pos >= header_end
+                ],
+                [
+                    (pos, elem.length, type(elem.obj))
+                    for pos, elem in codegen.map_pos_to_addr.items()
+                    if pos >= header_end
+                ],
+                [(addr, elem.posmap_pos) for addr, elem in codegen.map_addr_to_pos.items()],
+                {k: v for k, v in codegen.map_ast_to_pos.items() if isinstance(k, SimVariable)},
+            )
+
+        vars_in_use = list(codegen.cfunc.variables_in_use.values())
+        for new_name in ("a_much_longer_variable_name", "x", "puts", "not_puts"):
+            variable = vars_in_use[0].unified_variable or vars_in_use[0].variable
+            variable.name = new_name
+            variable.renamed = True
+            codegen.regenerate_text(changed_variables=[variable])
+            header_end = codegen._render_cache.header_end
+            incremental = rendering()
+            codegen.regenerate_text()
+            assert codegen._render_cache.header_end == header_end
+            assert incremental == rendering()
+            assert new_name in codegen.text
+        assert "::puts" not in codegen.text
+
+        # retyping a variable changes how the code around it is rendered, so everything is re-rendered
+        cvar = vars_in_use[0]
+        cache = codegen._render_cache
+        cvar.variable_type = SimTypePointer(SimTypeLongLong()).with_arch(proj.arch)
+        codegen.regenerate_text(changed_variables=[cvar.unified_variable or cvar.variable])
+        assert codegen._render_cache is not cache
+        assert codegen.text == codegen.render_text(codegen.cfunc)[0]
+
     @unittest.skip("This test is disabled until CodeMotion is reimplemented")
     @for_all_structuring_algos
     def test_code_motion_down_opt(self, decompiler_options=None):
@@ -5248,6 +5296,59 @@ class TestDecompiler(unittest.TestCase):
         assert dec.codegen is not None and dec.codegen.text is not None
         assert "InterlockedExchange(" in dec.codegen.text
 
+    def test_decompilation_budget(self):
+        now = [0.0]
+        budget = DecompilationBudget(timeout=5.0, deadline=3.0, clock=lambda: now[0])
+        assert budget.deadline == 3.0
+        assert not budget.expired
+        assert budget.remaining == 3.0
+        assert not budget.should_skip_pass(LoweredSwitchSimplifier)
+
+        now[0] = 3.5
+        assert budget.expired
+        assert budget.remaining == 0.0
+        assert budget.should_skip_pass(LoweredSwitchSimplifier)
+        # essential passes are never skipped
+        assert not any(budget.should_skip_pass(pass_) for pass_ in DECOMPILATION_PRESETS["basic"].opt_passes)
+        assert budget.degradations == [("LoweredSwitchSimplifier", "Skipped optional optimization pass")]
+
+        assert not DecompilationBudget().expired
+
+    def test_decompiling_with_expired_budget(self, decompiler_options=None):
+        # xor eax, eax; test esi, esi; jle end; loop: add eax, edi; dec esi; jnz loop; end: ret
+        proj = angr.load_shellcode(bytes.fromhex("31c085f67e0601f8ffce75fac3"), "AMD64", load_address=0x400000)
+        cfg = proj.analyses.CFGFast(normalize=True)
+
+        f = proj.kb.functions[0x400000]
+        dec = proj.analyses[Decompiler].prep(fail_fast=True)(f, cfg=cfg.model, options=decompiler_options, timeout=0)
+        assert dec.codegen is not None and dec.codegen.text is not None
+        print_decompilation_result(dec)
+
+        # the decompiler degrades gracefully instead of aborting
+        assert "do" in dec.codegen.text or "while" in dec.codegen.text
+        assert dec.budget is not None and dec.budget.degradations
+        assert "decompilation_budget" in dec.notes
+
+        dec = proj.analyses[Decompiler].prep(fail_fast=True)(f, cfg=cfg.model, options=decompiler_options)
+        assert dec.budget is None
+        assert "decompilation_budget" not in dec.notes
+
+    def test_decompiling_skips_unchanged_simplification_rounds(self, decompiler_options=None):
+        # xor eax, eax; test esi, esi; jle end; loop: add eax, edi; dec esi; jnz loop; end: ret
+        proj = angr.load_shellcode(bytes.fromhex("31c085f67e0601f8ffce75fac3"), "AMD64", load_address=0x400000)
+        cfg = proj.analyses.CFGFast(normalize=True)
+
+        dec = proj.analyses[Decompiler].prep(fail_fast=True)(
+            proj.kb.functions[0x400000], cfg=cfg.model, options=decompiler_options
+        )
+        assert dec.codegen is not None and dec.codegen.text is not None
+        print_decompilation_result(dec)
+
+        # blocks that are not changed by function-level simplification are not simplified again
+        assert dec.clinic is not None
+        assert dec.clinic.skipped_block_simplifications > 0
+        assert dec.clinic.skipped_function_simplifications > 0
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -115,6 +115,44 @@ class TestStructurer(unittest.TestCase):
         region = ri.region
         assert len(region.graph.nodes()) == 2
 
+    def test_region_identifier_reuses_dominators(self):
+        g = networkx.DiGraph()
+
+        #
+        #        1
+        #       / \
+        #      2   3
+        #      |   |
+        #      4   5
+        #     / \  |
+        #    6   7 |
+        #     \ /  |
+        #      8   |
+        #       \ /
+        #        9
+
+        g.add_edges_from(
+            [
+                D(1, 2),
+                D(1, 3),
+                D(2, 4),
+                D(3, 5),
+                D(4, 6),
+                D(4, 7),
+                D(6, 8),
+                D(7, 8),
+                D(8, 9),
+                D(5, 9),
+            ]
+        )
+
+        ri = angr.analyses.decompiler.RegionIdentifier(None, graph=g)
+        assert len(ri.region.graph.nodes()) == 2
+        # dominators are computed once for the only region and then updated incrementally
+        assert ri.dominator_stats["computed"] == 1
+        assert ri.dominator_stats["updated"] > 0
+        assert ri.dominator_stats["reused"] > 0
+
     def test_smoketest(self):
         p = angr.Project(os.path.join(test_location, "x86_64", "all"), auto_load_libs=False, load_debug_info=True)
         cfg = p.analyses.CFG(data_references=True, normalize=True)
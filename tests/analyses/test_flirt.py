@@ -4,10 +4,18 @@ from __future__ import annotations
 
 __package__ = __package__ or "tests.analyses"  # pylint:disable=redefined-builtin
 
+import json
 import os.path
+import shutil
+import tempfile
 import unittest
 
 import angr
+import angr.flirt
+from angr.analyses.flirt.flirt_function import FlirtFunction
+from angr.analyses.flirt.flirt_matcher import FlirtMatcher
+from angr.analyses.flirt.flirt_module import FlirtModule
+from angr.analyses.flirt.flirt_node import FlirtNode
 
 from tests.common import bin_location, slow_test
 
@@ -46,6 +54,70 @@ class TestFlirt(unittest.TestCase):
         assert proj.kb.functions[0xF38D9].prototype is not None
         assert proj.kb.functions[0xF38D9].calling_convention is not None
 
+    @slow_test
+    def test_amd64_parallel_candidates(self):
+        binary_path = os.path.join(bin_location, "tests", "x86_64", "elf_with_static_libc_ubuntu_2004_stripped")
+        sig_paths = [
+            os.path.join(bin_location, "tests", "x86_64", "libc_ubuntu_2004.sig"),
+            # an ARM signature file that matches none of the functions
+            os.path.join(bin_location, "tests", "armhf", "debian_10.3_libc.sig"),
+        ]
+
+        def match(workers: int) -> tuple[dict[int, str], dict[str, tuple[str, dict[int, str]]]]:
+            proj = angr.Project(binary_path, auto_load_libs=False, load_debug_info=False)
+            proj.analyses.CFGFast(show_progressbar=False)
+            flirt = proj.analyses.Flirt(workers=workers)
+            names = {func.addr: func.name for func in proj.kb.functions.values()}
+            return names, {lib: (sig.sig_path, sugg) for lib, (sig, sugg) in flirt.matched_suggestions.items()}
+
+        with tempfile.TemporaryDirectory() as sig_dir:
+            for i, sig_path in enumerate(sig_paths):
+                shutil.copy(sig_path, os.path.join(sig_dir, f"{i}.sig"))
+                with open(os.path.join(sig_dir, f"{i}.meta"), "w") as f:
+                    json.dump({"arch": "amd64", "platform": "linux", "unique_strings": ["malloc(): "]}, f)
+            angr.flirt.load_signatures(sig_dir)
+            try:
+                serial = match(0)
+                parallel = match(2)
+            finally:
+                angr.flirt.FLIRT_SIGNATURES_BY_ARCH.clear()
+                angr.flirt.LIBRARY_TO_SIGNATURES.clear()
+                angr.flirt.STRING_TO_LIBRARIES.clear()
+
+        assert serial[0][0x415CC0] == "_IO_file_open"
+        assert serial == parallel
+
+    def test_matcher_with_compiled_nodes(self):
+        def make_sig(patterns: list[list[int]]) -> angr.analyses.flirt.FlirtSignatureParsed:
+            children = [
+                FlirtNode([], [FlirtModule(0, 0, 0, [FlirtFunction(f"func_{i}", 0, False, False)], [], [])], 4, p)
+                for i, p in enumerate(patterns)
+            ]
+            root = FlirtNode(children, [], 0, [])
+            return angr.analyses.flirt.FlirtSignatureParsed(0, 0, 0, 0, 0, 0, 0, 0, 0, None, None, "test", root)
+
+        sig = make_sig([[0x55, 0x48, -1, 0xE5], [0x55, -1, -1, 0x90], [-1, 0x31, 0xC0, 0xC3]])
+
+        def match(buff: bytes, tolerance: int = 0) -> list[str]:
+            matched = []
+            matcher = FlirtMatcher(
+                sig,
+                None,  # type:ignore
+                lambda *args: None,
+                lambda _func, _addr, flirt_func: matched.append(flirt_func.name),
+                mismatch_bytes_tolerance=tolerance,
+            )
+            # modules are matched starting from offset 32
+            matcher.match_function(buff + b"\x00" * 32, 0x400000)
+            return matched
+
+        assert match(b"\x55\x48\x89\xe5") == ["func_0"]
+        assert match(b"\x55\x00\x00\x90") == ["func_1"]
+        assert match(b"\xcc\x31\xc0\xc3") == ["func_2"]
+        assert not match(b"\x56\x48\x89\xe5")
+        assert match(b"\x56\x48\x89\xe5", tolerance=1) == ["func_0"]
+        assert not match(b"\x56\x49\x89\xe5", tolerance=1)
+
 
 if __name__ == "__main__":
     unittest.main()
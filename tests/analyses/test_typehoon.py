@@ -21,6 +21,7 @@ from angr.analyses.typehoon.typevars import (
 )
 from angr.analyses.typehoon.typeconsts import Int32, Struct, Pointer64, Float32, Float64
 from angr.analyses.typehoon.translator import TypeTranslator
+from angr.analyses.typehoon.simple_solver import SimpleSolver
 
 from tests.common import bin_location
 
@@ -166,6 +167,22 @@ class TestTypehoon(unittest.TestCase):
         assert isinstance(sol.basetype.fields[8], Pointer64)
         assert sol.basetype.fields[8].basetype == sol.basetype
 
+    def test_solver_timing(self):
+        func_f = TypeVariable(name="F")
+        t0 = TypeVariable(name="T0")
+        t1 = TypeVariable(name="T1")
+        type_constraints = {
+            func_f: {
+                Subtype(t0, Int32()),
+                Subtype(DerivedTypeVariable(t1, None, labels=[Load(), HasField(32, 0)]), Int32()),
+            },
+        }
+        solver = SimpleSolver(64, type_constraints, {t0, t1})
+        assert isinstance(solver.solution[t0], Int32)
+        assert isinstance(solver.solution[t1], Pointer64)
+        assert "compute_quotient_graph" in solver.timing
+        assert "get_all_paths" in solver.timing
+
     def test_solving_cascading_type_constraints(self):
         p = angr.Project(os.path.join(test_location, "x86_64", "decompiler", "tiny_aes_test.elf"), auto_load_libs=False)
         cfg = p.analyses.CFG(data_references=True, normalize=True)
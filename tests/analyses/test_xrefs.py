@@ -5,6 +5,8 @@ from __future__ import annotations
 __package__ = __package__ or "tests.analyses"  # pylint:disable=redefined-builtin
 
 import os
+import pickle
+import random
 import unittest
 
 import angr
@@ -54,6 +56,60 @@ class TestXrefs(unittest.TestCase):
             ins_addr=0x23CF, dst=0x1FFF36F4, xref_type=XRefType.Write
         )
 
+    def test_xref_manager_region_queries(self):
+        p = angr.load_shellcode(b"\xc3", "amd64")
+        xrefs = p.kb.xrefs
+        rand = random.Random(0x1337)
+        all_xrefs = [
+            XRef(
+                ins_addr=rand.randrange(0x400000, 0x401000),
+                dst=rand.randrange(0x600000, 0x601000),
+                xref_type=rand.choice([XRefType.Read, XRefType.Write, XRefType.Offset]),
+            )
+            for _ in range(2000)
+        ]
+        xrefs.add_xrefs(all_xrefs[:1000])
+        # build the indices, and then keep them updated
+        xrefs.get_xrefs_by_ins_addr_region(0, 0)
+        xrefs.get_xrefs_by_dst_region(0, 0)
+        for xref in all_xrefs[1000:1500]:
+            xrefs.add_xref(xref)
+        xrefs.add_xrefs(all_xrefs[1500:])
+
+        def _region(attr, start, end):
+            refs = set()
+            for d in getattr(xrefs, attr).values():
+                refs |= {
+                    x for x in d if start <= getattr(x, "ins_addr" if attr == "xrefs_by_ins_addr" else "dst") <= end
+                }
+            return refs
+
+        for xm in (xrefs, xrefs.copy(), pickle.loads(pickle.dumps(xrefs))):
+            for _ in range(50):
+                start = rand.randrange(0x400000, 0x401000)
+                end = start + rand.randrange(0x100)
+                assert xm.get_xrefs_by_ins_addr_region(start, end) == _region("xrefs_by_ins_addr", start, end)
+                start = rand.randrange(0x600000, 0x601000)
+                end = start + rand.randrange(0x100)
+                assert xm.get_xrefs_by_dst_region(start, end) == _region("xrefs_by_dst", start, end)
+
+        # non-offset references replace offset references in the same batch
+        xrefs.clear()
+        xrefs.add_xrefs(
+            [
+                XRef(ins_addr=0x400000, dst=0x600000, xref_type=XRefType.Offset),
+                XRef(ins_addr=0x400000, dst=0x600000, xref_type=XRefType.Read),
+                XRef(ins_addr=0x400000, dst=0x600008, xref_type=XRefType.Offset),
+            ]
+        )
+        assert xrefs.get_xrefs_by_ins_addr_region(0x400000, 0x400000) == {
+            XRef(ins_addr=0x400000, dst=0x600000, xref_type=XRefType.Read),
+            XRef(ins_addr=0x400000, dst=0x600008, xref_type=XRefType.Offset),
+        }
+        assert xrefs.get_xrefs_by_dst_region(0x600000, 0x600007) == {
+            XRef(ins_addr=0x400000, dst=0x600000, xref_type=XRefType.Read)
+        }
+
     def test_lwip_udpecho_bm_the_better_way(self):
         bin_path = os.path.join(test_location, "armel", "lwip_udpecho_bm.elf")
         p = angr.Project(bin_path, auto_load_libs=False)
@@ -61,6 +61,26 @@ def skip_if_not_linux(func):
     return skipUnless(sys.platform.startswith("linux"), "Skipping Linux Test Cases")(func)
 
 
+# sub_40000d calls sub_400000, which contains a loop
+TWO_FUNCTIONS_SHELLCODE = bytes.fromhex("31c085f67e0601f8ffce75fac3e8eeffffffc3")
+TWO_FUNCTIONS_STARTS = [0x400000, 0x40000D]
+
+
+def load_two_functions(cfg: bool = True, **cfg_kwargs) -> Project:
+    """
+    Load a tiny amd64 shellcode with two functions, for tests that do not need any binary from the binaries repo.
+
+    :param cfg:         Recover the two functions with CFGFast.
+    :param cfg_kwargs:  Extra arguments for CFGFast.
+    :return:            The project.
+    """
+    proj = load_shellcode(TWO_FUNCTIONS_SHELLCODE, "amd64", load_address=0x400000)
+    if cfg:
+        cfg_kwargs.setdefault("normalize", True)
+        proj.analyses.CFGFast(function_starts=TWO_FUNCTIONS_STARTS, **cfg_kwargs)
+    return proj
+
+
 TRACE_VERSION = 1
 
 
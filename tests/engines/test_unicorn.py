@@ -11,11 +11,13 @@ import platform
 import re
 import sys
 import unittest
+from collections import Counter
 
 import claripy
 
 import angr
 from angr import options as so
+from angr.state_plugins import unicorn_engine
 from tests.common import bin_location, broken, slow_test
 
 test_location = os.path.join(bin_location, "tests")
@@ -509,6 +511,122 @@ class TestUnicorn(unittest.TestCase):
 
         assert result == b"FLAG{l00ps_4r3_t00_34sy_r1gh7??}"
 
+    @unittest.skipIf(unicorn_engine._UC_NATIVE is None, "unicornlib is not built")
+    def test_unicorn_pool(self):
+        p = angr.load_shellcode(b"\xc3", "amd64", load_address=0x400000)
+        pool = unicorn_engine.UnicornPool(max_size=2)
+
+        # objects are reused for the same key
+        a = pool.get(p.arch, 1)
+        assert pool.get(p.arch, 1) is a
+        b = pool.get(p.arch, 2)
+        assert b is not a
+        assert len(pool) == 2
+
+        # the least recently used object is evicted, and the pages it pins are released
+        state = p.factory.blank_state()
+        page = state.memory._get_page(0x400, False)
+        refcount = page.refcount
+        b.add_base_page(0x400000, 5, page, memoryview(bytes(0x1000)))
+        assert page.refcount == refcount + 1
+        assert pool.get(p.arch, 1) is a
+        c = pool.get(p.arch, 3)
+        assert len(pool) == 2
+        assert page.refcount == refcount
+        assert pool.get(p.arch, 1) is a
+        assert pool.get(p.arch, 3) is c
+        assert pool.get(p.arch, 2) is not b
+
+        # discarded objects are recreated
+        pool.discard(p.arch, 1)
+        assert pool.get(p.arch, 1) is not a
+
+    @unittest.skipIf(unicorn_engine._UC_NATIVE is None, "unicornlib is not built")
+    def test_unicorn_restores_read_only_pages(self):
+        # mov rax, [0x600000]; add rax, rbx; ret
+        p = angr.load_shellcode(bytes.fromhex("488b0425000060004801d8c3"), "amd64", load_address=0x400000)
+        p.hook(0x40000B, angr.SIM_PROCEDURES["stubs"]["PathTerminator"]())
+        state = p.factory.blank_state(
+            addr=0x400000,
+            add_options=so.unicorn | {so.ZERO_FILL_UNCONSTRAINED_REGISTERS, so.ZERO_FILL_UNCONSTRAINED_MEMORY},
+        )
+        state.memory.map_region(0x600000, 0x1000, 1)
+        state.memory.store(0x600000, b"AAAAAAAA")
+        page = state.memory._pages[0x600]
+
+        def run(s, rbx):
+            s = s.copy()
+            s.regs.rbx = rbx
+            successors = p.factory.successors(s)
+            assert "Unicorn" in successors.description
+            (succ,) = successors.flat_successors
+            assert succ.addr == 0x40000B
+            return succ.solver.eval(succ.regs.rax)
+
+        def base_page():
+            uc = unicorn_engine._unicorn_pool().get(p.arch, state.unicorn.cache_key)
+            return uc.base_pages[0x600000][1]
+
+        a = int.from_bytes(b"AAAAAAAA", "little")
+        b = int.from_bytes(b"BBBBBBBB", "little")
+        assert run(state, 1) == a + 1
+        assert base_page() is page
+        # the page is kept mapped, and registers that changed are written
+        assert run(state, 2) == a + 2
+        assert base_page() is page
+
+        # the page is mapped again after a state writes to it
+        written = state.copy()
+        written.memory.store(0x600000, b"BBBBBBBB")
+        assert written.memory._pages[0x600] is not page
+        assert run(written, 1) == b + 1
+        assert base_page() is written.memory._pages[0x600]
+        assert run(state, 1) == a + 1
+        assert base_page() is page
+
+    @unittest.skipIf(unicorn_engine._UC_NATIVE is None, "unicornlib is not built")
+    def test_unicorn_coverage(self):
+        p = angr.Project(os.path.join(test_location, "x86_64", "longinit"), auto_load_libs=False)
+        state = p.factory.entry_state(
+            add_options=so.unicorn | {so.UNICORN_TRACK_COVERAGE}, remove_options={so.SHORT_READS}
+        )
+
+        def loc(addr):
+            return ((addr >> 4) ^ (addr << 8)) & 0xFFFF
+
+        unicorn_steps = 0
+        loops = 0
+        states = [state]
+        while states:
+            successors = p.factory.successors(states.pop())
+            states.extend(successors.flat_successors)
+            if "Unicorn" not in successors.description:
+                continue
+            for succ in successors.flat_successors:
+                unicorn_steps += 1
+                bbl_addrs = list(succ.history.recent_bbl_addrs)
+                hits = succ.scratch.block_hit_counts
+                # the block at the stop point may or may not be counted
+                extra = Counter(hits) - Counter(bbl_addrs)
+                assert sum(extra.values()) <= 1
+                bbl_addrs += list(extra)
+                assert hits == Counter(bbl_addrs)
+                loops += any(count > 1 for count in hits.values())
+
+                # AFL-style edges between consecutive blocks, starting from an edge into the first block
+                expected = Counter()
+                prev_loc = 0
+                for addr in bbl_addrs:
+                    expected[loc(addr) ^ prev_loc] += 1
+                    prev_loc = loc(addr) >> 1
+                bitmap = succ.scratch.coverage_bitmap
+                assert len(bitmap) == 0x10000
+                assert {idx: count for idx, count in enumerate(bitmap) if count} == {
+                    idx: min(count, 0xFF) for idx, count in expected.items()
+                }
+        assert unicorn_steps > 0
+        assert loops > 0
+
 
 if __name__ == "__main__":
     import logging
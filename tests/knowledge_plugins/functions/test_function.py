@@ -1,11 +1,22 @@
 #!/usr/bin/env python3
 from __future__ import annotations
+
+__package__ = __package__ or "tests.knowledge_plugins.functions"  # pylint:disable=redefined-builtin
+
+import os
 from unittest import main, TestCase
 
 import networkx
 
+import angr
+from angr.codenode import BlockNode
 from angr.knowledge_plugins.functions import Function
 
+from tests.common import bin_location, load_two_functions
+
+
+test_location = os.path.join(bin_location, "tests")
+
 
 def makeFunction(function_manager, function_address, function_name):
     # Fill some value that are not relevant for the tests, but help circumvent a lot of mocking.
@@ -87,6 +98,109 @@ class TestFunction(TestCase):
 
         self.assertEqual(function.functions_reachable(), {function, C})
 
+    def test_compact_transition_graph(self):
+        proj = angr.Project(os.path.join(test_location, "x86_64", "fauxware"), auto_load_libs=False)
+        proj.analyses.CFGFast(normalize=True)
+        funcs = proj.kb.functions
+        main = funcs["main"]
+
+        def _edges(func):
+            return {
+                (src.addr, dst.addr, tuple(sorted(data.items())))
+                for src, dst, data in func.transition_graph.edges(data=True)
+            }
+
+        def _local_edges(func):
+            return {(src.addr, dst.addr) for src, dst in func.graph.edges}
+
+        edges = {func.addr: _edges(func) for func in funcs.values()}
+        local_edges = {func.addr: _local_edges(func) for func in funcs.values()}
+        block_addrs = {func.addr: set(func.block_addrs_set) for func in funcs.values()}
+        successors = {n.addr for n in main.startpoint.successors()}
+        serialized = {func.addr: func.serialize() for func in funcs.values()}
+
+        funcs.compact(drop_block_bytes=True)
+        assert all(func.is_compact for func in funcs.values())
+        # these do not rebuild the transition graph
+        for func in funcs.values():
+            assert _local_edges(func) == local_edges[func.addr]
+            assert func.block_addrs_set == block_addrs[func.addr]
+            assert func.serialize() == serialized[func.addr]
+        assert all(func.is_compact for func in funcs.values())
+        assert main.copy().is_compact
+
+        # the transition graph is rebuilt upon access
+        assert {n.addr for n in main.startpoint.successors()} == successors
+        assert main.is_compact
+        for func in funcs.values():
+            assert _edges(func) == edges[func.addr]
+            assert not func.is_compact
+        # bytes of blocks are loaded from memory
+        for block in main.blocks:
+            assert block.bytes == proj.loader.memory.load(block.addr, block.size)
+
+    def test_compact_transition_graph_view(self):
+        proj = angr.Project(os.path.join(test_location, "x86_64", "fauxware"), auto_load_libs=False)
+        proj.analyses.CFGFast(normalize=True)
+        func = proj.kb.functions["authenticate"]
+        graph = networkx.DiGraph(func.transition_graph)
+        successors = {node: {n.addr for n in node.successors()} for node in graph if isinstance(node, BlockNode)}
+        predecessors = {node: {n.addr for n in node.predecessors()} for node in graph if isinstance(node, BlockNode)}
+        func.compact()
+
+        view = func.transition_graph_view
+        assert func.is_compact
+        assert set(func.nodes) == set(graph)
+        for node in graph:
+            assert node in view
+            assert set(view.successors(node)) == set(graph.successors(node))
+            assert set(view.predecessors(node)) == set(graph.predecessors(node))
+            assert view.out_degree(node) == graph.out_degree(node)
+            assert view.in_degree(node) == graph.in_degree(node)
+            assert view[node] == dict(graph[node])
+            assert list(view.in_edges(node, data=True)) == list(graph.in_edges(node, data=True))
+        for src, dst, data in graph.edges(data=True):
+            assert view.has_edge(src, dst)
+            assert view.get_edge_data(src, dst) == data
+        for src in graph:
+            for dst in graph:
+                if not graph.has_edge(src, dst):
+                    assert not view.has_edge(src, dst)
+                    assert view.get_edge_data(src, dst, default=False) is False
+        with self.assertRaises(networkx.NetworkXError):
+            list(view.successors(BlockNode(func.addr + 1, 1)))
+
+        # nodes know their successors without rebuilding the transition graph
+        for node, succ_addrs in successors.items():
+            assert {n.addr for n in node.successors()} == succ_addrs
+        for node, pred_addrs in predecessors.items():
+            assert {n.addr for n in node.predecessors()} == pred_addrs
+        # edge attributes are copies
+        src, dst, data = next(iter(graph.edges(data=True)))
+        view.get_edge_data(src, dst)["type"] = "fake_type"
+        assert view.get_edge_data(src, dst)["type"] == data["type"]
+        assert func.is_compact
+
+    def test_compact_does_not_share_nodes_across_functions(self):
+        proj = load_two_functions()
+        funcs = proj.kb.functions
+        callee, caller = funcs[0x400000], funcs[0x40000D]
+        # the caller also jumps to the entry block of the callee
+        outside_node = BlockNode(callee.startpoint.addr, callee.startpoint.size)
+        caller._transit_to(caller.startpoint, outside_node, outside=True)
+        assert outside_node == callee.startpoint and outside_node is not callee.startpoint
+
+        funcs.compact()
+        assert not {id(node) for node in callee.nodes} & {id(node) for node in caller.nodes}
+
+        # expanding the caller does not take the node away from the callee
+        assert outside_node in caller.transition_graph
+        assert not caller.is_compact and callee.is_compact
+        assert {n.addr for n in callee.startpoint.successors()} == {0x400006, 0x40000C}
+        assert not list(outside_node.successors())
+        assert {n.addr for n in callee.transition_graph.successors(callee.startpoint)} == {0x400006, 0x40000C}
+        assert {n.addr for n in callee.startpoint.successors()} == {0x400006, 0x40000C}
+
 
 if __name__ == "__main__":
     main()
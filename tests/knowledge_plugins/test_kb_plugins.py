@@ -10,6 +10,8 @@ import unittest
 import networkx
 
 import angr
+from angr.analyses.typehoon.lifter import TypeLifter
+from angr.analyses.typehoon.typeconsts import Int32, Pointer64
 
 from tests.common import bin_location
 
@@ -87,6 +89,32 @@ class TestKbPlugins(unittest.TestCase):
 
         assert p.kb.get_knowledge(TestPlugin) == t
 
+    def test_lifted_prototypes(self):
+        p = angr.load_shellcode(b"\x90\x90", "AMD64")
+        lifter = TypeLifter(64)
+        proto = angr.sim_type.parse_signature("int foo(int a, char *b)").with_arch(p.arch)
+
+        lifted = p.kb.lifted_prototypes.lift_args(0x1000, proto, None, lifter)
+        assert len(lifted) == 2
+        assert isinstance(lifted[0], Int32)
+        assert isinstance(lifted[1], Pointer64)
+        assert p.kb.lifted_prototypes.misses == 1
+
+        # the same prototype is served from the cache
+        cached = p.kb.lifted_prototypes.lift_args(0x1000, proto, None, lifter)
+        assert cached == lifted
+        assert p.kb.lifted_prototypes.hits == 1
+        assert p.kb.lifted_prototypes.misses == 1
+
+        # modifying returned type constants does not affect the cache
+        cached[1].basetype = Int32()
+        assert p.kb.lifted_prototypes.lift_args(0x1000, proto, None, lifter) == lifted
+
+        # a changed prototype invalidates the cached entry
+        new_proto = angr.sim_type.parse_signature("int foo(int a)").with_arch(p.arch)
+        assert len(p.kb.lifted_prototypes.lift_args(0x1000, new_proto, None, lifter)) == 1
+        assert p.kb.lifted_prototypes.misses == 2
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# pylint: disable=missing-class-docstring,disable=no-self-use
+from __future__ import annotations
+import pickle
+import unittest
+
+from angr.misc import LazyHooks
+
+
+class TestLazyHooks(unittest.TestCase):
+    def test_lazy_hooks(self):
+        created = []
+
+        def factory(name):
+            def create():
+                created.append(name)
+                return name
+
+            return create
+
+        hooks = LazyHooks({0x1000: "eager"})
+        hooks.add_pending(0x2000, factory("a"))
+        hooks.add_pending(0x3000, factory("b"))
+
+        # membership tests and iterating over addresses do not create hooks
+        assert 0x2000 in hooks
+        assert 0x4000 not in hooks
+        assert len(hooks) == 3
+        assert sorted(hooks) == [0x1000, 0x2000, 0x3000]
+        assert hooks.pending_count == 2
+        assert not created
+
+        # looking up hooks creates them once
+        assert hooks[0x2000] == "a"
+        assert hooks.get(0x2000) == "a"
+        assert created == ["a"]
+        assert hooks.get(0x4000) is None
+        with self.assertRaises(KeyError):
+            _ = hooks[0x4000]
+
+        # replacing and removing pending hooks
+        hooks[0x3000] = "c"
+        assert hooks[0x3000] == "c"
+        hooks.add_pending(0x5000, factory("d"))
+        del hooks[0x5000]
+        assert 0x5000 not in hooks
+        assert created == ["a"]
+
+        hooks.add_pending(0x6000, factory("e"))
+        assert dict(hooks.items()) == {0x1000: "eager", 0x2000: "a", 0x3000: "c", 0x6000: "e"}
+        assert hooks.pending_count == 0
+
+    def test_lazy_hooks_pickle(self):
+        hooks = LazyHooks()
+        hooks.add_pending(0x1000, str)
+        hooks2 = pickle.loads(pickle.dumps(hooks))
+        assert hooks2.pending_count == 0
+        assert dict(hooks2) == {0x1000: ""}
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,21 @@
+from __future__ import annotations
+import subprocess
+import sys
+import time
+
+# angr must be imported in a fresh interpreter every time
+CMD = [sys.executable, "-c", "import angr"]
+
+
+def main():
+    subprocess.run(CMD, check=True)
+
+
+if __name__ == "__main__":
+    # the first run warms up the file system cache and writes bytecode caches
+    main()
+    tstart = time.time()
+    for _ in range(5):
+        main()
+    tend = time.time()
+    print("Elapsed: %f sec" % ((tend - tstart) / 5))
@@ -259,6 +259,285 @@ class TestDb(unittest.TestCase):
             assert proj_new.loader.main_object.binary is None
             assert len(proj.kb.functions) == func_count
 
+    def test_angrdb_lazy_functions(self):
+        bin_path = os.path.join(test_location, "x86_64", "fauxware")
+
+        proj = angr.Project(bin_path, auto_load_libs=False)
+        proj.analyses.CFGFast(normalize=True)
+        main_addr = proj.kb.functions["main"].addr
+        authenticate_addr = proj.kb.functions["authenticate"].addr
+
+        with tempfile.TemporaryDirectory() as td:
+            db_file = os.path.join(td, "fauxware.adb")
+            AngrDB(proj).dump(db_file)
+
+            proj1 = AngrDB().load(db_file, lazy_functions=True, max_cached_functions=2)
+            funcs = proj1.kb.functions
+            func_map = funcs._function_map
+            assert len(funcs) == len(proj.kb.functions)
+            assert list(funcs) == list(proj.kb.functions)
+            assert func_map.loaded_count == 0
+
+            # the call graph and CFGNode.function_address are available without loading any function
+            assert funcs.callgraph.has_edge(main_addr, authenticate_addr)
+            cfg = proj1.kb.cfgs.get_most_accurate()
+            assert cfg.get_any_node(main_addr).function_address == main_addr
+            assert func_map.loaded_count == 0
+
+            # loading a caller does not load its callees
+            assert funcs.get_by_addr(main_addr).block_addrs_set == proj.kb.functions[main_addr].block_addrs_set
+            assert not func_map.is_loaded(authenticate_addr)
+
+            assert funcs.floor_func(main_addr + 1).addr == main_addr
+            assert funcs.get_by_addr(authenticate_addr).name == "authenticate"
+            assert funcs.ceiling_func(main_addr).block_addrs_set == proj.kb.functions[main_addr].block_addrs_set
+            assert func_map.loaded_count == 2
+
+            # the least recently used functions are evicted
+            funcs[authenticate_addr].name = "check_password"
+            assert sorted(f.addr for f in funcs.values()) == sorted(proj.kb.functions)
+            assert func_map.loaded_count == 2
+            assert func_map.evicted > 0
+            assert not func_map.is_loaded(authenticate_addr)
+            # changes to evicted functions are kept
+            assert funcs.get_by_addr(authenticate_addr).name == "check_password"
+
+            # copies are fully loaded
+            assert len(funcs.copy()._function_map) == len(proj.kb.functions)
+            del funcs, func_map, cfg, proj1
+
+    def test_lazy_function_eviction_keeps_references(self):
+        from angr.angrdb.serializers import KnowledgeBaseSerializer  # pylint:disable=import-outside-toplevel
+
+        bin_path = os.path.join(test_location, "x86_64", "fauxware")
+        proj = angr.Project(bin_path, auto_load_libs=False)
+        proj.analyses.CFGFast(normalize=True)
+        main_addr = proj.kb.functions["main"].addr
+        authenticate_addr = proj.kb.functions["authenticate"].addr
+
+        with tempfile.TemporaryDirectory() as td:
+            db_file = os.path.join(td, "fauxware.adb")
+            with AngrDB.open_db(f"sqlite:///{db_file}") as Session:
+                with AngrDB.session_scope(Session) as session:
+                    KnowledgeBaseSerializer.dump(session, proj.kb, new_revision="r1")
+                with AngrDB.session_scope(Session) as session:
+                    kb = KnowledgeBaseSerializer.load(
+                        session, proj, "global", Session=Session, max_cached_functions=1, revision="r1"
+                    )
+
+                funcs = kb.functions
+                func_map = funcs._function_map
+                main = funcs[main_addr]
+                authenticate = funcs[authenticate_addr]
+                assert not func_map.is_loaded(main_addr)
+
+                # the evicted function is still referenced here. changes to it are neither lost nor hidden by a fresh
+                # copy from the database
+                main.returning = False
+                assert func_map.spilled(main_addr) is not None
+                assert funcs[main_addr] is main
+                assert func_map.materialized == 2
+                assert not func_map.is_loaded(authenticate_addr)
+                assert funcs[authenticate_addr] is authenticate
+
+                # the change is written even though the function was evicted when it was made
+                funcs[authenticate_addr]  # pylint:disable=pointless-statement
+                assert not func_map.is_loaded(main_addr)
+                with AngrDB.session_scope(Session) as session:
+                    KnowledgeBaseSerializer.dump(session, kb, revision="r1", new_revision="r2")
+                with AngrDB.session_scope(Session) as session:
+                    kb2 = KnowledgeBaseSerializer.load(session, proj, "global", revision="r2")
+                    assert kb2.functions[main_addr].returning is False
+                del kb, kb2, funcs, func_map, main, authenticate
+
+    def test_lazy_function_dirty_tracking(self):
+        # pylint:disable=import-outside-toplevel
+        from sqlalchemy import event
+        from angr.angrdb.models import DbFunction
+        from angr.angrdb.serializers import KnowledgeBaseSerializer
+
+        bin_path = os.path.join(test_location, "x86_64", "fauxware")
+        proj = angr.Project(bin_path, auto_load_libs=False)
+        proj.analyses.CFGFast(normalize=True)
+        main_addr = proj.kb.functions["main"].addr
+        authenticate_addr = proj.kb.functions["authenticate"].addr
+
+        with tempfile.TemporaryDirectory() as td:
+            db_file = os.path.join(td, "fauxware.adb")
+            with AngrDB.open_db(f"sqlite:///{db_file}") as Session:
+                with AngrDB.session_scope(Session) as session:
+                    KnowledgeBaseSerializer.dump(session, proj.kb, new_revision="r1")
+                with AngrDB.session_scope(Session) as session:
+                    kb = KnowledgeBaseSerializer.load(
+                        session, proj, "global", Session=Session, max_cached_functions=1, revision="r1"
+                    )
+
+                inserted_funcs = []
+
+                def _on_insert(mapper, connection, target):  # pylint:disable=unused-argument
+                    inserted_funcs.append(target.addr)
+
+                event.listen(DbFunction, "before_insert", _on_insert)
+                self.addCleanup(event.remove, DbFunction, "before_insert", _on_insert)
+
+                # clean functions are not serialized upon eviction
+                funcs = kb.functions
+                func_map = funcs._function_map
+                assert not funcs[authenticate_addr].dirty
+                funcs[main_addr].returning = False
+                assert not func_map.is_loaded(authenticate_addr)
+                assert func_map.spilled(authenticate_addr) is None
+                assert not func_map.is_dirty(authenticate_addr)
+
+                # modified functions are serialized upon eviction, and only they are written
+                funcs[authenticate_addr]  # pylint:disable=pointless-statement
+                assert func_map.is_dirty(main_addr)
+                assert func_map.spilled(main_addr) is not None
+                with AngrDB.session_scope(Session) as session:
+                    KnowledgeBaseSerializer.dump(session, kb, revision="r1", new_revision="r2")
+                assert inserted_funcs == [main_addr]
+                assert not func_map.is_dirty(main_addr)
+                assert not func_map.is_dirty(authenticate_addr)
+
+                # the modification is kept across evictions after it has been written
+                assert funcs[main_addr].returning is False
+                funcs[authenticate_addr]  # pylint:disable=pointless-statement
+                assert funcs[main_addr].returning is False
+
+                inserted_funcs.clear()
+                with AngrDB.session_scope(Session) as session:
+                    KnowledgeBaseSerializer.dump(session, kb, revision="r2", new_revision="r3")
+                assert not inserted_funcs
+                del kb, funcs, func_map
+
+    def test_callgraph_with_soot_keys(self):
+        # pylint:disable=import-outside-toplevel
+        import networkx
+        from archinfo.arch_soot import SootMethodDescriptor
+        from angr.angrdb.serializers.funcs import FunctionManagerSerializer
+
+        main = SootMethodDescriptor("Main", "main", ("java.lang.String[]",), ret_type="void")
+        callee = SootMethodDescriptor("Main", "callee", ())
+        callgraph = networkx.MultiDiGraph()
+        callgraph.add_edge(main, callee, type="call")
+        callgraph.add_node(SootMethodDescriptor("Main", "unused", ("int", "int")))
+
+        blob = FunctionManagerSerializer._serialize_callgraph(callgraph)
+        parsed = FunctionManagerSerializer._parse_callgraph(blob)
+        assert set(parsed.nodes) == set(callgraph.nodes)
+        assert list(parsed.edges(data=True)) == [(main, callee, {"type": "call"})]
+        assert all(isinstance(node.params, tuple) for node in parsed.nodes)
+
+    def test_migrate_version_1_database(self):
+        # pylint:disable=import-outside-toplevel
+        from angr.angrdb.models import DbCallGraph
+        from angr.angrdb.serializers import KnowledgeBaseSerializer
+        from angr.knowledge_plugins.functions.function_manager import LazyFunctionDict
+
+        db = AngrDB()
+        assert db.db_compatible(1)
+        assert db.db_compatible(AngrDB.VERSION)
+        assert not db.db_compatible(AngrDB.VERSION + 1)
+        assert not db.db_compatible(None)
+
+        bin_path = os.path.join(test_location, "x86_64", "fauxware")
+        proj = angr.Project(bin_path, auto_load_libs=False)
+        proj.analyses.CFGFast(normalize=True)
+        main_addr = proj.kb.functions["main"].addr
+        authenticate_addr = proj.kb.functions["authenticate"].addr
+
+        with tempfile.TemporaryDirectory() as td:
+            db_file = os.path.join(td, "fauxware.adb")
+            with AngrDB.open_db(f"sqlite:///{db_file}") as Session:
+                # a version 1 database whose call graph was not updated by the last writer
+                with AngrDB.session_scope(Session) as session:
+                    KnowledgeBaseSerializer.dump(session, proj.kb, new_revision="r1")
+                    AngrDB.save_info(session, "revision", "r1")
+                    AngrDB.save_info(session, "version", "1")
+                    session.query(DbCallGraph).one().blob = b'{"nodes": [], "edges": []}'
+
+                with AngrDB.session_scope(Session) as session:
+                    db.migrate(session, 1)
+                with AngrDB.session_scope(Session) as session:
+                    assert db.get_dbinfo(session)["version"] == AngrDB.VERSION
+                    assert AngrDB.get_info(session, "revision") is None
+                    kb = KnowledgeBaseSerializer.load(session, proj, "global", Session=Session)
+                    # functions are loaded eagerly, and the call graph is rebuilt from them
+                    assert not isinstance(kb.functions._function_map, LazyFunctionDict)
+                    assert kb.functions.callgraph.has_edge(main_addr, authenticate_addr)
+                    del kb
+
+    def test_incremental_dump(self):
+        # pylint:disable=import-outside-toplevel
+        from sqlalchemy import event
+        from angr.angrdb.models import DbComment, DbFunction
+        from angr.angrdb.serializers import KnowledgeBaseSerializer
+
+        bin_path = os.path.join(test_location, "x86_64", "fauxware")
+        proj = angr.Project(bin_path, auto_load_libs=False)
+        proj.analyses.CFGFast(normalize=True)
+        main_addr = proj.kb.functions["main"].addr
+        authenticate_addr = proj.kb.functions["authenticate"].addr
+        proj.kb.comments[main_addr] = "first"
+
+        with tempfile.TemporaryDirectory() as td:
+            db_file = os.path.join(td, "fauxware.adb")
+            with AngrDB.open_db(f"sqlite:///{db_file}") as Session:
+                inserted_funcs = []
+
+                def _on_insert(mapper, connection, target):  # pylint:disable=unused-argument
+                    inserted_funcs.append(target.addr)
+
+                event.listen(DbFunction, "before_insert", _on_insert)
+                self.addCleanup(event.remove, DbFunction, "before_insert", _on_insert)
+
+                with AngrDB.session_scope(Session) as session:
+                    KnowledgeBaseSerializer.dump(session, proj.kb, revision=None, new_revision="r1")
+                assert sorted(inserted_funcs) == sorted(proj.kb.functions)
+
+                # only changed rows are written
+                inserted_funcs.clear()
+                proj.kb.functions[main_addr].name = "entry"
+                del proj.kb.comments[main_addr]
+                proj.kb.comments[authenticate_addr] = "second"
+                with AngrDB.session_scope(Session) as session:
+                    KnowledgeBaseSerializer.dump(session, proj.kb, revision="r1", new_revision="r2")
+                    assert [(c.addr, c.comment) for c in session.query(DbComment)] == [(authenticate_addr, "second")]
+                assert inserted_funcs == [main_addr]
+
+                # functions are only written when they are modified
+                inserted_funcs.clear()
+                func = proj.kb.functions[authenticate_addr]
+                _ = func.graph, func.transition_graph, func.cyclomatic_complexity
+                proj.kb.functions.compact()
+                assert not func.dirty
+                with AngrDB.session_scope(Session) as session:
+                    KnowledgeBaseSerializer.dump(session, proj.kb, revision="r2", new_revision="r2a")
+                assert not inserted_funcs
+
+                func.transition_graph.remove_edge(*next(iter(func.transition_graph.edges)))
+                func.mark_dirty()
+                proj.kb.functions[main_addr].prototype = None
+                with AngrDB.session_scope(Session) as session:
+                    KnowledgeBaseSerializer.dump(session, proj.kb, revision="r2a", new_revision="r2b")
+                assert sorted(inserted_funcs) == sorted([authenticate_addr, main_addr])
+                assert not any(f.dirty for f in proj.kb.functions.values())
+
+                # the database has been updated elsewhere. rewrite all functions
+                inserted_funcs.clear()
+                with AngrDB.session_scope(Session) as session:
+                    KnowledgeBaseSerializer.dump(session, proj.kb, revision="r3", new_revision="r4")
+                assert sorted(inserted_funcs) == sorted(proj.kb.functions)
+
+                with AngrDB.session_scope(Session) as session:
+                    kb = KnowledgeBaseSerializer.load(session, proj, "global", revision="r4")
+                    assert kb.functions[main_addr].name == "entry"
+                    assert kb.functions[main_addr].prototype is None
+                    assert not any(f.dirty for f in kb.functions.values())
+                    assert not kb.xrefs._dirty
+                    assert dict(kb.comments) == {authenticate_addr: "second"}
+                    del kb
+
 
 if __name__ == "__main__":
     unittest.main()
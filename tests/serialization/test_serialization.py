@@ -5,6 +5,7 @@ from __future__ import annotations
 __package__ = __package__ or "tests.serialization"  # pylint:disable=redefined-builtin
 
 import gc
+import io
 import os
 import pickle
 import shutil
@@ -13,6 +14,11 @@ import unittest
 
 import angr
 from angr.sim_variable import SimStackVariable
+from angr.protos import cfg_pb2
+from angr.knowledge_plugins.cfg import CFGModel
+from angr.knowledge_plugins.functions import FunctionManager
+from angr.knowledge_plugins.xrefs import XRefManager
+from angr.serializable import read_chunks, read_delimited, write_delimited
 
 from tests.common import bin_location
 
@@ -138,6 +144,109 @@ class TestSerialization(unittest.TestCase):
         cmsg = v1.serialize_to_cmessage()
         assert cmsg.offset == 0x7FFF_DEAD
 
+    @staticmethod
+    def _xrefs(xref_manager):
+        return {
+            (xref.ins_addr, xref.block_addr, xref.stmt_idx, xref.dst, xref.type)
+            for xrefs in xref_manager.xrefs_by_ins_addr.values()
+            for xref in xrefs
+        }
+
+    def test_streaming_serialization(self):
+        bin_path = os.path.join(test_location, "x86_64", "fauxware")
+        p = angr.Project(bin_path, auto_load_libs=False)
+        cfg = p.analyses.CFGFast(normalize=True, data_references=True, cross_references=True).model
+        assert p.kb.xrefs.xrefs_by_ins_addr
+        main_addr = p.kb.functions["main"].addr
+
+        # multiple sections, each of which consists of many small chunks, in one stream
+        stream = io.BytesIO()
+        cfg.serialize_to_stream(stream, chunk_size=2)
+        p.kb.functions.serialize_to_stream(stream, chunk_size=1)
+        p.kb.xrefs.serialize_to_stream(stream, chunk_size=4)
+
+        # chunks are self-contained messages, which are merged into the entire message
+        stream.seek(0)
+        chunks = list(read_chunks(stream))
+        assert len(chunks) > 2
+        cmsg = cfg_pb2.CFG()
+        for chunk in chunks:
+            cmsg.MergeFrom(cfg_pb2.CFG.FromString(chunk))
+        assert cmsg == cfg.serialize_to_cmessage()
+
+        stream.seek(0)
+        p2 = angr.Project(bin_path, auto_load_libs=False)
+        model = CFGModel.parse_from_stream(stream, cfg_manager=p2.kb.cfgs)
+        funcs = FunctionManager.parse_from_stream(stream, kb=p2.kb)
+        xrefs = XRefManager.parse_from_stream(stream, cfg_model=model, kb=p2.kb)
+        assert stream.read() == b""
+
+        assert model.serialize() == cfg.serialize()
+        assert model.normalized
+        assert {(src.addr, dst.addr) for src, dst in model.graph.edges} == {
+            (src.addr, dst.addr) for src, dst in cfg.graph.edges
+        }
+        assert set(funcs) == set(p.kb.functions)
+        for addr in funcs:
+            assert funcs[addr].serialize() == p.kb.functions[addr].serialize()
+        assert sorted(funcs.callgraph.edges(data=True)) == sorted(p.kb.functions.callgraph.edges(data=True))
+        # the kind of target of an xref is not serialized
+        assert self._xrefs(xrefs) == self._xrefs(p.kb.xrefs)
+
+        # streams can be parsed as a whole, too
+        stream = io.BytesIO()
+        p.kb.functions.serialize_to_stream(stream, chunk_size=1)
+        stream.seek(0)
+        blob = b"".join(read_chunks(stream))
+        assert FunctionManager.parse(blob, kb=p2.kb)[main_addr].serialize() == p.kb.functions[main_addr].serialize()
+
+    def test_streaming_serialization_edge_cases(self):
+        # lengths of records that take more than one byte
+        stream = io.BytesIO()
+        for n in (0, 1, 0x7F, 0x80, 0x3FFF, 0x4000):
+            write_delimited(stream, b"\xaa" * n)
+        stream.seek(0)
+        assert [len(read_delimited(stream)) for _ in range(6)] == [0, 1, 0x7F, 0x80, 0x3FFF, 0x4000]
+        assert read_delimited(stream) is None
+
+        # truncated records
+        for data in (b"\x80", b"\x05abc"):
+            with self.assertRaises(EOFError):
+                read_delimited(io.BytesIO(data))
+
+        # empty objects are written as one chunk at most, and sections of them are parsed in order
+        p = angr.Project(os.path.join(test_location, "x86_64", "fauxware"), auto_load_libs=False)
+        stream = io.BytesIO()
+        CFGModel("empty", cfg_manager=p.kb.cfgs).serialize_to_stream(stream, chunk_size=1)
+        p.kb.functions.serialize_to_stream(stream, chunk_size=1)
+        p.kb.xrefs.serialize_to_stream(stream, chunk_size=1)
+        stream.seek(0)
+        model = CFGModel.parse_from_stream(stream, cfg_manager=p.kb.cfgs)
+        funcs = FunctionManager.parse_from_stream(stream, kb=p.kb)
+        xrefs = XRefManager.parse_from_stream(stream, cfg_model=model, kb=p.kb)
+        assert stream.read() == b""
+        assert model.ident == "empty"
+        assert model.graph.number_of_nodes() == 0
+        assert len(funcs) == 0
+        assert not xrefs.xrefs_by_ins_addr
+
+        # chunk_size=None writes everything in one chunk
+        cfg = p.analyses.CFGFast(normalize=True)
+        for obj in (cfg.model, p.kb.functions):
+            stream = io.BytesIO()
+            obj.serialize_to_stream(stream, chunk_size=None)
+            stream.seek(0)
+            assert len(list(read_chunks(stream))) == 1
+
+        # classes that do not support chunking write a single chunk
+        v = SimStackVariable(-8, 4, ident="s_0")
+        stream = io.BytesIO()
+        v.serialize_to_stream(stream, chunk_size=1)
+        stream.seek(0)
+        assert len(list(read_chunks(stream))) == 1
+        stream.seek(0)
+        assert SimStackVariable.parse_from_stream(stream).serialize() == v.serialize()
+
 
 if __name__ == "__main__":
     unittest.main()
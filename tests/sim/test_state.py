@@ -6,6 +6,9 @@ __package__ = __package__ or "tests.sim"  # pylint:disable=redefined-builtin
 import pickle
 import gc
 import os
+import subprocess
+import sys
+import tempfile
 import unittest
 
 import claripy
@@ -213,6 +216,83 @@ class TestState(unittest.TestCase):
         s = pickle.loads(sp)
         assert s.solver.eval(s.memory.load(100, 10), cast_to=bytes) == b"AAABAABABC"
 
+    def test_state_snapshot(self):
+        p = angr.Project(os.path.join(bin_location, "tests", "x86_64", "fauxware"), auto_load_libs=False)
+        main_addr = p.loader.find_symbol("main").rebased_addr
+        code = p.loader.memory.load(main_addr, 4)
+        s = p.factory.blank_state(addr=main_addr)
+        s.regs.rdi = 7
+        snapshot = s.snapshot()
+
+        # changes to the original state do not affect the snapshot
+        s.regs.rdi = 8
+        s.memory.store(main_addr, b"AAAA")
+
+        a = snapshot.spawn()
+        b = snapshot.spawn()
+        assert a is not b
+        assert a.project is p
+        b.memory.store(main_addr, b"BBBB")
+        b.regs.rdi = 9
+        assert a.solver.eval(a.regs.rdi) == 7
+        assert a.solver.eval(a.memory.load(main_addr, 4), cast_to=bytes) == code
+        assert b.solver.eval(b.memory.load(main_addr, 4), cast_to=bytes) == b"BBBB"
+        assert snapshot.spawn().solver.eval(snapshot.spawn().regs.rdi) == 7
+
+        # save and load the snapshot without the project
+        data = snapshot.dumps()
+        with self.assertRaises(angr.SimStateError):
+            angr.StateSnapshot.loads(data)
+        loaded = angr.StateSnapshot.loads(data, project=p)
+        c = loaded.spawn()
+        assert c.project is p
+        assert c.addr == snapshot.addr
+        assert c.solver.eval(c.regs.rdi) == 7
+        assert c.solver.eval(c.memory.load(main_addr, 4), cast_to=bytes) == code
+        # the loader is not pickled with the snapshot
+        assert c.memory._cle_loader is p.loader
+        assert c.memory._clemory_backer is p.loader.memory
+        assert b"cle.loader" not in data
+        assert b"cle.backends" not in data
+
+        # spawned states can be executed
+        simgr = p.factory.simgr(c)
+        simgr.step()
+        assert [st.addr for st in simgr.active] == list(p.factory.block(main_addr).vex.constant_jump_targets)
+
+        # snapshots cannot be loaded with projects that loaded other objects
+        other = angr.load_shellcode(b"\xc3", "amd64", load_address=main_addr)
+        with self.assertRaises(angr.SimStateError):
+            angr.StateSnapshot.loads(data, project=other)
+
+    def test_state_snapshot_in_another_process(self):
+        bin_path = os.path.join(bin_location, "tests", "x86_64", "fauxware")
+        p = angr.Project(bin_path, auto_load_libs=False)
+        main_addr = p.loader.find_symbol("main").rebased_addr
+        s = p.factory.blank_state(addr=main_addr)
+        s.regs.rdi = 7
+        s.memory.store(0x500000, b"AAAA")
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, "snapshot")
+            with open(path, "wb") as f:
+                s.snapshot().dump(f)
+
+            code = (
+                "import sys, angr\n"
+                "p = angr.Project(sys.argv[2], auto_load_libs=False)\n"
+                "with open(sys.argv[1], 'rb') as f:\n"
+                "    state = angr.StateSnapshot.load(f, project=p).spawn()\n"
+                "assert state.project is p\n"
+                "assert state.memory._cle_loader is p.loader\n"
+                "assert state.memory._clemory_backer is p.loader.memory\n"
+                f"assert state.addr == {main_addr:#x}\n"
+                "assert state.solver.eval(state.regs.rdi) == 7\n"
+                "assert state.solver.eval(state.memory.load(0x500000, 4), cast_to=bytes) == b'AAAA'\n"
+                f"assert state.solver.eval(state.memory.load({main_addr:#x}, 4), cast_to=bytes) == "
+                f"{p.loader.memory.load(main_addr, 4)!r}\n"
+            )
+            subprocess.run([sys.executable, "-c", code, path, bin_path], check=True)
+
     def test_global_condition(self):
         s = SimState(arch="AMD64")
 
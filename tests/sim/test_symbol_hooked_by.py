@@ -46,6 +46,27 @@ class TestSymbolHookedBy(unittest.TestCase):
         assert proj.symbol_hooked_by("inet_ntoa") != original_hook
         assert proj.symbol_hooked_by("inet_ntoa") == fake_inet_ntoa
 
+    def test_lazy_hooks(self):
+        bin_path = os.path.join(test_location, "x86_64", "inet_ntoa")
+        proj = angr.Project(bin_path, auto_load_libs=False, use_sim_procedures=True)
+        lazy_proj = angr.Project(bin_path, auto_load_libs=False, use_sim_procedures=True, lazy_hooks=True)
+
+        assert set(lazy_proj.init_timings) == {"load", "setup", "hook_symbols", "configure_simos"}
+        assert lazy_proj._sim_procedures.pending_count > 0
+        assert set(lazy_proj._sim_procedures) == set(proj._sim_procedures)
+
+        assert lazy_proj.is_symbol_hooked("inet_ntoa")
+        hook = lazy_proj.symbol_hooked_by("inet_ntoa")
+        assert isinstance(hook, angr.SIM_PROCEDURES["posix"]["inet_ntoa"])
+        assert lazy_proj.symbol_hooked_by("inet_ntoa") is hook
+
+        for addr, proc in proj._sim_procedures.items():
+            lazy_proc = lazy_proj.hooked_by(addr)
+            assert type(lazy_proc) is type(proc)
+            assert lazy_proc.display_name == proc.display_name
+            assert lazy_proc.is_stub == proc.is_stub
+        assert lazy_proj._sim_procedures.pending_count == 0
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# pylint: disable=missing-class-docstring,disable=no-self-use
+from __future__ import annotations
+import gc
+import itertools
+import unittest
+import weakref
+
+import claripy
+
+from angr.utils.bool_minimizer import full_table, variable_table, cube_table, prime_implicants, minimize
+from angr.analyses.decompiler.condition_processor import ConditionProcessor
+
+
+class TestBoolMinimizer(unittest.TestCase):
+    def test_variable_tables(self):
+        for num_vars in range(4):
+            for i in range(num_vars):
+                table = variable_table(i, num_vars)
+                for a in range(1 << num_vars):
+                    assert (table >> a) & 1 == (a >> i) & 1
+
+    def test_prime_implicants(self):
+        # f = a & b | ~a & c, whose prime implicants are a & b, ~a & c, and b & c
+        a, b, c = (variable_table(i, 3) for i in range(3))
+        full = full_table(3)
+        table = (a & b) | ((full ^ a) & c)
+        assert prime_implicants(table, 3) == {(0b011, 0b011), (0b101, 0b100), (0b110, 0b110)}
+
+    def test_prime_implicants_limit(self):
+        # every minterm of the parity function is a prime implicant
+        num_vars = 6
+        full = full_table(num_vars)
+        table = 0
+        for i in range(num_vars):
+            table ^= variable_table(i, num_vars)
+        assert len(prime_implicants(table, num_vars)) == 32
+        assert len(prime_implicants(table, num_vars, limit=32)) == 32
+        assert prime_implicants(table, num_vars, limit=31) is None
+        assert minimize(table, num_vars, primes_limit=31) is None
+        assert minimize(full ^ table, num_vars, primes_limit=31) is None
+
+    def test_minimize_all_functions_of_three_variables(self):
+        num_vars = 3
+        full = full_table(num_vars)
+        columns = [variable_table(i, num_vars) for i in range(num_vars)]
+        for table in range(full + 1):
+            is_sop, cubes = minimize(table, num_vars)
+            covered = 0
+            for cube in cubes:
+                covered |= cube_table(cube, columns, full)
+            assert (covered if is_sop else full ^ covered) == table
+
+    def test_simplify_condition(self):
+        a, b, c = (claripy.BVS(name, 32) for name in "abc")
+        cond = claripy.Or(a == 1, claripy.And(a != 1, b > 2))
+        assert ConditionProcessor.simplify_condition(cond) is claripy.Or(a == 1, b > 2)
+
+        cond = claripy.And(claripy.Or(a == 1, b > 2), claripy.Or(a == 1, b <= 2))
+        assert ConditionProcessor.simplify_condition(cond) is (a == 1)
+
+        cond = claripy.And(a == 1, claripy.Not(a == 1), c == 3)
+        assert claripy.is_false(ConditionProcessor.simplify_condition(cond))
+
+    def test_simplify_condition_memo(self):
+        a, b = (claripy.BVS(name, 32) for name in "ab")
+        cond = claripy.Or(a == 1, claripy.And(a != 1, b > 2))
+        simplified = ConditionProcessor.simplify_condition(cond)
+        assert ConditionProcessor.simplify_condition(cond) is simplified
+
+        # the memo does not keep conditions or their simplified forms alive
+        cond_ref, simplified_ref = weakref.ref(cond), weakref.ref(simplified)
+        del cond, simplified
+        gc.collect()
+        assert cond_ref() is None
+        assert simplified_ref() is None
+
+    def test_simplify_condition_many_variables(self):
+        xs = [claripy.BVS(f"x{i}", 32) == i for i in range(12)]
+        cond = claripy.Or(*(claripy.And(x, claripy.Or(x, y)) for x, y in itertools.pairwise(xs)))
+        # too many variables for the default limit
+        assert ConditionProcessor.simplify_condition(cond) is cond
+        assert ConditionProcessor.simplify_condition(cond, variables_limit=12) is claripy.Or(*xs[:-1])
+
+    def test_simplify_condition_limits(self):
+        a, b, c = (claripy.BVS(name, 32) for name in "abc")
+        cond = claripy.Or(claripy.And(a == 1, b == 2), claripy.And(a == 1, b != 2), c == 3)
+        assert ConditionProcessor.simplify_condition(cond) is claripy.Or(a == 1, c == 3)
+        assert ConditionProcessor.simplify_condition(cond, depth_limit=1) is cond
+        assert ConditionProcessor.simplify_condition(cond, variables_limit=2) is cond
+        # a | c has two prime implicants, and its negation ~a & ~c has one
+        assert ConditionProcessor.simplify_condition(cond, primes_limit=1) is cond
+        assert ConditionProcessor.simplify_condition(cond, primes_limit=2) is claripy.Or(a == 1, c == 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
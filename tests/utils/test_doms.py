@@ -133,6 +133,42 @@ class TestDoms(TestCase):
         assert doms.idom(4) == 3
         assert doms.idom(5) == 1
 
+    def test_replacing_start_node_repeatedly(self):
+        g = networkx.DiGraph()
+        g.add_edges_from([(1, 2), (1, 3), (2, 4), (3, 4), (4, 5), (5, 6)])
+
+        doms = IncrementalDominators(g, 1)
+        for new_node, replaced_nodes, replaced_head, successor in [
+            (10, {1, 2, 3}, 1, 4),
+            (11, {10, 4}, 10, 5),
+            (12, {11, 5}, 11, 6),
+        ]:
+            g.remove_nodes_from(replaced_nodes)
+            g.add_edge(new_node, successor)
+            doms.graph_updated(new_node, replaced_nodes, replaced_head)
+            doms._debug_check()
+            assert doms.start == new_node
+            assert doms.idom(new_node) == new_node
+            assert doms.idom(successor) == new_node
+        assert doms.incremental_updates == 3
+        assert doms.full_computations == 1
+
+    def test_end_node_removed(self):
+        g = networkx.DiGraph()
+        g.add_edges_from([(1, 2), (1, 3), (2, 4), (3, 4), (4, "END")])
+
+        doms = IncrementalDominators(g, 1)
+        postdoms = IncrementalDominators(g, "END", post=True)
+        g.remove_node("END")
+        doms.end_node_removed("END")
+        postdoms.end_node_removed("END")
+        doms._debug_check()
+        postdoms._debug_check()
+        assert doms.idom("END") is None
+        assert postdoms.start == 4
+        assert postdoms.idom(4) == 4
+        assert postdoms.idom(1) == 4
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# pylint: disable=missing-class-docstring,disable=no-self-use,protected-access
+from __future__ import annotations
+import random
+import unittest
+from unittest import mock
+
+import networkx as nx
+
+from angr.utils import graph_kernel
+from angr.utils.graph_kernel import (
+    HAS_NATIVE_GRAPH_KERNEL,
+    IndexedGraph,
+    immediate_dominators,
+    dominance_frontiers,
+    strongly_connected_components,
+    loop_nesting_forest,
+)
+
+
+def _random_graphs(count: int = 20, num_nodes: int = 40, num_edges: int = 80):
+    rng = random.Random(0x41)
+    for _ in range(count):
+        g = nx.DiGraph()
+        g.add_nodes_from(range(num_nodes))
+        for _ in range(num_edges):
+            g.add_edge(rng.randrange(num_nodes), rng.randrange(num_nodes))
+        yield g
+
+
+class TestGraphKernel(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch.object(graph_kernel, "USE_NATIVE_GRAPH_KERNEL", False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_indexed_graph(self):
+        g = nx.DiGraph([("a", "b"), ("b", "c"), ("c", "a")])
+        ig = IndexedGraph.from_networkx(g)
+        assert len(ig) == 3
+        assert [(ig.nodes[src], ig.nodes[dst]) for src, dst in ig.edges] == list(g.edges)
+
+    def test_dominators_match_networkx(self):
+        for g in _random_graphs():
+            assert immediate_dominators(g, 0) == nx.immediate_dominators(g, 0)
+            assert immediate_dominators(g, 0, reverse=True) == nx.immediate_dominators(g.reverse(), 0)
+            assert dominance_frontiers(g, 0) == nx.dominance_frontiers(g, 0)
+
+    def test_sccs_match_networkx(self):
+        for g in _random_graphs():
+            expected = sorted(sorted(scc) for scc in nx.strongly_connected_components(g))
+            assert sorted(sorted(scc) for scc in strongly_connected_components(g)) == expected
+
+    def test_loop_nesting_forest(self):
+        # 0 -> 1 -> 2 -> 3 -> 2, 3 -> 1, 1 -> 4, 4 -> 4
+        g = nx.DiGraph([(0, 1), (1, 2), (2, 3), (3, 2), (3, 1), (1, 4), (4, 4)])
+        assert loop_nesting_forest(g, 0) == [(1, {1, 2, 3}), (2, {2, 3}), (4, {4})]
+
+    def test_loop_nesting_forest_headers(self):
+        for g in _random_graphs():
+            forest = loop_nesting_forest(g, 0)
+            reachable = nx.descendants(g, 0) | {0}
+            sub = g.subgraph(reachable)
+            # top-level loops are exactly the non-trivial SCCs of the reachable subgraph
+            top_level = [
+                members
+                for header, members in forest
+                if not any(header in outer and header != outer_header for outer_header, outer in forest)
+            ]
+            expected = [
+                scc
+                for scc in nx.strongly_connected_components(sub)
+                if len(scc) > 1 or sub.has_edge(next(iter(scc)), next(iter(scc)))
+            ]
+            assert sorted(map(sorted, top_level)) == sorted(map(sorted, expected))
+            # headers belong to their loops, and inner loops are nested in outer loops
+            for i, (header, members) in enumerate(forest):
+                assert header in members
+                for inner_header, inner_members in forest[i + 1 :]:
+                    if inner_header in members:
+                        assert inner_members <= members
+
+
+@unittest.skipIf(not HAS_NATIVE_GRAPH_KERNEL, "angr.rustylib is not built")
+class TestNativeGraphKernel(TestGraphKernel):
+    """
+    Run the same tests against the native graph kernel.
+    """
+
+    def setUp(self):
+        patcher = mock.patch.object(graph_kernel, "USE_NATIVE_GRAPH_KERNEL", True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_invalid_nodes(self):
+        with self.assertRaises(ValueError):
+            graph_kernel._native_graph.immediate_dominators(2, [(0, 2)], 0)
+        with self.assertRaises(ValueError):
+            graph_kernel._native_graph.loop_nesting_forest(2, [(0, 1)], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
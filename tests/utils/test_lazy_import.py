@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+import importlib
+import json
+import pkgutil
+import subprocess
+import sys
+import unittest
+
+from angr.utils.lazy_import import LazyDict
+
+
+# public attributes of lazily-populated packages before they became lazy
+_BASELINE_EXPORTS = {
+    "angr": """
+        Analysis AngrAnalysisError AngrAnnotatedCFGError AngrAssemblyError AngrBackwardSlicingError AngrBladeError
+        AngrBladeSimProcError AngrCFGError AngrCallableError AngrCallableMultistateError AngrCorruptDBError AngrDBError
+        AngrDDGError AngrDataGraphError AngrDecompilationError AngrDelayJobNotice AngrDirectorError AngrError
+        AngrExitError AngrExplorationTechniqueError AngrExplorerError AngrForwardAnalysisError AngrIncompatibleDBError
+        AngrIncongruencyError AngrInvalidArgumentError AngrJobMergingFailureNotice AngrJobWideningFailureNotice
+        AngrLifterError AngrLoopAnalysisError AngrMissingTypeError AngrNoPluginError AngrPathError AngrRuntimeError
+        AngrSimOSError AngrSkipJobNotice AngrSurveyorError AngrSyscallError AngrTracerError AngrTypeError
+        AngrUnsupportedSyscallError AngrVFGError AngrVFGRestartAnalysisNotice AngrValueError AngrVaultError BP BP_AFTER
+        BP_BEFORE BP_BOTH BP_IPDB BP_IPYTHON Blade Block DEFAULT_CC Emulator EmulatorStopReason ExplorationTechnique
+        KnowledgeBase PTChunk PathUnreachableError PointerWrapper Project SIM_LIBRARIES SIM_PROCEDURES
+        SIM_TYPE_COLLECTIONS SYSCALL_CC Server SimAbstractMemoryError SimActionError SimCC SimCCError SimCCallError
+        SimConcreteBreakpointError SimConcreteMemoryError SimConcreteRegisterError SimEmptyCallStackError SimEngineError
+        SimError SimEventError SimException SimExpressionError SimFastMemoryError SimFastPathError SimFile SimFileBase
+        SimFileDescriptor SimFileDescriptorDuplex SimFileError SimFileStream SimFilesystemError SimHeapBrk SimHeapError
+        SimHeapPTMalloc SimHostFilesystem SimIRSBError SimIRSBNoDecodeError SimMemoryAddressError SimMemoryError
+        SimMemoryLimitError SimMemoryMissingError SimMergeError SimMissingTempError SimMount SimOS SimOperationError
+        SimPackets SimPacketsStream SimPosixError SimProcedure SimProcedureArgumentError SimProcedureError SimProcedures
+        SimRegionMapError SimReliftException SimSegfaultError SimSegfaultException SimShadowStackError SimSlicerError
+        SimSolverError SimSolverModeError SimSolverOptionError SimState SimStateError SimStateOptionsError
+        SimStatePlugin SimStatementError SimSymbolicFilesystemError SimTranslationError SimUCManagerAllocationError
+        SimUCManagerError SimUnicornError SimUnicornSymbolic SimUnicornUnsupport SimUninitializedAccessError
+        SimUnsatError SimUnsupportedError SimValueError SimZeroDivisionException SimulationManager
+        SimulationManagerError StateHierarchy TracerEnvironmentError UnsupportedCCallError UnsupportedDirtyError
+        UnsupportedIRExprError UnsupportedIROpError UnsupportedIRStmtError UnsupportedNodeTypeError
+        UnsupportedSyscallError ailment analyses annocfg annotations blade block callable calling_conventions
+        code_location codenode concretization_strategies default_cc distributed emulator engines errors
+        exploration_techniques factory keyed_region knowledge_base knowledge_plugins load_external_definitions
+        load_shellcode loggers manager misc options procedures project protos register_analysis rustylib serializable
+        sim_manager sim_options sim_procedure sim_state sim_state_options sim_type sim_variable simos slicer
+        state_hierarchy state_plugins storage tablespecs types utils vaults
+    """,
+    "angr.analyses": """
+        AnalysesHub Analysis BackwardSlice BinDiff BinaryOptimizer BoyScout CDG CFG CFGArchOptions CFGEmulated CFGFast
+        CFGFastSoot CalleeCleanupFinder CallingConventionAnalysis ClassIdentifier CodeCaveAnalysis CodeTagging
+        CompleteCallingConventionsAnalysis CongruencyCheck DDG DataDependencyGraphAnalysis Decompiler Disassembly
+        DominanceFrontier FactCollector FastConstantPropagation FlirtAnalysis ForwardAnalysis Identifier
+        InitializationFinder LoopFinder PackingDetector PatchFinderAnalysis Pathfinder PropagatorAnalysis
+        ProximityGraphAnalysis ReachingDefinitionsAnalysis Reassembler SLivenessAnalysis SPropagatorAnalysis
+        SReachingDefinitionsAnalysis SelfModifyingCodeAnalysis SootClassHierarchy StackPointerTracker StaticHooker
+        StaticObjectFinder Typehoon VFG VSA_DDG VariableRecovery VariableRecoveryFast Veritesting VtableFinder
+        XRefsAnalysis analysis annotations backward_slice binary_optimizer bindiff boyscout callee_cleanup_finder
+        calling_convention cdg cfg class_identifier code_tagging codecave complete_calling_conventions congruency_check
+        data_dep ddg decompiler deobfuscator disassembly disassembly_utils dominance_frontier fcp find_objects_static
+        flirt forward_analysis identifier init_finder loopfinder patchfinder pathfinder propagator proximity_graph
+        reaching_definitions reassembler register_analysis s_liveness s_propagator s_reaching_definitions smc
+        soot_class_hierarchy stack_pointer_tracker static_hooker typehoon unpacker variable_recovery veritesting vfg
+        visitors vsa_ddg vtable xrefs
+    """,
+    "angr.engines": """
+        HeavyPcodeMixin HeavyResilienceMixin HeavyVEXMixin HooksMixin ProcedureEngine ProcedureMixin SimEngine
+        SimEngineFailure SimEngineSyscall SimEngineUnicorn SimInspectMixin SimSuccessors SootMixin SuccessorsEngine
+        SuperFastpathMixin TrackActionsMixin UberEngine UberEnginePcode annotations concrete engine failure hook light
+        pcode procedure soot successors syscall unicorn vex
+    """,
+    "angr.engines.soot": """
+        SootMixin annotations engine exceptions expressions field_dispatcher method_dispatcher statements values
+    """,
+    "angr.engines.vex": """
+        ClaripyDataMixin HeavyResilienceMixin HeavyVEXMixin SimInspectMixin SuperFastpathMixin TrackActionsMixin
+        VEXLifter VEXMixin VEXResilienceMixin VEXSlicingMixin annotations claripy heavy lifter light
+    """,
+    "angr.engines.vex.claripy": """
+        ClaripyDataMixin annotations ccall datalayer irop
+    """,
+    "angr.exploration_techniques": """
+        Bucketizer CallFunctionGoal DFS Director DrillerCore ExecuteAddressGoal ExplorationTechnique Explorer
+        LengthLimiter LocalLoopSeer LoopSeer ManualMergepoint MemoryWatcher Oppologist Slicecutor Spiller
+        StochasticSearch StubStasher Suggestions TechniqueBuilder Threading Timeout Tracer UniqueSearch Veritesting
+        annotations base bucketizer common dfs director driller_core explorer lengthlimiter local_loop_seer loop_seer
+        manual_mergepoint memory_watcher oppologist slicecutor spiller stochastic stub_stasher suggestions tech_builder
+        threading timeout tracer unique veritesting
+    """,
+    "angr.procedures": """
+        SIM_LIBRARIES SIM_PROCEDURES SIM_TYPE_COLLECTIONS SimProcedures advapi32 annotations cgc definitions glibc
+        gnulib java java_io java_jni java_lang java_util libc libstdcpp linux_kernel linux_loader msvcr ntdll posix
+        procedure_dict stubs testing tracer uclibc win32 win32_kernel win_user32
+    """,
+}
+
+
+# pylint: disable=missing-class-docstring,disable=no-self-use
+class TestLazyImport(unittest.TestCase):
+
+    def test_lazy_dict(self):
+        calls = []
+
+        def loader():
+            calls.append(1)
+            # the loader may access the dict while it is running
+            d["a"] = 1
+            assert "a" in d
+
+        d = LazyDict(loader)
+        assert not calls
+        assert d["a"] == 1
+        d["b"] = 2
+        assert dict(d) == {"a": 1, "b": 2}
+        assert len(calls) == 1
+
+    def test_import_angr_is_lazy(self):
+        code = (
+            "import sys, angr\n"
+            "lazy = ['angr.analyses.cfg', 'angr.analyses.decompiler', 'angr.engines.vex.heavy', "
+            "'angr.exploration_techniques.tracer', 'angr.procedures.libc']\n"
+            "assert not any(m in sys.modules for m in lazy), [m for m in lazy if m in sys.modules]\n"
+            "assert angr.analyses.CFGFast.__module__ == 'angr.analyses.cfg.cfg_fast'\n"
+            "assert angr.exploration_techniques.Tracer.__name__ == 'Tracer'\n"
+            "assert angr.SIM_PROCEDURES['libc']['malloc'].__name__ == 'malloc'\n"
+            "assert 'libc.so' in angr.SIM_LIBRARIES\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_baseline_exports_resolve(self):
+        # run in a fresh interpreter so that modules imported by other tests do not hide missing attributes
+        code = (
+            "import importlib, json, sys\n"
+            "for module_name, names in json.loads(sys.argv[1]).items():\n"
+            "    module = importlib.import_module(module_name)\n"
+            "    missing = [name for name in names if not hasattr(module, name)]\n"
+            "    assert not missing, (module_name, missing)\n"
+        )
+        exports = {module_name: names.split() for module_name, names in _BASELINE_EXPORTS.items()}
+        subprocess.run([sys.executable, "-c", code, json.dumps(exports)], check=True)
+
+    def test_lazy_analyses_table(self):
+        # every analysis that registers itself must also be listed in the lazy table, otherwise it is only available
+        # after its module happens to be imported
+        import angr.analyses
+        from angr.analyses.analysis import default_analyses
+
+        for module_info in pkgutil.walk_packages(angr.analyses.__path__, angr.analyses.__name__ + "."):
+            importlib.import_module(module_info.name)
+
+        registered = default_analyses._default_plugins  # pylint:disable=protected-access
+        assert sorted(set(registered) - set(angr.analyses._ANALYSES)) == []
+        for name, (module_name, cls_name) in angr.analyses._ANALYSES.items():
+            assert registered[name] is getattr(importlib.import_module(module_name), cls_name), name
+
+
+if __name__ == "__main__":
+    unittest.main()